@@ -0,0 +1,110 @@
+"""
+Benchmark NepaliLocalizedSerializerMixin on large ``many=True`` payloads.
+
+Compares a plain ModelSerializer with the mixin, with and without the
+``ne`` context, over unsaved instances (no database access is timed).
+
+Usage:
+    make benchmark
+    python benchmarks/localized_serializer.py --rows 1000 --repeat 5
+"""
+
+import argparse
+import os
+import sys
+import time
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "django_nepkit.tests.settings")
+
+import django
+
+django.setup()
+
+from django.db import models  # noqa: E402
+from nepali.datetime import nepalidate, nepalidatetime  # noqa: E402
+from rest_framework import serializers  # noqa: E402
+
+from django_nepkit import (  # noqa: E402
+    DistrictField,
+    NepaliCurrencyField,
+    NepaliDateField,
+    NepaliDateTimeField,
+    NepaliLocalizedSerializerMixin,
+)
+
+
+class Receipt(models.Model):
+    title = models.CharField(max_length=100)
+    issued_on = NepaliDateField()
+    recorded_at = NepaliDateTimeField()
+    amount = NepaliCurrencyField()
+    tax = NepaliCurrencyField()
+    district = DistrictField()
+    note = models.CharField(max_length=100)
+
+    class Meta:
+        app_label = "django_nepkit"
+
+
+class PlainSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Receipt
+        fields = "__all__"
+
+
+class LocalizedSerializer(NepaliLocalizedSerializerMixin, PlainSerializer):
+    class Meta(PlainSerializer.Meta):
+        pass
+
+
+def make_receipts(count):
+    return [
+        Receipt(
+            id=number,
+            title=f"Receipt {number}",
+            issued_on=nepalidate(2081, 1 + number % 12, 1 + number % 28),
+            recorded_at=nepalidatetime(2081, 1 + number % 12, 1, 10, 30),
+            amount=Decimal(number * 1000) / 7,
+            tax=Decimal(number * 13) / 10,
+            district="Kaski",
+            note="",
+        )
+        for number in range(1, count + 1)
+    ]
+
+
+def best_time(serializer_class, receipts, context, repeat):
+    # Untimed run, so one-off setup is not counted
+    len(serializer_class(receipts[:10], many=True, context=context).data)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        len(serializer_class(receipts, many=True, context=context).data)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    cases = (
+        ("ModelSerializer", PlainSerializer, {}),
+        ("mixin", LocalizedSerializer, {}),
+        ("mixin, ne=True", LocalizedSerializer, {"ne": True}),
+    )
+    for rows in args.rows:
+        receipts = make_receipts(rows)
+        print(f"{rows} rows (best of {args.repeat}):")
+        for label, serializer_class, context in cases:
+            seconds = best_time(serializer_class, receipts, context, args.repeat)
+            print(f"  {label:<16} {seconds * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,8 @@ from .models import (
 from .admin import (
     NepaliDateFilter,
     NepaliMonthFilter,
+    NepaliDateHierarchyFilter,
+    NepaliDateRangeListFilter,
     format_nepali_date,
     format_nepali_datetime,
     NepaliModelAdmin,
@@ -37,6 +39,8 @@ __all__ = [
     "MunicipalityField",
     "NepaliDateFilter",
     "NepaliMonthFilter",
+    "NepaliDateHierarchyFilter",
+    "NepaliDateRangeListFilter",
     "format_nepali_date",
     "format_nepali_datetime",
     "NepaliModelAdmin",
@@ -1,13 +1,30 @@
+import re
+from datetime import timedelta
+
+import django
 from django.contrib import admin
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.contrib.admin.sites import all_sites
+from django.contrib.admin.utils import NotRelationField, get_fields_from_path
+from django.core.cache import cache
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
+from django.db.models import Count
+from django.db.models.functions import Substr
+from django.db.models.signals import post_delete, post_save
+from django.http import FileResponse, StreamingHttpResponse
+from django.utils.http import content_disposition_header
 from django.utils.translation import gettext_lazy as _
 from nepali.datetime import nepalidate, nepalidatetime
 
+from django_nepkit.assets import datepicker_media
 from django_nepkit.conf import nepkit_settings
 from django_nepkit.models import (
+    BaseLocationField,
     NepaliDateField,
     NepaliDateTimeField,
     NepaliCurrencyField,
 )
+from django_nepkit.registry import registry
 from django_nepkit.utils import (
     try_parse_nepali_date,
     try_parse_nepali_datetime,
@@ -46,48 +63,223 @@ def format_nepali_date(date_value, format_string="%B %d, %Y", ne=False):
     )
 
 
+def _default_datetime_format():
+    if nepkit_settings.TIME_FORMAT == 24:
+        return "%B %d, %Y %H:%M"
+    return "%B %d, %Y %I:%M %p"
+
+
 def format_nepali_datetime(datetime_value, format_string=None, ne=False):
     """
     Format a nepalidatetime object with Nepali month names.
     """
     if format_string is None:
-        if nepkit_settings.TIME_FORMAT == 24:
-            format_string = "%B %d, %Y %H:%M"
-        else:
-            format_string = "%B %d, %Y %I:%M %p"
+        format_string = _default_datetime_format()
 
     return _format_nepali_common(
         datetime_value, try_parse_nepali_datetime, format_string, ne, nepalidatetime
     )
 
 
+# (Nepali, English) names of the BS months.
+BS_MONTH_NAMES = (
+    ("बैशाख", "Baisakh"),
+    ("जेठ", "Jestha"),
+    ("असार", "Ashad"),
+    ("साउन", "Shrawan"),
+    ("भदौ", "Bhadra"),
+    ("असोज", "Ashwin"),
+    ("कात्तिक", "Kartik"),
+    ("मंसिर", "Mangsir"),
+    ("पुष", "Poush"),
+    ("माघ", "Magh"),
+    ("फागुन", "Falgun"),
+    ("चैत", "Chaitra"),
+)
+
+# Width of each strftime directive in stored BS date strings.
+_DIRECTIVE_WIDTHS = {"Y": 4, "m": 2, "d": 2, "H": 2, "I": 2, "M": 2, "S": 2}
+
+
+def _bs_date_part_position(format_string, directive):
+    """
+    Locate a directive (e.g. 'Y') in date strings stored with a format.
+
+    Returns the 1-based ``(start, length)`` for ``Substr``, or None if the
+    position isn't fixed (the directive is missing or follows one whose
+    width varies).
+    """
+    position = 1
+    i = 0
+    while i < len(format_string):
+        if format_string[i] != "%":
+            position += 1
+            i += 1
+            continue
+        code = format_string[i + 1 : i + 2]
+        if code == directive:
+            return position, _DIRECTIVE_WIDTHS[code]
+        if code not in _DIRECTIVE_WIDTHS:
+            return None
+        position += _DIRECTIVE_WIDTHS[code]
+        i += 2
+    return None
+
+
+def _count_bs_parts(queryset, field_path, expression):
+    """
+    Count rows per value of a part (year, month, day) of stored BS dates.
+
+    One GROUP BY query; empty dates and non-numeric parts are left out.
+    """
+    rows = (
+        queryset.exclude(**{f"{field_path}__isnull": True})
+        .exclude(**{field_path: ""})
+        .annotate(nepkit_bs_part=expression)
+        .order_by()
+        .values("nepkit_bs_part")
+        .annotate(nepkit_count=Count("pk"))
+    )
+    return {
+        row["nepkit_bs_part"]: row["nepkit_count"]
+        for row in rows
+        if row["nepkit_bs_part"] and row["nepkit_bs_part"].isdigit()
+    }
+
+
+# Cache keys of filter options, per model whose changes invalidate them.
+_filter_cache_keys = {}
+
+
+def _invalidate_filter_options(sender, **kwargs):
+    keys = _filter_cache_keys.get(sender)
+    if keys:
+        cache.delete_many(list(keys))
+
+
+def _invalidate_filter_options_on_change(model, key):
+    if model not in _filter_cache_keys:
+        _filter_cache_keys[model] = set()
+        uid = f"django_nepkit.admin_filter.{model._meta.label_lower}"
+        post_save.connect(_invalidate_filter_options, sender=model, dispatch_uid=uid)
+        post_delete.connect(_invalidate_filter_options, sender=model, dispatch_uid=uid)
+    _filter_cache_keys[model].add(key)
+
+
+def _filter_cache_key(model, field_path, suffix):
+    return f"django_nepkit:admin_filter:{model._meta.label_lower}:{field_path}:{suffix}"
+
+
+def _watch_filter(model, field_path, filter_class):
+    """Clear a filter's cached options when its model or field's model changes."""
+    key = _filter_cache_key(model, field_path, filter_class.suffix)
+    _invalidate_filter_options_on_change(model, key)
+    try:
+        field = get_fields_from_path(model, field_path)[-1]
+    except (FieldDoesNotExist, NotRelationField):
+        return
+    _invalidate_filter_options_on_change(field.model, key)
+
+
+def connect_filter_invalidation():
+    """
+    Watch the models of every year/month filter in a registered admin's
+    list_filter.
+
+    Called from AppConfig.ready(), so that saves clear the cached options in
+    every process, not only in those that have rendered the changelist.
+    """
+    for site in all_sites:
+        for model, model_admin in site._registry.items():
+            for item in model_admin.list_filter:
+                if (
+                    isinstance(item, (list, tuple))
+                    and isinstance(item[1], type)
+                    and issubclass(item[1], BaseNepaliDateFilter)
+                ):
+                    _watch_filter(model, item[0], item[1])
+
+
 class BaseNepaliDateFilter(admin.FieldListFilter):
-    """Base class for date filters (Year/Month)."""
+    """
+    Base class for date filters (Year/Month).
+
+    Options are the values present in the data, counted with one GROUP BY
+    over the year or month part of the stored strings. They are cached for
+    NEPKIT["ADMIN_FILTER_CACHE_TIMEOUT"] seconds and cleared when an instance
+    is saved or deleted (bulk updates expire with the timeout). With facets
+    shown, the counts under the other active filters take one more GROUP BY.
+    """
+
+    directive = None
 
     def __init__(self, field, request, params, model, model_admin, field_path):
         self.parameter_name = f"{field_path}_{self.suffix}"
+        self.model = model
         super().__init__(field, request, params, model, model_admin, field_path)
+        format_string = getattr(field, "format_str", BS_DATE_FORMAT)
+        position = _bs_date_part_position(format_string, self.directive)
+        self.part_expression = Substr(field_path, *position) if position else None
 
     def expected_parameters(self):
         return [self.parameter_name]
 
+    def get_value(self):
+        """The selected value; Django 5 passes query parameters as lists."""
+        value = self.used_parameters.get(self.parameter_name)
+        if isinstance(value, list):
+            value = value[-1] if value else None
+        return value
+
     def choices(self, changelist):
+        selected = self.get_value()
+        # Facets (and the filter's `request`) only exist on Django 5.0+.
+        add_facets = (
+            django.VERSION >= (5, 0)
+            and getattr(changelist, "add_facets", False)
+            and self.part_expression is not None
+        )
+        facet_counts = self.get_facet_queryset(changelist) if add_facets else None
         yield {
-            "selected": self.used_parameters.get(self.parameter_name) is None,
+            "selected": selected is None,
             "query_string": changelist.get_query_string(remove=[self.parameter_name]),
             "display": _("All"),
         }
         for value, display in self.get_filter_options():
+            if add_facets:
+                display = f"{display} ({facet_counts.get(str(value), 0)})"
             yield {
-                "selected": self.used_parameters.get(self.parameter_name) == str(value),
+                "selected": selected == str(value),
                 "query_string": changelist.get_query_string(
                     {self.parameter_name: str(value)}
                 ),
                 "display": display,
             }
 
+    def get_facet_queryset(self, changelist):
+        filtered_qs = changelist.get_queryset(
+            self.request, exclude_parameters=self.expected_parameters()
+        )
+        return self.count_values(filtered_qs)
+
+    def count_values(self, queryset):
+        """Count rows per year/month value of the queryset in one query."""
+        return _count_bs_parts(queryset, self.field_path, self.part_expression)
+
+    def get_available_values(self):
+        """``{value: count}`` over all rows of the model, cached."""
+        key = _filter_cache_key(self.model, self.field_path, self.suffix)
+        values = cache.get(key)
+        if values is None:
+            # Filters added outside list_filter (e.g. by get_list_filter) are
+            # not known to connect_filter_invalidation.
+            _watch_filter(self.model, self.field_path, type(self))
+            values = self.count_values(self.model._default_manager.all())
+            cache.set(key, values, nepkit_settings.ADMIN_FILTER_CACHE_TIMEOUT)
+        return values
+
     def queryset(self, request, queryset):
-        value = self.used_parameters.get(self.parameter_name)
+        value = self.get_value()
         if value:
             return self.apply_filter(queryset, value)
         return queryset
@@ -103,11 +295,14 @@ class NepaliDateFilter(BaseNepaliDateFilter):
     """Filter by Nepali Year (e.g., 2080)."""
 
     suffix = "bs_year"
+    directive = "Y"
     title = _("Nepali Date (Year)")
 
     def get_filter_options(self):
-        current_year = nepalidate.today().year
-        return [(y, str(y)) for y in range(current_year - 10, current_year + 2)]
+        if self.part_expression is None:
+            current_year = nepalidate.today().year
+            return [(y, str(y)) for y in range(current_year - 10, current_year + 2)]
+        return [(year, year) for year in sorted(self.get_available_values())]
 
     def apply_filter(self, queryset, value):
         if BS_DATE_FORMAT.startswith("%Y"):
@@ -123,25 +318,22 @@ class NepaliMonthFilter(BaseNepaliDateFilter):
     """Filter by Nepali Month (e.g., Baisakh)."""
 
     suffix = "bs_month"
+    directive = "m"
     title = _("Nepali Date (Month)")
 
+    month_names = BS_MONTH_NAMES
+
     def get_filter_options(self):
         ne = nepkit_settings.DEFAULT_LANGUAGE == "ne"
-        names = [
-            ("बैशाख", "Baisakh"),
-            ("जेठ", "Jestha"),
-            ("असार", "Ashad"),
-            ("साउन", "Shrawan"),
-            ("भदौ", "Bhadra"),
-            ("असोज", "Ashwin"),
-            ("कात्तिक", "Kartik"),
-            ("मंसिर", "Mangsir"),
-            ("पुष", "Poush"),
-            ("माघ", "Magh"),
-            ("फागुन", "Falgun"),
-            ("चैत", "Chaitra"),
+        if self.part_expression is None:
+            months = [f"{i:02d}" for i in range(1, 13)]
+        else:
+            months = sorted(self.get_available_values())
+        return [
+            (month, self.month_names[int(month) - 1][0 if ne else 1])
+            for month in months
+            if 1 <= int(month) <= 12
         ]
-        return [(f"{i:02d}", n[0] if ne else n[1]) for i, n in enumerate(names, 1)]
 
     def apply_filter(self, queryset, value):
         from django_nepkit.utils import BS_DATE_FORMAT
@@ -155,6 +347,296 @@ class NepaliMonthFilter(BaseNepaliDateFilter):
         )
 
 
+def _sortable_bs_separator(field, field_path):
+    """
+    Separator of a field's year-first storage format (e.g. "%Y-%m-%d").
+
+    Only such strings sort like the dates they hold, so that ranges over
+    them are date ranges. Raises ImproperlyConfigured for other formats.
+    """
+    format_string = getattr(field, "format_str", BS_DATE_FORMAT)
+    match = re.match(r"%Y(\W)%m\1%d", format_string)
+    if match is None:
+        raise ImproperlyConfigured(
+            f"Filtering '{field_path}' by BS date ranges needs dates stored "
+            f"year first (e.g. '%Y-%m-%d'), but it uses '{format_string}'."
+        )
+    return match.group(1)
+
+
+class NepaliDateHierarchyFilter(admin.FieldListFilter):
+    """
+    Year -> month -> day drill-down for a Nepali date, like `date_hierarchy`.
+
+    Added by ``NepaliModelAdmin.bs_date_hierarchy``. The selected period is
+    applied as a range over the stored string, which an index on the column
+    can serve, and the buckets of the next level come from one GROUP BY.
+    Requires a year-month-day storage format such as the default "%Y-%m-%d".
+    """
+
+    template = "django_nepkit/admin/bs_date_hierarchy.html"
+    levels = ("year", "month", "day")
+    widths = (4, 2, 2)
+    limits = (9999, 12, 32)
+
+    def __init__(self, field, request, params, model, model_admin, field_path):
+        self.parameter_names = [f"{field_path}__bs_{level}" for level in self.levels]
+        super().__init__(field, request, params, model, model_admin, field_path)
+        self.separator = _sortable_bs_separator(field, field_path)
+        self.ne = getattr(field, "ne", nepkit_settings.DEFAULT_LANGUAGE == "ne")
+        self.selected = self._get_selected()
+
+    def expected_parameters(self):
+        return self.parameter_names
+
+    def _get_selected(self):
+        """The selected (year, month, day) prefix, as integers."""
+        selected = []
+        for name in self.parameter_names:
+            value = self.used_parameters.get(name)
+            if isinstance(value, list):
+                value = value[-1] if value else None
+            if not value:
+                break
+            try:
+                value = int(value)
+            except ValueError as e:
+                raise IncorrectLookupParameters(e)
+            if not 0 < value <= self.limits[len(selected)]:
+                raise IncorrectLookupParameters(f"Invalid BS {name}: {value}.")
+            selected.append(value)
+        return tuple(selected)
+
+    def get_bounds(self, selected):
+        """
+        ``(lower, upper)`` strings enclosing every date in a period.
+
+        ``(2080, 3)`` gives ``("2080-03-", "2080-04-")``; zero padding keeps
+        string order equal to date order.
+        """
+        parts = [f"{v:0{w}d}" for v, w in zip(selected, self.widths)]
+        last = len(selected) - 1
+        upper = parts[:last] + [f"{selected[last] + 1:0{self.widths[last]}d}"]
+        lower, upper = self.separator.join(parts), self.separator.join(upper)
+        if len(selected) < len(self.levels):
+            lower += self.separator
+            upper += self.separator
+        return lower, upper
+
+    def queryset(self, request, queryset):
+        if not self.selected:
+            return queryset
+        lower, upper = self.get_bounds(self.selected)
+        return queryset.filter(
+            **{f"{self.field_path}__gte": lower, f"{self.field_path}__lt": upper}
+        )
+
+    def get_buckets(self, queryset):
+        """``[(value, count)]`` for the level below the selection."""
+        level = len(self.selected)
+        if level == len(self.levels):
+            return []
+        start = 1 + sum(w + len(self.separator) for w in self.widths[:level])
+        expression = Substr(self.field_path, start, self.widths[level])
+        counts = _count_bs_parts(queryset, self.field_path, expression)
+        return sorted(
+            (int(value), count)
+            for value, count in counts.items()
+            if 0 < int(value) <= self.limits[level]
+        )
+
+    def _month_name(self, month):
+        return BS_MONTH_NAMES[month - 1][0 if self.ne else 1]
+
+    def _display(self, selected):
+        """Label of a selected period, e.g. "Ashad 2080"."""
+        if len(selected) == 1:
+            return str(selected[0])
+        if len(selected) == 2:
+            return f"{self._month_name(selected[1])} {selected[0]}"
+        return f"{self._month_name(selected[1])} {selected[2]}, {selected[0]}"
+
+    def _query_string(self, changelist, selected):
+        return changelist.get_query_string(
+            dict(zip(self.parameter_names, map(str, selected))),
+            self.parameter_names[len(selected) :],
+        )
+
+    def choices(self, changelist):
+        add_facets = getattr(changelist, "add_facets", False)
+        yield {
+            "selected": not self.selected,
+            "query_string": self._query_string(changelist, ()),
+            "display": _("All dates"),
+            "back": bool(self.selected),
+        }
+        for depth in range(1, len(self.selected)):
+            yield {
+                "selected": False,
+                "query_string": self._query_string(changelist, self.selected[:depth]),
+                "display": self._display(self.selected[:depth]),
+                "back": True,
+            }
+        if self.selected:
+            yield {
+                "selected": True,
+                "query_string": self._query_string(changelist, self.selected),
+                "display": self._display(self.selected),
+            }
+        level = len(self.selected)
+        for value, count in self.get_buckets(changelist.queryset):
+            display = self._month_name(value) if level == 1 else str(value)
+            yield {
+                "selected": False,
+                "query_string": self._query_string(
+                    changelist, self.selected + (value,)
+                ),
+                "display": f"{display} ({count})" if add_facets else display,
+            }
+
+
+def _month_start(year, month):
+    if month > 12:
+        year, month = year + 1, month - 12
+    elif month < 1:
+        year, month = year - 1, month + 12
+    return nepalidate(year, month, 1)
+
+
+def nepali_date_presets(today):
+    """
+    Named BS periods around a date, as ``{key: (label, first day, last day)}``.
+
+    The fiscal year runs from 1 Shrawan to the end of Ashad.
+    """
+    day = timedelta(days=1)
+    this_month = _month_start(today.year, today.month)
+    fiscal_year = today.year if today.month >= 4 else today.year - 1
+    this_fiscal_year = _month_start(fiscal_year, 4)
+    return {
+        "today": (_("Today"), today, today),
+        "this_month": (
+            _("This month"),
+            this_month,
+            _month_start(today.year, today.month + 1) - day,
+        ),
+        "last_month": (
+            _("Last month"),
+            _month_start(today.year, today.month - 1),
+            this_month - day,
+        ),
+        "this_year": (
+            _("This year"),
+            _month_start(today.year, 1),
+            _month_start(today.year + 1, 1) - day,
+        ),
+        "this_fiscal_year": (
+            _("This fiscal year"),
+            this_fiscal_year,
+            _month_start(fiscal_year + 1, 4) - day,
+        ),
+        "last_fiscal_year": (
+            _("Last fiscal year"),
+            _month_start(fiscal_year - 1, 4),
+            this_fiscal_year - day,
+        ),
+    }
+
+
+class NepaliDateRangeListFilter(admin.FieldListFilter):
+    """
+    From/to filter for a Nepali date in the admin, with presets.
+
+    Both inputs use the Nepali datepicker. They are normalized into the
+    field's storage strings, so the query is a single ``__range`` (or
+    ``__gte``/``__lte`` when one end is open) that an index on the column
+    can serve. Presets such as "This fiscal year" are computed once per
+    request; override ``get_presets`` to change them.
+
+    Example:
+        list_filter = (("paid_on", NepaliDateRangeListFilter),)
+    """
+
+    template = "django_nepkit/admin/bs_date_range_filter.html"
+
+    def __init__(self, field, request, params, model, model_admin, field_path):
+        self.parameter_gte = f"{field_path}__bs_gte"
+        self.parameter_lte = f"{field_path}__bs_lte"
+        super().__init__(field, request, params, model, model_admin, field_path)
+        _sortable_bs_separator(field, field_path)
+        self.input_format = BS_DATE_FORMAT
+        self.ne = getattr(field, "ne", nepkit_settings.DEFAULT_LANGUAGE == "ne")
+        self.value_gte = self._get_value(self.parameter_gte)
+        self.value_lte = self._get_value(self.parameter_lte)
+        self.date_gte = self._parse(self.value_gte)
+        self.date_lte = self._parse(self.value_lte)
+        self.presets = self.get_presets(nepalidate.today())
+
+    def expected_parameters(self):
+        return [self.parameter_gte, self.parameter_lte]
+
+    def get_presets(self, today):
+        return nepali_date_presets(today)
+
+    def _get_value(self, name):
+        value = self.used_parameters.get(name)
+        if isinstance(value, list):
+            value = value[-1] if value else None
+        return value or ""
+
+    def _parse(self, value):
+        if not value:
+            return None
+        parsed = try_parse_nepali_date(value)
+        if parsed is None:
+            raise IncorrectLookupParameters(f"Invalid BS date: '{value}'.")
+        return parsed
+
+    def to_storage(self, date, end=False):
+        """The field's stored string for the start (or end) of a BS day."""
+        if getattr(self.field, "nepali_cls", nepalidate) is nepalidatetime:
+            time = (23, 59, 59) if end else (0, 0, 0)
+            date = nepalidatetime(date.year, date.month, date.day, *time)
+        return self.field.get_prep_value(date)
+
+    def queryset(self, request, queryset):
+        lower = self.date_gte and self.to_storage(self.date_gte)
+        upper = self.date_lte and self.to_storage(self.date_lte, end=True)
+        if lower and upper:
+            return queryset.filter(**{f"{self.field_path}__range": (lower, upper)})
+        if lower:
+            return queryset.filter(**{f"{self.field_path}__gte": lower})
+        if upper:
+            return queryset.filter(**{f"{self.field_path}__lte": upper})
+        return queryset
+
+    def choices(self, changelist):
+        # Other active filters, kept as hidden inputs of the from/to form.
+        self.hidden_params = [
+            (name, value)
+            for name, value in changelist.params.items()
+            if name not in self.expected_parameters()
+        ]
+        yield {
+            "selected": self.date_gte is None and self.date_lte is None,
+            "query_string": changelist.get_query_string(
+                remove=self.expected_parameters()
+            ),
+            "display": _("Any date"),
+        }
+        for label, first, last in self.presets.values():
+            yield {
+                "selected": (self.date_gte, self.date_lte) == (first, last),
+                "query_string": changelist.get_query_string(
+                    {
+                        self.parameter_gte: first.strftime(self.input_format),
+                        self.parameter_lte: last.strftime(self.input_format),
+                    }
+                ),
+                "display": label,
+            }
+
+
 # Standard filter for any NepaliDateField in Admin
 admin.FieldListFilter.register(
     lambda f: isinstance(f, NepaliDateField),
@@ -238,6 +720,59 @@ class NepaliAdminMixin:
         """
         return format_nepali_currency(value, currency_symbol=currency_symbol, ne=ne)
 
+    def format_location_name(self, value, level, ne=True, field_name=None):
+        """
+        Follow a location name with its name in the other language.
+        Available as a method on admin classes using this mixin.
+
+        Args:
+            value: Stored province, district or municipality name
+            level: One of 'province', 'district' or 'municipality'
+            ne: Language of the added name: True for Nepali, False for English
+            field_name: Unused; accepted like the other formatters
+        """
+        translated = registry.translate(level, value, ne=ne)
+        if not translated or translated == value:
+            return value
+        return f"{value} ({translated})"
+
+    # search_fields prefix -> lookup used for location fields
+    location_search_lookups = {
+        "": "location_contains",
+        "^": "location_startswith",
+        "=": "location_exact",
+    }
+
+    def get_search_fields(self, request):
+        """
+        Search location fields through the location registry.
+
+        Entries of ``search_fields`` naming a Province/District/Municipality
+        field are rewritten to a ``location_*`` lookup: each search word is
+        matched against names in both scripts and known aliases, ignoring the
+        Chandrabindu/Anusvara difference, and becomes an ``IN`` over the
+        exact stored values instead of an ``icontains`` scan.
+        """
+        search_fields = super().get_search_fields(request)
+        cache = self.__dict__.setdefault("_location_search_fields_cache", {})
+        key = tuple(search_fields)
+        if key not in cache:
+            cache[key] = tuple(
+                self._location_search_field(str(name)) for name in search_fields
+            )
+        return cache[key]
+
+    def _location_search_field(self, search_field):
+        prefix = search_field[0] if search_field[:1] in ("^", "=") else ""
+        path = search_field[len(prefix) :]
+        try:
+            field = get_fields_from_path(self.model, path)[-1]
+        except (FieldDoesNotExist, NotRelationField):
+            return search_field
+        if not isinstance(field, BaseLocationField) or not field.level:
+            return search_field
+        return f"{path}__{self.location_search_lookups[prefix]}"
+
 
 class NepaliModelAdmin(NepaliAdminMixin, admin.ModelAdmin):
     """
@@ -250,29 +785,59 @@ class NepaliModelAdmin(NepaliAdminMixin, admin.ModelAdmin):
         class MyModelAdmin(NepaliModelAdmin):
             list_display = ("name", "birth_date", "created_at")  # auto-formatted
             list_filter = (("birth_date", NepaliDateFilter),)
+            bs_date_hierarchy = "birth_date"
     """
 
     # Make filters available as class attributes
     NepaliDateFilter = NepaliDateFilter
     NepaliMonthFilter = NepaliMonthFilter
 
-    def _make_nepali_display(self, field_name, formatter_method):
-        """Helper to create display columns for Nepali dates."""
-        admin_instance = self
+    # Name of a NepaliDateField (or NepaliDateTimeField) to drill down by
+    # BS year, month and day, like Django's `date_hierarchy`.
+    bs_date_hierarchy = None
+
+    # The export actions are opt-in: add "export_as_csv" and/or
+    # "export_as_xlsx" to `actions` to enable them. `export_fields` lists the
+    # concrete fields they write (default: those shown on the admin form), and
+    # `export_include_ad` adds an AD column next to each Nepali date.
+    export_fields = None
+    export_include_ad = False
+
+    # Location fields whose list column adds the name in the other language,
+    # e.g. "Kaski (कास्की)", or True for all of them.
+    bilingual_location_fields = ()
+
+    def get_list_filter(self, request):
+        list_filter = super().get_list_filter(request)
+        if self.bs_date_hierarchy:
+            hierarchy = (self.bs_date_hierarchy, NepaliDateHierarchyFilter)
+            list_filter = (hierarchy, *list_filter)
+        return list_filter
+
+    def _make_nepali_display(self, field_name, formatter_method, **format_kwargs):
+        """
+        Helper to create display columns for Nepali dates.
+
+        The field's label and language are resolved here, once, and bound
+        into the column; rendering a cell doesn't look the field up again.
+        """
         try:
             field = self.model._meta.get_field(field_name)
             short_description = getattr(
                 field, "verbose_name", field_name.replace("_", " ").title()
             )
         except Exception:
+            field = None
             short_description = field_name.replace("_", " ").title()
+        format_kwargs.setdefault("ne", getattr(field, "ne", False))
+        get_empty_value_display = self.get_empty_value_display
 
         def display(obj):
             val = getattr(obj, field_name, None)
             if val is None:
-                return admin_instance.get_empty_value_display()
+                return get_empty_value_display()
             # Call the passed formatter method (bound to self)
-            return formatter_method(val, field_name=field_name)
+            return formatter_method(val, field_name=field_name, **format_kwargs)
 
         display.short_description = short_description
         display.admin_order_field = field_name
@@ -282,13 +847,39 @@ class NepaliModelAdmin(NepaliAdminMixin, admin.ModelAdmin):
         return self._make_nepali_display(field_name, self.format_nepali_date)
 
     def _make_nepali_datetime_display(self, field_name):
-        return self._make_nepali_display(field_name, self.format_nepali_datetime)
+        return self._make_nepali_display(
+            field_name,
+            self.format_nepali_datetime,
+            format_string=_default_datetime_format(),
+        )
 
     def _make_nepali_currency_display(self, field_name):
-        return self._make_nepali_display(field_name, self.format_nepali_currency)
+        return self._make_nepali_display(
+            field_name, self.format_nepali_currency, ne=False
+        )
+
+    def _make_location_display(self, field_name):
+        field = self.model._meta.get_field(field_name)
+        return self._make_nepali_display(
+            field_name, self.format_location_name, level=field.level, ne=not field.ne
+        )
 
     def get_list_display(self, request):
+        """
+        Replace Nepali date, datetime and currency fields, and bilingual
+        location fields, with display columns.
+
+        Columns are built once per admin and list_display, and rebuilt when
+        TIME_FORMAT changes, instead of on every changelist request.
+        """
         list_display = super().get_list_display(request)
+        key = (tuple(list_display), nepkit_settings.TIME_FORMAT)
+        cache = self.__dict__.setdefault("_nepali_list_display_cache", {})
+        if key not in cache:
+            cache[key] = tuple(self._build_nepali_list_display(list_display))
+        return list(cache[key])
+
+    def _build_nepali_list_display(self, list_display):
         result = []
         for item in list_display:
             if not isinstance(item, str):
@@ -305,11 +896,20 @@ class NepaliModelAdmin(NepaliAdminMixin, admin.ModelAdmin):
                 if isinstance(field, NepaliCurrencyField):
                     result.append(self._make_nepali_currency_display(item))
                     continue
+                if self._is_bilingual_location(field):
+                    result.append(self._make_location_display(item))
+                    continue
             except Exception:
                 pass
             result.append(item)
         return result
 
+    def _is_bilingual_location(self, field):
+        if not isinstance(field, BaseLocationField) or not field.level:
+            return False
+        fields = self.bilingual_location_fields
+        return fields is True or field.name in fields
+
     def formfield_for_dbfield(self, db_field, request, **kwargs):
         """Automatically use NepaliDatePicker in the admin form."""
         try:
@@ -332,28 +932,84 @@ class NepaliModelAdmin(NepaliAdminMixin, admin.ModelAdmin):
 
         return super().formfield_for_dbfield(db_field, request, **kwargs)
 
-    class Media:
-        """Loads the Nepali Datepicker and bridging scripts."""
+    def get_actions(self, request):
+        from django_nepkit.export import openpyxl
+
+        actions = super().get_actions(request)
+        if openpyxl is None:
+            actions.pop("export_as_xlsx", None)
+        return actions
+
+    def get_export_rows(self, request, queryset):
+        """Header and formatted rows written by the export actions."""
+        from django_nepkit.export import iter_export_rows
+
+        field_names = self.export_fields
+        if field_names is None:
+            # Only export what the admin already shows, so fields hidden with
+            # `fields`/`exclude` do not leak to users with view permission.
+            visible = set(self.get_fields(request))
+            field_names = [
+                field.name
+                for field in self.model._meta.concrete_fields
+                if field.name in visible
+            ]
+        return iter_export_rows(queryset, field_names, self.export_include_ad)
+
+    def _export_filename(self, extension):
+        return f"{self.model._meta.model_name}.{extension}"
+
+    @admin.action(
+        description=_("Export selected %(verbose_name_plural)s to CSV"),
+        permissions=["view"],
+    )
+    def export_as_csv(self, request, queryset):
+        """Stream the selected rows as CSV, formatted like the changelist."""
+        from django_nepkit.export import stream_csv
 
-        css = {
-            "all": (
-                "https://nepalidatepicker.sajanmaharjan.com.np/v5/nepali.datepicker/css/nepali.datepicker.v5.0.6.min.css",
-                "django_nepkit/css/admin-nepali-datepicker.css",
-            )
-        }
-        js = (
-            # Bridge admin's `django.jQuery` -> `window.jQuery`
-            "django_nepkit/js/admin-jquery-bridge.js",
-            # Date picker lib
-            "https://nepalidatepicker.sajanmaharjan.com.np/v5/nepali.datepicker/js/nepali.datepicker.v5.0.6.min.js",
-            # Init
-            "django_nepkit/js/nepali-datepicker-init.js",
+        response = StreamingHttpResponse(
+            stream_csv(self.get_export_rows(request, queryset)),
+            content_type="text/csv; charset=utf-8",
+        )
+        response["Content-Disposition"] = content_disposition_header(
+            True, self._export_filename("csv")
+        )
+        return response
+
+    @admin.action(
+        description=_("Export selected %(verbose_name_plural)s to Excel"),
+        permissions=["view"],
+    )
+    def export_as_xlsx(self, request, queryset):
+        """Build an XLSX file of the selected rows on disk and stream it."""
+        from django_nepkit.export import write_xlsx
+
+        output = write_xlsx(
+            self.get_export_rows(request, queryset),
+            title=str(self.model._meta.verbose_name_plural),
+        )
+        return FileResponse(
+            output,
+            as_attachment=True,
+            filename=self._export_filename("xlsx"),
+            content_type=(
+                "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+            ),
+        )
+
+    @property
+    def media(self):
+        """Adds the Nepali Datepicker and bridging scripts."""
+        return super().media + datepicker_media(
+            loading=nepkit_settings.ASSET_LOADING, admin=True
         )
 
 
 __all__ = [
     "NepaliDateFilter",
     "NepaliMonthFilter",
+    "NepaliDateHierarchyFilter",
+    "NepaliDateRangeListFilter",
     "format_nepali_date",
     "format_nepali_datetime",
     "NepaliAdminMixin",
@@ -0,0 +1,11 @@
+from django.apps import AppConfig, apps
+
+
+class DjangoNepkitConfig(AppConfig):
+    name = "django_nepkit"
+
+    def ready(self):
+        if apps.is_installed("django.contrib.admin"):
+            from django_nepkit.admin import connect_filter_invalidation
+
+            connect_filter_invalidation()
@@ -0,0 +1,185 @@
+"""
+Third-party frontend assets used by the datepicker.
+
+They are loaded from their CDNs (NEPKIT["ASSET_MODE"] = "cdn", the default)
+or from versioned copies under `static/django_nepkit/vendor` ("local").
+Fetch the local copies once with `python manage.py nepkit_vendor_assets`;
+until they exist, local mode falls back to the CDN and a system check warns.
+"""
+
+import base64
+import hashlib
+from functools import lru_cache
+from pathlib import Path
+
+from django import forms
+from django.core import checks
+from django.templatetags.static import static
+from django.utils.html import format_html, format_html_join
+
+from django_nepkit.conf import nepkit_settings
+
+DATEPICKER_VERSION = "5.0.6"
+JQUERY_VERSION = "3.5.1"
+
+# name -> (CDN URL, path of the local copy relative to the static root)
+VENDOR_ASSETS = {
+    "datepicker_css": (
+        "https://nepalidatepicker.sajanmaharjan.com.np/v5/nepali.datepicker/css/"
+        f"nepali.datepicker.v{DATEPICKER_VERSION}.min.css",
+        f"django_nepkit/vendor/nepali-datepicker/{DATEPICKER_VERSION}/"
+        f"nepali.datepicker.v{DATEPICKER_VERSION}.min.css",
+    ),
+    "datepicker_js": (
+        "https://nepalidatepicker.sajanmaharjan.com.np/v5/nepali.datepicker/js/"
+        f"nepali.datepicker.v{DATEPICKER_VERSION}.min.js",
+        f"django_nepkit/vendor/nepali-datepicker/{DATEPICKER_VERSION}/"
+        f"nepali.datepicker.v{DATEPICKER_VERSION}.min.js",
+    ),
+    "jquery": (
+        f"https://code.jquery.com/jquery-{JQUERY_VERSION}.slim.min.js",
+        f"django_nepkit/vendor/jquery/{JQUERY_VERSION}/"
+        f"jquery-{JQUERY_VERSION}.slim.min.js",
+    ),
+}
+
+# name -> Subresource Integrity hash ("sha256-..."/"sha384-...") that a
+# download must match. None marks an asset whose hash is not pinned yet;
+# nepkit_vendor_assets only saves those with --allow-unpinned.
+VENDOR_ASSET_INTEGRITY = {
+    "datepicker_css": None,
+    "datepicker_js": None,
+    "jquery": "sha384-DfXdz2htPH0lsSSs5nCTpuj/zy4C+OGpamoFVy38MVBnE+IbbVYUew+OrCXaRkfj",
+}
+
+ASSET_MODES = ("local", "cdn")
+LOADING_MODES = (None, "defer", "async")
+
+
+class Script:
+    """
+    A script for `forms.Media` that renders extra attributes such as `defer`.
+
+    Equal scripts are merged by `Media` like plain paths.
+    """
+
+    def __init__(self, src, **attributes):
+        self.src = src
+        self.attributes = attributes
+
+    def __eq__(self, other):
+        if isinstance(other, Script):
+            return (self.src, self.attributes) == (other.src, other.attributes)
+        return self.src == other and not self.attributes
+
+    def __hash__(self):
+        return hash(self.src)
+
+    def __html__(self):
+        src = self.src
+        if not src.startswith(("http://", "https://", "/")):
+            src = static(src)
+        attributes = format_html_join(
+            "",
+            " {}",
+            ((name,) for name, value in sorted(self.attributes.items()) if value),
+        )
+        return format_html('<script src="{}"{}></script>', src, attributes)
+
+    def __str__(self):
+        return self.__html__()
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.src!r}, **{self.attributes!r})"
+
+
+@lru_cache(maxsize=None)
+def local_asset_exists(path):
+    """Whether a static file can be found locally."""
+    from django.apps import apps
+
+    if apps.is_installed("django.contrib.staticfiles"):
+        from django.contrib.staticfiles import finders
+
+        if finders.find(path):
+            return True
+    return (Path(__file__).resolve().parent / "static" / path).is_file()
+
+
+def integrity_of(content, algorithm="sha384"):
+    """Subresource Integrity string of some bytes, e.g. ``"sha384-..."``."""
+    digest = hashlib.new(algorithm, content).digest()
+    return f"{algorithm}-{base64.b64encode(digest).decode('ascii')}"
+
+
+def asset_path(name):
+    """Local static path or CDN URL of a vendored asset, per ASSET_MODE."""
+    cdn_url, local_path = VENDOR_ASSETS[name]
+    if nepkit_settings.ASSET_MODE == "local" and local_asset_exists(local_path):
+        return local_path
+    return cdn_url
+
+
+def script(path, loading=None):
+    """A `forms.Media` js entry, deferred or async when requested."""
+    if loading is None:
+        return path
+    return Script(path, **{loading: True})
+
+
+def datepicker_media(loading=None, admin=False):
+    """
+    Media for the Nepali datepicker.
+
+    Args:
+        loading: None, 'defer' or 'async' for the script tags
+        admin: Use the admin's jQuery bridge and dark-mode styles instead of
+               loading jQuery separately
+    """
+    css = [asset_path("datepicker_css")]
+    if admin:
+        css.append("django_nepkit/css/admin-nepali-datepicker.css")
+        js = ["django_nepkit/js/admin-jquery-bridge.js"]
+    else:
+        js = [asset_path("jquery")]
+    js += [asset_path("datepicker_js"), "django_nepkit/js/nepali-datepicker-init.js"]
+    return forms.Media(
+        css={"all": css},
+        js=[script(path, loading) for path in js],
+    )
+
+
+@checks.register(checks.Tags.staticfiles)
+def check_asset_settings(app_configs=None, **kwargs):
+    errors = []
+    if nepkit_settings.ASSET_MODE not in ASSET_MODES:
+        errors.append(
+            checks.Error(
+                f"NEPKIT['ASSET_MODE'] must be one of {ASSET_MODES!r}.",
+                id="django_nepkit.E002",
+            )
+        )
+    elif nepkit_settings.ASSET_MODE == "local":
+        missing = [
+            local_path
+            for _cdn_url, local_path in VENDOR_ASSETS.values()
+            if not local_asset_exists(local_path)
+        ]
+        if missing:
+            errors.append(
+                checks.Warning(
+                    "Local datepicker assets are missing, so they are loaded "
+                    f"from their CDNs: {', '.join(missing)}.",
+                    hint="Run `python manage.py nepkit_vendor_assets`, or set "
+                    "NEPKIT['ASSET_MODE'] = 'cdn' to silence this warning.",
+                    id="django_nepkit.W001",
+                )
+            )
+    if nepkit_settings.ASSET_LOADING not in LOADING_MODES:
+        errors.append(
+            checks.Error(
+                f"NEPKIT['ASSET_LOADING'] must be one of {LOADING_MODES!r}.",
+                id="django_nepkit.E003",
+            )
+        )
+    return errors
@@ -0,0 +1,101 @@
+"""
+Helpers for precompressing response bodies and static files.
+
+Brotli is optional: install `django-nepkit[brotli]` to enable it. Without it
+only gzip is produced and negotiated.
+"""
+
+import gzip
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:  # Brotli support is optional
+    brotli = None
+
+# Preferred first when a client accepts several encodings.
+ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+# File suffix of the precompressed sibling for each encoding.
+SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    """Compress bytes at maximum level for a supported content encoding."""
+    if encoding == "gzip":
+        # mtime=0 keeps the output, and therefore ETags, reproducible.
+        return gzip.compress(data, compresslevel=9, mtime=0)
+    if encoding == "br" and brotli is not None:
+        return brotli.compress(data, quality=11)
+    raise ValueError(f"Unsupported content encoding '{encoding}'.")
+
+
+def accepted_encodings(header: str) -> set[str]:
+    """Parse an Accept-Encoding header into the set of acceptable codings."""
+    accepted = set()
+    for part in (header or "").split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = params.strip().replace(" ", "")
+        if quality in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        accepted.add(coding)
+    if "*" in accepted:
+        accepted.update(ENCODINGS)
+    return accepted
+
+
+def negotiate_encoding(request) -> str | None:
+    """Pick the best precompressed encoding a request accepts, if any."""
+    accepted = accepted_encodings(request.headers.get("Accept-Encoding", ""))
+    for encoding in ENCODINGS:
+        if encoding in accepted:
+            return encoding
+    return None
+
+
+# Text assets worth compressing; images and fonts are already compressed.
+COMPRESSIBLE_EXTENSIONS = (".js", ".css", ".json", ".svg", ".html", ".txt", ".map")
+
+# Files smaller than this gain nothing from compression.
+MIN_COMPRESS_SIZE = 256
+
+
+def precompress_file(path) -> list:
+    """
+    Write ``.gz`` (and ``.br``) siblings of a file at maximum compression.
+
+    Siblings that are up to date are left alone, and a variant that would not
+    be smaller than the original is not written. Returns the paths written.
+    """
+    path = Path(path)
+    stat = path.stat()
+    if stat.st_size < MIN_COMPRESS_SIZE:
+        return []
+
+    written = []
+    data = None
+    for encoding in ENCODINGS:
+        target = path.with_name(path.name + SUFFIXES[encoding])
+        if target.exists() and target.stat().st_mtime >= stat.st_mtime:
+            continue
+        if data is None:
+            data = path.read_bytes()
+        compressed = compress(data, encoding)
+        if len(compressed) >= len(data):
+            target.unlink(missing_ok=True)
+            continue
+        target.write_bytes(compressed)
+        written.append(target)
+    return written
+
+
+def precompress_directory(root, extensions=COMPRESSIBLE_EXTENSIONS) -> list:
+    """Precompress every compressible file below a directory."""
+    written = []
+    for path in sorted(Path(root).rglob("*")):
+        if path.is_file() and path.suffix in extensions:
+            written.extend(precompress_file(path))
+    return written
@@ -7,6 +7,12 @@ DEFAULTS = {
     "TIME_FORMAT": 12,
     "BS_DATE_FORMAT": "%Y-%m-%d",
     "BS_DATETIME_FORMAT": "%Y-%m-%d %H:%M:%S",
+    "GEODATA_PATH": None,
+    "LOCATION_CACHE_MAX_AGE": 86400,
+    "ASYNC_VIEWS": None,
+    "ASSET_MODE": "cdn",
+    "ASSET_LOADING": None,
+    "ADMIN_FILTER_CACHE_TIMEOUT": 300,
 }
 
 
@@ -127,3 +127,73 @@ PLACEHOLDERS = {
 
 # Internal parameters to exclude from fallback logic
 INTERNAL_PARAMS = ["ne", "en", "html"]
+
+# Static directory (relative to STATIC_URL) of the generated location data
+LOCATION_DATA_DIR = "django_nepkit/js/data"
+LOCATION_DATA_MANIFEST = "manifest.json"
+
+# Maximum number of parents a single batch location request may ask for
+LOCATION_BATCH_MAX_PARENTS = 100
+
+# Largest radius (km) accepted by the reverse geocoding endpoint
+GEO_MAX_RADIUS_KM = 500
+
+# Official province numbers, used as their storage codes
+PROVINCE_CODES = {
+    "Koshi Province": 1,
+    "Madhesh Province": 2,
+    "Bagmati Province": 3,
+    "Gandaki Province": 4,
+    "Lumbini Province": 5,
+    "Karnali Province": 6,
+    "Sudurpaschim Province": 7,
+}
+
+# Alternative spellings and former names accepted by location search
+LOCATION_ALIASES = {
+    "province": {
+        "Koshi Province": ["Province 1", "Province No. 1"],
+        "Madhesh Province": ["Province 2", "Province No. 2"],
+        "Bagmati Province": ["Province 3", "Province No. 3"],
+        "Gandaki Province": ["Province 4", "Province No. 4"],
+        "Lumbini Province": ["Province 5", "Province No. 5"],
+        "Karnali Province": ["Province 6", "Province No. 6"],
+        "Sudurpaschim Province": ["Province 7", "Province No. 7", "Far-Western"],
+    },
+    "district": {
+        "Bhaktapur": ["Bhadgaon"],
+        "Chitawan": ["Chitwan"],
+        "Dhanusa": ["Dhanusha"],
+        "Kapilvastu": ["Kapilbastu"],
+        "Kavrepalanchok": ["Kavre", "Kabhrepalanchok"],
+        "Lalitpur": ["Patan"],
+        "Makwanpur": ["Makawanpur"],
+        "Nawalparasi East": ["Nawalpur"],
+        "Nawalparasi West": ["Parasi"],
+        "Sindhupalchok": ["Sindhupalchowk"],
+        "Tanahu": ["Tanahun"],
+        "Tehrathum": ["Terhathum"],
+    },
+    "municipality": {
+        "Birgunj Metropolitan City": ["Birganj"],
+        "Janakpur Sub-Metropolitan City": ["Janakpurdham"],
+        "Kathmandu Metropolitan City": ["KMC"],
+        "Lalitpur Metropolitan City": ["Patan"],
+    },
+}
+
+# Generic words that are not indexed on their own by location search
+LOCATION_SEARCH_STOP_WORDS = {
+    "city",
+    "metropolitan",
+    "municipality",
+    "province",
+    "rural",
+    "sub-metropolitan",
+    "गाउँपालिका",
+    "गाउंपालिका",
+    "नगरपालिका",
+    "प्रदेश",
+    "महानगरपालिका",
+    "उपमहानगरपालिका",
+}
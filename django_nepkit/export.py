@@ -0,0 +1,160 @@
+"""
+Streaming export of querysets to CSV and XLSX with BS formatting.
+
+Rows are read with ``values_list(...).iterator()`` and formatted a batch at a
+time with one formatter per column, resolved up front. Memory stays bounded
+by the batch size however many rows are exported.
+
+XLSX is optional: install `django-nepkit[xlsx]` (openpyxl) to enable it.
+"""
+
+import csv
+import tempfile
+from decimal import Decimal
+from itertools import islice
+
+from nepali.datetime import nepalidate, nepalidatetime
+
+from django_nepkit.admin import format_nepali_date, format_nepali_datetime
+from django_nepkit.models import (
+    NepaliCurrencyField,
+    NepaliDateField,
+    NepaliDateTimeField,
+)
+from django_nepkit.utils import format_nepali_currency
+
+try:
+    import openpyxl
+except ImportError:  # XLSX export is optional
+    openpyxl = None
+
+# Rows fetched from the database and formatted together.
+EXPORT_BATCH_SIZE = 2000
+
+
+def _batches(iterable, size):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _format_plain(value):
+    if value is None:
+        return ""
+    if isinstance(value, (str, int, float, Decimal)):
+        return value
+    return str(value)
+
+
+def _format_ad(value):
+    if isinstance(value, nepalidatetime):
+        # Same wall-clock time as the BS column, without the +05:45 offset
+        return value.to_datetime().replace(tzinfo=None).isoformat(sep=" ")
+    if isinstance(value, nepalidate):
+        return value.to_date().isoformat()
+    return ""
+
+
+def export_columns(model, field_names=None, include_ad=False):
+    """
+    Resolve the columns of an export.
+
+    Args:
+        model: Model class being exported
+        field_names: Concrete field names, in order (default: all of them)
+        include_ad: Add an AD column after each Nepali date/datetime column
+
+    Returns:
+        List of ``(header, attname, formatter)`` tuples
+    """
+    opts = model._meta
+    if field_names is None:
+        fields = list(opts.concrete_fields)
+    else:
+        fields = [opts.get_field(name) for name in field_names]
+
+    columns = []
+    for field in fields:
+        header = str(field.verbose_name)
+        ne = getattr(field, "ne", False)
+        if isinstance(field, (NepaliDateField, NepaliDateTimeField)):
+            formatter = (
+                format_nepali_datetime
+                if isinstance(field, NepaliDateTimeField)
+                else format_nepali_date
+            )
+
+            def format_bs(value, formatter=formatter, fmt=field.format_str, ne=ne):
+                return formatter(value, fmt, ne=ne)
+
+            if include_ad:
+                columns.append((f"{header} (BS)", field.attname, format_bs))
+                columns.append((f"{header} (AD)", field.attname, _format_ad))
+            else:
+                columns.append((header, field.attname, format_bs))
+        elif isinstance(field, NepaliCurrencyField):
+
+            def format_currency(value, ne=ne):
+                return format_nepali_currency(value, currency_symbol="", ne=ne)
+
+            columns.append((header, field.attname, format_currency))
+        else:
+            columns.append((header, field.attname, _format_plain))
+    return columns
+
+
+def iter_export_rows(queryset, field_names=None, include_ad=False):
+    """Yield the header and then each row of a queryset, formatted."""
+    columns = export_columns(queryset.model, field_names, include_ad)
+    yield [header for header, _attname, _formatter in columns]
+
+    attnames = list(dict.fromkeys(attname for _header, attname, _f in columns))
+    positions = [attnames.index(attname) for _header, attname, _f in columns]
+    rows = queryset.values_list(*attnames).iterator(chunk_size=EXPORT_BATCH_SIZE)
+    for batch in _batches(rows, EXPORT_BATCH_SIZE):
+        formatted = [
+            [formatter(row[position]) for row in batch]
+            for position, (_header, _attname, formatter) in zip(positions, columns)
+        ]
+        yield from zip(*formatted)
+
+
+class _Echo:
+    """File-like object whose write() returns what it was given."""
+
+    def write(self, value):
+        return value
+
+
+def stream_csv(rows):
+    """
+    Yield CSV lines for rows, starting with a UTF-8 BOM.
+
+    The BOM lets spreadsheet applications detect UTF-8, so Devanagari text
+    opens correctly.
+    """
+    writer = csv.writer(_Echo())
+    yield "\ufeff"
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def write_xlsx(rows, title=None):
+    """
+    Write rows to a temporary XLSX file and return it, rewound.
+
+    The workbook is built in openpyxl's write-only mode, which streams rows to
+    disk instead of keeping them in memory. The file is deleted when closed.
+    """
+    if openpyxl is None:
+        raise ImportError(
+            "XLSX export is optional. Install with `django-nepkit[xlsx]`."
+        )
+    workbook = openpyxl.Workbook(write_only=True)
+    sheet = workbook.create_sheet(title=title[:31] if title else None)
+    for row in rows:
+        sheet.append(row)
+    output = tempfile.TemporaryFile()
+    workbook.save(output)
+    output.seek(0)
+    return output
@@ -0,0 +1,59 @@
+"""
+Database expressions for location fields.
+"""
+
+from django.db.models import Case, CharField, F, Value, When
+from django.db.models.lookups import Exact
+
+from django_nepkit.registry import registry
+
+
+class LocationTranslation(Case):
+    """
+    A location's name in the other language, computed by the database.
+
+    The ``CASE`` is generated from the registry, one ``WHEN`` per location at
+    the field's level, so exports and ``values()`` queries get both languages
+    without a second column:
+
+        Person.objects.annotate(province_ne=LocationTranslation("province"))
+
+    Args:
+        field_path: Location field to translate, e.g. ``"address__district"``
+        ne: True for Nepali names, False for English ones. By default, the
+            language the field does not use.
+
+    Unknown stored values translate to NULL.
+    """
+
+    def __init__(self, field_path, ne=None):
+        super().__init__(output_field=CharField())
+        self.field_path = field_path
+        self.ne = ne
+
+    def resolve_expression(
+        self, query=None, allow_joins=True, reuse=None, summarize=False, for_save=False
+    ):
+        column = F(self.field_path).resolve_expression(
+            query, allow_joins, reuse, summarize, for_save
+        )
+        field = column.output_field
+        if not getattr(field, "level", None):
+            raise ValueError(
+                f"'{self.field_path}' is not a province, district or "
+                "municipality field."
+            )
+        ne = not field.ne if self.ne is None else bool(self.ne)
+        if not field.code and field.ne == ne:
+            # Already stored in the requested language.
+            return column
+
+        translations = registry.translations(field.level, ne, code=field.code)
+        case = Case(
+            *[
+                When(Exact(column, stored), then=Value(name))
+                for stored, name in translations.items()
+            ],
+            output_field=CharField(),
+        )
+        return case.resolve_expression(query, allow_joins, reuse, summarize, for_save)
@@ -0,0 +1,247 @@
+"""
+Offline reverse geocoding for Nepali locations.
+
+Coordinates come from a compact CSV dataset, configured with
+``NEPKIT["GEODATA_PATH"]``. Each row holds a centroid and a bounding box:
+
+    level,name,parent,lat,lon,south,west,north,east
+    municipality,Pokhara Metropolitan City,Kaski,28.2096,83.9856,28.09,83.83,28.37,84.12
+
+``parent`` is the district for municipalities and may be left empty for
+provinces and districts. Names may be English or Nepali.
+
+No dataset ships with django-nepkit, so ``GEODATA_PATH`` is required: until it
+is set, every lookup returns None or an empty list.
+
+Lookups go through a uniform grid so a query only inspects the few cells
+around the point instead of every location.
+"""
+
+from __future__ import annotations
+
+import csv
+import math
+from functools import lru_cache
+from typing import Optional
+
+from django_nepkit.conf import nepkit_settings
+from django_nepkit.registry import LEVELS, registry
+
+EARTH_RADIUS_KM = 6371.0088
+
+# Roughly 28 km at Nepal's latitude, so a municipality spans only a few cells.
+DEFAULT_CELL_SIZE = 0.25
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    """Great-circle distance between two points in kilometres."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = (
+        math.sin(d_phi / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+class GeoEntry:
+    """Centroid and bounding box of a single location."""
+
+    __slots__ = ("level", "location", "lat", "lon", "bbox")
+
+    def __init__(self, level, location, lat, lon, bbox):
+        self.level = level
+        self.location = location
+        self.lat = lat
+        self.lon = lon
+        # (south, west, north, east)
+        self.bbox = bbox
+
+    def contains(self, lat, lon):
+        south, west, north, east = self.bbox
+        return south <= lat <= north and west <= lon <= east
+
+
+class GeoIndex:
+    """Grid spatial index over location centroids and bounding boxes."""
+
+    def __init__(self, entries, cell_size=DEFAULT_CELL_SIZE):
+        self.cell_size = cell_size
+        self.entries = {level: [] for level in LEVELS}
+        self._by_location = {}
+        # level -> cell -> entries whose centroid falls in the cell
+        self._centroids = {level: {} for level in LEVELS}
+        # level -> cell -> entries whose bounding box overlaps the cell
+        self._boxes = {level: {} for level in LEVELS}
+
+        for entry in entries:
+            self.entries[entry.level].append(entry)
+            self._by_location[entry.location] = entry
+            self._centroids[entry.level].setdefault(
+                self._cell(entry.lat, entry.lon), []
+            ).append(entry)
+
+            south, west, north, east = entry.bbox
+            row_min, col_min = self._cell(south, west)
+            row_max, col_max = self._cell(north, east)
+            for row in range(row_min, row_max + 1):
+                for col in range(col_min, col_max + 1):
+                    self._boxes[entry.level].setdefault((row, col), []).append(entry)
+
+        # level -> (row_min, row_max, col_min, col_max) of its centroid cells
+        self._extents = {}
+        for level, cells in self._centroids.items():
+            if cells:
+                rows = [row for row, _col in cells]
+                cols = [col for _row, col in cells]
+                self._extents[level] = (min(rows), max(rows), min(cols), max(cols))
+
+    @classmethod
+    def from_csv(cls, path, cell_size=DEFAULT_CELL_SIZE):
+        """Build an index from a CSV dataset; rows naming unknown places are skipped."""
+        entries = []
+        with open(path, newline="", encoding="utf-8") as fh:
+            for row in csv.DictReader(fh):
+                level = row["level"].strip()
+                if level not in LEVELS:
+                    continue
+                parent = (row.get("parent") or "").strip() or None
+                location = registry.get(
+                    level,
+                    row["name"].strip(),
+                    parent=parent if level == "municipality" else None,
+                )
+                if location is None:
+                    continue
+                entries.append(
+                    GeoEntry(
+                        level,
+                        location,
+                        float(row["lat"]),
+                        float(row["lon"]),
+                        tuple(
+                            float(row[key])
+                            for key in ("south", "west", "north", "east")
+                        ),
+                    )
+                )
+        return cls(entries, cell_size=cell_size)
+
+    def _cell(self, lat, lon):
+        return (
+            math.floor(lat / self.cell_size),
+            math.floor(lon / self.cell_size),
+        )
+
+    def get(self, location):
+        """Return the GeoEntry for a location object, or None."""
+        return self._by_location.get(location)
+
+    def locate(self, lat, lon, level="municipality"):
+        """
+        Find the location containing a point.
+
+        Bounding boxes can overlap, so the candidate with the closest
+        centroid wins.
+        """
+        candidates = [
+            entry
+            for entry in self._boxes[level].get(self._cell(lat, lon), ())
+            if entry.contains(lat, lon)
+        ]
+        if not candidates:
+            return None
+        return min(
+            candidates,
+            key=lambda e: (e.lat - lat) ** 2 + (e.lon - lon) ** 2,
+        )
+
+    def nearest(self, lat, lon, n=5, level="municipality"):
+        """
+        Return up to ``n`` ``(entry, distance_km)`` pairs ordered by distance.
+
+        Searches rings of grid cells outward from the point and stops once
+        the next ring cannot hold anything closer than the results so far.
+        """
+        cells = self._centroids[level]
+        total = len(self.entries[level])
+        if n <= 0 or not total:
+            return []
+
+        row, col = self._cell(lat, lon)
+        # One ring is at least this far away (latitude degrees shrink least).
+        ring_km = self.cell_size * 111.0 * math.cos(math.radians(min(abs(lat), 89)))
+        found = []
+        seen = 0
+        radius = 0
+        while seen < total:
+            for cell in self._ring(row, col, radius):
+                for entry in cells.get(cell, ()):
+                    found.append((entry, haversine_km(lat, lon, entry.lat, entry.lon)))
+                    seen += 1
+            if len(found) >= n:
+                found.sort(key=lambda pair: pair[1])
+                if found[n - 1][1] <= radius * ring_km:
+                    break
+            radius += 1
+
+        found.sort(key=lambda pair: pair[1])
+        return found[:n]
+
+    def within_radius(self, lat, lon, radius_km, level="municipality"):
+        """
+        Return ``(entry, distance_km)`` pairs within ``radius_km``, nearest first.
+
+        Only grid cells inside both the search box and the extent of the data
+        are visited, so a huge radius costs no more than a full scan.
+        """
+        cells = self._centroids[level]
+        extent = self._extents.get(level)
+        if extent is None or not radius_km >= 0:
+            return []
+        row_min, row_max, col_min, col_max = extent
+        if math.isfinite(radius_km):
+            d_lat = radius_km / 111.0
+            d_lon = radius_km / (111.0 * max(math.cos(math.radians(lat)), 1e-6))
+            if math.isfinite(d_lat + d_lon) and max(d_lat, d_lon) < 360:
+                low_row, low_col = self._cell(lat - d_lat, lon - d_lon)
+                high_row, high_col = self._cell(lat + d_lat, lon + d_lon)
+                row_min, row_max = max(row_min, low_row), min(row_max, high_row)
+                col_min, col_max = max(col_min, low_col), min(col_max, high_col)
+
+        found = []
+        for row in range(row_min, row_max + 1):
+            for col in range(col_min, col_max + 1):
+                for entry in cells.get((row, col), ()):
+                    distance = haversine_km(lat, lon, entry.lat, entry.lon)
+                    if distance <= radius_km:
+                        found.append((entry, distance))
+        found.sort(key=lambda pair: pair[1])
+        return found
+
+    @staticmethod
+    def _ring(row, col, radius):
+        if radius == 0:
+            yield (row, col)
+            return
+        for c in range(col - radius, col + radius + 1):
+            yield (row - radius, c)
+            yield (row + radius, c)
+        for r in range(row - radius + 1, row + radius):
+            yield (r, col - radius)
+            yield (r, col + radius)
+
+
+@lru_cache(maxsize=1)
+def get_geo_index() -> Optional[GeoIndex]:
+    """Load the configured dataset once; returns None if none is configured."""
+    path = nepkit_settings.GEODATA_PATH
+    if not path:
+        return None
+    return GeoIndex.from_csv(path)
+
+
+def is_geo_index_loaded() -> bool:
+    """Whether get_geo_index() has already run, so calling it does no file I/O."""
+    return get_geo_index.cache_info().currsize > 0
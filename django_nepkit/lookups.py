@@ -0,0 +1,81 @@
+"""
+Lookups for location fields.
+
+Fields stored as integer codes (``code=True``) keep accepting names, e.g.
+``filter(district="Kaski")`` or ``filter(municipality__icontains="pokhara")``,
+by resolving the names to codes in Python and issuing a single ``IN`` over the
+indexed code column.
+
+The ``location_*`` lookups do the same for text typed by people, as in admin
+search: ``filter(district__location_contains="kabhre")`` matches names in
+both scripts and known aliases, and queries the exact stored values.
+"""
+
+from django.core.exceptions import EmptyResultSet
+from django.db.models import Field, Lookup
+from django.db.models.lookups import In
+
+from django_nepkit.registry import registry
+
+
+class LocationCodeLookup(Lookup):
+    """Resolve a name-based right-hand side into matching location codes."""
+
+    prepare_rhs = False
+
+    def as_sql(self, compiler, connection):
+        field = self.lhs.output_field
+        if hasattr(self.rhs, "resolve_expression"):
+            # Subqueries and expressions already yield codes; compare directly.
+            lookup = Field.get_lookup(field, self.lookup_name)
+            return lookup(self.lhs, self.rhs).as_sql(compiler, connection)
+
+        codes = registry.codes_matching(field.level, self.lookup_name, self.rhs)
+        if not codes:
+            raise EmptyResultSet
+        return In(self.lhs, sorted(codes)).as_sql(compiler, connection)
+
+
+LOCATION_CODE_LOOKUPS = {
+    name: type(
+        f"LocationCode{name.title()}Lookup",
+        (LocationCodeLookup,),
+        {"lookup_name": name},
+    )
+    for name in (
+        "exact",
+        "iexact",
+        "in",
+        "contains",
+        "icontains",
+        "startswith",
+        "istartswith",
+        "endswith",
+        "iendswith",
+    )
+}
+
+
+class LocationSearchLookup(Lookup):
+    """Resolve free text through the registry into the exact stored values."""
+
+    prepare_rhs = False
+    match_mode = None
+
+    def as_sql(self, compiler, connection):
+        field = self.lhs.output_field
+        locations = registry.match(field.level, str(self.rhs), self.match_mode)
+        values = registry.stored_values(locations, code=field.code)
+        if not values:
+            raise EmptyResultSet
+        return In(self.lhs, sorted(values)).as_sql(compiler, connection)
+
+
+LOCATION_SEARCH_LOOKUPS = {
+    f"location_{mode}": type(
+        f"Location{mode.title()}SearchLookup",
+        (LocationSearchLookup,),
+        {"lookup_name": f"location_{mode}", "match_mode": mode},
+    )
+    for mode in ("exact", "startswith", "contains")
+}
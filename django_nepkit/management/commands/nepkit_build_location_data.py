@@ -0,0 +1,182 @@
+"""
+Generate the client-side location data used by the chained select widgets.
+
+One file is written per language, under a content-hashed name so it can be
+cached forever, plus a manifest.json that widgets use to find them.
+
+Example:
+    python manage.py nepkit_build_location_data
+    python manage.py nepkit_build_location_data --chunks
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+
+from django_nepkit.constants import LOCATION_DATA_DIR, LOCATION_DATA_MANIFEST
+from django_nepkit.registry import registry
+
+LANGUAGES = ("en", "ne")
+
+# Finds the directory holding the running script, so chunk URLs can be
+# resolved relative to it whatever STATIC_URL is.
+_BASE_URL_JS = (
+    "(document.currentScript && document.currentScript.src || '').replace(/[^/]*$/, '')"
+)
+
+
+def _name(item, ne):
+    return item.name_nepali if ne else item.name
+
+
+def _options(items, ne):
+    return [{"id": _name(item, ne), "text": _name(item, ne)} for item in items]
+
+
+def build_language_data(lang, chunks=False):
+    """
+    Build the data for one language.
+
+    Returns ``(data, chunk_data)``. With ``chunks``, municipalities are moved
+    out of ``data`` into one mapping per province code in ``chunk_data``.
+    """
+    ne = lang == "ne"
+    provinces = registry.sources["province"]
+    data = {
+        "version": registry.dataset_version,
+        "provinces": _options(provinces, ne),
+        "districts": {},
+        "municipalities": {},
+    }
+    chunk_data = {}
+    for province in provinces:
+        data["districts"][_name(province, ne)] = _options(province.districts, ne)
+        municipalities = {
+            _name(district, ne): _options(district.municipalities, ne)
+            for district in province.districts
+        }
+        if chunks:
+            chunk_data[registry.code(province)] = municipalities
+        else:
+            data["municipalities"].update(municipalities)
+    return data, chunk_data
+
+
+def _dump(data):
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def _hashed_name(stem, content):
+    digest = hashlib.sha256(content.encode("utf-8")).hexdigest()[:12]
+    return f"{stem}.{digest}.js"
+
+
+def render_language_file(lang, data, chunk_names=None):
+    """JavaScript that installs one language into ``window.NEPKIT_DATA``."""
+    lines = [
+        "window.NEPKIT_DATA = window.NEPKIT_DATA || {};",
+        f"window.NEPKIT_DATA.{lang} = {_dump(data)};",
+    ]
+    if chunk_names:
+        lines.append(
+            f"(function(base) {{ window.NEPKIT_DATA.{lang}.chunks = "
+            f"Object.fromEntries(Object.entries({_dump(chunk_names)})"
+            f".map(function(e) {{ return [e[0], base + e[1]]; }})); }})"
+            f"({_BASE_URL_JS});"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def render_chunk_file(lang, municipalities):
+    """JavaScript that merges one province's municipalities into the data."""
+    return (
+        f"Object.assign(window.NEPKIT_DATA.{lang}.municipalities, "
+        f"{_dump(municipalities)});\n"
+    )
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate content-hashed, per-language location data files for the "
+        "chained select widgets, plus a manifest."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output-dir",
+            help=(
+                "Directory to write to (default: the package's "
+                f"static/{LOCATION_DATA_DIR})."
+            ),
+        )
+        parser.add_argument(
+            "--chunks",
+            action="store_true",
+            help="Split municipalities into per-province files loaded on demand.",
+        )
+        parser.add_argument(
+            "--keep-old",
+            action="store_true",
+            help="Keep previously generated files instead of deleting them.",
+        )
+
+    def handle(self, *args, **options):
+        if options["output_dir"]:
+            output_dir = Path(options["output_dir"])
+        else:
+            output_dir = Path(__file__).resolve().parents[2] / "static"
+            output_dir = output_dir / LOCATION_DATA_DIR
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        manifest = {
+            "version": registry.dataset_version,
+            "files": {},
+            "chunks": {},
+        }
+        written = []
+        for lang in LANGUAGES:
+            data, chunk_data = build_language_data(lang, chunks=options["chunks"])
+
+            chunk_names = {}
+            for code, municipalities in chunk_data.items():
+                content = render_chunk_file(lang, municipalities)
+                filename = _hashed_name(f"nepal-data.{lang}.p{code}", content)
+                (output_dir / filename).write_text(content, encoding="utf-8")
+                written.append(filename)
+                province = registry.get_by_code("province", code)
+                chunk_names[_name(province, lang == "ne")] = filename
+            if chunk_names:
+                manifest["chunks"][lang] = {
+                    name: f"{LOCATION_DATA_DIR}/{filename}"
+                    for name, filename in chunk_names.items()
+                }
+
+            content = render_language_file(lang, data, chunk_names)
+            filename = _hashed_name(f"nepal-data.{lang}", content)
+            (output_dir / filename).write_text(content, encoding="utf-8")
+            written.append(filename)
+            manifest["files"][lang] = f"{LOCATION_DATA_DIR}/{filename}"
+
+        (output_dir / LOCATION_DATA_MANIFEST).write_text(
+            json.dumps(manifest, ensure_ascii=False, indent=2, sort_keys=True) + "\n",
+            encoding="utf-8",
+        )
+
+        removed = 0
+        if not options["keep_old"]:
+            for path in output_dir.glob("nepal-data.*"):
+                # Precompressed siblings go with the file they were made from.
+                name = path.name.removesuffix(".gz").removesuffix(".br")
+                if name not in written:
+                    path.unlink()
+                    removed += 1
+
+        total = sum((output_dir / name).stat().st_size for name in written)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Wrote {len(written)} files ({total} bytes) to {output_dir}"
+                + (f", removed {removed} stale files." if removed else ".")
+            )
+        )
@@ -0,0 +1,253 @@
+"""
+Bulk-normalize a free-text address column into structured location columns.
+
+Example:
+    python manage.py nepkit_normalize_addresses crm.Customer address \\
+        --province=province --district=district --municipality=municipality
+"""
+
+from itertools import islice
+
+from django.apps import apps
+from django.core.exceptions import FieldDoesNotExist
+from django.core.management.base import BaseCommand, CommandError
+
+from django_nepkit.models import (
+    DistrictField,
+    LocationName,
+    MunicipalityField,
+    ProvinceField,
+)
+from django_nepkit.registry import registry
+from django_nepkit.utils import _resolve_address
+
+LEVELS = (
+    ("province", ProvinceField),
+    ("district", DistrictField),
+    ("municipality", MunicipalityField),
+)
+
+
+def _normalize_batch(values):
+    """
+    Resolve a batch of raw addresses.
+
+    Returns one tuple per address holding ``(name, name_nepali, code)`` for
+    province, district and municipality (or None). Only plain values are
+    returned so the result can cross process boundaries cheaply.
+    """
+    results = []
+    for value in values:
+        results.append(
+            tuple(
+                (location.name, location.name_nepali, registry.code(location))
+                if location
+                else None
+                for location in _resolve_address(value)
+            )
+        )
+    return results
+
+
+def _chunked(iterable, size):
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+class Command(BaseCommand):
+    help = (
+        "Normalize a free-text address column into ProvinceField, DistrictField "
+        "and MunicipalityField columns using bulk updates."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("model", help="Model label, e.g. 'app_label.ModelName'.")
+        parser.add_argument("raw_field", help="Field holding the raw address text.")
+        for level, _field_cls in LEVELS:
+            parser.add_argument(
+                f"--{level}",
+                dest=level,
+                help=f"Target {level} field to fill.",
+            )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=2000,
+            help="Rows fetched per database round trip (default: 2000).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Rows normalized and written per bulk_update (default: 500).",
+        )
+        parser.add_argument(
+            "--resume-from",
+            dest="resume_from",
+            help="Only process rows with a primary key greater than this value.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of processes used for normalization (default: 1).",
+        )
+        parser.add_argument(
+            "--overwrite",
+            action="store_true",
+            help="Overwrite target columns that already hold a value.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report statistics without writing anything.",
+        )
+
+    def handle(self, *args, **options):
+        model = self._get_model(options["model"])
+        raw_field = options["raw_field"]
+        targets = self._get_targets(model, raw_field, options)
+
+        if options["batch_size"] < 1 or options["chunk_size"] < 1:
+            raise CommandError("--batch-size and --chunk-size must be positive.")
+
+        pk_name = model._meta.pk.name
+        queryset = model._default_manager.order_by(pk_name).only(
+            pk_name, raw_field, *(field.name for _level, field in targets)
+        )
+        if options["resume_from"] is not None:
+            queryset = queryset.filter(pk__gt=options["resume_from"])
+
+        stats = {
+            "processed": 0,
+            "resolved": 0,
+            "unresolved": 0,
+            "skipped": 0,
+            "updated": 0,
+        }
+        dry_run = options["dry_run"]
+        rows = queryset.iterator(chunk_size=options["chunk_size"])
+        batches = _chunked(rows, options["batch_size"])
+
+        pool = None
+        if options["workers"] > 1:
+            from multiprocessing import Pool
+
+            pool = Pool(options["workers"])
+
+        try:
+            for objs, results in self._normalize(
+                batches, raw_field, pool, options["workers"]
+            ):
+                changed = self._apply(objs, results, targets, options, stats)
+                if changed and not dry_run:
+                    model._default_manager.bulk_update(
+                        changed,
+                        [field.name for _level, field in targets],
+                        batch_size=options["batch_size"],
+                    )
+                stats["updated"] += len(changed)
+                self.stdout.write(
+                    f"Processed {stats['processed']} rows "
+                    f"(last {pk_name}={objs[-1].pk})"
+                )
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+
+        self._report(stats, dry_run)
+
+    def _get_model(self, label):
+        try:
+            return apps.get_model(label)
+        except (LookupError, ValueError) as e:
+            raise CommandError(f"Unknown model '{label}'.") from e
+
+    def _get_targets(self, model, raw_field, options):
+        try:
+            model._meta.get_field(raw_field)
+        except FieldDoesNotExist as e:
+            raise CommandError(
+                f"'{raw_field}' is not a field of {model.__name__}."
+            ) from e
+
+        targets = []
+        for level, field_cls in LEVELS:
+            field_name = options.get(level)
+            if not field_name:
+                continue
+            try:
+                field = model._meta.get_field(field_name)
+            except FieldDoesNotExist as e:
+                raise CommandError(
+                    f"'{field_name}' is not a field of {model.__name__}."
+                ) from e
+            if not isinstance(field, field_cls):
+                raise CommandError(
+                    f"'{field_name}' must be a {field_cls.__name__} for --{level}."
+                )
+            targets.append((level, field))
+
+        if not targets:
+            raise CommandError(
+                "Pass at least one of --province, --district or --municipality."
+            )
+        return targets
+
+    def _normalize(self, batches, raw_field, pool, workers):
+        """Yield ``(objs, results)`` pairs, normalizing in worker processes if given."""
+        if pool is None:
+            for objs in batches:
+                yield objs, _normalize_batch([getattr(obj, raw_field) for obj in objs])
+            return
+
+        # Rows are read on this thread (database connections are thread-local);
+        # only the normalization itself is handed to the workers.
+        for group in _chunked(batches, workers * 2):
+            values = [[getattr(obj, raw_field) for obj in objs] for objs in group]
+            yield from zip(group, pool.map(_normalize_batch, values))
+
+    def _apply(self, objs, results, targets, options, stats):
+        """Copy resolved names onto the instances and return the changed ones."""
+        changed = []
+        level_index = {"province": 0, "district": 1, "municipality": 2}
+        for obj, resolved in zip(objs, results):
+            stats["processed"] += 1
+            if not any(resolved):
+                stats["unresolved"] += 1
+                continue
+            stats["resolved"] += 1
+
+            dirty = False
+            for level, field in targets:
+                names = resolved[level_index[level]]
+                if names is None:
+                    continue
+                current = getattr(obj, field.attname)
+                if current and not options["overwrite"]:
+                    continue
+                name = names[1] if field.ne else names[0]
+                if current != name:
+                    # bulk_update skips pre_save, so code columns get the code
+                    # resolved here rather than a name that may be ambiguous.
+                    value = LocationName(name, names[2]) if field.code else name
+                    setattr(obj, field.attname, value)
+                    dirty = True
+
+            if dirty:
+                changed.append(obj)
+            else:
+                stats["skipped"] += 1
+        return changed
+
+    def _report(self, stats, dry_run):
+        verb = "Would update" if dry_run else "Updated"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{verb} {stats['updated']} of {stats['processed']} rows "
+                f"({stats['resolved']} resolved, {stats['unresolved']} unresolved, "
+                f"{stats['skipped']} unchanged)."
+            )
+        )
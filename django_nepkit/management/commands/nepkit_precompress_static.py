@@ -0,0 +1,50 @@
+"""
+Write gzip (and brotli) siblings for static assets at maximum compression.
+
+Without paths, STATIC_ROOT is processed (run it after collectstatic).
+
+Example:
+    python manage.py nepkit_precompress_static
+    python manage.py nepkit_precompress_static /srv/static
+"""
+
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from django_nepkit.compression import ENCODINGS, precompress_directory
+
+
+class Command(BaseCommand):
+    help = (
+        "Precompress static assets into .gz (and .br, with the brotli package) "
+        "files next to the originals."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "paths",
+            nargs="*",
+            help="Directories to process (default: STATIC_ROOT).",
+        )
+
+    def handle(self, *args, **options):
+        paths = options["paths"]
+        if not paths:
+            if not settings.STATIC_ROOT:
+                raise CommandError(
+                    "STATIC_ROOT is not set; pass the directories to precompress."
+                )
+            paths = [settings.STATIC_ROOT]
+        written = []
+        for path in map(Path, paths):
+            if not path.is_dir():
+                raise CommandError(f"'{path}' is not a directory.")
+            written.extend(precompress_directory(path))
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Wrote {len(written)} precompressed files ({', '.join(ENCODINGS)})."
+            )
+        )
@@ -0,0 +1,106 @@
+"""
+Download the datepicker's third-party assets for local serving.
+
+Run it once on a machine with internet access (for example while building a
+release or a container image); the versioned copies are then served from
+static files with NEPKIT["ASSET_MODE"] = "local". They are written to the
+first unprefixed entry of STATICFILES_DIRS unless --output-dir says otherwise.
+Every download is checked against its hash in VENDOR_ASSET_INTEGRITY.
+
+Example:
+    python manage.py nepkit_vendor_assets
+    python manage.py nepkit_vendor_assets --output-dir assets/static
+"""
+
+from pathlib import Path
+from urllib.error import URLError
+from urllib.request import urlopen
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from django_nepkit.assets import VENDOR_ASSET_INTEGRITY, VENDOR_ASSETS, integrity_of
+
+
+class Command(BaseCommand):
+    help = "Download versioned copies of the datepicker's CDN assets into static files."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output-dir",
+            help="Static root to write into (default: the first of STATICFILES_DIRS).",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Download again even if a copy already exists.",
+        )
+        parser.add_argument(
+            "--allow-unpinned",
+            action="store_true",
+            help="Also save assets that have no pinned hash yet, printing theirs.",
+        )
+        parser.add_argument(
+            "--timeout",
+            type=float,
+            default=30,
+            help="Seconds to wait for each download (default: 30).",
+        )
+
+    def handle(self, *args, **options):
+        root = self._output_dir(options["output_dir"])
+
+        for name, (url, local_path) in VENDOR_ASSETS.items():
+            target = root / local_path
+            if target.exists() and not options["force"]:
+                self.stdout.write(f"{local_path} already present.")
+                continue
+            try:
+                with urlopen(url, timeout=options["timeout"]) as response:
+                    content = response.read()
+            except (URLError, OSError) as e:
+                raise CommandError(f"Could not download {name} from {url}: {e}")
+            self._verify(name, url, content, options["allow_unpinned"])
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(content)
+            self.stdout.write(f"Saved {local_path} ({len(content)} bytes).")
+
+        self.stdout.write(self.style.SUCCESS(f"Assets are ready under {root}."))
+
+    @staticmethod
+    def _output_dir(output_dir):
+        if output_dir:
+            return Path(output_dir)
+        # Entries may be (prefix, path) pairs; files under a prefix would be
+        # served at the wrong URL, so only unprefixed entries qualify.
+        for entry in settings.STATICFILES_DIRS:
+            if isinstance(entry, (list, tuple)):
+                prefix, path = entry
+                if not prefix:
+                    return Path(path)
+            else:
+                return Path(entry)
+        raise CommandError(
+            "STATICFILES_DIRS has no entry without a prefix; pass --output-dir "
+            "to choose where the assets are written."
+        )
+
+    def _verify(self, name, url, content, allow_unpinned):
+        expected = VENDOR_ASSET_INTEGRITY.get(name)
+        if expected is None:
+            actual = integrity_of(content)
+            if not allow_unpinned:
+                raise CommandError(
+                    f"{name} has no pinned hash; the download from {url} has "
+                    f"{actual}. Check it and pin it in VENDOR_ASSET_INTEGRITY, "
+                    "or pass --allow-unpinned."
+                )
+            self.stdout.write(f"Unpinned {name}: {actual}")
+            return
+        algorithm = expected.split("-", 1)[0]
+        actual = integrity_of(content, algorithm)
+        if actual != expected:
+            raise CommandError(
+                f"{name} from {url} does not match its pinned hash "
+                f"(expected {expected}, got {actual})."
+            )
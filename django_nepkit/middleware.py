@@ -0,0 +1,125 @@
+"""
+Middleware serving precompressed static files for deployments without a
+front proxy that does it (such as nginx `gzip_static`).
+"""
+
+import mimetypes
+from pathlib import Path
+from urllib.parse import urlparse
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, HttpResponseNotModified
+from django.utils._os import safe_join
+from django.utils.cache import patch_vary_headers
+from django.utils.http import http_date
+from django.views.static import was_modified_since
+
+from django_nepkit.compression import ENCODINGS, SUFFIXES, accepted_encodings
+
+
+class PrecompressedStaticMiddleware:
+    """
+    Answer requests under STATIC_URL with the `.br` or `.gz` sibling of the
+    file when the client accepts it, and pass everything else through.
+
+    Files are looked up in STATIC_ROOT, then through the staticfiles finders.
+    Siblings older than the file are ignored, as they may be out of date.
+    Place it near the top of MIDDLEWARE. It works under both WSGI and ASGI;
+    in async mode the file lookups run in a worker thread.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(self.get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+        static_url = urlparse(settings.STATIC_URL or "")
+        # Static files on another host are not ours to serve.
+        self.prefix = None if static_url.netloc else static_url.path or None
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        response = self.serve(request)
+        if response is None:
+            response = self.get_response(request)
+        return response
+
+    async def __acall__(self, request):
+        response = None
+        # Only static requests pay for the hop to a thread.
+        if self.prefix and request.path_info.startswith(self.prefix):
+            response = await sync_to_async(self.serve)(request)
+        if response is None:
+            response = await self.get_response(request)
+        return response
+
+    def serve(self, request):
+        if not self.prefix or request.method not in ("GET", "HEAD"):
+            return None
+        if not request.path_info.startswith(self.prefix):
+            return None
+
+        accepted = accepted_encodings(request.headers.get("Accept-Encoding", ""))
+        encodings = [encoding for encoding in ENCODINGS if encoding in accepted]
+        if not encodings:
+            return None
+
+        original = self.find(request.path_info[len(self.prefix) :])
+        if original is None:
+            return None
+
+        source_mtime = original.stat().st_mtime
+        for encoding in encodings:
+            compressed = original.with_name(original.name + SUFFIXES[encoding])
+            # A sibling older than its source was left behind by an update.
+            if compressed.is_file() and compressed.stat().st_mtime >= source_mtime:
+                return self.respond(request, original, compressed, encoding)
+        return None
+
+    def find(self, relative_path):
+        """Absolute path of a static file, or None."""
+        if not relative_path:
+            return None
+        if settings.STATIC_ROOT:
+            try:
+                path = Path(safe_join(settings.STATIC_ROOT, relative_path))
+            except SuspiciousFileOperation:
+                return None
+            if path.is_file():
+                return path
+
+        from django.apps import apps
+
+        if apps.is_installed("django.contrib.staticfiles"):
+            from django.contrib.staticfiles import finders
+
+            found = finders.find(relative_path)
+            if found:
+                return Path(found)
+        return None
+
+    @staticmethod
+    def respond(request, original, compressed, encoding):
+        stat = compressed.stat()
+        if not was_modified_since(
+            request.META.get("HTTP_IF_MODIFIED_SINCE"), stat.st_mtime
+        ):
+            response = HttpResponseNotModified()
+        else:
+            content_type, _encoding = mimetypes.guess_type(original.name)
+            response = FileResponse(
+                compressed.open("rb"),
+                content_type=content_type or "application/octet-stream",
+                filename=original.name,
+            )
+            response["Content-Encoding"] = encoding
+            response["Content-Length"] = stat.st_size
+        response["Last-Modified"] = http_date(stat.st_mtime)
+        patch_vary_headers(response, ("Accept-Encoding",))
+        return response
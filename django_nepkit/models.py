@@ -1,19 +1,27 @@
+import re
 from datetime import date as python_date
 from datetime import datetime as python_datetime
 
+import django
+from django.core import checks, exceptions
 from django.db import models
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from nepali.datetime import nepalidate, nepalidatetime
 from nepali.locations import districts, municipalities, provinces
 
+from django_nepkit.lookups import LOCATION_CODE_LOOKUPS, LOCATION_SEARCH_LOOKUPS
+from django_nepkit.registry import LEVELS, registry
 from django_nepkit.utils import (
     BS_DATE_FORMAT,
     BS_DATETIME_FORMAT,
     try_parse_nepali_date,
     try_parse_nepali_datetime,
 )
-from django_nepkit.validators import validate_nepali_phone_number
+from django_nepkit.validators import (
+    PHONE_NUMBER_PATTERN,
+    validate_nepali_phone_number,
+)
 from django_nepkit.widgets import (
     DistrictSelectWidget,
     MunicipalitySelectWidget,
@@ -23,6 +31,91 @@ from django_nepkit.widgets import (
 from django_nepkit.conf import nepkit_settings
 
 
+# CheckConstraint's `check` argument was renamed to `condition` in Django 5.1.
+_CHECK_CONSTRAINT_ARG = "condition" if django.VERSION >= (5, 1) else "check"
+
+# strftime directive -> regex accepted for it in stored BS values
+_BS_DIRECTIVE_PATTERNS = {
+    "Y": "[0-9]{4}",
+    "m": "(0[1-9]|1[0-2])",
+    "d": "(0[1-9]|[12][0-9]|3[0-2])",
+    "H": "([01][0-9]|2[0-3])",
+    "M": "[0-5][0-9]",
+    "S": "[0-5][0-9]",
+}
+
+
+def _bs_format_pattern(format_string):
+    """Anchored regex matching values written with a BS strftime format."""
+    parts = []
+    for literal, directive in re.findall(r"([^%]*)(?:%(.))?", format_string):
+        # Only metacharacters are escaped, so the pattern suits every backend.
+        parts.append(re.sub(r"([.^$*+?()\[\]{}|\\])", r"\\\1", literal))
+        if directive:
+            if directive not in _BS_DIRECTIVE_PATTERNS:
+                raise exceptions.ImproperlyConfigured(
+                    f"db_constraints does not support '%{directive}' in the BS "
+                    f"format '{format_string}'."
+                )
+            parts.append(_BS_DIRECTIVE_PATTERNS[directive])
+    return "^" + "".join(parts) + "$"
+
+
+class CheckConstraintMixin:
+    """
+    Adds a ``db_constraints`` option to a field.
+
+    With ``db_constraints=True`` the field adds a CHECK constraint on its
+    column to the model, so the format or domain is enforced by the database
+    for ``bulk_create``, ``update()`` and raw SQL too. It is picked up by
+    ``makemigrations`` like one declared in ``Meta.constraints``.
+
+    Fields using it define ``get_check_condition()``.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.db_constraints = kwargs.pop("db_constraints", False)
+        super().__init__(*args, **kwargs)
+
+    def get_check_condition(self):
+        """
+        Return the Q object that valid non-blank values of the column satisfy.
+
+        Field classes using the mixin override it.
+        """
+        raise exceptions.ImproperlyConfigured(
+            f"{type(self).__name__} '{self.name}' has db_constraints=True but "
+            "does not define get_check_condition()."
+        )
+
+    def contribute_to_class(self, cls, name, *args, **kwargs):
+        super().contribute_to_class(cls, name, *args, **kwargs)
+        if self.db_constraints and not cls._meta.abstract:
+            self._add_check_constraint(cls)
+
+    def _add_check_constraint(self, cls):
+        opts = cls._meta
+        name = f"{opts.app_label}_{opts.model_name}_{self.name}_valid"
+        # Models rendered from migration state already carry it in Meta.
+        if any(constraint.name == name for constraint in opts.constraints):
+            return
+        condition = self.get_check_condition()
+        if self.blank and self.empty_strings_allowed:
+            condition |= models.Q((self.name, ""))
+        constraint = models.CheckConstraint(
+            name=name, **{_CHECK_CONSTRAINT_ARG: condition}
+        )
+        opts.constraints = [*opts.constraints, constraint]
+        # Model state only reads constraints of models that declare some.
+        opts.original_attrs["constraints"] = opts.constraints
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        if self.db_constraints:
+            kwargs["db_constraints"] = True
+        return name, path, args, kwargs
+
+
 class NepaliFieldMixin:
     """Adds Nepali 'ne' and 'en' support to any field."""
 
@@ -53,7 +146,7 @@ class NepaliFieldMixin:
         return name, path, args, kwargs
 
 
-class NepaliPhoneNumberField(models.CharField):
+class NepaliPhoneNumberField(CheckConstraintMixin, models.CharField):
     description = _("Nepali Phone Number")
 
     def __init__(self, *args, **kwargs):
@@ -61,10 +154,19 @@ class NepaliPhoneNumberField(models.CharField):
         super().__init__(*args, **kwargs)
         self.validators.append(validate_nepali_phone_number)
 
+    def get_check_condition(self):
+        return models.Q((f"{self.name}__regex", PHONE_NUMBER_PATTERN))
+
 
-class BaseNepaliBSField(NepaliFieldMixin, models.CharField):
+class BaseNepaliBSField(CheckConstraintMixin, NepaliFieldMixin, models.CharField):
     """Base class for Nepali date and datetime fields."""
 
+    default_error_messages = {
+        "invalid": _(
+            "%(value)s is not a valid Bikram Sambat value. Expected format: %(format)s."
+        ),
+    }
+
     def __init__(self, *args, **kwargs):
         self.auto_now = kwargs.pop("auto_now", False)
         self.auto_now_add = kwargs.pop("auto_now_add", False)
@@ -155,6 +257,9 @@ class BaseNepaliBSField(NepaliFieldMixin, models.CharField):
             kwargs["auto_now_add"] = True
         return name, path, args, kwargs
 
+    def get_check_condition(self):
+        return models.Q((f"{self.name}__regex", _bs_format_pattern(self.format_str)))
+
     def formfield(self, **kwargs):
         defaults = {
             "widget": NepaliDatePickerWidget(ne=self.ne, en=self.en),
@@ -190,26 +295,257 @@ class NepaliDateTimeField(BaseNepaliBSField):
     parse_func = staticmethod(try_parse_nepali_datetime)
 
 
-class BaseLocationField(NepaliFieldMixin, models.CharField):
-    """Base class for Province, District, and Municipality fields."""
+class LocationName(str):
+    """
+    A location name read from a ``code=True`` column, carrying its code.
+
+    It behaves like the plain name, but saving it back writes the same code
+    even when several locations share the name.
+    """
+
+    def __new__(cls, name, code):
+        value = super().__new__(cls, name)
+        value.code = code
+        return value
+
+    def __reduce__(self):
+        return (LocationName, (str(self), self.code))
+
+
+class BaseLocationField(CheckConstraintMixin, NepaliFieldMixin, models.CharField):
+    """
+    Base class for Province, District, and Municipality fields.
+
+    With ``code=True`` the column stores a small integer location code instead
+    of the name. Values are still names in Python (in the field's language),
+    and name-based lookups keep working.
+
+    With ``parent_field`` naming a sibling location field (e.g. ``"province"``
+    on a DistrictField), validation also checks that the value lies within it.
+    """
+
+    level = None
+    default_error_messages = {
+        "invalid_parent": _("%(value)s is not in %(parent)s."),
+        "ambiguous": _(
+            "More than one %(level)s is named %(value)s; a parent location is "
+            "needed to choose one."
+        ),
+    }
 
     def __init__(self, *args, **kwargs):
         kwargs.setdefault("max_length", 100)
+        self.code = kwargs.pop("code", False)
+        self.parent_field = kwargs.pop("parent_field", None)
 
         default_lang = nepkit_settings.DEFAULT_LANGUAGE
         ne = kwargs.get("ne", default_lang == "ne")
 
-        # Load choices from the library (provinces, districts, etc.)
+        # Choices come from the library (provinces, districts, etc.) and are
+        # shared between fields; they are only built when first iterated.
         kwargs.setdefault("choices", self.get_choices_from_source(ne))
         super().__init__(*args, **kwargs)
 
     def get_choices_from_source(self, ne):
+        if self.level:
+            return registry.lazy_choices(self.level, ne)
         source = getattr(self, "source", [])
         return [(self._get_name(item, ne), self._get_name(item, ne)) for item in source]
 
     def _get_name(self, item, ne):
         return getattr(item, "name_nepali", item.name) if ne else item.name
 
+    def get_internal_type(self):
+        if self.code:
+            return "SmallIntegerField"
+        return super().get_internal_type()
+
+    def _name_from_code(self, value):
+        location = registry.get_by_code(self.level, int(value))
+        if location is None:
+            return value
+        return LocationName(self._get_name(location, self.ne), registry.code(location))
+
+    def _from_db_code(self, value, expression, connection):
+        return self._name_from_code(value) if value is not None else value
+
+    def get_db_converters(self, connection):
+        converters = super().get_db_converters(connection)
+        if self.code:
+            converters = [self._from_db_code, *converters]
+        return converters
+
+    def to_python(self, value):
+        if self.code and (
+            isinstance(value, int) or (isinstance(value, str) and value.isdigit())
+        ):
+            return self._name_from_code(value)
+        return super().to_python(value)
+
+    def get_prep_value(self, value):
+        if not self.code:
+            return super().get_prep_value(value)
+        if value in (None, ""):
+            return None
+        if isinstance(value, int):
+            return value
+        if isinstance(value, LocationName):
+            return value.code
+
+        locations = registry.get_all(self.level, str(value))
+        if not locations:
+            raise ValueError(f"Unknown {self.level} '{value}' for field '{self.name}'.")
+        if len(locations) > 1:
+            # Municipality names repeat across districts; pre_save resolves
+            # them through parent_field before they get here.
+            raise ValueError(
+                f"Ambiguous {self.level} '{value}' for field '{self.name}'; "
+                "it needs a parent_field value to pick a code."
+            )
+        return registry.code(locations[0])
+
+    def pre_save(self, model_instance, add):
+        value = super().pre_save(model_instance, add)
+        if self.code and isinstance(value, str):
+            locations = self._locations_within_parent(value, model_instance)
+            if locations and len(locations) == 1:
+                return registry.code(locations[0])
+        return value
+
+    def _locations_within_parent(self, value, model_instance):
+        """
+        Return the locations named ``value`` inside the instance's parent_field,
+        or None when there is no parent value to narrow them down.
+        """
+        if not self.parent_field or model_instance is None:
+            return None
+        parent_value = getattr(model_instance, self.parent_field, None)
+        if parent_value in self.empty_values:
+            return None
+        parent = self.model._meta.get_field(self.parent_field)
+        return registry.get_within(self.level, value, parent.level, parent_value)
+
+    def get_check_condition(self):
+        if self.code:
+            # Codes are numbered consecutively from 1 within each level.
+            codes = [registry.code(item) for item in registry.sources[self.level]]
+            return models.Q((f"{self.name}__range", (min(codes), max(codes))))
+        return models.Q(
+            (f"{self.name}__in", sorted(registry.names(self.level, self.ne)))
+        )
+
+    def check(self, **kwargs):
+        return [*super().check(**kwargs), *self._check_parent_field()]
+
+    def _check_parent_field(self):
+        if not self.parent_field:
+            return []
+        try:
+            parent = self.model._meta.get_field(self.parent_field)
+        except (AttributeError, exceptions.FieldDoesNotExist):
+            parent = None
+        if not isinstance(parent, BaseLocationField):
+            return [
+                checks.Error(
+                    f"'parent_field' refers to '{self.parent_field}', which is "
+                    "not a location field on this model.",
+                    obj=self,
+                    id="django_nepkit.E001",
+                )
+            ]
+        if (
+            self.level
+            and parent.level
+            and LEVELS.index(parent.level) >= LEVELS.index(self.level)
+        ):
+            return [
+                checks.Error(
+                    f"'parent_field' refers to '{self.parent_field}', a "
+                    f"{parent.level} field, which is not above this "
+                    f"{self.level} field.",
+                    obj=self,
+                    id="django_nepkit.E004",
+                )
+            ]
+        return []
+
+    def _has_registry_choices(self):
+        return bool(self.level) and self.choices is self.get_choices_from_source(
+            self.ne
+        )
+
+    def validate(self, value, model_instance):
+        if not self._has_registry_choices():
+            super().validate(value, model_instance)
+        elif self.editable:
+            # Same checks as Field.validate, with an O(1) membership test in
+            # place of the linear scan over choices. Code-backed fields accept
+            # names in either language.
+            names = registry.names(self.level, None if self.code else self.ne)
+            if value not in self.empty_values and value not in names:
+                raise exceptions.ValidationError(
+                    self.error_messages["invalid_choice"],
+                    code="invalid_choice",
+                    params={"value": value},
+                )
+            if value is None and not self.null:
+                raise exceptions.ValidationError(
+                    self.error_messages["null"], code="null"
+                )
+            if not self.blank and value in self.empty_values:
+                raise exceptions.ValidationError(
+                    self.error_messages["blank"], code="blank"
+                )
+            if (
+                self.code
+                and value not in self.empty_values
+                and not isinstance(value, LocationName)
+                and len(registry.get_all(self.level, value)) > 1
+            ):
+                # A parent that contains none of them is reported below.
+                within = self._locations_within_parent(value, model_instance)
+                if within is None or len(within) > 1:
+                    raise exceptions.ValidationError(
+                        self.error_messages["ambiguous"],
+                        code="ambiguous",
+                        params={"value": value, "level": self.level},
+                    )
+
+        if self.parent_field and model_instance is not None:
+            self.validate_parent(
+                value, getattr(model_instance, self.parent_field, None)
+            )
+
+    def validate_parent(self, value, parent_value):
+        """Raise ValidationError if ``value`` does not lie within ``parent_value``."""
+        if value in self.empty_values or parent_value in self.empty_values:
+            return
+        parent_level = self.model._meta.get_field(self.parent_field).level
+        if not registry.belongs_to(self.level, value, parent_value, parent_level):
+            raise exceptions.ValidationError(
+                self.error_messages["invalid_parent"],
+                code="invalid_parent",
+                params={"value": value, "parent": parent_value},
+            )
+
+    def get_lookup(self, lookup_name):
+        if self.code and lookup_name in LOCATION_CODE_LOOKUPS:
+            return LOCATION_CODE_LOOKUPS[lookup_name]
+        if self.level and lookup_name in LOCATION_SEARCH_LOOKUPS:
+            return LOCATION_SEARCH_LOOKUPS[lookup_name]
+        return super().get_lookup(lookup_name)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        if self.code:
+            kwargs["code"] = True
+        if self.parent_field:
+            kwargs["parent_field"] = self.parent_field
+        # Default choices are rebuilt from the registry; keep them out of migrations.
+        if self._has_registry_choices():
+            kwargs.pop("choices", None)
+        return name, path, args, kwargs
+
     def formfield(self, **kwargs):
         widget_cls = getattr(self, "widget_class", None)
         if widget_cls:
@@ -221,18 +557,21 @@ class BaseLocationField(NepaliFieldMixin, models.CharField):
 
 class ProvinceField(BaseLocationField):
     description = _("Nepali Province")
+    level = "province"
     source = provinces
     widget_class = ProvinceSelectWidget
 
 
 class DistrictField(BaseLocationField):
     description = _("Nepali District")
+    level = "district"
     source = districts
     widget_class = DistrictSelectWidget
 
 
 class MunicipalityField(BaseLocationField):
     description = _("Nepali Municipality")
+    level = "municipality"
     source = municipalities
     widget_class = MunicipalitySelectWidget
 
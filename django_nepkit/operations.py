@@ -0,0 +1,196 @@
+"""
+Migration operations for django-nepkit fields.
+"""
+
+from django.db import migrations
+
+
+class ConvertLocationNamesToCodes(migrations.AlterField):
+    """
+    Convert a name-storing location column to ``code=True`` storage in place.
+
+    The stored names are rewritten to their codes with one ``UPDATE`` per
+    distinct name, then the column type is altered. Blank values become NULL,
+    so the new field usually needs ``null=True``. Reversing restores the
+    names in the original field's language.
+
+    Example:
+        from django_nepkit.models import DistrictField
+        from django_nepkit.operations import ConvertLocationNamesToCodes
+
+        operations = [
+            ConvertLocationNamesToCodes(
+                model_name="address",
+                name="district",
+                field=DistrictField(code=True),
+            ),
+        ]
+
+    Municipality names shared by several districts are resolved through the
+    field's ``parent_field`` column, row by row.
+
+    Args:
+        on_unknown: What to do with values that are not known location names,
+                    or are ambiguous and not resolved by the parent column:
+                    'error' (default) aborts the migration, 'null' clears them.
+    """
+
+    def __init__(self, model_name, name, field, on_unknown="error", **kwargs):
+        if on_unknown not in ("error", "null"):
+            raise ValueError("on_unknown must be 'error' or 'null'.")
+        self.on_unknown = on_unknown
+        super().__init__(model_name, name, field, **kwargs)
+
+    def deconstruct(self):
+        name, args, kwargs = super().deconstruct()
+        if self.on_unknown != "error":
+            kwargs["on_unknown"] = self.on_unknown
+        return name, args, kwargs
+
+    def describe(self):
+        return f"Convert {self.model_name}.{self.name} location names to codes"
+
+    @property
+    def migration_name_fragment(self):
+        return f"{self.model_name_lower}_{self.name_lower}_to_codes"
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        from django_nepkit.registry import registry
+
+        model = from_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            field = model._meta.get_field(self.name)
+            level = self.field.level
+
+            mapping = {}
+            unknown = []
+            ambiguous = []
+            for value in self._distinct_values(schema_editor, model, field):
+                if value == "":
+                    # Blank names become NULL codes.
+                    mapping[value] = None
+                    continue
+                locations = registry.get_all(level, value)
+                if not locations:
+                    unknown.append(value)
+                elif len(locations) > 1:
+                    ambiguous.append(value)
+                else:
+                    mapping[value] = str(registry.code(locations[0]))
+
+            # Names shared by several locations are resolved row by row through
+            # the field's parent_field column; without one they cannot be.
+            by_parent, unresolved = self._resolve_ambiguous(
+                schema_editor, model, field, ambiguous
+            )
+
+            if (unknown or unresolved) and self.on_unknown == "error":
+                problems = []
+                if unknown:
+                    problems.append(f"unknown {level} values {sorted(unknown)!r}")
+                if unresolved:
+                    problems.append(
+                        f"ambiguous {level} values {sorted(unresolved)!r} that "
+                        "parent_field does not resolve"
+                    )
+                raise ValueError(
+                    f"Cannot convert {model.__name__}.{self.name}: "
+                    f"{'; '.join(problems)}. Fix them first or pass "
+                    "on_unknown='null'."
+                )
+            self._rewrite_within_parent(schema_editor, model, field, by_parent)
+            mapping.update({value: None for value in unknown + unresolved})
+            self._rewrite(schema_editor, model, field, mapping)
+
+        super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        from django_nepkit.registry import registry
+
+        # Restore the character column first, then swap codes back to names.
+        # (AlterField's backwards is its forwards with the states swapped.)
+        super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            field = model._meta.get_field(self.name)
+            mapping = {}
+            for value in self._distinct_values(schema_editor, model, field):
+                if not str(value).isdigit():
+                    continue
+                location = registry.get_by_code(self.field.level, int(value))
+                if location is not None:
+                    mapping[value] = location.name_nepali if field.ne else location.name
+            self._rewrite(schema_editor, model, field, mapping)
+
+    @staticmethod
+    def _distinct_values(schema_editor, model, field):
+        quote = schema_editor.quote_name
+        with schema_editor.connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT DISTINCT {quote(field.column)} "
+                f"FROM {quote(model._meta.db_table)} "
+                f"WHERE {quote(field.column)} IS NOT NULL"
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+    def _resolve_ambiguous(self, schema_editor, model, field, values):
+        """
+        Map ``(name, parent value)`` pairs to codes for names that need a parent.
+
+        Returns the mapping and the names left with at least one unresolved row.
+        """
+        from django_nepkit.registry import registry
+
+        if not values:
+            return {}, []
+        if not self.field.parent_field:
+            return {}, list(values)
+
+        parent = model._meta.get_field(self.field.parent_field)
+        quote = schema_editor.quote_name
+        placeholders = ", ".join(["%s"] * len(values))
+        with schema_editor.connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT DISTINCT {quote(field.column)}, {quote(parent.column)} "
+                f"FROM {quote(model._meta.db_table)} "
+                f"WHERE {quote(field.column)} IN ({placeholders})",
+                list(values),
+            )
+            pairs = cursor.fetchall()
+
+        mapping = {}
+        unresolved = set()
+        for value, parent_value in pairs:
+            locations = []
+            if parent_value not in (None, ""):
+                locations = registry.get_within(
+                    self.field.level, value, parent.level, parent_value
+                )
+            if len(locations) == 1:
+                mapping[(value, parent_value)] = str(registry.code(locations[0]))
+            else:
+                unresolved.add(value)
+        return mapping, sorted(unresolved)
+
+    def _rewrite_within_parent(self, schema_editor, model, field, mapping):
+        if not mapping:
+            return
+        parent = model._meta.get_field(self.field.parent_field)
+        quote = schema_editor.quote_name
+        sql = (
+            f"UPDATE {quote(model._meta.db_table)} SET {quote(field.column)} = %s "
+            f"WHERE {quote(field.column)} = %s AND {quote(parent.column)} = %s"
+        )
+        for (old, parent_value), new in mapping.items():
+            schema_editor.execute(sql, [new, old, parent_value])
+
+    @staticmethod
+    def _rewrite(schema_editor, model, field, mapping):
+        quote = schema_editor.quote_name
+        sql = (
+            f"UPDATE {quote(model._meta.db_table)} SET {quote(field.column)} = %s "
+            f"WHERE {quote(field.column)} = %s"
+        )
+        for old, new in mapping.items():
+            schema_editor.execute(sql, [new, old])
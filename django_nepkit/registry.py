@@ -0,0 +1,550 @@
+"""
+In-memory registry of Nepali locations.
+
+Lookup tables over `nepali.locations` are built once, on first use, so callers
+get O(1) access by English or Nepali name instead of scanning the source lists.
+"""
+
+import hashlib
+import json
+from functools import cached_property
+from pathlib import Path
+
+from django.core.exceptions import ImproperlyConfigured
+from nepali.locations import districts, municipalities, provinces
+
+from django_nepkit.constants import (
+    LOCATION_ALIASES,
+    LOCATION_SEARCH_STOP_WORDS,
+    PROVINCE_CODES,
+)
+from django_nepkit.utils import _normalize_nepali_text
+
+try:
+    from django.utils.choices import BaseChoiceIterator
+except ImportError:  # Django < 5.0 keeps field choices exactly as given
+    BaseChoiceIterator = object
+
+LEVELS = ("province", "district", "municipality")
+
+# Frozen district and municipality storage codes
+LOCATION_CODES_PATH = Path(__file__).resolve().parent / "data" / "location_codes.json"
+
+# Upper bound on results stored per prefix node (and thus per search).
+SEARCH_MAX_RESULTS = 50
+
+
+def _search_key(text):
+    """Normalize text for prefix search: case, whitespace and Chandrabindu."""
+    return " ".join(_normalize_nepali_text(text).lower().split())
+
+
+class LocationChoices(BaseChoiceIterator):
+    """
+    Lazy view of one level's choices in one language.
+
+    A single instance per (level, language) is shared by every field, and the
+    underlying tuple is only built the first time it is iterated.
+    """
+
+    def __init__(self, level, ne):
+        self.level = level
+        self.ne = ne
+
+    def __iter__(self):
+        return iter(registry.choices(self.level, self.ne))
+
+    def __len__(self):
+        return len(registry.choices(self.level, self.ne))
+
+    def __repr__(self):
+        return f"<LocationChoices {self.level} ne={self.ne}>"
+
+
+class LocationRegistry:
+    """Name-indexed access to provinces, districts and municipalities."""
+
+    sources = {
+        "province": provinces,
+        "district": districts,
+        "municipality": municipalities,
+    }
+
+    @cached_property
+    def dataset_version(self):
+        """
+        Short hash of the location data, its codes and search aliases.
+
+        It only changes when the bundled data changes, which makes it a safe
+        validator for HTTP caching and client-side caches.
+        """
+        digest = hashlib.sha256()
+        for level in LEVELS:
+            for item in self.sources[level]:
+                parents = [
+                    getattr(item, attr, None) for attr in ("province", "district")
+                ]
+                row = [level, item.name, item.name_nepali, str(self._codes[item])]
+                row += [parent.name for parent in parents if parent is not None]
+                digest.update("\x1f".join(row).encode("utf-8"))
+                digest.update(b"\x1e")
+        digest.update(repr(sorted(LOCATION_ALIASES.items())).encode("utf-8"))
+        return digest.hexdigest()[:16]
+
+    @cached_property
+    def _by_name(self):
+        """
+        Map each level to ``{name: [locations]}`` for English and Nepali names.
+        Nepali names are also keyed in normalized form (Chandrabindu -> Anusvara).
+        """
+        index = {}
+        for level, source in self.sources.items():
+            names = {}
+            for item in source:
+                for name in self._names(item):
+                    bucket = names.setdefault(name, [])
+                    if item not in bucket:
+                        bucket.append(item)
+            index[level] = names
+        return index
+
+    @cached_property
+    def _municipalities_by_district(self):
+        """Map ``(district, municipality name)`` to the municipality object."""
+        index = {}
+        for item in municipalities:
+            for name in self._names(item):
+                index[(item.district, name)] = item
+        return index
+
+    @staticmethod
+    def _names(item):
+        return (item.name, item.name_nepali, _normalize_nepali_text(item.name_nepali))
+
+    @cached_property
+    def _choices(self):
+        return {}
+
+    def choices(self, level, ne=False):
+        """Return the shared ``(name, name)`` tuple for a level in one language."""
+        key = (level, bool(ne))
+        try:
+            return self._choices[key]
+        except KeyError:
+            pass
+        choices = []
+        for item in self.sources[level]:
+            name = item.name_nepali if ne else item.name
+            choices.append((name, name))
+        self._choices[key] = tuple(choices)
+        return self._choices[key]
+
+    @cached_property
+    def _lazy_choices(self):
+        return {
+            (level, ne): LocationChoices(level, ne)
+            for level in LEVELS
+            for ne in (False, True)
+        }
+
+    def lazy_choices(self, level, ne=False):
+        """Return the shared LocationChoices instance used as a field's choices."""
+        return self._lazy_choices[(level, bool(ne))]
+
+    @cached_property
+    def _names_by_language(self):
+        index = {
+            (level, ne): frozenset(name for name, _label in self.choices(level, ne))
+            for level in LEVELS
+            for ne in (False, True)
+        }
+        for level in LEVELS:
+            index[(level, None)] = frozenset(self._by_name[level])
+        return index
+
+    def names(self, level, ne=None):
+        """
+        Return the frozenset of valid names for a level.
+
+        ``ne`` selects one language; None accepts both English and Nepali.
+        """
+        return self._names_by_language[(level, None if ne is None else bool(ne))]
+
+    @cached_property
+    def _ancestors(self):
+        """
+        Map each ``(level, parent level)`` to ``{name: frozenset(parent names)}``
+        in both languages.
+        """
+        index = {}
+        for level, parent_level in (
+            ("district", "province"),
+            ("municipality", "province"),
+            ("municipality", "district"),
+        ):
+            ancestors = {}
+            for item in self.sources[level]:
+                parent_names = self._names(getattr(item, parent_level))
+                for name in self._names(item):
+                    ancestors.setdefault(name, set()).update(parent_names)
+            index[(level, parent_level)] = {
+                name: frozenset(names) for name, names in ancestors.items()
+            }
+        return index
+
+    def belongs_to(self, level, name, parent_name, parent_level=None):
+        """
+        Check that a location lies within a parent location.
+
+        ``parent_level`` names the level of ``parent_name`` and defaults to
+        the level directly above (province for districts, district for
+        municipalities). Municipality names that repeat across districts are
+        accepted if any of them matches. Raises ValueError if ``parent_level``
+        is not above ``level``.
+        """
+        if parent_level is None:
+            if LEVELS.index(level) == 0:
+                raise ValueError(f"Level '{level}' has no parent level.")
+            parent_level = LEVELS[LEVELS.index(level) - 1]
+        elif LEVELS.index(parent_level) >= LEVELS.index(level):
+            raise ValueError(f"Level '{parent_level}' is not above '{level}'.")
+        ancestors = self._ancestors.get((level, parent_level), {})
+        parents = ancestors.get(name) or ancestors.get(_normalize_nepali_text(name))
+        if not parents:
+            return False
+        return parent_name in parents or _normalize_nepali_text(parent_name) in parents
+
+    def get(self, level, name, parent=None):
+        """
+        Find a location by English or Nepali name.
+
+        Args:
+            level: One of 'province', 'district' or 'municipality'
+            name: English or Nepali name of the location
+            parent: Optional district (object or name) used to disambiguate
+                    municipalities that share a name
+
+        Returns:
+            Location object or None
+        """
+        if level == "municipality" and parent is not None:
+            if isinstance(parent, str):
+                parent = self.get("district", parent)
+            return self._municipalities_by_district.get(
+                (parent, name)
+            ) or self._municipalities_by_district.get(
+                (parent, _normalize_nepali_text(name))
+            )
+
+        names = self._by_name[level]
+        matches = names.get(name) or names.get(_normalize_nepali_text(name))
+        return matches[0] if matches else None
+
+    def get_all(self, level, name):
+        """Return every location at a level carrying this name (municipality names repeat)."""
+        names = self._by_name[level]
+        return names.get(name) or names.get(_normalize_nepali_text(name)) or []
+
+    def get_within(self, level, name, parent_level, parent):
+        """
+        Return the locations named ``name`` that lie within a parent location.
+
+        ``parent`` is a location object, an English or Nepali name, or a
+        storage code at ``parent_level``.
+        """
+        if isinstance(parent, int):
+            parent = self.get_by_code(parent_level, parent)
+        elif isinstance(parent, str):
+            parent = self.get(parent_level, parent)
+        if parent is None:
+            return []
+        return [
+            item
+            for item in self.get_all(level, name)
+            if getattr(item, parent_level, None) is parent
+        ]
+
+    @cached_property
+    def _translations(self):
+        """Map each (level, ne) to ``{name in either script: name in that language}``."""
+        index = {}
+        for level in LEVELS:
+            for ne in (False, True):
+                names = {}
+                for item in self.sources[level]:
+                    target = item.name_nepali if ne else item.name
+                    for name in self._names(item):
+                        names.setdefault(name, target)
+                index[(level, ne)] = names
+        return index
+
+    def translate(self, level, name, ne=True):
+        """
+        Translate a location name between English and Nepali.
+
+        Args:
+            level: One of 'province', 'district' or 'municipality'
+            name: English or Nepali name of the location
+            ne: True for the Nepali name, False for the English one
+
+        Returns:
+            The name in the requested language, or None if it is unknown
+        """
+        if not name:
+            return None
+        names = self._translations[(level, bool(ne))]
+        return names.get(name) or names.get(_normalize_nepali_text(name))
+
+    def translations(self, level, ne=True, code=False):
+        """
+        Map the values a column stores to names in one language.
+
+        Keys are codes with ``code=True``, otherwise names in the other
+        language, e.g. English names when ``ne`` is True. Nepali names are
+        included with either nasal mark.
+        """
+        translations = {}
+        for item in self.sources[level]:
+            if code:
+                keys = (self._codes[item],)
+            elif ne:
+                keys = (item.name,)
+            else:
+                keys = (item.name_nepali, _normalize_nepali_text(item.name_nepali))
+            for key in keys:
+                translations.setdefault(key, item.name_nepali if ne else item.name)
+        return translations
+
+    @cached_property
+    def _codes(self):
+        """
+        Map each location to its storage code.
+
+        Provinces use their official numbers. District and municipality codes
+        come from the frozen table in ``data/location_codes.json``, so values
+        already stored in the database keep their meaning when the upstream
+        dataset is reordered or extended. A location missing from the table
+        raises ImproperlyConfigured rather than getting a made-up code.
+        """
+        with open(LOCATION_CODES_PATH, encoding="utf-8") as f:
+            table = json.load(f)
+        codes = {}
+        for item in provinces:
+            codes[item] = PROVINCE_CODES.get(item.name)
+        for item in districts:
+            codes[item] = table["district"].get(item.name)
+        for item in municipalities:
+            codes[item] = (
+                table["municipality"].get(item.district.name, {}).get(item.name)
+            )
+        missing = [item.name for item, code in codes.items() if code is None]
+        if missing:
+            raise ImproperlyConfigured(
+                f"No storage code for {len(missing)} location(s): "
+                f"{', '.join(sorted(missing)[:5])}. Add them to {LOCATION_CODES_PATH}."
+            )
+        return codes
+
+    @cached_property
+    def _by_code(self):
+        index = {level: {} for level in LEVELS}
+        for level, source in self.sources.items():
+            for item in source:
+                index[level][self._codes[item]] = item
+        return index
+
+    def code(self, location):
+        """Return the storage code of a location object."""
+        return self._codes[location]
+
+    def get_by_code(self, level, code):
+        """Find a location by its storage code, or None."""
+        return self._by_code[level].get(code)
+
+    def codes_matching(self, level, lookup_name, value):
+        """
+        Resolve a name-based lookup into the set of matching codes.
+
+        Supports exact/iexact/in and the contains/startswith/endswith families,
+        comparing against both English and Nepali names. Integers are taken as
+        codes and passed through.
+        """
+        if lookup_name == "in":
+            codes = set()
+            for item in value:
+                codes |= self.codes_matching(level, "exact", item)
+            return codes
+
+        if isinstance(value, int):
+            return {value} if lookup_name == "exact" else set()
+
+        value = str(value)
+        if lookup_name == "exact":
+            return {self._codes[item] for item in self.get_all(level, value)}
+
+        insensitive = lookup_name.startswith("i")
+        operation = lookup_name[1:] if insensitive else lookup_name
+        needle = value.lower() if insensitive else value
+        needle_normalized = _normalize_nepali_text(needle)
+
+        codes = set()
+        for item in self.sources[level]:
+            for name in self._names(item):
+                haystack = name.lower() if insensitive else name
+                if operation == "exact":
+                    matched = haystack == needle
+                elif operation == "contains":
+                    matched = needle in haystack or needle_normalized in haystack
+                elif operation == "startswith":
+                    matched = haystack.startswith((needle, needle_normalized))
+                elif operation == "endswith":
+                    matched = haystack.endswith((needle, needle_normalized))
+                else:
+                    raise ValueError(f"Unsupported location lookup '{lookup_name}'.")
+                if matched:
+                    codes.add(self._codes[item])
+                    break
+        return codes
+
+    @cached_property
+    def _match_keys(self):
+        """Per level, a ``(normalized name, location)`` pair per name and alias."""
+        index = {}
+        for level in LEVELS:
+            aliases = LOCATION_ALIASES.get(level, {})
+            keys = []
+            for item in self.sources[level]:
+                names = {item.name, item.name_nepali, *aliases.get(item.name, ())}
+                keys.extend((_search_key(name), item) for name in names)
+            index[level] = keys
+        return index
+
+    def match(self, level, text, mode="contains"):
+        """
+        Find every location at a level whose name or alias matches ``text``.
+
+        Unlike ``search`` the result is complete, not ranked. Matching ignores
+        case, extra whitespace and the Chandrabindu/Anusvara difference.
+
+        Args:
+            level: One of 'province', 'district' or 'municipality'
+            text: English or Nepali text
+            mode: 'contains', 'startswith' or 'exact'
+
+        Returns:
+            Set of location objects
+        """
+        key = _search_key(text or "")
+        if not key:
+            return set()
+        if mode == "contains":
+            return {item for name, item in self._match_keys[level] if key in name}
+        if mode == "startswith":
+            return {
+                item for name, item in self._match_keys[level] if name.startswith(key)
+            }
+        if mode == "exact":
+            return {item for name, item in self._match_keys[level] if name == key}
+        raise ValueError(f"Unsupported match mode '{mode}'.")
+
+    def stored_values(self, locations, code=False):
+        """
+        Values a location column can hold for these locations.
+
+        Codes for code-backed fields, otherwise the names in both scripts.
+        """
+        if code:
+            return {self._codes[item] for item in locations}
+        return {name for item in locations for name in self._names(item)}
+
+    @cached_property
+    def _search_index(self):
+        """
+        Per-level prefix tries over names, aliases and the start of each word.
+
+        Every node keeps its best ``SEARCH_MAX_RESULTS`` entries already
+        ranked, so a query only walks its prefix and reads one list.
+        """
+        index = {}
+        for level in LEVELS:
+            aliases = LOCATION_ALIASES.get(level, {})
+            root = {}
+            exact = {}
+            for item in self.sources[level]:
+                full_keys = {_search_key(n) for n in (item.name, item.name_nepali)}
+                full_keys.update(_search_key(a) for a in aliases.get(item.name, ()))
+                word_keys = set()
+                for key in full_keys:
+                    exact.setdefault(key, set()).add(item)
+                    words = key.split(" ")
+                    for position in range(1, len(words)):
+                        if words[position] not in LOCATION_SEARCH_STOP_WORDS:
+                            word_keys.add(" ".join(words[position:]))
+                for kind, keys in ((0, full_keys), (1, word_keys - full_keys)):
+                    for key in keys:
+                        node = root
+                        for char in key:
+                            node = node.setdefault(char, {})
+                            best = node.setdefault(None, {})
+                            rank = (kind, len(item.name), item.name)
+                            if item not in best or rank < best[item]:
+                                best[item] = rank
+            self._finalize_search_node(root)
+            index[level] = (root, exact)
+        return index
+
+    @staticmethod
+    def _finalize_search_node(root):
+        """Replace each node's ``{item: rank}`` map with its ranked top entries."""
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            best = node.pop(None, None)
+            stack.extend(node.values())
+            if best is not None:
+                ordered = sorted(best.items(), key=lambda pair: pair[1])
+                node[None] = tuple(ordered[:SEARCH_MAX_RESULTS])
+
+    def search(self, query, limit=10, level=None):
+        """
+        Find locations whose name, alias or any word starts with ``query``.
+
+        Matching is case-insensitive and treats Chandrabindu and Anusvara
+        alike. Exact name matches rank first, then whole-name prefixes, then
+        word prefixes; provinces come before districts and municipalities.
+
+        Args:
+            query: Text typed by the user, in English or Nepali
+            limit: Maximum number of results (capped at ``SEARCH_MAX_RESULTS``)
+            level: Optional level to restrict the search to
+
+        Returns:
+            List of ``(level, location)`` tuples
+        """
+        key = _search_key(query or "")
+        if not key:
+            return []
+        limit = max(0, min(int(limit), SEARCH_MAX_RESULTS))
+        levels = (level,) if level else LEVELS
+
+        candidates = []
+        for level_index, current in enumerate(LEVELS):
+            if current not in levels:
+                continue
+            node, exact = self._search_index[current]
+            for char in key:
+                node = node.get(char)
+                if node is None:
+                    break
+            else:
+                exact_items = exact.get(key, ())
+                for item, (kind, length, name) in node.get(None, ()):
+                    first = 0 if item in exact_items else 1
+                    candidates.append(
+                        ((first, kind, level_index, length, name), current, item)
+                    )
+        candidates.sort(key=lambda candidate: candidate[0])
+        return [(current, item) for _rank, current, item in candidates[:limit]]
+
+
+registry = LocationRegistry()
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import re
 from typing import Any, Optional, Type
 
+from django.core.exceptions import FieldDoesNotExist
 from nepali.datetime import nepalidate, nepalidatetime
 
 try:
@@ -157,11 +159,79 @@ class NepaliCurrencySerializerField(serializers.Field):
         return data
 
 
+# strftime directive -> attribute of a BS date/datetime, zero-padded width
+_NUMERIC_DIRECTIVES = {
+    "Y": ("year", 4),
+    "m": ("month", 2),
+    "d": ("day", 2),
+    "H": ("hour", 2),
+    "M": ("minute", 2),
+    "S": ("second", 2),
+}
+
+_DEVANAGARI_DIGITS = str.maketrans("0123456789", "०१२३४५६७८९")
+
+
+def _numeric_template(format_string):
+    """
+    A ``str.format`` template equivalent to a numeric-only strftime format.
+
+    ``strftime_ne`` converts every value to AD before formatting; numeric
+    directives only need the BS fields. Returns None for other formats.
+    """
+    parts = []
+    for literal, directive in re.findall(r"([^%]*)(?:%(.))?", format_string):
+        parts.append(literal.replace("{", "{{").replace("}", "}}"))
+        if directive:
+            if directive not in _NUMERIC_DIRECTIVES:
+                return None
+            attribute, width = _NUMERIC_DIRECTIVES[directive]
+            parts.append(f"{{0.{attribute}:0{width}d}}")
+    return "".join(parts)
+
+
+def _localize_date(format_string, nepali_type):
+    template = _numeric_template(format_string)
+
+    def localize(instance, field_name, value):
+        raw_val = getattr(instance, field_name)
+        if template is not None and type(raw_val) is nepali_type:
+            return template.format(raw_val).translate(_DEVANAGARI_DIGITS)
+        if hasattr(raw_val, "strftime_ne"):
+            return raw_val.strftime_ne(format_string)
+        return _SKIP
+
+    return localize
+
+
+def _localize_currency(instance, field_name, value):
+    return format_nepali_currency(value, currency_symbol="", ne=True)
+
+
+def _localize_location(level, ne):
+    from django_nepkit.registry import registry
+
+    def localize(instance, field_name, value):
+        return registry.translate(level, value, ne=ne)
+
+    return localize
+
+
+# Returned by a localizer when there is nothing to add.
+_SKIP = object()
+
+
 class NepaliLocalizedSerializerMixin:
     """
     A mixin for ModelSerializer that automatically adds localized counterparts
     for eligible fields if `ne=True` is passed in the context.
-    Eligible fields: NepaliDateField, NepaliDateTimeField, NepaliCurrencyField.
+    Eligible fields: NepaliDateField, NepaliDateTimeField, NepaliCurrencyField,
+    and location fields, which get their name in the other language
+    (`province_ne`, or `province_en` for a field storing Nepali names).
+
+    Which output keys are eligible, and how each is localized, is worked out
+    once per serializer class and set of output keys; each instance then only
+    runs the resulting plan.
 
     Usage:
         class MySerializer(NepaliLocalizedSerializerMixin, serializers.ModelSerializer):
@@ -174,39 +244,64 @@ class NepaliLocalizedSerializerMixin:
         if not ne:
             return ret
 
+        model = getattr(self.Meta, "model", None)  # type: ignore[attr-defined]
+        if not model:
+            return ret
+
+        for field_name, localized_name, localize in self._get_localized_plan(
+            model, tuple(ret)
+        ):
+            if localized_name in ret:
+                continue
+            try:
+                localized = localize(instance, field_name, ret[field_name])
+            except (ValueError, KeyError, AttributeError):
+                continue
+            if localized is not _SKIP:
+                ret[localized_name] = localized
+
+        return ret
+
+    @classmethod
+    def _get_localized_plan(cls, model, keys):
+        plans = cls.__dict__.get("_nepkit_localized_plans")
+        if plans is None:
+            plans = {}
+            cls._nepkit_localized_plans = plans
+        try:
+            return plans[(model, keys)]
+        except KeyError:
+            plan = plans[(model, keys)] = cls._build_localized_plan(model, keys)
+            return plan
+
+    @staticmethod
+    def _build_localized_plan(model, keys):
+        """List ``(field_name, localized_name, localize)`` for eligible keys."""
         from django_nepkit.models import (
+            BaseLocationField,
             NepaliCurrencyField,
             NepaliDateField,
             NepaliDateTimeField,
         )
 
-        model = getattr(self.Meta, "model", None)  # type: ignore[attr-defined]
-        if not model:
-            return ret
-
-        for field_name, value in list(ret.items()):
+        plan = []
+        for field_name in keys:
             try:
                 model_field = model._meta.get_field(field_name)
-                localized_name = f"{field_name}_ne"
-
-                if localized_name in ret:
-                    continue
-
-                if isinstance(model_field, NepaliDateField):
-                    raw_val = getattr(instance, field_name)
-                    if hasattr(raw_val, "strftime_ne"):
-                        ret[localized_name] = raw_val.strftime_ne(BS_DATE_FORMAT)
-
-                elif isinstance(model_field, NepaliDateTimeField):
-                    raw_val = getattr(instance, field_name)
-                    if hasattr(raw_val, "strftime_ne"):
-                        ret[localized_name] = raw_val.strftime_ne(BS_DATETIME_FORMAT)
-
-                elif isinstance(model_field, NepaliCurrencyField):
-                    ret[localized_name] = format_nepali_currency(
-                        value, currency_symbol="", ne=True
-                    )
-            except Exception:
+            except FieldDoesNotExist:
                 continue
-
-        return ret
+            localized_name = f"{field_name}_ne"
+            if isinstance(model_field, NepaliDateField):
+                localize = _localize_date(BS_DATE_FORMAT, nepalidate)
+            elif isinstance(model_field, NepaliDateTimeField):
+                localize = _localize_date(BS_DATETIME_FORMAT, nepalidatetime)
+            elif isinstance(model_field, BaseLocationField) and model_field.level:
+                if model_field.ne:
+                    localized_name = f"{field_name}_en"
+                localize = _localize_location(model_field.level, not model_field.ne)
+            elif isinstance(model_field, NepaliCurrencyField):
+                localize = _localize_currency
+            else:
+                continue
+            plan.append((field_name, localized_name, localize))
+        return tuple(plan)
@@ -15,7 +15,13 @@
         return PLACEHOLDERS[type][isNepali ? 'ne' : 'en'];
     }
 
-    function updateOptions(selectElement, data, placeholder) {
+    /**
+     * Replace the options of a select.
+     * With keepValue, the current selection is restored and no change event
+     * is fired, so dependent selects are not cleared.
+     */
+    function updateOptions(selectElement, data, placeholder, keepValue) {
+        const previous = selectElement.value;
         selectElement.innerHTML = '';
         if (placeholder) {
             const opt = document.createElement('option');
@@ -29,6 +35,10 @@
             opt.textContent = item.text;
             selectElement.appendChild(opt);
         });
+        if (keepValue) {
+            selectElement.value = previous;
+            return;
+        }
         selectElement.dispatchEvent(new Event('change'));
     }
 
@@ -41,22 +51,225 @@
         if (type === 'districts') {
             return data.districts[parentId] || [];
         } else if (type === 'municipalities') {
+            // With per-province chunks, a district's list may not be loaded yet
+            if (data.chunks && !(parentId in data.municipalities)) return null;
             return data.municipalities[parentId] || [];
         }
         return null;
     }
 
-    function getMatchingSelect(container, selector, isNepali) {
-        const matches = container.querySelectorAll(selector);
-        for (let el of matches) {
-            const elIsNepali = el.dataset.ne === 'true';
-            if (elIsNepali === isNepali) {
-                return el;
+    const chunkRequests = {};
+
+    /**
+     * URL of the per-province chunk holding a district's municipalities,
+     * when the data was generated with chunks and it is not loaded yet.
+     */
+    function getChunkUrl(type, parentId, isNepali) {
+        if (type !== 'municipalities' || !window.NEPKIT_DATA) return null;
+        const data = window.NEPKIT_DATA[isNepali ? 'ne' : 'en'];
+        if (!data || !data.chunks || parentId in data.municipalities) return null;
+
+        for (const province in data.districts) {
+            if (data.districts[province].some(item => item.id === parentId)) {
+                return data.chunks[province] || null;
             }
         }
         return null;
     }
 
+    function loadChunk(url) {
+        if (!chunkRequests[url]) {
+            chunkRequests[url] = new Promise((resolve, reject) => {
+                const script = document.createElement('script');
+                script.src = url;
+                script.async = true;
+                script.onload = resolve;
+                script.onerror = () => {
+                    delete chunkRequests[url];
+                    reject();
+                };
+                document.head.appendChild(script);
+            });
+        }
+        return chunkRequests[url];
+    }
+
+    /**
+     * Name prefix shared by the fields of one address block, e.g. "form-0-"
+     * for "form-0-province" in a formset, or "" for a plain form.
+     */
+    function namePrefix(select) {
+        const name = select.name || '';
+        return name.slice(0, name.lastIndexOf('-') + 1);
+    }
+
+    /**
+     * Find the child select that belongs to the same address block as
+     * `parentSelect`. A child may name its parent explicitly with
+     * `data-parent` (the parent's name or id); otherwise both must share the
+     * form's field-name prefix. Returns null unless exactly one select
+     * matches, so selects in other blocks are never touched.
+     */
+    function findChildSelect(parentSelect, selector, isNepali) {
+        const container = parentSelect.closest('form') || document;
+        const candidates = Array.from(container.querySelectorAll(selector))
+            .filter(el => (el.dataset.ne === 'true') === isNepali);
+
+        const explicit = candidates.filter(el => el.dataset.parent &&
+            (el.dataset.parent === parentSelect.name || el.dataset.parent === parentSelect.id));
+        if (explicit.length) return explicit.length === 1 ? explicit[0] : null;
+
+        const prefix = namePrefix(parentSelect);
+        const matches = candidates.filter(el => !el.dataset.parent && namePrefix(el) === prefix);
+        return matches.length === 1 ? matches[0] : null;
+    }
+
+    // Responses are memoized per URL for the page's lifetime and, when the
+    // widget provides its dataset version, persisted in sessionStorage under
+    // that version so that later page loads skip the network entirely.
+    const STORAGE_PREFIX = 'nepkit:';
+    const memo = new Map();
+    // Network requests still in flight, with how many owners wait for them
+    const inflight = new Map();
+    const pending = new WeakMap();
+    // Selects updated by the user since load; hydration leaves them alone
+    const touched = new WeakSet();
+    let prunedVersion = null;
+
+    function storageKey(url, version) {
+        return STORAGE_PREFIX + version + ':' + url;
+    }
+
+    function readStored(url, version) {
+        if (!version) return null;
+        try {
+            const raw = window.sessionStorage.getItem(storageKey(url, version));
+            return raw ? JSON.parse(raw) : null;
+        } catch (e) {
+            return null;
+        }
+    }
+
+    function writeStored(url, version, data) {
+        if (!version) return;
+        try {
+            if (prunedVersion !== version) {
+                // Drop entries saved for older datasets
+                for (let i = window.sessionStorage.length - 1; i >= 0; i--) {
+                    const key = window.sessionStorage.key(i);
+                    if (key.indexOf(STORAGE_PREFIX) === 0 && key.indexOf(STORAGE_PREFIX + version + ':') !== 0) {
+                        window.sessionStorage.removeItem(key);
+                    }
+                }
+                prunedVersion = version;
+            }
+            window.sessionStorage.setItem(storageKey(url, version), JSON.stringify(data));
+        } catch (e) {
+            // Storage may be full or disabled; the in-memory memo still applies
+        }
+    }
+
+    /**
+     * Cancel the request a select is still waiting for, if any.
+     */
+    function cancelPending(owner) {
+        const previous = pending.get(owner);
+        if (previous && previous.cancel) previous.cancel();
+        pending.delete(owner);
+    }
+
+    function abortError() {
+        const error = new Error('Request superseded');
+        error.name = 'AbortError';
+        return error;
+    }
+
+    /**
+     * Start (or reuse) the shared request for a URL. Every owner waiting for
+     * it holds a reference; the network request is only aborted once none is
+     * left.
+     */
+    function sharedRequest(url, version) {
+        if (!memo.has(url)) {
+            const stored = readStored(url, version);
+            if (stored) {
+                memo.set(url, Promise.resolve(stored));
+            }
+        }
+        if (memo.has(url)) return memo.get(url);
+
+        const controller = typeof AbortController !== 'undefined' ? new AbortController() : null;
+        const entry = { controller: controller, waiting: 0 };
+        const request = fetch(url, controller ? { signal: controller.signal } : undefined)
+            .then(response => {
+                if (!response.ok) throw new Error('Request failed: ' + response.status);
+                return response.json();
+            })
+            .then(data => {
+                writeStored(url, version, data);
+                return data;
+            });
+        memo.set(url, request);
+        inflight.set(url, entry);
+        request.then(() => inflight.delete(url), () => {
+            // Failed or aborted requests are not remembered
+            inflight.delete(url);
+            if (memo.get(url) === request) memo.delete(url);
+        });
+        return request;
+    }
+
+    /**
+     * Fetch JSON through the memo. A new request for the same owner (a
+     * select) cancels the one it supersedes; owners asking for the same URL
+     * share one network request, which each of them can drop independently.
+     */
+    function fetchJson(url, owner, version) {
+        cancelPending(owner);
+
+        const shared = sharedRequest(url, version);
+        const entry = inflight.get(url);
+        if (entry) entry.waiting++;
+
+        let settled = false;
+        return new Promise((resolve, reject) => {
+            pending.set(owner, {
+                url: url,
+                cancel: function() {
+                    if (settled) return;
+                    settled = true;
+                    if (entry && --entry.waiting === 0 && entry.controller && inflight.get(url) === entry) {
+                        entry.controller.abort();
+                    }
+                    reject(abortError());
+                }
+            });
+            shared.then(data => {
+                if (settled) return;
+                settled = true;
+                resolve(data);
+            }, error => {
+                if (settled) return;
+                settled = true;
+                reject(error);
+            });
+        });
+    }
+
+    /**
+     * Whether a response is still the latest one its owner asked for.
+     */
+    function isCurrent(owner, url) {
+        const current = pending.get(owner);
+        if (!current || current.url !== url) return false;
+        pending.delete(owner);
+        return true;
+    }
+
+    function ignoreAbort(error) {
+        if (!error || error.name !== 'AbortError') throw error;
+    }
+
     /**
      * Fetch data from server endpoint
      */
@@ -67,11 +280,12 @@
         if (isNepali) url += '&ne=true';
         if (selectElement.dataset.en === 'true') url += '&en=true';
 
-        fetch(url)
-            .then(response => response.json())
+        fetchJson(url, selectElement, selectElement.dataset.version)
             .then(data => {
+                if (!isCurrent(selectElement, url)) return;
                 updateOptions(selectElement, data, getPlaceholder(placeholderType, isNepali));
-            });
+            })
+            .catch(ignoreAbort);
     }
 
     /**
@@ -80,27 +294,128 @@
     function updateDependentSelect(childSelect, dataType, parentValue, placeholderType, isNepali, paramName) {
         if (!childSelect) return;
 
+        // Whatever happens next supersedes any request still in flight
+        cancelPending(childSelect);
+        touched.add(childSelect);
+
         if (!parentValue) {
             updateOptions(childSelect, [], getPlaceholder(placeholderType, isNepali));
             return;
         }
 
         const localData = getLocalData(dataType, parentValue, isNepali);
+        const chunkUrl = getChunkUrl(dataType, parentValue, isNepali);
 
         if (localData) {
             updateOptions(childSelect, localData, getPlaceholder(placeholderType, isNepali));
+        } else if (chunkUrl) {
+            // Chunks are not aborted, but a newer parent value still wins
+            pending.set(childSelect, { url: chunkUrl, cancel: null });
+            loadChunk(chunkUrl)
+                .then(() => {
+                    if (!isCurrent(childSelect, chunkUrl)) return;
+                    const data = getLocalData(dataType, parentValue, isNepali) || [];
+                    updateOptions(childSelect, data, getPlaceholder(placeholderType, isNepali));
+                })
+                .catch(() => {
+                    if (!isCurrent(childSelect, chunkUrl)) return;
+                    fetchData(childSelect, paramName, parentValue, placeholderType, isNepali);
+                });
         } else {
             fetchData(childSelect, paramName, parentValue, placeholderType, isNepali);
         }
     }
 
+    /**
+     * Narrow pre-filled district and municipality selects to their parent's
+     * children, keeping the selected values. Anything not covered by local
+     * data is fetched from the batch endpoint in one request per language.
+     */
+    function hydrate() {
+        const batches = {};
+
+        // Narrow a pre-filled select, unless that would drop its saved value
+        function narrow(select, data, placeholder) {
+            if (select.value && !data.some(item => String(item.id) === select.value)) return;
+            updateOptions(select, data, placeholder, true);
+        }
+
+        function queue(childSelect, dataType, parentValue, placeholderType, isNepali) {
+            if (!childSelect) return;
+            const placeholder = getPlaceholder(placeholderType, isNepali);
+            const localData = getLocalData(dataType, parentValue, isNepali);
+            if (localData) {
+                narrow(childSelect, localData, placeholder);
+                return;
+            }
+            const chunkUrl = getChunkUrl(dataType, parentValue, isNepali);
+            if (chunkUrl) {
+                loadChunk(chunkUrl).then(() => {
+                    if (touched.has(childSelect)) return;
+                    const data = getLocalData(dataType, parentValue, isNepali) || [];
+                    narrow(childSelect, data, placeholder);
+                }).catch(() => {});
+                return;
+            }
+            const batchUrl = childSelect.dataset.batchUrl;
+            if (!batchUrl) return;
+
+            const key = batchUrl + '|' + isNepali + '|' + (childSelect.dataset.en === 'true');
+            if (!batches[key]) {
+                batches[key] = {
+                    url: batchUrl,
+                    isNepali: isNepali,
+                    en: childSelect.dataset.en === 'true',
+                    version: childSelect.dataset.version,
+                    items: []
+                };
+            }
+            batches[key].items.push({ select: childSelect, dataType: dataType, parent: parentValue, placeholder: placeholder });
+        }
+
+        document.querySelectorAll('.nepkit-province-select').forEach(provinceSelect => {
+            if (!provinceSelect.value) return;
+            const isNepali = provinceSelect.dataset.ne === 'true';
+            const districtSelect = findChildSelect(provinceSelect, '.nepkit-district-select', isNepali);
+            queue(districtSelect, 'districts', provinceSelect.value, 'district', isNepali);
+        });
+
+        document.querySelectorAll('.nepkit-district-select').forEach(districtSelect => {
+            if (!districtSelect.value) return;
+            const isNepali = districtSelect.dataset.ne === 'true';
+            const municipalitySelect = findChildSelect(districtSelect, '.nepkit-municipality-select', isNepali);
+            queue(municipalitySelect, 'municipalities', districtSelect.value, 'municipality', isNepali);
+        });
+
+        Object.values(batches).forEach(batch => {
+            const params = new URLSearchParams();
+            batch.items.forEach(item => {
+                params.append(item.dataType === 'districts' ? 'province' : 'district', item.parent);
+            });
+            if (batch.isNepali) params.append('ne', 'true');
+            if (batch.en) params.append('en', 'true');
+
+            const url = batch.url + '?' + params.toString();
+            fetchJson(url, batch, batch.version)
+                .then(data => {
+                    batch.items.forEach(item => {
+                        const children = (data[item.dataType] || {})[item.parent];
+                        // Skip selects the user changed while this was loading
+                        if (children && !touched.has(item.select)) {
+                            narrow(item.select, children, item.placeholder);
+                        }
+                    });
+                })
+                .catch(ignoreAbort);
+        });
+    }
+
     function init() {
         // Initialize province selects
         document.querySelectorAll('.nepkit-province-select').forEach(provinceSelect => {
             const isNepali = provinceSelect.dataset.ne === 'true';
-            const container = provinceSelect.closest('form') || document;
-            const districtSelect = getMatchingSelect(container, '.nepkit-district-select', isNepali);
-            const municipalitySelect = getMatchingSelect(container, '.nepkit-municipality-select', isNepali);
+            const districtSelect = findChildSelect(provinceSelect, '.nepkit-district-select', isNepali);
+            const municipalitySelect = districtSelect && findChildSelect(districtSelect, '.nepkit-municipality-select', isNepali);
 
             if (!provinceSelect.value) {
                 if (districtSelect && !districtSelect.value) {
@@ -115,8 +430,7 @@
         // Initialize district selects
         document.querySelectorAll('.nepkit-district-select').forEach(districtSelect => {
             const isNepali = districtSelect.dataset.ne === 'true';
-            const container = districtSelect.closest('form') || document;
-            const municipalitySelect = getMatchingSelect(container, '.nepkit-municipality-select', isNepali);
+            const municipalitySelect = findChildSelect(districtSelect, '.nepkit-municipality-select', isNepali);
 
             if (!districtSelect.value) {
                 if (municipalitySelect && !municipalitySelect.value) {
@@ -124,6 +438,8 @@
                 }
             }
         });
+
+        hydrate();
     }
 
     document.addEventListener('change', function(e) {
@@ -131,9 +447,8 @@
         if (e.target.matches('.nepkit-province-select')) {
             const province = e.target.value;
             const isNepali = e.target.dataset.ne === 'true';
-            const container = e.target.closest('form') || document;
-            const districtSelect = getMatchingSelect(container, '.nepkit-district-select', isNepali);
-            const municipalitySelect = getMatchingSelect(container, '.nepkit-municipality-select', isNepali);
+            const districtSelect = findChildSelect(e.target, '.nepkit-district-select', isNepali);
+            const municipalitySelect = districtSelect && findChildSelect(districtSelect, '.nepkit-municipality-select', isNepali);
 
             // Always clear municipality if province changes
             if (municipalitySelect) {
@@ -148,8 +463,7 @@
         if (e.target.matches('.nepkit-district-select')) {
             const district = e.target.value;
             const isNepali = e.target.dataset.ne === 'true';
-            const container = e.target.closest('form') || document;
-            const municipalitySelect = getMatchingSelect(container, '.nepkit-municipality-select', isNepali);
+            const municipalitySelect = findChildSelect(e.target, '.nepkit-municipality-select', isNepali);
 
             // Update municipality options
             updateDependentSelect(municipalitySelect, 'municipalities', district, 'municipality', isNepali, 'district');
@@ -0,0 +1,2 @@
+window.NEPKIT_DATA = window.NEPKIT_DATA || {};
+window.NEPKIT_DATA.en = {"version":"c80d1f1b8c9b89af","provinces":[{"id":"Sudurpaschim Province","text":"Sudurpaschim Province"},{"id":"Madhesh Province","text":"Madhesh Province"},{"id":"Gandaki Province","text":"Gandaki Province"},{"id":"Bagmati Province","text":"Bagmati Province"},{"id":"Lumbini Province","text":"Lumbini Province"},{"id":"Karnali Province","text":"Karnali Province"},{"id":"Koshi Province","text":"Koshi Province"}],"districts":{"Sudurpaschim Province":[{"id":"Bajura","text":"Bajura"},{"id":"Bajhang","text":"Bajhang"},{"id":"Baitadi","text":"Baitadi"},{"id":"Dadeldhura","text":"Dadeldhura"},{"id":"Doti","text":"Doti"},{"id":"Achham","text":"Achham"},{"id":"Kailali","text":"Kailali"},{"id":"Darchula","text":"Darchula"},{"id":"Kanchanpur","text":"Kanchanpur"}],"Madhesh Province":[{"id":"Saptari","text":"Saptari"},{"id":"Siraha","text":"Siraha"},{"id":"Dhanusa","text":"Dhanusa"},{"id":"Mahottari","text":"Mahottari"},{"id":"Sarlahi","text":"Sarlahi"},{"id":"Rautahat","text":"Rautahat"},{"id":"Bara","text":"Bara"},{"id":"Parsa","text":"Parsa"}],"Gandaki Province":[{"id":"Gorkha","text":"Gorkha"},{"id":"Manang","text":"Manang"},{"id":"Mustang","text":"Mustang"},{"id":"Myagdi","text":"Myagdi"},{"id":"Kaski","text":"Kaski"},{"id":"Lamjung","text":"Lamjung"},{"id":"Tanahu","text":"Tanahu"},{"id":"Nawalparasi East","text":"Nawalparasi East"},{"id":"Syangja","text":"Syangja"},{"id":"Parbat","text":"Parbat"},{"id":"Baglung","text":"Baglung"}],"Bagmati Province":[{"id":"Dolakha","text":"Dolakha"},{"id":"Sindhupalchok","text":"Sindhupalchok"},{"id":"Rasuwa","text":"Rasuwa"},{"id":"Dhading","text":"Dhading"},{"id":"Nuwakot","text":"Nuwakot"},{"id":"Kathmandu","text":"Kathmandu"},{"id":"Bhaktapur","text":"Bhaktapur"},{"id":"Lalitpur","text":"Lalitpur"},{"id":"Kavrepalanchok","text":"Kavrepalanchok"},{"id":"Ramechhap","text":"Ramechhap"},{"id":"Sindhuli","text":"Sindhuli"},{"id":"Makwanpur","text":"Makwanpur"},{"id":"Chitawan","text":"Chitawan"}],"Lumbini Province":[{"id":"Rukum East","text":"Rukum East"},{"id":"Rolpa","text":"Rolpa"},{"id":"Pyuthan","text":"Pyuthan"},{"id":"Gulmi","text":"Gulmi"},{"id":"Arghakhanchi","text":"Arghakhanchi"},{"id":"Palpa","text":"Palpa"},{"id":"Rupandehi","text":"Rupandehi"},{"id":"Kapilvastu","text":"Kapilvastu"},{"id":"Dang","text":"Dang"},{"id":"Banke","text":"Banke"},{"id":"Bardiya","text":"Bardiya"},{"id":"Nawalparasi West","text":"Nawalparasi West"}],"Karnali Province":[{"id":"Dolpa","text":"Dolpa"},{"id":"Mugu","text":"Mugu"},{"id":"Jumla","text":"Jumla"},{"id":"Kalikot","text":"Kalikot"},{"id":"Dailekh","text":"Dailekh"},{"id":"Jajarkot","text":"Jajarkot"},{"id":"Salyan","text":"Salyan"},{"id":"Surkhet","text":"Surkhet"},{"id":"Humla","text":"Humla"},{"id":"Rukum West","text":"Rukum West"}],"Koshi Province":[{"id":"Taplejung","text":"Taplejung"},{"id":"Sankhuwasabha","text":"Sankhuwasabha"},{"id":"Solukhumbu","text":"Solukhumbu"},{"id":"Okhaldhunga","text":"Okhaldhunga"},{"id":"Khotang","text":"Khotang"},{"id":"Bhojpur","text":"Bhojpur"},{"id":"Dhankuta","text":"Dhankuta"},{"id":"Tehrathum","text":"Tehrathum"},{"id":"Panchthar","text":"Panchthar"},{"id":"Ilam","text":"Ilam"},{"id":"Jhapa","text":"Jhapa"},{"id":"Morang","text":"Morang"},{"id":"Sunsari","text":"Sunsari"},{"id":"Udayapur","text":"Udayapur"}]},"municipalities":{"Bajura":[{"id":"Himali Rural Municipality","text":"Himali Rural Municipality"},{"id":"Gaumul Rural Municipality","text":"Gaumul Rural Municipality"},{"id":"Badimalika Municipality","text":"Badimalika Municipality"},{"id":"Chhededaha Rural Municipality","text":"Chhededaha Rural Municipality"},{"id":"Budhiganga Municipality","text":"Budhiganga Municipality"},{"id":"Tribeni Municipality","text":"Tribeni Municipality"},{"id":"Jagannath Rural Municipality","text":"Jagannath Rural Municipality"},{"id":"Budhinanda Municipality","text":"Budhinanda Municipality"},{"id":"Swami Kartik Rural Municipality","text":"Swami Kartik Rural Municipality"}],"Bajhang":[{"id":"Kanda Rural Municipality","text":"Kanda Rural Municipality"},{"id":"Bungal Municipality","text":"Bungal Municipality"},{"id":"Talkot Rural Municipality","text":"Talkot Rural Municipality"},{"id":"Masta Rural Municipality","text":"Masta Rural Municipality"},{"id":"Jayaprithbi Municipality","text":"Jayaprithbi Municipality"},{"id":"Chhabis Pathibhara Rural Municipality","text":"Chhabis Pathibhara Rural Municipality"},{"id":"Durgathali Rural Municipality","text":"Durgathali Rural Municipality"},{"id":"Bitthadchir Rural Municipality","text":"Bitthadchir Rural Municipality"},{"id":"Thalara Rural Municipality","text":"Thalara Rural Municipality"},{"id":"Khaptad Chhanna Rural Municipality","text":"Khaptad Chhanna Rural Municipality"},{"id":"Surma Rural Municipality","text":"Surma Rural Municipality"},{"id":"Kedarsyun Rural Municipality","text":"Kedarsyun Rural Municipality"}],"Baitadi":[{"id":"Dilasaini Rural Municipality","text":"Dilasaini Rural Municipality"},{"id":"Dogada Kedar Rural Municipality","text":"Dogada Kedar Rural Municipality"},{"id":"Puchaundi Municipality","text":"Puchaundi Municipality"},{"id":"Surnaya Rural Municipality","text":"Surnaya Rural Municipality"},{"id":"Dasharathchand Municipality","text":"Dasharathchand Municipality"},{"id":"Shivanath Rural Municipality","text":"Shivanath Rural Municipality"},{"id":"Melauli Municipality","text":"Melauli Municipality"},{"id":"Patan Municipality","text":"Patan Municipality"},{"id":"Sigas Rural Municipality","text":"Sigas Rural Municipality"},{"id":"Pancheshwor Rural Municipality","text":"Pancheshwor Rural Municipality"}],"Dadeldhura":[{"id":"Nawadurga Rural Municipality","text":"Nawadurga Rural Municipality"},{"id":"Amargadhi Municipality","text":"Amargadhi Municipality"},{"id":"Bhageshwor Rural Municipality","text":"Bhageshwor Rural Municipality"},{"id":"Parashuram Municipality","text":"Parashuram Municipality"},{"id":"Aalital Rural Municipality","text":"Aalital Rural Municipality"},{"id":"Ganyapdhura Rural Municipality","text":"Ganyapdhura Rural Municipality"},{"id":"Ajayameru Rural Municipality","text":"Ajayameru Rural Municipality"}],"Doti":[{"id":"Purbichouki Rural Municipality","text":"Purbichouki Rural Municipality"},{"id":"Sayal Rural Municipality","text":"Sayal Rural Municipality"},{"id":"K.I. Singh Rural Municipality","text":"K.I. Singh Rural Municipality"},{"id":"Bogatan Foodsil Rural Municipality","text":"Bogatan Foodsil Rural Municipality"},{"id":"Badi Kedar Rural Municipality","text":"Badi Kedar Rural Municipality"},{"id":"Jorayal Rural Municipality","text":"Jorayal Rural Municipality"},{"id":"Aadarsha Rural Municipality","text":"Aadarsha Rural Municipality"},{"id":"Shikhar Municipality","text":"Shikhar Municipality"},{"id":"Dipayal Silgadhi Municipality","text":"Dipayal Silgadhi Municipality"}],"Achham":[{"id":"Ramaroshan Rural Municipality","text":"Ramaroshan Rural Municipality"},{"id":"Mellekh Rural Municipality","text":"Mellekh Rural Municipality"},{"id":"Sanphebagar Municipality","text":"Sanphebagar Municipality"},{"id":"Chaurpati Rural Municipality","text":"Chaurpati Rural Municipality"},{"id":"Mangalsen Municipality","text":"Mangalsen Municipality"},{"id":"Kamal Bazar Municipality","text":"Kamal Bazar Municipality"},{"id":"Dhakari Rural Municipality","text":"Dhakari Rural Municipality"},{"id":"Turmakhand Rural Municipality","text":"Turmakhand Rural Municipality"},{"id":"Panchdebal Binayak Municipality","text":"Panchdebal Binayak Municipality"},{"id":"Bannigadhi Jayagadh Rural Municipality","text":"Bannigadhi Jayagadh Rural Municipality"}],"Kailali":[{"id":"Mohanyal Rural Municipality","text":"Mohanyal Rural Municipality"},{"id":"Chure Rural Municipality","text":"Chure Rural Municipality"},{"id":"Godawari Municipality","text":"Godawari Municipality"},{"id":"Gauriganga Municipality","text":"Gauriganga Municipality"},{"id":"Bardagoriya Rural Municipality","text":"Bardagoriya Rural Municipality"},{"id":"Lamki Chuha Municipality","text":"Lamki Chuha Municipality"},{"id":"Janaki Rural Municipality","text":"Janaki Rural Municipality"},{"id":"Joshipur Rural Municipality","text":"Joshipur Rural Municipality"},{"id":"Tikapur Municipality","text":"Tikapur Municipality"},{"id":"Bhajani Municipality","text":"Bhajani Municipality"},{"id":"Dhangadhi Sub-Metropolitan City","text":"Dhangadhi Sub-Metropolitan City"},{"id":"Ghodaghodi Municipality","text":"Ghodaghodi Municipality"},{"id":"Kailari Rural Municipality","text":"Kailari Rural Municipality"}],"Darchula":[{"id":"Byas Rural Municipality","text":"Byas Rural Municipality"},{"id":"Duhun Rural Municipality","text":"Duhun Rural Municipality"},{"id":"Mahakali Municipality","text":"Mahakali Municipality"},{"id":"Apihimal Rural Municipality","text":"Apihimal Rural Municipality"},{"id":"Marma Rural Municipality","text":"Marma Rural Municipality"},{"id":"Shailyashikhar Municipality","text":"Shailyashikhar Municipality"},{"id":"Lekam Rural Municipality","text":"Lekam Rural Municipality"},{"id":"Naugad Rural Municipality","text":"Naugad Rural Municipality"},{"id":"Malikarjun Rural Municipality","text":"Malikarjun Rural Municipality"}],"Kanchanpur":[{"id":"Krishnapur Municipality","text":"Krishnapur Municipality"},{"id":"Shuklaphanta Municipality","text":"Shuklaphanta Municipality"},{"id":"Bedkot Municipality","text":"Bedkot Municipality"},{"id":"Bhimdatta Municipality","text":"Bhimdatta Municipality"},{"id":"Laljhadi Rural Municipality","text":"Laljhadi Rural Municipality"},{"id":"Punarbas Municipality","text":"Punarbas Municipality"},{"id":"Belouri Municipality","text":"Belouri Municipality"},{"id":"Beldandi Rural Municipality","text":"Beldandi Rural Municipality"},{"id":"Mahakali Municipality","text":"Mahakali Municipality"}],"Saptari":[{"id":"Saptakoshi Municipality","text":"Saptakoshi Municipality"},{"id":"Kanchanrup Municipality","text":"Kanchanrup Municipality"},{"id":"Rupani Rural Municipality","text":"Rupani Rural Municipality"},{"id":"Shambhunath Municipality","text":"Shambhunath Municipality"},{"id":"Surunga Municipality","text":"Surunga Municipality"},{"id":"Balan-Bihul Rural Municipality","text":"Balan-Bihul Rural Municipality"},{"id":"BodeBarsain Municipality","text":"BodeBarsain Municipality"},{"id":"Belhi Chapena Rural Municipality","text":"Belhi Chapena Rural Municipality"},{"id":"Bishnupur Rural Municipality","text":"Bishnupur Rural Municipality"},{"id":"Rajbiraj Municipality","text":"Rajbiraj Municipality"},{"id":"Mahadewa Rural Municipality","text":"Mahadewa Rural Municipality"},{"id":"Tirahut Rural Municipality","text":"Tirahut Rural Municipality"},{"id":"Tilathi Koiladi Rural Municipality","text":"Tilathi Koiladi Rural Municipality"},{"id":"Chhinnamasta Rural Municipality","text":"Chhinnamasta Rural Municipality"},{"id":"Agnisair Krishna Sabaran Rural Municipality","text":"Agnisair Krishna Sabaran Rural Municipality"},{"id":"Khadak Municipality","text":"Khadak Municipality"},{"id":"Dakneshwori Municipality","text":"Dakneshwori Municipality"},{"id":"Hanumannagar Kankalini Municipality","text":"Hanumannagar Kankalini Municipality"}],"Siraha":[{"id":"Lahan Municipality","text":"Lahan Municipality"},{"id":"Dhangadhimai Municipality","text":"Dhangadhimai Municipality"},{"id":"Golbazar Municipality","text":"Golbazar Municipality"},{"id":"Mirchaiya Municipality","text":"Mirchaiya Municipality"},{"id":"Karjanha Municipality","text":"Karjanha Municipality"},{"id":"Naraha Rural Municipality","text":"Naraha Rural Municipality"},{"id":"Bishnupur Rural Municipality","text":"Bishnupur Rural Municipality"},{"id":"Arnama Rural Municipality","text":"Arnama Rural Municipality"},{"id":"Sukhipur Municipality","text":"Sukhipur Municipality"},{"id":"Sakhuwa Nankarkatti Rural Municipality","text":"Sakhuwa Nankarkatti Rural Municipality"},{"id":"Bhagawanpur Rural Municipality","text":"Bhagawanpur Rural Municipality"},{"id":"Nawarajpur Rural Municipality","text":"Nawarajpur Rural Municipality"},{"id":"Bariyarpatti Rural Municipality","text":"Bariyarpatti Rural Municipality"},{"id":"Aurahi Rural Municipality","text":"Aurahi Rural Municipality"},{"id":"Siraha Municipality","text":"Siraha Municipality"},{"id":"Kalyanpur Municipality","text":"Kalyanpur Municipality"},{"id":"Laxmipur Patari Rural Municipality","text":"Laxmipur Patari Rural Municipality"}],"Dhanusa":[{"id":"Dhanushadham Municipality","text":"Dhanushadham Municipality"},{"id":"Mithila Municipality","text":"Mithila Municipality"},{"id":"Bateshwor Rural Municipality","text":"Bateshwor Rural Municipality"},{"id":"Chhireshwornath Municipality","text":"Chhireshwornath Municipality"},{"id":"Laxminiya Rural Municipality","text":"Laxminiya Rural Municipality"},{"id":"Mithila Bihari Municipality","text":"Mithila Bihari Municipality"},{"id":"Hansapur Municipality","text":"Hansapur Municipality"},{"id":"Shahidnagar Municipality","text":"Shahidnagar Municipality"},{"id":"Kamala Municipality","text":"Kamala Municipality"},{"id":"Janak Nandini Rural Municipality","text":"Janak Nandini Rural Municipality"},{"id":"Bideha Municipality","text":"Bideha Municipality"},{"id":"Janakpur Sub-Metropolitan City","text":"Janakpur Sub-Metropolitan City"},{"id":"Dhanauji Rural Municipality","text":"Dhanauji Rural Municipality"},{"id":"Nagarain Municipality","text":"Nagarain Municipality"},{"id":"Ganeshman Charnath Municipality","text":"Ganeshman Charnath Municipality"},{"id":"Sabaila Municipality","text":"Sabaila Municipality"},{"id":"Aurahi Rural Municipality","text":"Aurahi Rural Municipality"},{"id":"Mukhiyapatti Musharniya Rural Municipality","text":"Mukhiyapatti Musharniya Rural Municipality"}],"Mahottari":[{"id":"Bardibas Municipality","text":"Bardibas Municipality"},{"id":"Gaushala Municipality","text":"Gaushala Municipality"},{"id":"Sonama Rural Municipality","text":"Sonama Rural Municipality"},{"id":"Aurahi Municipality","text":"Aurahi Municipality"},{"id":"Loharpatti Municipality","text":"Loharpatti Municipality"},{"id":"Balawa Municipality","text":"Balawa Municipality"},{"id":"Ram Gopalpur Municipality","text":"Ram Gopalpur Municipality"},{"id":"Samsi Rural Municipality","text":"Samsi Rural Municipality"},{"id":"Ekadara Rural Municipality","text":"Ekadara Rural Municipality"},{"id":"Mahottari Rural Municipality","text":"Mahottari Rural Municipality"},{"id":"Pipara Rural Municipality","text":"Pipara Rural Municipality"},{"id":"Matihani Municipality","text":"Matihani Municipality"},{"id":"Jaleshwor Municipality","text":"Jaleshwor Municipality"},{"id":"Bhangaha Municipality","text":"Bhangaha Municipality"},{"id":"Manara Shiswa Municipality","text":"Manara Shiswa Municipality"}],"Sarlahi":[{"id":"Lalbandi Municipality","text":"Lalbandi Municipality"},{"id":"Bagmati Municipality","text":"Bagmati Municipality"},{"id":"Barahathawa Municipality","text":"Barahathawa Municipality"},{"id":"Haripur Municipality","text":"Haripur Municipality"},{"id":"Ishworpur Municipality","text":"Ishworpur Municipality"},{"id":"Parsa Rural Municipality","text":"Parsa Rural Municipality"},{"id":"Brahmapuri Rural Municipality","text":"Brahmapuri Rural Municipality"},{"id":"Chandranagar Rural Municipality","text":"Chandranagar Rural Municipality"},{"id":"Kabilashi Municipality","text":"Kabilashi Municipality"},{"id":"Chakraghatta Rural Municipality","text":"Chakraghatta Rural Municipality"},{"id":"Dhanakaul Rural Municipality","text":"Dhanakaul Rural Municipality"},{"id":"Ramnagar Rural Municipality","text":"Ramnagar Rural Municipality"},{"id":"Balara Municipality","text":"Balara Municipality"},{"id":"Godaita Municipality","text":"Godaita Municipality"},{"id":"Bishnu Rural Municipality","text":"Bishnu Rural Municipality"},{"id":"Malangawa Municipality","text":"Malangawa Municipality"},{"id":"Hariwan Municipality","text":"Hariwan Municipality"},{"id":"Haripurwa Municipality","text":"Haripurwa Municipality"},{"id":"Basbariya Rural Municipality","text":"Basbariya Rural Municipality"},{"id":"Kaudena Rural Municipality","text":"Kaudena Rural Municipality"}],"Rautahat":[{"id":"Chandrapur Municipality","text":"Chandrapur Municipality"},{"id":"Gujara Municipality","text":"Gujara Municipality"},{"id":"Phatuwa Bijayapur Municipality","text":"Phatuwa Bijayapur Municipality"},{"id":"Katahariya Municipality","text":"Katahariya Municipality"},{"id":"Brindaban Municipality","text":"Brindaban Municipality"},{"id":"Madhav Narayan Municipality","text":"Madhav Narayan Municipality"},{"id":"Garuda Municipality","text":"Garuda Municipality"},{"id":"Dewahi Gonahi Municipality","text":"Dewahi Gonahi Municipality"},{"id":"Maulapur Municipality","text":"Maulapur Municipality"},{"id":"Boudhimai Municipality","text":"Boudhimai Municipality"},{"id":"Paroha Municipality","text":"Paroha Municipality"},{"id":"Yamunamai Rural Municipality","text":"Yamunamai Rural Municipality"},{"id":"Rajdevi Municipality","text":"Rajdevi Municipality"},{"id":"Gaur Municipality","text":"Gaur Municipality"},{"id":"Ishanath Municipality","text":"Ishanath Municipality"},{"id":"Gadhimai Municipality","text":"Gadhimai Municipality"},{"id":"Rajpur Municipality","text":"Rajpur Municipality"},{"id":"Durga Bhagawati Rural Municipality","text":"Durga Bhagawati Rural Municipality"}],"Bara":[{"id":"Nijagadh Municipality","text":"Nijagadh Municipality"},{"id":"Kolhabi Municipality","text":"Kolhabi Municipality"},{"id":"Parawanipur Rural Municipality","text":"Parawanipur Rural Municipality"},{"id":"Prasauni Rural Municipality","text":"Prasauni Rural Municipality"},{"id":"Bishrampur Rural Municipality","text":"Bishrampur Rural Municipality"},{"id":"Pheta Rural Municipality","text":"Pheta Rural Municipality"},{"id":"Kalaiya Sub-Metropolitan City","text":"Kalaiya Sub-Metropolitan City"},{"id":"Karaiyamai Rural Municipality","text":"Karaiyamai Rural Municipality"},{"id":"Aadarsha Kotwal Rural Municipality","text":"Aadarsha Kotwal Rural Municipality"},{"id":"Simroungadh Municipality","text":"Simroungadh Municipality"},{"id":"Pacharauta Municipality","text":"Pacharauta Municipality"},{"id":"Mahagadhimai Municipality","text":"Mahagadhimai Municipality"},{"id":"Devtal Rural Municipality","text":"Devtal Rural Municipality"},{"id":"Jitpur Simara Sub-Metropolitan City","text":"Jitpur Simara Sub-Metropolitan City"},{"id":"Baragadhi Rural Municipality","text":"Baragadhi Rural Municipality"},{"id":"Subarna Rural Municipality","text":"Subarna Rural Municipality"}],"Parsa":[{"id":"Thori Rural Municipality","text":"Thori Rural Municipality"},{"id":"Jirabhawani Rural Municipality","text":"Jirabhawani Rural Municipality"},{"id":"Jagarnathpur Rural Municipality","text":"Jagarnathpur Rural Municipality"},{"id":"Sakhuwa Prasauni Rural Municipality","text":"Sakhuwa Prasauni Rural Municipality"},{"id":"Parsagadhi Municipality","text":"Parsagadhi Municipality"},{"id":"Birgunj Metropolitan City","text":"Birgunj Metropolitan City"},{"id":"Bahudarmai Municipality","text":"Bahudarmai Municipality"},{"id":"Pokhariya Municipality","text":"Pokhariya Municipality"},{"id":"Kalikamai Rural Municipality","text":"Kalikamai Rural Municipality"},{"id":"Dhobini Rural Municipality","text":"Dhobini Rural Municipality"},{"id":"Pakaha Mainpur Rural Municipality","text":"Pakaha Mainpur Rural Municipality"},{"id":"Bindabasini Rural Municipality","text":"Bindabasini Rural Municipality"},{"id":"Paterwa Sugauli Rural Municipality","text":"Paterwa Sugauli Rural Municipality"},{"id":"Chhipaharmai Rural Municipality","text":"Chhipaharmai Rural Municipality"}],"Gorkha":[{"id":"Chumanubri Rural Municipality","text":"Chumanubri Rural Municipality"},{"id":"Sulikot Rural Municipality","text":"Sulikot Rural Municipality"},{"id":"Dharche Rural Municipality","text":"Dharche Rural Municipality"},{"id":"Aarughat Rural Municipality","text":"Aarughat Rural Municipality"},{"id":"Bhimsen Rural Municipality","text":"Bhimsen Rural Municipality"},{"id":"Siranchowk Rural Municipality","text":"Siranchowk Rural Municipality"},{"id":"Gorkha Municipality","text":"Gorkha Municipality"},{"id":"Shahid Lakhan Rural Municipality","text":"Shahid Lakhan Rural Municipality"},{"id":"Gandaki Rural Municipality","text":"Gandaki Rural Municipality"},{"id":"Ajirkot Rural Municipality","text":"Ajirkot Rural Municipality"},{"id":"Palungtar Municipality","text":"Palungtar Municipality"}],"Manang":[{"id":"Narpa Bhumi Rural Municipality","text":"Narpa Bhumi Rural Municipality"},{"id":"Chame Rural Municipality","text":"Chame Rural Municipality"},{"id":"Nashong Rural Municipality","text":"Nashong Rural Municipality"},{"id":"Neshang Rural Municipality","text":"Neshang Rural Municipality"}],"Mustang":[{"id":"Dalome Rural Municipality","text":"Dalome Rural Municipality"},{"id":"Gharpajhong Rural Municipality","text":"Gharpajhong Rural Municipality"},{"id":"Lomanthang Rural Municipality","text":"Lomanthang Rural Municipality"},{"id":"Thasang Rural Municipality","text":"Thasang Rural Municipality"},{"id":"Bahragaun Muktikshetra Rural Municipality","text":"Bahragaun Muktikshetra Rural Municipality"}],"Myagdi":[{"id":"Annapurna Rural Municipality","text":"Annapurna Rural Municipality"},{"id":"Raghuganga Rural Municipality","text":"Raghuganga Rural Municipality"},{"id":"Dhawalagiri Rural Municipality","text":"Dhawalagiri Rural Municipality"},{"id":"Malika Rural Municipality","text":"Malika Rural Municipality"},{"id":"Mangala Rural Municipality","text":"Mangala Rural Municipality"},{"id":"Beni Municipality","text":"Beni Municipality"}],"Kaski":[{"id":"Madi Rural Municipality","text":"Madi Rural Municipality"},{"id":"Annapurna Rural Municipality","text":"Annapurna Rural Municipality"},{"id":"Pokhara Metropolitan City","text":"Pokhara Metropolitan City"},{"id":"Rupa Rural Municipality","text":"Rupa Rural Municipality"},{"id":"Machhapuchchhre Rural Municipality","text":"Machhapuchchhre Rural Municipality"}],"Lamjung":[{"id":"Dordi Rural Municipality","text":"Dordi Rural Municipality"},{"id":"Marshyangdi Rural Municipality","text":"Marshyangdi Rural Municipality"},{"id":"Madhya Nepal Municipality","text":"Madhya Nepal Municipality"},{"id":"Bensi Shahar Municipality","text":"Bensi Shahar Municipality"},{"id":"Rainas Municipality","text":"Rainas Municipality"},{"id":"Kwhola Sothar Rural Municipality","text":"Kwhola Sothar Rural Municipality"},{"id":"Sundarbazar Municipality","text":"Sundarbazar Municipality"},{"id":"Dudhapokhari Rural Municipality","text":"Dudhapokhari Rural Municipality"}],"Tanahu":[{"id":"Bhanu Municipality","text":"Bhanu Municipality"},{"id":"Byas Municipality","text":"Byas Municipality"},{"id":"Myagde Rural Municipality","text":"Myagde Rural Municipality"},{"id":"Shuklagandaki Municipality","text":"Shuklagandaki Municipality"},{"id":"Bhimad Municipality","text":"Bhimad Municipality"},{"id":"Ghiring Rural Municipality","text":"Ghiring Rural Municipality"},{"id":"Devghat Rural Municipality","text":"Devghat Rural Municipality"},{"id":"Bandipur Rural Municipality","text":"Bandipur Rural Municipality"},{"id":"Aanbookhaireni Rural Municipality","text":"Aanbookhaireni Rural Municipality"},{"id":"Rhishing Rural Municipality","text":"Rhishing Rural Municipality"}],"Nawalparasi East":[{"id":"Gaidakot Municipality","text":"Gaidakot Municipality"},{"id":"Bulingtar Rural Municipality","text":"Bulingtar Rural Municipality"},{"id":"Hupsekot Rural Municipality","text":"Hupsekot Rural Municipality"},{"id":"Devchuli Municipality","text":"Devchuli Municipality"},{"id":"Kawasoti Municipality","text":"Kawasoti Municipality"},{"id":"Madhyabindu Municipality","text":"Madhyabindu Municipality"},{"id":"Binayi Tribeni Rural Municipality","text":"Binayi Tribeni Rural Municipality"},{"id":"Bungdikali Rural Municipality","text":"Bungdikali Rural Municipality"}],"Syangja":[{"id":"Phedikhola Rural Municipality","text":"Phedikhola Rural Municipality"},{"id":"Aandhikhola Rural Municipality","text":"Aandhikhola Rural Municipality"},{"id":"Arjun Choupari Rural Municipality","text":"Arjun Choupari Rural Municipality"},{"id":"Bhirkot Municipality","text":"Bhirkot Municipality"},{"id":"Biruwa Rural Municipality","text":"Biruwa Rural Municipality"},{"id":"Chapakot Municipality","text":"Chapakot Municipality"},{"id":"Walling Municipality","text":"Walling Municipality"},{"id":"Galyang Municipality","text":"Galyang Municipality"},{"id":"Kaligandaki Rural Municipality","text":"Kaligandaki Rural Municipality"},{"id":"Putalibazar Municipality","text":"Putalibazar Municipality"},{"id":"Harinas Rural Municipality","text":"Harinas Rural Municipality"}],"Parbat":[{"id":"Modi Rural Municipality","text":"Modi Rural Municipality"},{"id":"Kushma Municipality","text":"Kushma Municipality"},{"id":"Phalebas Municipality","text":"Phalebas Municipality"},{"id":"Mahashila Rural Municipality","text":"Mahashila Rural Municipality"},{"id":"Bihadi Rural Municipality","text":"Bihadi Rural Municipality"},{"id":"Paiyu Rural Municipality","text":"Paiyu Rural Municipality"},{"id":"Jaljala Rural Municipality","text":"Jaljala Rural Municipality"}],"Baglung":[{"id":"Baglung Municipality","text":"Baglung Municipality"},{"id":"Tarakhola Rural Municipality","text":"Tarakhola Rural Municipality"},{"id":"Tamankhola Rural Municipality","text":"Tamankhola Rural Municipality"},{"id":"Dhorpatan Municipality","text":"Dhorpatan Municipality"},{"id":"Nisikhola Rural Municipality","text":"Nisikhola Rural Municipality"},{"id":"Badigad Rural Municipality","text":"Badigad Rural Municipality"},{"id":"Galkot Municipality","text":"Galkot Municipality"},{"id":"Jaimuni Municipality","text":"Jaimuni Municipality"},{"id":"Kathekhola Rural Municipality","text":"Kathekhola Rural Municipality"},{"id":"Bareng Rural Municipality","text":"Bareng Rural Municipality"}],"Dolakha":[{"id":"Gaurishankar Rural Municipality","text":"Gaurishankar Rural Municipality"},{"id":"Bigu Rural Municipality","text":"Bigu Rural Municipality"},{"id":"Kalinchowk Rural Municipality","text":"Kalinchowk Rural Municipality"},{"id":"Jiri Municipality","text":"Jiri Municipality"},{"id":"Tamakoshi Rural Municipality","text":"Tamakoshi Rural Municipality"},{"id":"Melung Rural Municipality","text":"Melung Rural Municipality"},{"id":"Shailung Rural Municipality","text":"Shailung Rural Municipality"},{"id":"Bhimeshwor Municipality","text":"Bhimeshwor Municipality"},{"id":"Baitedhar Rural Municipality","text":"Baitedhar Rural Municipality"}],"Sindhupalchok":[{"id":"Jugal Rural Municipality","text":"Jugal Rural Municipality"},{"id":"Panchpokhari Thangpal Rural Municipality","text":"Panchpokhari Thangpal Rural Municipality"},{"id":"Helambu Rural Municipality","text":"Helambu Rural Municipality"},{"id":"Choutara Sangachowkgadhi Municipality","text":"Choutara Sangachowkgadhi Municipality"},{"id":"Balephi Rural Municipality","text":"Balephi Rural Municipality"},{"id":"Bahrabise Municipality","text":"Bahrabise Municipality"},{"id":"Lisankhu Pakhar Rural Municipality","text":"Lisankhu Pakhar Rural Municipality"},{"id":"Sunkoshi Rural Municipality","text":"Sunkoshi Rural Municipality"},{"id":"Bhotekoshi Rural Municipality","text":"Bhotekoshi Rural Municipality"},{"id":"Melanchi Municipality","text":"Melanchi Municipality"},{"id":"Indrawoti Rural Municipality","text":"Indrawoti Rural Municipality"},{"id":"Tripurasundari Rural Municipality","text":"Tripurasundari Rural Municipality"}],"Rasuwa":[{"id":"Gosaikunda Rural Municipality","text":"Gosaikunda Rural Municipality"},{"id":"Aama Chhodingmo Rural Municipality","text":"Aama Chhodingmo Rural Municipality"},{"id":"Uttargaya Rural Municipality","text":"Uttargaya Rural Municipality"},{"id":"Kalika Rural Municipality","text":"Kalika Rural Municipality"},{"id":"Naukunda Rural Municipality","text":"Naukunda Rural Municipality"}],"Dhading":[{"id":"Khaniyabas Rural Municipality","text":"Khaniyabas Rural Municipality"},{"id":"Ganga Jamuna Rural Municipality","text":"Ganga Jamuna Rural Municipality"},{"id":"Tripurasundari Rural Municipality","text":"Tripurasundari Rural Municipality"},{"id":"Netrawati Rural Municipality","text":"Netrawati Rural Municipality"},{"id":"Neelakantha Municipality","text":"Neelakantha Municipality"},{"id":"Siddhalek Rural Municipality","text":"Siddhalek Rural Municipality"},{"id":"Benighat Rorang Rural Municipality","text":"Benighat Rorang Rural Municipality"},{"id":"Gajuri Rural Municipality","text":"Gajuri Rural Municipality"},{"id":"Galchhi Rural Municipality","text":"Galchhi Rural Municipality"},{"id":"Thakre Rural Municipality","text":"Thakre Rural Municipality"},{"id":"Dhunibenshi Municipality","text":"Dhunibenshi Municipality"},{"id":"Rubi Valley Rural Municipality","text":"Rubi Valley Rural Municipality"},{"id":"Jwalamukhi Rural Municipality","text":"Jwalamukhi Rural Municipality"}],"Nuwakot":[{"id":"Tadi Rural Municipality","text":"Tadi Rural Municipality"},{"id":"Suryagadhi Rural Municipality","text":"Suryagadhi Rural Municipality"},{"id":"Bidur Municipality","text":"Bidur Municipality"},{"id":"Kispang Rural Municipality","text":"Kispang Rural Municipality"},{"id":"Meghang Rural Municipality","text":"Meghang Rural Municipality"},{"id":"Belkotgadhi Municipality","text":"Belkotgadhi Municipality"},{"id":"Likhu Rural Municipality","text":"Likhu Rural Municipality"},{"id":"Panchakanya Rural Municipality","text":"Panchakanya Rural Municipality"},{"id":"Shivapuri Rural Municipality","text":"Shivapuri Rural Municipality"},{"id":"Kakani Rural Municipality","text":"Kakani Rural Municipality"},{"id":"Dupcheshwor Rural Municipality","text":"Dupcheshwor Rural Municipality"},{"id":"Tarakeshwor Rural Municipality","text":"Tarakeshwor Rural Municipality"}],"Kathmandu":[{"id":"Kageshwori Manahara Municipality","text":"Kageshwori Manahara Municipality"},{"id":"Gokarneshwor Municipality","text":"Gokarneshwor Municipality"},{"id":"Budhanilkhantha Municipality","text":"Budhanilkhantha Municipality"},{"id":"Tokha Municipality","text":"Tokha Municipality"},{"id":"Tarakeshwor Municipality","text":"Tarakeshwor Municipality"},{"id":"Nagarjun Municipality","text":"Nagarjun Municipality"},{"id":"Kirtipur Municipality","text":"Kirtipur Municipality"},{"id":"Dakshinkali Municipality","text":"Dakshinkali Municipality"},{"id":"Shankharapur Municipality","text":"Shankharapur Municipality"},{"id":"Kathmandu Metropolitan City","text":"Kathmandu Metropolitan City"},{"id":"Chandragiri Municipality","text":"Chandragiri Municipality"}],"Bhaktapur":[{"id":"Bhaktapur Municipality","text":"Bhaktapur Municipality"},{"id":"Madhyapur Thimi Municipality","text":"Madhyapur Thimi Municipality"},{"id":"Suryabinayak Municipality","text":"Suryabinayak Municipality"},{"id":"Changunarayan Municipality","text":"Changunarayan Municipality"}],"Lalitpur":[{"id":"Mahalaxmi Municipality","text":"Mahalaxmi Municipality"},{"id":"Lalitpur Metropolitan City","text":"Lalitpur Metropolitan City"},{"id":"Godawari Municipality","text":"Godawari Municipality"},{"id":"Mahankal Rural Municipality","text":"Mahankal Rural Municipality"},{"id":"Bagmati Rural Municipality","text":"Bagmati Rural Municipality"},{"id":"Konjyosom Rural Municipality","text":"Konjyosom Rural Municipality"}],"Kavrepalanchok":[{"id":"Chauri Deurali Rural Municipality","text":"Chauri Deurali Rural Municipality"},{"id":"Bhumlu Rural Municipality","text":"Bhumlu Rural Municipality"},{"id":"Mandan Deupur Municipality","text":"Mandan Deupur Municipality"},{"id":"Banepa Municipality","text":"Banepa Municipality"},{"id":"Panchkhal Municipality","text":"Panchkhal Municipality"},{"id":"Temal Rural Municipality","text":"Temal Rural Municipality"},{"id":"Namobuddha Municipality","text":"Namobuddha Municipality"},{"id":"Panauti Municipality","text":"Panauti Municipality"},{"id":"Roshi Rural Municipality","text":"Roshi Rural Municipality"},{"id":"Mahabharat Rural Municipality","text":"Mahabharat Rural Municipality"},{"id":"Khanikhola Rural Municipality","text":"Khanikhola Rural Municipality"},{"id":"Dhulikhel Municipality","text":"Dhulikhel Municipality"},{"id":"Bethanchowk Rural Municipality","text":"Bethanchowk Rural Municipality"}],"Ramechhap":[{"id":"Umakunda Rural Municipality","text":"Umakunda Rural Municipality"},{"id":"Gokulganga Rural Municipality","text":"Gokulganga Rural Municipality"},{"id":"Likhu Rural Municipality","text":"Likhu Rural Municipality"},{"id":"Manthali Municipality","text":"Manthali Municipality"},{"id":"Khandadevi Rural Municipality","text":"Khandadevi Rural Municipality"},{"id":"Doramba Rural Municipality","text":"Doramba Rural Municipality"},{"id":"Sunapati Rural Municipality","text":"Sunapati Rural Municipality"},{"id":"Ramechhap Municipality","text":"Ramechhap Municipality"}],"Sindhuli":[{"id":"Dudhouli Municipality","text":"Dudhouli Municipality"},{"id":"Tinpatan Rural Municipality","text":"Tinpatan Rural Municipality"},{"id":"Golanjor Rural Municipality","text":"Golanjor Rural Municipality"},{"id":"Kamalamai Municipality","text":"Kamalamai Municipality"},{"id":"Sunkoshi Rural Municipality","text":"Sunkoshi Rural Municipality"},{"id":"Marin Rural Municipality","text":"Marin Rural Municipality"},{"id":"Hariharpurgaghi Rural Municipality","text":"Hariharpurgaghi Rural Municipality"},{"id":"Phikkal Rural Municipality","text":"Phikkal Rural Municipality"},{"id":"Ghyanglekha Rural Municipality","text":"Ghyanglekha Rural Municipality"}],"Makwanpur":[{"id":"Indrasarowar Rural Municipality","text":"Indrasarowar Rural Municipality"},{"id":"Thaha Municipality","text":"Thaha Municipality"},{"id":"Kailash Rural Municipality","text":"Kailash Rural Municipality"},{"id":"Manahari Rural Municipality","text":"Manahari Rural Municipality"},{"id":"Hetauda Sub-Metropolitan City","text":"Hetauda Sub-Metropolitan City"},{"id":"Makawanpurgadhi Rural Municipality","text":"Makawanpurgadhi Rural Municipality"},{"id":"Bakaiya Rural Municipality","text":"Bakaiya Rural Municipality"},{"id":"Bagmati Rural Municipality","text":"Bagmati Rural Municipality"},{"id":"Raksirang Rural Municipality","text":"Raksirang Rural Municipality"},{"id":"Bhimphedi Rural Municipality","text":"Bhimphedi Rural Municipality"}],"Chitawan":[{"id":"Rapti Municipality","text":"Rapti Municipality"},{"id":"Kalika Municipality","text":"Kalika Municipality"},{"id":"Bharatpur Metropolitan City","text":"Bharatpur Metropolitan City"},{"id":"Ratnanagar Municipality","text":"Ratnanagar Municipality"},{"id":"Khairahani Municipality","text":"Khairahani Municipality"},{"id":"Madi Municipality","text":"Madi Municipality"},{"id":"Ichchha Kamana Rural Municipality","text":"Ichchha Kamana Rural Municipality"}],"Rukum East":[{"id":"Sisne Rural Municipality","text":"Sisne Rural Municipality"},{"id":"Bhoome Rural Municipality","text":"Bhoome Rural Municipality"},{"id":"Putha Uttanganga Rural Municipality","text":"Putha Uttanganga Rural Municipality"}],"Rolpa":[{"id":"Sunchhahari Rural Municipality","text":"Sunchhahari Rural Municipality"},{"id":"Thawang Rural Municipality","text":"Thawang Rural Municipality"},{"id":"Duikholi Rural Municipality","text":"Duikholi Rural Municipality"},{"id":"Madi Rural Municipality","text":"Madi Rural Municipality"},{"id":"Tribeni Rural Municipality","text":"Tribeni Rural Municipality"},{"id":"Rolpa Municipality","text":"Rolpa Municipality"},{"id":"Runtigadhi Rural Municipality","text":"Runtigadhi Rural Municipality"},{"id":"Sunilsmiriti Rural Municipality","text":"Sunilsmiriti Rural Municipality"},{"id":"Lungri Rural Municipality","text":"Lungri Rural Municipality"},{"id":"Gangadev Rural Municipality","text":"Gangadev Rural Municipality"}],"Pyuthan":[{"id":"Naubahini Rural Municipality","text":"Naubahini Rural Municipality"},{"id":"Jhimaruk Rural Municipality","text":"Jhimaruk Rural Municipality"},{"id":"Pyuthan Municipality","text":"Pyuthan Municipality"},{"id":"Sworgadwari Municipality","text":"Sworgadwari Municipality"},{"id":"Mandavi Rural Municipality","text":"Mandavi Rural Municipality"},{"id":"Aairawati Rural Municipality","text":"Aairawati Rural Municipality"},{"id":"Sarumarani Rural Municipality","text":"Sarumarani Rural Municipality"},{"id":"Gaumukhi Rural Municipality","text":"Gaumukhi Rural Municipality"},{"id":"Mallarani Rural Municipality","text":"Mallarani Rural Municipality"}],"Gulmi":[{"id":"Kali Gandaki Rural Municipality","text":"Kali Gandaki Rural Municipality"},{"id":"Satyawoti Rural Municipality","text":"Satyawoti Rural Municipality"},{"id":"Musikot Municipality","text":"Musikot Municipality"},{"id":"Isma Rural Municipality","text":"Isma Rural Municipality"},{"id":"Malika Rural Municipality","text":"Malika Rural Municipality"},{"id":"Madane Rural Municipality","text":"Madane Rural Municipality"},{"id":"Dhurkot Rural Municipality","text":"Dhurkot Rural Municipality"},{"id":"Resunga Municipality","text":"Resunga Municipality"},{"id":"Chhatrakot Rural Municipality","text":"Chhatrakot Rural Municipality"},{"id":"Ruru Rural Municipality","text":"Ruru Rural Municipality"},{"id":"Chandrakot Rural Municipality","text":"Chandrakot Rural Municipality"},{"id":"Gulmi Durbar Rural Municipality","text":"Gulmi Durbar Rural Municipality"}],"Arghakhanchi":[{"id":"Chhatradev Rural Municipality","text":"Chhatradev Rural Municipality"},{"id":"Malarani Rural Municipality","text":"Malarani Rural Municipality"},{"id":"Bhumikasthan Municipality","text":"Bhumikasthan Municipality"},{"id":"Sandhikharka Municipality","text":"Sandhikharka Municipality"},{"id":"Shitaganga Municipality","text":"Shitaganga Municipality"},{"id":"Panini Rural Municipality","text":"Panini Rural Municipality"}],"Palpa":[{"id":"Rampur Municipality","text":"Rampur Municipality"},{"id":"Purbakhola Rural Municipality","text":"Purbakhola Rural Municipality"},{"id":"Rambha Rural Municipality","text":"Rambha Rural Municipality"},{"id":"Baganaskali Rural Municipality","text":"Baganaskali Rural Municipality"},{"id":"Tansen Municipality","text":"Tansen Municipality"},{"id":"Rainadevi Chhahara Rural Municipality","text":"Rainadevi Chhahara Rural Municipality"},{"id":"Mathagadhi Rural Municipality","text":"Mathagadhi Rural Municipality"},{"id":"Ribdikot Rural Municipality","text":"Ribdikot Rural Municipality"},{"id":"Tinau Rural Municipality","text":"Tinau Rural Municipality"},{"id":"Nisdi Rural Municipality","text":"Nisdi Rural Municipality"}],"Rupandehi":[{"id":"Devdaha Municipality","text":"Devdaha Municipality"},{"id":"Butwal Sub-Metropolitan City","text":"Butwal Sub-Metropolitan City"},{"id":"Sainamaina Municipality","text":"Sainamaina Municipality"},{"id":"Kanchan Rural Municipality","text":"Kanchan Rural Municipality"},{"id":"Suddhodhan Rural Municipality","text":"Suddhodhan Rural Municipality"},{"id":"Siyari Rural Municipality","text":"Siyari Rural Municipality"},{"id":"Tilottama Municipality","text":"Tilottama Municipality"},{"id":"Om Satiya Rural Municipality","text":"Om Satiya Rural Municipality"},{"id":"Rohini Rural Municipality","text":"Rohini Rural Municipality"},{"id":"Mayadevi Rural Municipality","text":"Mayadevi Rural Municipality"},{"id":"Lumbini Sanskritik Municipality","text":"Lumbini Sanskritik Municipality"},{"id":"Kotahimai Rural Municipality","text":"Kotahimai Rural Municipality"},{"id":"Sammarimai Rural Municipality","text":"Sammarimai Rural Municipality"},{"id":"Marchawari Rural Municipality","text":"Marchawari Rural Municipality"},{"id":"Gaidahawa Rural Municipality","text":"Gaidahawa Rural Municipality"},{"id":"Siddharthanagar Municipality","text":"Siddharthanagar Municipality"}],"Kapilvastu":[{"id":"Banganga Municipality","text":"Banganga Municipality"},{"id":"Shivaraj Municipality","text":"Shivaraj Municipality"},{"id":"Bijayanagar Rural Municipality","text":"Bijayanagar Rural Municipality"},{"id":"Krishnanagar Municipality","text":"Krishnanagar Municipality"},{"id":"Maharajganj Municipality","text":"Maharajganj Municipality"},{"id":"Yasodhara Rural Municipality","text":"Yasodhara Rural Municipality"},{"id":"Mayadevi Rural Municipality","text":"Mayadevi Rural Municipality"},{"id":"Shuddhodhan Rural Municipality","text":"Shuddhodhan Rural Municipality"},{"id":"Buddhabhumi Municipality","text":"Buddhabhumi Municipality"},{"id":"Kapilvastu Municipality","text":"Kapilvastu Municipality"}],"Dang":[{"id":"Bangalachuli Rural Municipality","text":"Bangalachuli Rural Municipality"},{"id":"Tulsipur Sub-Metropolitan City","text":"Tulsipur Sub-Metropolitan City"},{"id":"Shantinagar Rural Municipality","text":"Shantinagar Rural Municipality"},{"id":"Babai Rural Municipality","text":"Babai Rural Municipality"},{"id":"Dangisharan Rural Municipality","text":"Dangisharan Rural Municipality"},{"id":"Lamahi Municipality","text":"Lamahi Municipality"},{"id":"Ghorahi Sub-Metropolitan City","text":"Ghorahi Sub-Metropolitan City"},{"id":"Rapti Rural Municipality","text":"Rapti Rural Municipality"},{"id":"Gadhawa Rural Municipality","text":"Gadhawa Rural Municipality"},{"id":"Rajpur Rural Municipality","text":"Rajpur Rural Municipality"}],"Banke":[{"id":"Khajura Rural Municipality","text":"Khajura Rural Municipality"},{"id":"Janaki Rural Municipality","text":"Janaki Rural Municipality"},{"id":"Rapti Sonari Rural Municipality","text":"Rapti Sonari Rural Municipality"},{"id":"Kohalpur Municipality","text":"Kohalpur Municipality"},{"id":"Baijanath Rural Municipality","text":"Baijanath Rural Municipality"},{"id":"Nepalgunj Sub-Metropolitan City","text":"Nepalgunj Sub-Metropolitan City"},{"id":"Duduwa Rural Municipality","text":"Duduwa Rural Municipality"},{"id":"Narainapur Rural Municipality","text":"Narainapur Rural Municipality"}],"Bardiya":[{"id":"Thakurbaba Municipality","text":"Thakurbaba Municipality"},{"id":"Geruwa Rural Municipality","text":"Geruwa Rural Municipality"},{"id":"Rajapur Municipality","text":"Rajapur Municipality"},{"id":"Madhuwan Municipality","text":"Madhuwan Municipality"},{"id":"Bansgadhi Municipality","text":"Bansgadhi Municipality"},{"id":"Barbardiya Municipality","text":"Barbardiya Municipality"},{"id":"Gulariya Municipality","text":"Gulariya Municipality"},{"id":"Badhaiyatal Rural Municipality","text":"Badhaiyatal Rural Municipality"}],"Nawalparasi West":[{"id":"Bardaghat Municipality","text":"Bardaghat Municipality"},{"id":"Sunawal Municipality","text":"Sunawal Municipality"},{"id":"Ramgram Municipality","text":"Ramgram Municipality"},{"id":"Palhinandan Rural Municipality","text":"Palhinandan Rural Municipality"},{"id":"Sarawal Rural Municipality","text":"Sarawal Rural Municipality"},{"id":"Susta Rural Municipality","text":"Susta Rural Municipality"},{"id":"Pratapapur Rural Municipality","text":"Pratapapur Rural Municipality"}],"Dolpa":[{"id":"Mudkechula Rural Municipality","text":"Mudkechula Rural Municipality"},{"id":"Tripurasundari Municipality","text":"Tripurasundari Municipality"},{"id":"Thulibheri Municipality","text":"Thulibheri Municipality"},{"id":"Kaike Rural Municipality","text":"Kaike Rural Municipality"},{"id":"Chharka Tangsong Rural Municipality","text":"Chharka Tangsong Rural Municipality"},{"id":"Shey Phoksundo Rural Municipality","text":"Shey Phoksundo Rural Municipality"},{"id":"Jagadulla Rural Municipality","text":"Jagadulla Rural Municipality"},{"id":"Dolpo Buddha Rural Municipality","text":"Dolpo Buddha Rural Municipality"}],"Mugu":[{"id":"Mugumakarmarog Rural Municipality","text":"Mugumakarmarog Rural Municipality"},{"id":"Chhayanath Rara Municipality","text":"Chhayanath Rara Municipality"},{"id":"Khatyad Rural Municipality","text":"Khatyad Rural Municipality"},{"id":"Soru Rural Municipality","text":"Soru Rural Municipality"}],"Jumla":[{"id":"Patarasi Rural Municipality","text":"Patarasi Rural Municipality"},{"id":"Kanaka Sundari Rural Municipality","text":"Kanaka Sundari Rural Municipality"},{"id":"Sinja Rural Municipality","text":"Sinja Rural Municipality"},{"id":"Chandannath Municipality","text":"Chandannath Municipality"},{"id":"Guthichaur Rural Municipality","text":"Guthichaur Rural Municipality"},{"id":"Tatopani Rural Municipality","text":"Tatopani Rural Municipality"},{"id":"Tila Rural Municipality","text":"Tila Rural Municipality"},{"id":"Hima Rural Municipality","text":"Hima Rural Municipality"}],"Kalikot":[{"id":"Mahawai Rural Municipality","text":"Mahawai Rural Municipality"},{"id":"Kalika Rural Municipality","text":"Kalika Rural Municipality"},{"id":"Palata Rural Municipality","text":"Palata Rural Municipality"},{"id":"Pachal Jharana Rural Municipality","text":"Pachal Jharana Rural Municipality"},{"id":"Raskot Municipality","text":"Raskot Municipality"},{"id":"Sanni Tribeni Rural Municipality","text":"Sanni Tribeni Rural Municipality"},{"id":"Naraharinath Rural Municipality","text":"Naraharinath Rural Municipality"},{"id":"Khandachakra Municipality","text":"Khandachakra Municipality"},{"id":"Tilagupha Municipality","text":"Tilagupha Municipality"}],"Dailekh":[{"id":"Naumule Rural Municipality","text":"Naumule Rural Municipality"},{"id":"Mahabu Rural Municipality","text":"Mahabu Rural Municipality"},{"id":"Bhairabi Rural Municipality","text":"Bhairabi Rural Municipality"},{"id":"Thantikandh Rural Municipality","text":"Thantikandh Rural Municipality"},{"id":"Aathbis Municipality","text":"Aathbis Municipality"},{"id":"Chamunda Bindrasaini Municipality","text":"Chamunda Bindrasaini Municipality"},{"id":"Dullu Municipality","text":"Dullu Municipality"},{"id":"Narayan Municipality","text":"Narayan Municipality"},{"id":"Bhagawatimai Rural Municipality","text":"Bhagawatimai Rural Municipality"},{"id":"Dungeshwor Rural Municipality","text":"Dungeshwor Rural Municipality"},{"id":"Gurans Rural Municipality","text":"Gurans Rural Municipality"}],"Jajarkot":[{"id":"Shivalaya Rural Municipality","text":"Shivalaya Rural Municipality"},{"id":"Bheri Municipality","text":"Bheri Municipality"},{"id":"Tribeni Nalagad Municipality","text":"Tribeni Nalagad Municipality"},{"id":"Barekot Rural Municipality","text":"Barekot Rural Municipality"},{"id":"Kuse Rural Municipality","text":"Kuse Rural Municipality"},{"id":"Junichande Rural Municipality","text":"Junichande Rural Municipality"},{"id":"Chhedagad Municipality","text":"Chhedagad Municipality"}],"Salyan":[{"id":"Darma Rural Municipality","text":"Darma Rural Municipality"},{"id":"Kumakh Malika Rural Municipality","text":"Kumakh Malika Rural Municipality"},{"id":"Banagad Kupinde Municipality","text":"Banagad Kupinde Municipality"},{"id":"Dhorchaur Rural Municipality","text":"Dhorchaur Rural Municipality"},{"id":"Bagachour Municipality","text":"Bagachour Municipality"},{"id":"Chhatreshwori Rural Municipality","text":"Chhatreshwori Rural Municipality"},{"id":"Sharada Municipality","text":"Sharada Municipality"},{"id":"Kalimati Rural Municipality","text":"Kalimati Rural Municipality"},{"id":"Tribeni Rural Municipality","text":"Tribeni Rural Municipality"},{"id":"Kapurkot Rural Municipality","text":"Kapurkot Rural Municipality"}],"Surkhet":[{"id":"Simta Rural Municipality","text":"Simta Rural Municipality"},{"id":"Chingad Rural Municipality","text":"Chingad Rural Municipality"},{"id":"Lekabeshi Municipality","text":"Lekabeshi Municipality"},{"id":"Gurbhakot Municipality","text":"Gurbhakot Municipality"},{"id":"Bheriganga Municipality","text":"Bheriganga Municipality"},{"id":"Birendranagar Municipality","text":"Birendranagar Municipality"},{"id":"Barahatal Rural Municipality","text":"Barahatal Rural Municipality"},{"id":"Panchapuri Municipality","text":"Panchapuri Municipality"},{"id":"Chaukune Rural Municipality","text":"Chaukune Rural Municipality"}],"Humla":[{"id":"Chankheli Rural Municipality","text":"Chankheli Rural Municipality"},{"id":"Kharpunath Rural Municipality","text":"Kharpunath Rural Municipality"},{"id":"Simkot Rural Municipality","text":"Simkot Rural Municipality"},{"id":"Namkha Rural Municipality","text":"Namkha Rural Municipality"},{"id":"Sarkegad Rural Municipality","text":"Sarkegad Rural Municipality"},{"id":"Adanchuli Rural Municipality","text":"Adanchuli Rural Municipality"},{"id":"Tanjakot Rural Municipality","text":"Tanjakot Rural Municipality"}],"Rukum West":[{"id":"Aathabisakot Municipality","text":"Aathabisakot Municipality"},{"id":"Sanibheri Rural Municipality","text":"Sanibheri Rural Municipality"},{"id":"Banphikot Rural Municipality","text":"Banphikot Rural Municipality"},{"id":"Musikot Municipality","text":"Musikot Municipality"},{"id":"Tribeni Rural Municipality","text":"Tribeni Rural Municipality"},{"id":"Chaurjahari Municipality","text":"Chaurjahari Municipality"}],"Taplejung":[{"id":"Mikwakhola Rural Municipality","text":"Mikwakhola Rural Municipality"},{"id":"Maiwakhola Rural Municipality","text":"Maiwakhola Rural Municipality"},{"id":"Aatharai Tribeni Rural Municipality","text":"Aatharai Tribeni Rural Municipality"},{"id":"Phungling Municipality","text":"Phungling Municipality"},{"id":"Pathivara Yangwarak Rural Municipality","text":"Pathivara Yangwarak Rural Municipality"},{"id":"Sirijanga Rural Municipality","text":"Sirijanga Rural Municipality"},{"id":"Phaktanlung Rural Municipality","text":"Phaktanlung Rural Municipality"},{"id":"Meringden Rural Municipality","text":"Meringden Rural Municipality"},{"id":"Sidingba Rural Municipality","text":"Sidingba Rural Municipality"}],"Sankhuwasabha":[{"id":"Bhotkhola Rural Municipality","text":"Bhotkhola Rural Municipality"},{"id":"Makalu Rural Municipality","text":"Makalu Rural Municipality"},{"id":"Silichong Rural Municipality","text":"Silichong Rural Municipality"},{"id":"Chichila Rural Municipality","text":"Chichila Rural Municipality"},{"id":"Sabhapokhari Rural Municipality","text":"Sabhapokhari Rural Municipality"},{"id":"Panchakhapan Municipality","text":"Panchakhapan Municipality"},{"id":"Chainapur Municipality","text":"Chainapur Municipality"},{"id":"Madi Municipality","text":"Madi Municipality"},{"id":"Dharmadevi Municipality","text":"Dharmadevi Municipality"},{"id":"Khandabari Municipality","text":"Khandabari Municipality"}],"Solukhumbu":[{"id":"Mahakulung Rural Municipality","text":"Mahakulung Rural Municipality"},{"id":"Sotang Rural Municipality","text":"Sotang Rural Municipality"},{"id":"Dhudhakoshi Rural Municipality","text":"Dhudhakoshi Rural Municipality"},{"id":"Dhudha Koushika Rural Municipality","text":"Dhudha Koushika Rural Municipality"},{"id":"Necha Salyan Rural Municipality","text":"Necha Salyan Rural Municipality"},{"id":"Solu Dhudhakunda Municipality","text":"Solu Dhudhakunda Municipality"},{"id":"Likhu Pike Rural Municipality","text":"Likhu Pike Rural Municipality"},{"id":"Khumbu Pasanglhamu Rural Municipality","text":"Khumbu Pasanglhamu Rural Municipality"}],"Okhaldhunga":[{"id":"Siddhicharan Municipality","text":"Siddhicharan Municipality"},{"id":"Molung Rural Municipality","text":"Molung Rural Municipality"},{"id":"Khiji Demba Rural Municipality","text":"Khiji Demba Rural Municipality"},{"id":"Likhu Rural Municipality","text":"Likhu Rural Municipality"},{"id":"Champadevi Rural Municipality","text":"Champadevi Rural Municipality"},{"id":"Sunkoshi Rural Municipality","text":"Sunkoshi Rural Municipality"},{"id":"Chishankhu Gadhi Rural Municipality","text":"Chishankhu Gadhi Rural Municipality"},{"id":"Manebhanjyang Rural Municipality","text":"Manebhanjyang Rural Municipality"}],"Khotang":[{"id":"Kepilasgadhi Rural Municipality","text":"Kepilasgadhi Rural Municipality"},{"id":"Aiselukharka Rural Municipality","text":"Aiselukharka Rural Municipality"},{"id":"Lamidanda Rural Municipality","text":"Lamidanda Rural Municipality"},{"id":"Halesi Tuwachung Municipality","text":"Halesi Tuwachung Municipality"},{"id":"Sakela Rural Municipality","text":"Sakela Rural Municipality"},{"id":"Diprung Rural Municipality","text":"Diprung Rural Municipality"},{"id":"Khotehang Rural Municipality","text":"Khotehang Rural Municipality"},{"id":"Jante Dhunga Rural Municipality","text":"Jante Dhunga Rural Municipality"},{"id":"Barahapokhari Rural Municipality","text":"Barahapokhari Rural Municipality"},{"id":"Diktel Rupakot Majhuwagadhi Municipality","text":"Diktel Rupakot Majhuwagadhi Municipality"}],"Bhojpur":[{"id":"Shadananda Municipality","text":"Shadananda Municipality"},{"id":"Tyamke Maiyum Rural Municipality","text":"Tyamke Maiyum Rural Municipality"},{"id":"Bhojpur Municipality","text":"Bhojpur Municipality"},{"id":"Pauwa Dunma Rural Municipality","text":"Pauwa Dunma Rural Municipality"},{"id":"Ramprasad Rai Rural Municipality","text":"Ramprasad Rai Rural Municipality"},{"id":"Hatuwagadhi Rural Municipality","text":"Hatuwagadhi Rural Municipality"},{"id":"Aamchowk Rural Municipality","text":"Aamchowk Rural Municipality"},{"id":"Salpa Silichho Rural Municipality","text":"Salpa Silichho Rural Municipality"},{"id":"Arun Rural Municipality","text":"Arun Rural Municipality"}],"Dhankuta":[{"id":"Pakhribas Municipality","text":"Pakhribas Municipality"},{"id":"Chhathar Jorpati Rural Municipality","text":"Chhathar Jorpati Rural Municipality"},{"id":"Dhankuta Municipality","text":"Dhankuta Municipality"},{"id":"Sangurigadhi Rural Municipality","text":"Sangurigadhi Rural Municipality"},{"id":"Chaubise Rural Municipality","text":"Chaubise Rural Municipality"},{"id":"Mahalaxmi Municipality","text":"Mahalaxmi Municipality"},{"id":"Khalsa Chhintang Sahidbhumi Rural Municipality","text":"Khalsa Chhintang Sahidbhumi Rural Municipality"}],"Tehrathum":[{"id":"Aatharai Rural Municipality","text":"Aatharai Rural Municipality"},{"id":"Phedap Rural Municipality","text":"Phedap Rural Municipality"},{"id":"Menchhayayem Rural Municipality","text":"Menchhayayem Rural Municipality"},{"id":"Myanglung Municipality","text":"Myanglung Municipality"},{"id":"Laligurans Municipality","text":"Laligurans Municipality"},{"id":"Chhathar Rural Municipality","text":"Chhathar Rural Municipality"}],"Panchthar":[{"id":"Hilihan Rural Municipality","text":"Hilihan Rural Municipality"},{"id":"Falelung Rural Municipality","text":"Falelung Rural Municipality"},{"id":"Phidim Municipality","text":"Phidim Municipality"},{"id":"Falgunanda Rural Municipality","text":"Falgunanda Rural Municipality"},{"id":"Kummayak Rural Municipality","text":"Kummayak Rural Municipality"},{"id":"Miklajung Rural Municipality","text":"Miklajung Rural Municipality"},{"id":"Yangbarak Rural Municipality","text":"Yangbarak Rural Municipality"},{"id":"Tumbewa Rural Municipality","text":"Tumbewa Rural Municipality"}],"Ilam":[{"id":"Mai Jogmai Rural Municipality","text":"Mai Jogmai Rural Municipality"},{"id":"Sandakpur Rural Municipality","text":"Sandakpur Rural Municipality"},{"id":"Ilam Municipality","text":"Ilam Municipality"},{"id":"Deumai Municipality","text":"Deumai Municipality"},{"id":"Mangsebung Rural Municipality","text":"Mangsebung Rural Municipality"},{"id":"Chulachuli Rural Municipality","text":"Chulachuli Rural Municipality"},{"id":"Mai Municipality","text":"Mai Municipality"},{"id":"Suryodaya Municipality","text":"Suryodaya Municipality"},{"id":"Rong Rural Municipality","text":"Rong Rural Municipality"},{"id":"Fakfokathum Rural Municipality","text":"Fakfokathum Rural Municipality"}],"Jhapa":[{"id":"Mechinagar Municipality","text":"Mechinagar Municipality"},{"id":"Arjundhara Municipality","text":"Arjundhara Municipality"},{"id":"Kankai Municipality","text":"Kankai Municipality"},{"id":"Shivasatakshi Municipality","text":"Shivasatakshi Municipality"},{"id":"Kamal Rural Municipality","text":"Kamal Rural Municipality"},{"id":"Damak Municipality","text":"Damak Municipality"},{"id":"Gauradaha Municipality","text":"Gauradaha Municipality"},{"id":"Barhadashi Rural Municipality","text":"Barhadashi Rural Municipality"},{"id":"Haldibari Rural Municipality","text":"Haldibari Rural Municipality"},{"id":"Bhadrapur Municipality","text":"Bhadrapur Municipality"},{"id":"Kachanakawal Rural Municipality","text":"Kachanakawal Rural Municipality"},{"id":"Buddhashanti Rural Municipality","text":"Buddhashanti Rural Municipality"},{"id":"Gauriganj Rural Municipality","text":"Gauriganj Rural Municipality"},{"id":"Jhapa Rural Municipality","text":"Jhapa Rural Municipality"},{"id":"Birtamod Municipality","text":"Birtamod Municipality"}],"Morang":[{"id":"Miklajung Rural Municipality","text":"Miklajung Rural Municipality"},{"id":"Letang Municipality","text":"Letang Municipality"},{"id":"Sundarharaicha Municipality","text":"Sundarharaicha Municipality"},{"id":"Belbari Municipality","text":"Belbari Municipality"},{"id":"Kanepokhari Rural Municipality","text":"Kanepokhari Rural Municipality"},{"id":"Pathari Shanishchare Municipality","text":"Pathari Shanishchare Municipality"},{"id":"Urlabari Municipality","text":"Urlabari Municipality"},{"id":"Ratuwamai Municipality","text":"Ratuwamai Municipality"},{"id":"Rangeli Municipality","text":"Rangeli Municipality"},{"id":"Gramthan Rural Municipality","text":"Gramthan Rural Municipality"},{"id":"Budhiganga Rural Municipality","text":"Budhiganga Rural Municipality"},{"id":"Biratnagar Metropolitan City","text":"Biratnagar Metropolitan City"},{"id":"Dhanapalthan Rural Municipality","text":"Dhanapalthan Rural Municipality"},{"id":"Jahada Rural Municipality","text":"Jahada Rural Municipality"},{"id":"Kerabari Rural Municipality","text":"Kerabari Rural Municipality"},{"id":"Sunwarshi Municipality","text":"Sunwarshi Municipality"},{"id":"Katahari Rural Municipality","text":"Katahari Rural Municipality"}],"Sunsari":[{"id":"Dharan Sub-Metropolitan City","text":"Dharan Sub-Metropolitan City"},{"id":"Baraha Municipality","text":"Baraha Municipality"},{"id":"Koshi Rural Municipality","text":"Koshi Rural Municipality"},{"id":"Ramdhuni Municipality","text":"Ramdhuni Municipality"},{"id":"Itahari Sub-Metropolitan City","text":"Itahari Sub-Metropolitan City"},{"id":"Duhabi Municipality","text":"Duhabi Municipality"},{"id":"Gadhi Rural Municipality","text":"Gadhi Rural Municipality"},{"id":"Inaruwa Municipality","text":"Inaruwa Municipality"},{"id":"Harinagara Rural Municipality","text":"Harinagara Rural Municipality"},{"id":"Barju Rural Municipality","text":"Barju Rural Municipality"},{"id":"Bhokraha Rural Municipality","text":"Bhokraha Rural Municipality"},{"id":"Dewangunj Rural Municipality","text":"Dewangunj Rural Municipality"}],"Udayapur":[{"id":"Belaka Municipality","text":"Belaka Municipality"},{"id":"Chaudandigadhi Municipality","text":"Chaudandigadhi Municipality"},{"id":"Triyuga Municipality","text":"Triyuga Municipality"},{"id":"Rautamai Rural Municipality","text":"Rautamai Rural Municipality"},{"id":"Sunkoshi Rural Municipality","text":"Sunkoshi Rural Municipality"},{"id":"Katari Municipality","text":"Katari Municipality"},{"id":"Udayapurgadhi Rural Municipality","text":"Udayapurgadhi Rural Municipality"},{"id":"Tapli Rural Municipality","text":"Tapli Rural Municipality"}]}};
@@ -1 +0,0 @@
-window.NEPKIT_DATA = {"en": {"provinces": [{"id": "Sudurpaschim Province", "text": "Sudurpaschim Province"}, {"id": "Madhesh Province", "text": "Madhesh Province"}, {"id": "Gandaki Province", "text": "Gandaki Province"}, {"id": "Bagmati Province", "text": "Bagmati Province"}, {"id": "Lumbini Province", "text": "Lumbini Province"}, {"id": "Karnali Province", "text": "Karnali Province"}, {"id": "Koshi Province", "text": "Koshi Province"}], "districts": {"Sudurpaschim Province": [{"id": "Bajura", "text": "Bajura"}, {"id": "Bajhang", "text": "Bajhang"}, {"id": "Baitadi", "text": "Baitadi"}, {"id": "Dadeldhura", "text": "Dadeldhura"}, {"id": "Doti", "text": "Doti"}, {"id": "Achham", "text": "Achham"}, {"id": "Kailali", "text": "Kailali"}, {"id": "Darchula", "text": "Darchula"}, {"id": "Kanchanpur", "text": "Kanchanpur"}], "Madhesh Province": [{"id": "Saptari", "text": "Saptari"}, {"id": "Siraha", "text": "Siraha"}, {"id": "Dhanusa", "text": "Dhanusa"}, {"id": "Mahottari", "text": "Mahottari"}, {"id": "Sarlahi", "text": "Sarlahi"}, {"id": "Rautahat", "text": "Rautahat"}, {"id": "Bara", "text": "Bara"}, {"id": "Parsa", "text": "Parsa"}], "Gandaki Province": [{"id": "Gorkha", "text": "Gorkha"}, {"id": "Manang", "text": "Manang"}, {"id": "Mustang", "text": "Mustang"}, {"id": "Myagdi", "text": "Myagdi"}, {"id": "Kaski", "text": "Kaski"}, {"id": "Lamjung", "text": "Lamjung"}, {"id": "Tanahu", "text": "Tanahu"}, {"id": "Nawalparasi East", "text": "Nawalparasi East"}, {"id": "Syangja", "text": "Syangja"}, {"id": "Parbat", "text": "Parbat"}, {"id": "Baglung", "text": "Baglung"}], "Bagmati Province": [{"id": "Dolakha", "text": "Dolakha"}, {"id": "Sindhupalchok", "text": "Sindhupalchok"}, {"id": "Rasuwa", "text": "Rasuwa"}, {"id": "Dhading", "text": "Dhading"}, {"id": "Nuwakot", "text": "Nuwakot"}, {"id": "Kathmandu", "text": "Kathmandu"}, {"id": "Bhaktapur", "text": "Bhaktapur"}, {"id": "Lalitpur", "text": "Lalitpur"}, {"id": "Kavrepalanchok", "text": "Kavrepalanchok"}, {"id": "Ramechhap", "text": "Ramechhap"}, {"id": "Sindhuli", "text": "Sindhuli"}, {"id": "Makwanpur", "text": "Makwanpur"}, {"id": "Chitawan", "text": "Chitawan"}], "Lumbini Province": [{"id": "Rukum East", "text": "Rukum East"}, {"id": "Rolpa", "text": "Rolpa"}, {"id": "Pyuthan", "text": "Pyuthan"}, {"id": "Gulmi", "text": "Gulmi"}, {"id": "Arghakhanchi", "text": "Arghakhanchi"}, {"id": "Palpa", "text": "Palpa"}, {"id": "Rupandehi", "text": "Rupandehi"}, {"id": "Kapilvastu", "text": "Kapilvastu"}, {"id": "Dang", "text": "Dang"}, {"id": "Banke", "text": "Banke"}, {"id": "Bardiya", "text": "Bardiya"}, {"id": "Nawalparasi West", "text": "Nawalparasi West"}], "Karnali Province": [{"id": "Dolpa", "text": "Dolpa"}, {"id": "Mugu", "text": "Mugu"}, {"id": "Jumla", "text": "Jumla"}, {"id": "Kalikot", "text": "Kalikot"}, {"id": "Dailekh", "text": "Dailekh"}, {"id": "Jajarkot", "text": "Jajarkot"}, {"id": "Salyan", "text": "Salyan"}, {"id": "Surkhet", "text": "Surkhet"}, {"id": "Humla", "text": "Humla"}, {"id": "Rukum West", "text": "Rukum West"}], "Koshi Province": [{"id": "Taplejung", "text": "Taplejung"}, {"id": "Sankhuwasabha", "text": "Sankhuwasabha"}, {"id": "Solukhumbu", "text": "Solukhumbu"}, {"id": "Okhaldhunga", "text": "Okhaldhunga"}, {"id": "Khotang", "text": "Khotang"}, {"id": "Bhojpur", "text": "Bhojpur"}, {"id": "Dhankuta", "text": "Dhankuta"}, {"id": "Tehrathum", "text": "Tehrathum"}, {"id": "Panchthar", "text": "Panchthar"}, {"id": "Ilam", "text": "Ilam"}, {"id": "Jhapa", "text": "Jhapa"}, {"id": "Morang", "text": "Morang"}, {"id": "Sunsari", "text": "Sunsari"}, {"id": "Udayapur", "text": "Udayapur"}]}, "municipalities": {"Bajura": [{"id": "Himali Rural Municipality", "text": "Himali Rural Municipality"}, {"id": "Gaumul Rural Municipality", "text": "Gaumul Rural Municipality"}, {"id": "Badimalika Municipality", "text": "Badimalika Municipality"}, {"id": "Chhededaha Rural Municipality", "text": "Chhededaha Rural Municipality"}, {"id": "Budhiganga Municipality", "text": "Budhiganga Municipality"}, {"id": "Tribeni Municipality", "text": "Tribeni Municipality"}, {"id": "Jagannath Rural Municipality", "text": "Jagannath Rural Municipality"}, {"id": "Budhinanda Municipality", "text": "Budhinanda Municipality"}, {"id": "Swami Kartik Rural Municipality", "text": "Swami Kartik Rural Municipality"}], "Bajhang": [{"id": "Kanda Rural Municipality", "text": "Kanda Rural Municipality"}, {"id": "Bungal Municipality", "text": "Bungal Municipality"}, {"id": "Talkot Rural Municipality", "text": "Talkot Rural Municipality"}, {"id": "Masta Rural Municipality", "text": "Masta Rural Municipality"}, {"id": "Jayaprithbi Municipality", "text": "Jayaprithbi Municipality"}, {"id": "Chhabis Pathibhara Rural Municipality", "text": "Chhabis Pathibhara Rural Municipality"}, {"id": "Durgathali Rural Municipality", "text": "Durgathali Rural Municipality"}, {"id": "Bitthadchir Rural Municipality", "text": "Bitthadchir Rural Municipality"}, {"id": "Thalara Rural Municipality", "text": "Thalara Rural Municipality"}, {"id": "Khaptad Chhanna Rural Municipality", "text": "Khaptad Chhanna Rural Municipality"}, {"id": "Surma Rural Municipality", "text": "Surma Rural Municipality"}, {"id": "Kedarsyun Rural Municipality", "text": "Kedarsyun Rural Municipality"}], "Baitadi": [{"id": "Dilasaini Rural Municipality", "text": "Dilasaini Rural Municipality"}, {"id": "Dogada Kedar Rural Municipality", "text": "Dogada Kedar Rural Municipality"}, {"id": "Puchaundi Municipality", "text": "Puchaundi Municipality"}, {"id": "Surnaya Rural Municipality", "text": "Surnaya Rural Municipality"}, {"id": "Dasharathchand Municipality", "text": "Dasharathchand Municipality"}, {"id": "Shivanath Rural Municipality", "text": "Shivanath Rural Municipality"}, {"id": "Melauli Municipality", "text": "Melauli Municipality"}, {"id": "Patan Municipality", "text": "Patan Municipality"}, {"id": "Sigas Rural Municipality", "text": "Sigas Rural Municipality"}, {"id": "Pancheshwor Rural Municipality", "text": "Pancheshwor Rural Municipality"}], "Dadeldhura": [{"id": "Nawadurga Rural Municipality", "text": "Nawadurga Rural Municipality"}, {"id": "Amargadhi Municipality", "text": "Amargadhi Municipality"}, {"id": "Bhageshwor Rural Municipality", "text": "Bhageshwor Rural Municipality"}, {"id": "Parashuram Municipality", "text": "Parashuram Municipality"}, {"id": "Aalital Rural Municipality", "text": "Aalital Rural Municipality"}, {"id": "Ganyapdhura Rural Municipality", "text": "Ganyapdhura Rural Municipality"}, {"id": "Ajayameru Rural Municipality", "text": "Ajayameru Rural Municipality"}], "Doti": [{"id": "Purbichouki Rural Municipality", "text": "Purbichouki Rural Municipality"}, {"id": "Sayal Rural Municipality", "text": "Sayal Rural Municipality"}, {"id": "K.I. Singh Rural Municipality", "text": "K.I. Singh Rural Municipality"}, {"id": "Bogatan Foodsil Rural Municipality", "text": "Bogatan Foodsil Rural Municipality"}, {"id": "Badi Kedar Rural Municipality", "text": "Badi Kedar Rural Municipality"}, {"id": "Jorayal Rural Municipality", "text": "Jorayal Rural Municipality"}, {"id": "Aadarsha Rural Municipality", "text": "Aadarsha Rural Municipality"}, {"id": "Shikhar Municipality", "text": "Shikhar Municipality"}, {"id": "Dipayal Silgadhi Municipality", "text": "Dipayal Silgadhi Municipality"}], "Achham": [{"id": "Ramaroshan Rural Municipality", "text": "Ramaroshan Rural Municipality"}, {"id": "Mellekh Rural Municipality", "text": "Mellekh Rural Municipality"}, {"id": "Sanphebagar Municipality", "text": "Sanphebagar Municipality"}, {"id": "Chaurpati Rural Municipality", "text": "Chaurpati Rural Municipality"}, {"id": "Mangalsen Municipality", "text": "Mangalsen Municipality"}, {"id": "Kamal Bazar Municipality", "text": "Kamal Bazar Municipality"}, {"id": "Dhakari Rural Municipality", "text": "Dhakari Rural Municipality"}, {"id": "Turmakhand Rural Municipality", "text": "Turmakhand Rural Municipality"}, {"id": "Panchdebal Binayak Municipality", "text": "Panchdebal Binayak Municipality"}, {"id": "Bannigadhi Jayagadh Rural Municipality", "text": "Bannigadhi Jayagadh Rural Municipality"}], "Kailali": [{"id": "Mohanyal Rural Municipality", "text": "Mohanyal Rural Municipality"}, {"id": "Chure Rural Municipality", "text": "Chure Rural Municipality"}, {"id": "Godawari Municipality", "text": "Godawari Municipality"}, {"id": "Gauriganga Municipality", "text": "Gauriganga Municipality"}, {"id": "Bardagoriya Rural Municipality", "text": "Bardagoriya Rural Municipality"}, {"id": "Lamki Chuha Municipality", "text": "Lamki Chuha Municipality"}, {"id": "Janaki Rural Municipality", "text": "Janaki Rural Municipality"}, {"id": "Joshipur Rural Municipality", "text": "Joshipur Rural Municipality"}, {"id": "Tikapur Municipality", "text": "Tikapur Municipality"}, {"id": "Bhajani Municipality", "text": "Bhajani Municipality"}, {"id": "Dhangadhi Sub-Metropolitan City", "text": "Dhangadhi Sub-Metropolitan City"}, {"id": "Ghodaghodi Municipality", "text": "Ghodaghodi Municipality"}, {"id": "Kailari Rural Municipality", "text": "Kailari Rural Municipality"}], "Darchula": [{"id": "Byas Rural Municipality", "text": "Byas Rural Municipality"}, {"id": "Duhun Rural Municipality", "text": "Duhun Rural Municipality"}, {"id": "Mahakali Municipality", "text": "Mahakali Municipality"}, {"id": "Apihimal Rural Municipality", "text": "Apihimal Rural Municipality"}, {"id": "Marma Rural Municipality", "text": "Marma Rural Municipality"}, {"id": "Shailyashikhar Municipality", "text": "Shailyashikhar Municipality"}, {"id": "Lekam Rural Municipality", "text": "Lekam Rural Municipality"}, {"id": "Naugad Rural Municipality", "text": "Naugad Rural Municipality"}, {"id": "Malikarjun Rural Municipality", "text": "Malikarjun Rural Municipality"}], "Kanchanpur": [{"id": "Krishnapur Municipality", "text": "Krishnapur Municipality"}, {"id": "Shuklaphanta Municipality", "text": "Shuklaphanta Municipality"}, {"id": "Bedkot Municipality", "text": "Bedkot Municipality"}, {"id": "Bhimdatta Municipality", "text": "Bhimdatta Municipality"}, {"id": "Laljhadi Rural Municipality", "text": "Laljhadi Rural Municipality"}, {"id": "Punarbas Municipality", "text": "Punarbas Municipality"}, {"id": "Belouri Municipality", "text": "Belouri Municipality"}, {"id": "Beldandi Rural Municipality", "text": "Beldandi Rural Municipality"}, {"id": "Mahakali Municipality", "text": "Mahakali Municipality"}], "Saptari": [{"id": "Saptakoshi Municipality", "text": "Saptakoshi Municipality"}, {"id": "Kanchanrup Municipality", "text": "Kanchanrup Municipality"}, {"id": "Rupani Rural Municipality", "text": "Rupani Rural Municipality"}, {"id": "Shambhunath Municipality", "text": "Shambhunath Municipality"}, {"id": "Surunga Municipality", "text": "Surunga Municipality"}, {"id": "Balan-Bihul Rural Municipality", "text": "Balan-Bihul Rural Municipality"}, {"id": "BodeBarsain Municipality", "text": "BodeBarsain Municipality"}, {"id": "Belhi Chapena Rural Municipality", "text": "Belhi Chapena Rural Municipality"}, {"id": "Bishnupur Rural Municipality", "text": "Bishnupur Rural Municipality"}, {"id": "Rajbiraj Municipality", "text": "Rajbiraj Municipality"}, {"id": "Mahadewa Rural Municipality", "text": "Mahadewa Rural Municipality"}, {"id": "Tirahut Rural Municipality", "text": "Tirahut Rural Municipality"}, {"id": "Tilathi Koiladi Rural Municipality", "text": "Tilathi Koiladi Rural Municipality"}, {"id": "Chhinnamasta Rural Municipality", "text": "Chhinnamasta Rural Municipality"}, {"id": "Agnisair Krishna Sabaran Rural Municipality", "text": "Agnisair Krishna Sabaran Rural Municipality"}, {"id": "Khadak Municipality", "text": "Khadak Municipality"}, {"id": "Dakneshwori Municipality", "text": "Dakneshwori Municipality"}, {"id": "Hanumannagar Kankalini Municipality", "text": "Hanumannagar Kankalini Municipality"}], "Siraha": [{"id": "Lahan Municipality", "text": "Lahan Municipality"}, {"id": "Dhangadhimai Municipality", "text": "Dhangadhimai Municipality"}, {"id": "Golbazar Municipality", "text": "Golbazar Municipality"}, {"id": "Mirchaiya Municipality", "text": "Mirchaiya Municipality"}, {"id": "Karjanha Municipality", "text": "Karjanha Municipality"}, {"id": "Naraha Rural Municipality", "text": "Naraha Rural Municipality"}, {"id": "Bishnupur Rural Municipality", "text": "Bishnupur Rural Municipality"}, {"id": "Arnama Rural Municipality", "text": "Arnama Rural Municipality"}, {"id": "Sukhipur Municipality", "text": "Sukhipur Municipality"}, {"id": "Sakhuwa Nankarkatti Rural Municipality", "text": "Sakhuwa Nankarkatti Rural Municipality"}, {"id": "Bhagawanpur Rural Municipality", "text": "Bhagawanpur Rural Municipality"}, {"id": "Nawarajpur Rural Municipality", "text": "Nawarajpur Rural Municipality"}, {"id": "Bariyarpatti Rural Municipality", "text": "Bariyarpatti Rural Municipality"}, {"id": "Aurahi Rural Municipality", "text": "Aurahi Rural Municipality"}, {"id": "Siraha Municipality", "text": "Siraha Municipality"}, {"id": "Kalyanpur Municipality", "text": "Kalyanpur Municipality"}, {"id": "Laxmipur Patari Rural Municipality", "text": "Laxmipur Patari Rural Municipality"}], "Dhanusa": [{"id": "Dhanushadham Municipality", "text": "Dhanushadham Municipality"}, {"id": "Mithila Municipality", "text": "Mithila Municipality"}, {"id": "Bateshwor Rural Municipality", "text": "Bateshwor Rural Municipality"}, {"id": "Chhireshwornath Municipality", "text": "Chhireshwornath Municipality"}, {"id": "Laxminiya Rural Municipality", "text": "Laxminiya Rural Municipality"}, {"id": "Mithila Bihari Municipality", "text": "Mithila Bihari Municipality"}, {"id": "Hansapur Municipality", "text": "Hansapur Municipality"}, {"id": "Shahidnagar Municipality", "text": "Shahidnagar Municipality"}, {"id": "Kamala Municipality", "text": "Kamala Municipality"}, {"id": "Janak Nandini Rural Municipality", "text": "Janak Nandini Rural Municipality"}, {"id": "Bideha Municipality", "text": "Bideha Municipality"}, {"id": "Janakpur Sub-Metropolitan City", "text": "Janakpur Sub-Metropolitan City"}, {"id": "Dhanauji Rural Municipality", "text": "Dhanauji Rural Municipality"}, {"id": "Nagarain Municipality", "text": "Nagarain Municipality"}, {"id": "Ganeshman Charnath Municipality", "text": "Ganeshman Charnath Municipality"}, {"id": "Sabaila Municipality", "text": "Sabaila Municipality"}, {"id": "Aurahi Rural Municipality", "text": "Aurahi Rural Municipality"}, {"id": "Mukhiyapatti Musharniya Rural Municipality", "text": "Mukhiyapatti Musharniya Rural Municipality"}], "Mahottari": [{"id": "Bardibas Municipality", "text": "Bardibas Municipality"}, {"id": "Gaushala Municipality", "text": "Gaushala Municipality"}, {"id": "Sonama Rural Municipality", "text": "Sonama Rural Municipality"}, {"id": "Aurahi Municipality", "text": "Aurahi Municipality"}, {"id": "Loharpatti Municipality", "text": "Loharpatti Municipality"}, {"id": "Balawa Municipality", "text": "Balawa Municipality"}, {"id": "Ram Gopalpur Municipality", "text": "Ram Gopalpur Municipality"}, {"id": "Samsi Rural Municipality", "text": "Samsi Rural Municipality"}, {"id": "Ekadara Rural Municipality", "text": "Ekadara Rural Municipality"}, {"id": "Mahottari Rural Municipality", "text": "Mahottari Rural Municipality"}, {"id": "Pipara Rural Municipality", "text": "Pipara Rural Municipality"}, {"id": "Matihani Municipality", "text": "Matihani Municipality"}, {"id": "Jaleshwor Municipality", "text": "Jaleshwor Municipality"}, {"id": "Bhangaha Municipality", "text": "Bhangaha Municipality"}, {"id": "Manara Shiswa Municipality", "text": "Manara Shiswa Municipality"}], "Sarlahi": [{"id": "Lalbandi Municipality", "text": "Lalbandi Municipality"}, {"id": "Bagmati Municipality", "text": "Bagmati Municipality"}, {"id": "Barahathawa Municipality", "text": "Barahathawa Municipality"}, {"id": "Haripur Municipality", "text": "Haripur Municipality"}, {"id": "Ishworpur Municipality", "text": "Ishworpur Municipality"}, {"id": "Parsa Rural Municipality", "text": "Parsa Rural Municipality"}, {"id": "Brahmapuri Rural Municipality", "text": "Brahmapuri Rural Municipality"}, {"id": "Chandranagar Rural Municipality", "text": "Chandranagar Rural Municipality"}, {"id": "Kabilashi Municipality", "text": "Kabilashi Municipality"}, {"id": "Chakraghatta Rural Municipality", "text": "Chakraghatta Rural Municipality"}, {"id": "Dhanakaul Rural Municipality", "text": "Dhanakaul Rural Municipality"}, {"id": "Ramnagar Rural Municipality", "text": "Ramnagar Rural Municipality"}, {"id": "Balara Municipality", "text": "Balara Municipality"}, {"id": "Godaita Municipality", "text": "Godaita Municipality"}, {"id": "Bishnu Rural Municipality", "text": "Bishnu Rural Municipality"}, {"id": "Malangawa Municipality", "text": "Malangawa Municipality"}, {"id": "Hariwan Municipality", "text": "Hariwan Municipality"}, {"id": "Haripurwa Municipality", "text": "Haripurwa Municipality"}, {"id": "Basbariya Rural Municipality", "text": "Basbariya Rural Municipality"}, {"id": "Kaudena Rural Municipality", "text": "Kaudena Rural Municipality"}], "Rautahat": [{"id": "Chandrapur Municipality", "text": "Chandrapur Municipality"}, {"id": "Gujara Municipality", "text": "Gujara Municipality"}, {"id": "Phatuwa Bijayapur Municipality", "text": "Phatuwa Bijayapur Municipality"}, {"id": "Katahariya Municipality", "text": "Katahariya Municipality"}, {"id": "Brindaban Municipality", "text": "Brindaban Municipality"}, {"id": "Madhav Narayan Municipality", "text": "Madhav Narayan Municipality"}, {"id": "Garuda Municipality", "text": "Garuda Municipality"}, {"id": "Dewahi Gonahi Municipality", "text": "Dewahi Gonahi Municipality"}, {"id": "Maulapur Municipality", "text": "Maulapur Municipality"}, {"id": "Boudhimai Municipality", "text": "Boudhimai Municipality"}, {"id": "Paroha Municipality", "text": "Paroha Municipality"}, {"id": "Yamunamai Rural Municipality", "text": "Yamunamai Rural Municipality"}, {"id": "Rajdevi Municipality", "text": "Rajdevi Municipality"}, {"id": "Gaur Municipality", "text": "Gaur Municipality"}, {"id": "Ishanath Municipality", "text": "Ishanath Municipality"}, {"id": "Gadhimai Municipality", "text": "Gadhimai Municipality"}, {"id": "Rajpur Municipality", "text": "Rajpur Municipality"}, {"id": "Durga Bhagawati Rural Municipality", "text": "Durga Bhagawati Rural Municipality"}], "Bara": [{"id": "Nijagadh Municipality", "text": "Nijagadh Municipality"}, {"id": "Kolhabi Municipality", "text": "Kolhabi Municipality"}, {"id": "Parawanipur Rural Municipality", "text": "Parawanipur Rural Municipality"}, {"id": "Prasauni Rural Municipality", "text": "Prasauni Rural Municipality"}, {"id": "Bishrampur Rural Municipality", "text": "Bishrampur Rural Municipality"}, {"id": "Pheta Rural Municipality", "text": "Pheta Rural Municipality"}, {"id": "Kalaiya Sub-Metropolitan City", "text": "Kalaiya Sub-Metropolitan City"}, {"id": "Karaiyamai Rural Municipality", "text": "Karaiyamai Rural Municipality"}, {"id": "Aadarsha Kotwal Rural Municipality", "text": "Aadarsha Kotwal Rural Municipality"}, {"id": "Simroungadh Municipality", "text": "Simroungadh Municipality"}, {"id": "Pacharauta Municipality", "text": "Pacharauta Municipality"}, {"id": "Mahagadhimai Municipality", "text": "Mahagadhimai Municipality"}, {"id": "Devtal Rural Municipality", "text": "Devtal Rural Municipality"}, {"id": "Jitpur Simara Sub-Metropolitan City", "text": "Jitpur Simara Sub-Metropolitan City"}, {"id": "Baragadhi Rural Municipality", "text": "Baragadhi Rural Municipality"}, {"id": "Subarna Rural Municipality", "text": "Subarna Rural Municipality"}], "Parsa": [{"id": "Thori Rural Municipality", "text": "Thori Rural Municipality"}, {"id": "Jirabhawani Rural Municipality", "text": "Jirabhawani Rural Municipality"}, {"id": "Jagarnathpur Rural Municipality", "text": "Jagarnathpur Rural Municipality"}, {"id": "Sakhuwa Prasauni Rural Municipality", "text": "Sakhuwa Prasauni Rural Municipality"}, {"id": "Parsagadhi Municipality", "text": "Parsagadhi Municipality"}, {"id": "Birgunj Metropolitan City", "text": "Birgunj Metropolitan City"}, {"id": "Bahudarmai Municipality", "text": "Bahudarmai Municipality"}, {"id": "Pokhariya Municipality", "text": "Pokhariya Municipality"}, {"id": "Kalikamai Rural Municipality", "text": "Kalikamai Rural Municipality"}, {"id": "Dhobini Rural Municipality", "text": "Dhobini Rural Municipality"}, {"id": "Pakaha Mainpur Rural Municipality", "text": "Pakaha Mainpur Rural Municipality"}, {"id": "Bindabasini Rural Municipality", "text": "Bindabasini Rural Municipality"}, {"id": "Paterwa Sugauli Rural Municipality", "text": "Paterwa Sugauli Rural Municipality"}, {"id": "Chhipaharmai Rural Municipality", "text": "Chhipaharmai Rural Municipality"}], "Gorkha": [{"id": "Chumanubri Rural Municipality", "text": "Chumanubri Rural Municipality"}, {"id": "Sulikot Rural Municipality", "text": "Sulikot Rural Municipality"}, {"id": "Dharche Rural Municipality", "text": "Dharche Rural Municipality"}, {"id": "Aarughat Rural Municipality", "text": "Aarughat Rural Municipality"}, {"id": "Bhimsen Rural Municipality", "text": "Bhimsen Rural Municipality"}, {"id": "Siranchowk Rural Municipality", "text": "Siranchowk Rural Municipality"}, {"id": "Gorkha Municipality", "text": "Gorkha Municipality"}, {"id": "Shahid Lakhan Rural Municipality", "text": "Shahid Lakhan Rural Municipality"}, {"id": "Gandaki Rural Municipality", "text": "Gandaki Rural Municipality"}, {"id": "Ajirkot Rural Municipality", "text": "Ajirkot Rural Municipality"}, {"id": "Palungtar Municipality", "text": "Palungtar Municipality"}], "Manang": [{"id": "Narpa Bhumi Rural Municipality", "text": "Narpa Bhumi Rural Municipality"}, {"id": "Chame Rural Municipality", "text": "Chame Rural Municipality"}, {"id": "Nashong Rural Municipality", "text": "Nashong Rural Municipality"}, {"id": "Neshang Rural Municipality", "text": "Neshang Rural Municipality"}], "Mustang": [{"id": "Dalome Rural Municipality", "text": "Dalome Rural Municipality"}, {"id": "Gharpajhong Rural Municipality", "text": "Gharpajhong Rural Municipality"}, {"id": "Lomanthang Rural Municipality", "text": "Lomanthang Rural Municipality"}, {"id": "Thasang Rural Municipality", "text": "Thasang Rural Municipality"}, {"id": "Bahragaun Muktikshetra Rural Municipality", "text": "Bahragaun Muktikshetra Rural Municipality"}], "Myagdi": [{"id": "Annapurna Rural Municipality", "text": "Annapurna Rural Municipality"}, {"id": "Raghuganga Rural Municipality", "text": "Raghuganga Rural Municipality"}, {"id": "Dhawalagiri Rural Municipality", "text": "Dhawalagiri Rural Municipality"}, {"id": "Malika Rural Municipality", "text": "Malika Rural Municipality"}, {"id": "Mangala Rural Municipality", "text": "Mangala Rural Municipality"}, {"id": "Beni Municipality", "text": "Beni Municipality"}], "Kaski": [{"id": "Madi Rural Municipality", "text": "Madi Rural Municipality"}, {"id": "Annapurna Rural Municipality", "text": "Annapurna Rural Municipality"}, {"id": "Pokhara Metropolitan City", "text": "Pokhara Metropolitan City"}, {"id": "Rupa Rural Municipality", "text": "Rupa Rural Municipality"}, {"id": "Machhapuchchhre Rural Municipality", "text": "Machhapuchchhre Rural Municipality"}], "Lamjung": [{"id": "Dordi Rural Municipality", "text": "Dordi Rural Municipality"}, {"id": "Marshyangdi Rural Municipality", "text": "Marshyangdi Rural Municipality"}, {"id": "Madhya Nepal Municipality", "text": "Madhya Nepal Municipality"}, {"id": "Bensi Shahar Municipality", "text": "Bensi Shahar Municipality"}, {"id": "Rainas Municipality", "text": "Rainas Municipality"}, {"id": "Kwhola Sothar Rural Municipality", "text": "Kwhola Sothar Rural Municipality"}, {"id": "Sundarbazar Municipality", "text": "Sundarbazar Municipality"}, {"id": "Dudhapokhari Rural Municipality", "text": "Dudhapokhari Rural Municipality"}], "Tanahu": [{"id": "Bhanu Municipality", "text": "Bhanu Municipality"}, {"id": "Byas Municipality", "text": "Byas Municipality"}, {"id": "Myagde Rural Municipality", "text": "Myagde Rural Municipality"}, {"id": "Shuklagandaki Municipality", "text": "Shuklagandaki Municipality"}, {"id": "Bhimad Municipality", "text": "Bhimad Municipality"}, {"id": "Ghiring Rural Municipality", "text": "Ghiring Rural Municipality"}, {"id": "Devghat Rural Municipality", "text": "Devghat Rural Municipality"}, {"id": "Bandipur Rural Municipality", "text": "Bandipur Rural Municipality"}, {"id": "Aanbookhaireni Rural Municipality", "text": "Aanbookhaireni Rural Municipality"}, {"id": "Rhishing Rural Municipality", "text": "Rhishing Rural Municipality"}], "Nawalparasi East": [{"id": "Gaidakot Municipality", "text": "Gaidakot Municipality"}, {"id": "Bulingtar Rural Municipality", "text": "Bulingtar Rural Municipality"}, {"id": "Hupsekot Rural Municipality", "text": "Hupsekot Rural Municipality"}, {"id": "Devchuli Municipality", "text": "Devchuli Municipality"}, {"id": "Kawasoti Municipality", "text": "Kawasoti Municipality"}, {"id": "Madhyabindu Municipality", "text": "Madhyabindu Municipality"}, {"id": "Binayi Tribeni Rural Municipality", "text": "Binayi Tribeni Rural Municipality"}, {"id": "Bungdikali Rural Municipality", "text": "Bungdikali Rural Municipality"}], "Syangja": [{"id": "Phedikhola Rural Municipality", "text": "Phedikhola Rural Municipality"}, {"id": "Aandhikhola Rural Municipality", "text": "Aandhikhola Rural Municipality"}, {"id": "Arjun Choupari Rural Municipality", "text": "Arjun Choupari Rural Municipality"}, {"id": "Bhirkot Municipality", "text": "Bhirkot Municipality"}, {"id": "Biruwa Rural Municipality", "text": "Biruwa Rural Municipality"}, {"id": "Chapakot Municipality", "text": "Chapakot Municipality"}, {"id": "Walling Municipality", "text": "Walling Municipality"}, {"id": "Galyang Municipality", "text": "Galyang Municipality"}, {"id": "Kaligandaki Rural Municipality", "text": "Kaligandaki Rural Municipality"}, {"id": "Putalibazar Municipality", "text": "Putalibazar Municipality"}, {"id": "Harinas Rural Municipality", "text": "Harinas Rural Municipality"}], "Parbat": [{"id": "Modi Rural Municipality", "text": "Modi Rural Municipality"}, {"id": "Kushma Municipality", "text": "Kushma Municipality"}, {"id": "Phalebas Municipality", "text": "Phalebas Municipality"}, {"id": "Mahashila Rural Municipality", "text": "Mahashila Rural Municipality"}, {"id": "Bihadi Rural Municipality", "text": "Bihadi Rural Municipality"}, {"id": "Paiyu Rural Municipality", "text": "Paiyu Rural Municipality"}, {"id": "Jaljala Rural Municipality", "text": "Jaljala Rural Municipality"}], "Baglung": [{"id": "Baglung Municipality", "text": "Baglung Municipality"}, {"id": "Tarakhola Rural Municipality", "text": "Tarakhola Rural Municipality"}, {"id": "Tamankhola Rural Municipality", "text": "Tamankhola Rural Municipality"}, {"id": "Dhorpatan Municipality", "text": "Dhorpatan Municipality"}, {"id": "Nisikhola Rural Municipality", "text": "Nisikhola Rural Municipality"}, {"id": "Badigad Rural Municipality", "text": "Badigad Rural Municipality"}, {"id": "Galkot Municipality", "text": "Galkot Municipality"}, {"id": "Jaimuni Municipality", "text": "Jaimuni Municipality"}, {"id": "Kathekhola Rural Municipality", "text": "Kathekhola Rural Municipality"}, {"id": "Bareng Rural Municipality", "text": "Bareng Rural Municipality"}], "Dolakha": [{"id": "Gaurishankar Rural Municipality", "text": "Gaurishankar Rural Municipality"}, {"id": "Bigu Rural Municipality", "text": "Bigu Rural Municipality"}, {"id": "Kalinchowk Rural Municipality", "text": "Kalinchowk Rural Municipality"}, {"id": "Jiri Municipality", "text": "Jiri Municipality"}, {"id": "Tamakoshi Rural Municipality", "text": "Tamakoshi Rural Municipality"}, {"id": "Melung Rural Municipality", "text": "Melung Rural Municipality"}, {"id": "Shailung Rural Municipality", "text": "Shailung Rural Municipality"}, {"id": "Bhimeshwor Municipality", "text": "Bhimeshwor Municipality"}, {"id": "Baitedhar Rural Municipality", "text": "Baitedhar Rural Municipality"}], "Sindhupalchok": [{"id": "Jugal Rural Municipality", "text": "Jugal Rural Municipality"}, {"id": "Panchpokhari Thangpal Rural Municipality", "text": "Panchpokhari Thangpal Rural Municipality"}, {"id": "Helambu Rural Municipality", "text": "Helambu Rural Municipality"}, {"id": "Choutara Sangachowkgadhi Municipality", "text": "Choutara Sangachowkgadhi Municipality"}, {"id": "Balephi Rural Municipality", "text": "Balephi Rural Municipality"}, {"id": "Bahrabise Municipality", "text": "Bahrabise Municipality"}, {"id": "Lisankhu Pakhar Rural Municipality", "text": "Lisankhu Pakhar Rural Municipality"}, {"id": "Sunkoshi Rural Municipality", "text": "Sunkoshi Rural Municipality"}, {"id": "Bhotekoshi Rural Municipality", "text": "Bhotekoshi Rural Municipality"}, {"id": "Melanchi Municipality", "text": "Melanchi Municipality"}, {"id": "Indrawoti Rural Municipality", "text": "Indrawoti Rural Municipality"}, {"id": "Tripurasundari Rural Municipality", "text": "Tripurasundari Rural Municipality"}], "Rasuwa": [{"id": "Gosaikunda Rural Municipality", "text": "Gosaikunda Rural Municipality"}, {"id": "Aama Chhodingmo Rural Municipality", "text": "Aama Chhodingmo Rural Municipality"}, {"id": "Uttargaya Rural Municipality", "text": "Uttargaya Rural Municipality"}, {"id": "Kalika Rural Municipality", "text": "Kalika Rural Municipality"}, {"id": "Naukunda Rural Municipality", "text": "Naukunda Rural Municipality"}], "Dhading": [{"id": "Khaniyabas Rural Municipality", "text": "Khaniyabas Rural Municipality"}, {"id": "Ganga Jamuna Rural Municipality", "text": "Ganga Jamuna Rural Municipality"}, {"id": "Tripurasundari Rural Municipality", "text": "Tripurasundari Rural Municipality"}, {"id": "Netrawati Rural Municipality", "text": "Netrawati Rural Municipality"}, {"id": "Neelakantha Municipality", "text": "Neelakantha Municipality"}, {"id": "Siddhalek Rural Municipality", "text": "Siddhalek Rural Municipality"}, {"id": "Benighat Rorang Rural Municipality", "text": "Benighat Rorang Rural Municipality"}, {"id": "Gajuri Rural Municipality", "text": "Gajuri Rural Municipality"}, {"id": "Galchhi Rural Municipality", "text": "Galchhi Rural Municipality"}, {"id": "Thakre Rural Municipality", "text": "Thakre Rural Municipality"}, {"id": "Dhunibenshi Municipality", "text": "Dhunibenshi Municipality"}, {"id": "Rubi Valley Rural Municipality", "text": "Rubi Valley Rural Municipality"}, {"id": "Jwalamukhi Rural Municipality", "text": "Jwalamukhi Rural Municipality"}], "Nuwakot": [{"id": "Tadi Rural Municipality", "text": "Tadi Rural Municipality"}, {"id": "Suryagadhi Rural Municipality", "text": "Suryagadhi Rural Municipality"}, {"id": "Bidur Municipality", "text": "Bidur Municipality"}, {"id": "Kispang Rural Municipality", "text": "Kispang Rural Municipality"}, {"id": "Meghang Rural Municipality", "text": "Meghang Rural Municipality"}, {"id": "Belkotgadhi Municipality", "text": "Belkotgadhi Municipality"}, {"id": "Likhu Rural Municipality", "text": "Likhu Rural Municipality"}, {"id": "Panchakanya Rural Municipality", "text": "Panchakanya Rural Municipality"}, {"id": "Shivapuri Rural Municipality", "text": "Shivapuri Rural Municipality"}, {"id": "Kakani Rural Municipality", "text": "Kakani Rural Municipality"}, {"id": "Dupcheshwor Rural Municipality", "text": "Dupcheshwor Rural Municipality"}, {"id": "Tarakeshwor Rural Municipality", "text": "Tarakeshwor Rural Municipality"}], "Kathmandu": [{"id": "Kageshwori Manahara Municipality", "text": "Kageshwori Manahara Municipality"}, {"id": "Gokarneshwor Municipality", "text": "Gokarneshwor Municipality"}, {"id": "Budhanilkhantha Municipality", "text": "Budhanilkhantha Municipality"}, {"id": "Tokha Municipality", "text": "Tokha Municipality"}, {"id": "Tarakeshwor Municipality", "text": "Tarakeshwor Municipality"}, {"id": "Nagarjun Municipality", "text": "Nagarjun Municipality"}, {"id": "Kirtipur Municipality", "text": "Kirtipur Municipality"}, {"id": "Dakshinkali Municipality", "text": "Dakshinkali Municipality"}, {"id": "Shankharapur Municipality", "text": "Shankharapur Municipality"}, {"id": "Kathmandu Metropolitan City", "text": "Kathmandu Metropolitan City"}, {"id": "Chandragiri Municipality", "text": "Chandragiri Municipality"}], "Bhaktapur": [{"id": "Bhaktapur Municipality", "text": "Bhaktapur Municipality"}, {"id": "Madhyapur Thimi Municipality", "text": "Madhyapur Thimi Municipality"}, {"id": "Suryabinayak Municipality", "text": "Suryabinayak Municipality"}, {"id": "Changunarayan Municipality", "text": "Changunarayan Municipality"}], "Lalitpur": [{"id": "Mahalaxmi Municipality", "text": "Mahalaxmi Municipality"}, {"id": "Lalitpur Metropolitan City", "text": "Lalitpur Metropolitan City"}, {"id": "Godawari Municipality", "text": "Godawari Municipality"}, {"id": "Mahankal Rural Municipality", "text": "Mahankal Rural Municipality"}, {"id": "Bagmati Rural Municipality", "text": "Bagmati Rural Municipality"}, {"id": "Konjyosom Rural Municipality", "text": "Konjyosom Rural Municipality"}], "Kavrepalanchok": [{"id": "Chauri Deurali Rural Municipality", "text": "Chauri Deurali Rural Municipality"}, {"id": "Bhumlu Rural Municipality", "text": "Bhumlu Rural Municipality"}, {"id": "Mandan Deupur Municipality", "text": "Mandan Deupur Municipality"}, {"id": "Banepa Municipality", "text": "Banepa Municipality"}, {"id": "Panchkhal Municipality", "text": "Panchkhal Municipality"}, {"id": "Temal Rural Municipality", "text": "Temal Rural Municipality"}, {"id": "Namobuddha Municipality", "text": "Namobuddha Municipality"}, {"id": "Panauti Municipality", "text": "Panauti Municipality"}, {"id": "Roshi Rural Municipality", "text": "Roshi Rural Municipality"}, {"id": "Mahabharat Rural Municipality", "text": "Mahabharat Rural Municipality"}, {"id": "Khanikhola Rural Municipality", "text": "Khanikhola Rural Municipality"}, {"id": "Dhulikhel Municipality", "text": "Dhulikhel Municipality"}, {"id": "Bethanchowk Rural Municipality", "text": "Bethanchowk Rural Municipality"}], "Ramechhap": [{"id": "Umakunda Rural Municipality", "text": "Umakunda Rural Municipality"}, {"id": "Gokulganga Rural Municipality", "text": "Gokulganga Rural Municipality"}, {"id": "Likhu Rural Municipality", "text": "Likhu Rural Municipality"}, {"id": "Manthali Municipality", "text": "Manthali Municipality"}, {"id": "Khandadevi Rural Municipality", "text": "Khandadevi Rural Municipality"}, {"id": "Doramba Rural Municipality", "text": "Doramba Rural Municipality"}, {"id": "Sunapati Rural Municipality", "text": "Sunapati Rural Municipality"}, {"id": "Ramechhap Municipality", "text": "Ramechhap Municipality"}], "Sindhuli": [{"id": "Dudhouli Municipality", "text": "Dudhouli Municipality"}, {"id": "Tinpatan Rural Municipality", "text": "Tinpatan Rural Municipality"}, {"id": "Golanjor Rural Municipality", "text": "Golanjor Rural Municipality"}, {"id": "Kamalamai Municipality", "text": "Kamalamai Municipality"}, {"id": "Sunkoshi Rural Municipality", "text": "Sunkoshi Rural Municipality"}, {"id": "Marin Rural Municipality", "text": "Marin Rural Municipality"}, {"id": "Hariharpurgaghi Rural Municipality", "text": "Hariharpurgaghi Rural Municipality"}, {"id": "Phikkal Rural Municipality", "text": "Phikkal Rural Municipality"}, {"id": "Ghyanglekha Rural Municipality", "text": "Ghyanglekha Rural Municipality"}], "Makwanpur": [{"id": "Indrasarowar Rural Municipality", "text": "Indrasarowar Rural Municipality"}, {"id": "Thaha Municipality", "text": "Thaha Municipality"}, {"id": "Kailash Rural Municipality", "text": "Kailash Rural Municipality"}, {"id": "Manahari Rural Municipality", "text": "Manahari Rural Municipality"}, {"id": "Hetauda Sub-Metropolitan City", "text": "Hetauda Sub-Metropolitan City"}, {"id": "Makawanpurgadhi Rural Municipality", "text": "Makawanpurgadhi Rural Municipality"}, {"id": "Bakaiya Rural Municipality", "text": "Bakaiya Rural Municipality"}, {"id": "Bagmati Rural Municipality", "text": "Bagmati Rural Municipality"}, {"id": "Raksirang Rural Municipality", "text": "Raksirang Rural Municipality"}, {"id": "Bhimphedi Rural Municipality", "text": "Bhimphedi Rural Municipality"}], "Chitawan": [{"id": "Rapti Municipality", "text": "Rapti Municipality"}, {"id": "Kalika Municipality", "text": "Kalika Municipality"}, {"id": "Bharatpur Metropolitan City", "text": "Bharatpur Metropolitan City"}, {"id": "Ratnanagar Municipality", "text": "Ratnanagar Municipality"}, {"id": "Khairahani Municipality", "text": "Khairahani Municipality"}, {"id": "Madi Municipality", "text": "Madi Municipality"}, {"id": "Ichchha Kamana Rural Municipality", "text": "Ichchha Kamana Rural Municipality"}], "Rukum East": [{"id": "Sisne Rural Municipality", "text": "Sisne Rural Municipality"}, {"id": "Bhoome Rural Municipality", "text": "Bhoome Rural Municipality"}, {"id": "Putha Uttanganga Rural Municipality", "text": "Putha Uttanganga Rural Municipality"}], "Rolpa": [{"id": "Sunchhahari Rural Municipality", "text": "Sunchhahari Rural Municipality"}, {"id": "Thawang Rural Municipality", "text": "Thawang Rural Municipality"}, {"id": "Duikholi Rural Municipality", "text": "Duikholi Rural Municipality"}, {"id": "Madi Rural Municipality", "text": "Madi Rural Municipality"}, {"id": "Tribeni Rural Municipality", "text": "Tribeni Rural Municipality"}, {"id": "Rolpa Municipality", "text": "Rolpa Municipality"}, {"id": "Runtigadhi Rural Municipality", "text": "Runtigadhi Rural Municipality"}, {"id": "Sunilsmiriti Rural Municipality", "text": "Sunilsmiriti Rural Municipality"}, {"id": "Lungri Rural Municipality", "text": "Lungri Rural Municipality"}, {"id": "Gangadev Rural Municipality", "text": "Gangadev Rural Municipality"}], "Pyuthan": [{"id": "Naubahini Rural Municipality", "text": "Naubahini Rural Municipality"}, {"id": "Jhimaruk Rural Municipality", "text": "Jhimaruk Rural Municipality"}, {"id": "Pyuthan Municipality", "text": "Pyuthan Municipality"}, {"id": "Sworgadwari Municipality", "text": "Sworgadwari Municipality"}, {"id": "Mandavi Rural Municipality", "text": "Mandavi Rural Municipality"}, {"id": "Aairawati Rural Municipality", "text": "Aairawati Rural Municipality"}, {"id": "Sarumarani Rural Municipality", "text": "Sarumarani Rural Municipality"}, {"id": "Gaumukhi Rural Municipality", "text": "Gaumukhi Rural Municipality"}, {"id": "Mallarani Rural Municipality", "text": "Mallarani Rural Municipality"}], "Gulmi": [{"id": "Kali Gandaki Rural Municipality", "text": "Kali Gandaki Rural Municipality"}, {"id": "Satyawoti Rural Municipality", "text": "Satyawoti Rural Municipality"}, {"id": "Musikot Municipality", "text": "Musikot Municipality"}, {"id": "Isma Rural Municipality", "text": "Isma Rural Municipality"}, {"id": "Malika Rural Municipality", "text": "Malika Rural Municipality"}, {"id": "Madane Rural Municipality", "text": "Madane Rural Municipality"}, {"id": "Dhurkot Rural Municipality", "text": "Dhurkot Rural Municipality"}, {"id": "Resunga Municipality", "text": "Resunga Municipality"}, {"id": "Chhatrakot Rural Municipality", "text": "Chhatrakot Rural Municipality"}, {"id": "Ruru Rural Municipality", "text": "Ruru Rural Municipality"}, {"id": "Chandrakot Rural Municipality", "text": "Chandrakot Rural Municipality"}, {"id": "Gulmi Durbar Rural Municipality", "text": "Gulmi Durbar Rural Municipality"}], "Arghakhanchi": [{"id": "Chhatradev Rural Municipality", "text": "Chhatradev Rural Municipality"}, {"id": "Malarani Rural Municipality", "text": "Malarani Rural Municipality"}, {"id": "Bhumikasthan Municipality", "text": "Bhumikasthan Municipality"}, {"id": "Sandhikharka Municipality", "text": "Sandhikharka Municipality"}, {"id": "Shitaganga Municipality", "text": "Shitaganga Municipality"}, {"id": "Panini Rural Municipality", "text": "Panini Rural Municipality"}], "Palpa": [{"id": "Rampur Municipality", "text": "Rampur Municipality"}, {"id": "Purbakhola Rural Municipality", "text": "Purbakhola Rural Municipality"}, {"id": "Rambha Rural Municipality", "text": "Rambha Rural Municipality"}, {"id": "Baganaskali Rural Municipality", "text": "Baganaskali Rural Municipality"}, {"id": "Tansen Municipality", "text": "Tansen Municipality"}, {"id": "Rainadevi Chhahara Rural Municipality", "text": "Rainadevi Chhahara Rural Municipality"}, {"id": "Mathagadhi Rural Municipality", "text": "Mathagadhi Rural Municipality"}, {"id": "Ribdikot Rural Municipality", "text": "Ribdikot Rural Municipality"}, {"id": "Tinau Rural Municipality", "text": "Tinau Rural Municipality"}, {"id": "Nisdi Rural Municipality", "text": "Nisdi Rural Municipality"}], "Rupandehi": [{"id": "Devdaha Municipality", "text": "Devdaha Municipality"}, {"id": "Butwal Sub-Metropolitan City", "text": "Butwal Sub-Metropolitan City"}, {"id": "Sainamaina Municipality", "text": "Sainamaina Municipality"}, {"id": "Kanchan Rural Municipality", "text": "Kanchan Rural Municipality"}, {"id": "Suddhodhan Rural Municipality", "text": "Suddhodhan Rural Municipality"}, {"id": "Siyari Rural Municipality", "text": "Siyari Rural Municipality"}, {"id": "Tilottama Municipality", "text": "Tilottama Municipality"}, {"id": "Om Satiya Rural Municipality", "text": "Om Satiya Rural Municipality"}, {"id": "Rohini Rural Municipality", "text": "Rohini Rural Municipality"}, {"id": "Mayadevi Rural Municipality", "text": "Mayadevi Rural Municipality"}, {"id": "Lumbini Sanskritik Municipality", "text": "Lumbini Sanskritik Municipality"}, {"id": "Kotahimai Rural Municipality", "text": "Kotahimai Rural Municipality"}, {"id": "Sammarimai Rural Municipality", "text": "Sammarimai Rural Municipality"}, {"id": "Marchawari Rural Municipality", "text": "Marchawari Rural Municipality"}, {"id": "Gaidahawa Rural Municipality", "text": "Gaidahawa Rural Municipality"}, {"id": "Siddharthanagar Municipality", "text": "Siddharthanagar Municipality"}], "Kapilvastu": [{"id": "Banganga Municipality", "text": "Banganga Municipality"}, {"id": "Shivaraj Municipality", "text": "Shivaraj Municipality"}, {"id": "Bijayanagar Rural Municipality", "text": "Bijayanagar Rural Municipality"}, {"id": "Krishnanagar Municipality", "text": "Krishnanagar Municipality"}, {"id": "Maharajganj Municipality", "text": "Maharajganj Municipality"}, {"id": "Yasodhara Rural Municipality", "text": "Yasodhara Rural Municipality"}, {"id": "Mayadevi Rural Municipality", "text": "Mayadevi Rural Municipality"}, {"id": "Shuddhodhan Rural Municipality", "text": "Shuddhodhan Rural Municipality"}, {"id": "Buddhabhumi Municipality", "text": "Buddhabhumi Municipality"}, {"id": "Kapilvastu Municipality", "text": "Kapilvastu Municipality"}], "Dang": [{"id": "Bangalachuli Rural Municipality", "text": "Bangalachuli Rural Municipality"}, {"id": "Tulsipur Sub-Metropolitan City", "text": "Tulsipur Sub-Metropolitan City"}, {"id": "Shantinagar Rural Municipality", "text": "Shantinagar Rural Municipality"}, {"id": "Babai Rural Municipality", "text": "Babai Rural Municipality"}, {"id": "Dangisharan Rural Municipality", "text": "Dangisharan Rural Municipality"}, {"id": "Lamahi Municipality", "text": "Lamahi Municipality"}, {"id": "Ghorahi Sub-Metropolitan City", "text": "Ghorahi Sub-Metropolitan City"}, {"id": "Rapti Rural Municipality", "text": "Rapti Rural Municipality"}, {"id": "Gadhawa Rural Municipality", "text": "Gadhawa Rural Municipality"}, {"id": "Rajpur Rural Municipality", "text": "Rajpur Rural Municipality"}], "Banke": [{"id": "Khajura Rural Municipality", "text": "Khajura Rural Municipality"}, {"id": "Janaki Rural Municipality", "text": "Janaki Rural Municipality"}, {"id": "Rapti Sonari Rural Municipality", "text": "Rapti Sonari Rural Municipality"}, {"id": "Kohalpur Municipality", "text": "Kohalpur Municipality"}, {"id": "Baijanath Rural Municipality", "text": "Baijanath Rural Municipality"}, {"id": "Nepalgunj Sub-Metropolitan City", "text": "Nepalgunj Sub-Metropolitan City"}, {"id": "Duduwa Rural Municipality", "text": "Duduwa Rural Municipality"}, {"id": "Narainapur Rural Municipality", "text": "Narainapur Rural Municipality"}], "Bardiya": [{"id": "Thakurbaba Municipality", "text": "Thakurbaba Municipality"}, {"id": "Geruwa Rural Municipality", "text": "Geruwa Rural Municipality"}, {"id": "Rajapur Municipality", "text": "Rajapur Municipality"}, {"id": "Madhuwan Municipality", "text": "Madhuwan Municipality"}, {"id": "Bansgadhi Municipality", "text": "Bansgadhi Municipality"}, {"id": "Barbardiya Municipality", "text": "Barbardiya Municipality"}, {"id": "Gulariya Municipality", "text": "Gulariya Municipality"}, {"id": "Badhaiyatal Rural Municipality", "text": "Badhaiyatal Rural Municipality"}], "Nawalparasi West": [{"id": "Bardaghat Municipality", "text": "Bardaghat Municipality"}, {"id": "Sunawal Municipality", "text": "Sunawal Municipality"}, {"id": "Ramgram Municipality", "text": "Ramgram Municipality"}, {"id": "Palhinandan Rural Municipality", "text": "Palhinandan Rural Municipality"}, {"id": "Sarawal Rural Municipality", "text": "Sarawal Rural Municipality"}, {"id": "Susta Rural Municipality", "text": "Susta Rural Municipality"}, {"id": "Pratapapur Rural Municipality", "text": "Pratapapur Rural Municipality"}], "Dolpa": [{"id": "Mudkechula Rural Municipality", "text": "Mudkechula Rural Municipality"}, {"id": "Tripurasundari Municipality", "text": "Tripurasundari Municipality"}, {"id": "Thulibheri Municipality", "text": "Thulibheri Municipality"}, {"id": "Kaike Rural Municipality", "text": "Kaike Rural Municipality"}, {"id": "Chharka Tangsong Rural Municipality", "text": "Chharka Tangsong Rural Municipality"}, {"id": "Shey Phoksundo Rural Municipality", "text": "Shey Phoksundo Rural Municipality"}, {"id": "Jagadulla Rural Municipality", "text": "Jagadulla Rural Municipality"}, {"id": "Dolpo Buddha Rural Municipality", "text": "Dolpo Buddha Rural Municipality"}], "Mugu": [{"id": "Mugumakarmarog Rural Municipality", "text": "Mugumakarmarog Rural Municipality"}, {"id": "Chhayanath Rara Municipality", "text": "Chhayanath Rara Municipality"}, {"id": "Khatyad Rural Municipality", "text": "Khatyad Rural Municipality"}, {"id": "Soru Rural Municipality", "text": "Soru Rural Municipality"}], "Jumla": [{"id": "Patarasi Rural Municipality", "text": "Patarasi Rural Municipality"}, {"id": "Kanaka Sundari Rural Municipality", "text": "Kanaka Sundari Rural Municipality"}, {"id": "Sinja Rural Municipality", "text": "Sinja Rural Municipality"}, {"id": "Chandannath Municipality", "text": "Chandannath Municipality"}, {"id": "Guthichaur Rural Municipality", "text": "Guthichaur Rural Municipality"}, {"id": "Tatopani Rural Municipality", "text": "Tatopani Rural Municipality"}, {"id": "Tila Rural Municipality", "text": "Tila Rural Municipality"}, {"id": "Hima Rural Municipality", "text": "Hima Rural Municipality"}], "Kalikot": [{"id": "Mahawai Rural Municipality", "text": "Mahawai Rural Municipality"}, {"id": "Kalika Rural Municipality", "text": "Kalika Rural Municipality"}, {"id": "Palata Rural Municipality", "text": "Palata Rural Municipality"}, {"id": "Pachal Jharana Rural Municipality", "text": "Pachal Jharana Rural Municipality"}, {"id": "Raskot Municipality", "text": "Raskot Municipality"}, {"id": "Sanni Tribeni Rural Municipality", "text": "Sanni Tribeni Rural Municipality"}, {"id": "Naraharinath Rural Municipality", "text": "Naraharinath Rural Municipality"}, {"id": "Khandachakra Municipality", "text": "Khandachakra Municipality"}, {"id": "Tilagupha Municipality", "text": "Tilagupha Municipality"}], "Dailekh": [{"id": "Naumule Rural Municipality", "text": "Naumule Rural Municipality"}, {"id": "Mahabu Rural Municipality", "text": "Mahabu Rural Municipality"}, {"id": "Bhairabi Rural Municipality", "text": "Bhairabi Rural Municipality"}, {"id": "Thantikandh Rural Municipality", "text": "Thantikandh Rural Municipality"}, {"id": "Aathbis Municipality", "text": "Aathbis Municipality"}, {"id": "Chamunda Bindrasaini Municipality", "text": "Chamunda Bindrasaini Municipality"}, {"id": "Dullu Municipality", "text": "Dullu Municipality"}, {"id": "Narayan Municipality", "text": "Narayan Municipality"}, {"id": "Bhagawatimai Rural Municipality", "text": "Bhagawatimai Rural Municipality"}, {"id": "Dungeshwor Rural Municipality", "text": "Dungeshwor Rural Municipality"}, {"id": "Gurans Rural Municipality", "text": "Gurans Rural Municipality"}], "Jajarkot": [{"id": "Shivalaya Rural Municipality", "text": "Shivalaya Rural Municipality"}, {"id": "Bheri Municipality", "text": "Bheri Municipality"}, {"id": "Tribeni Nalagad Municipality", "text": "Tribeni Nalagad Municipality"}, {"id": "Barekot Rural Municipality", "text": "Barekot Rural Municipality"}, {"id": "Kuse Rural Municipality", "text": "Kuse Rural Municipality"}, {"id": "Junichande Rural Municipality", "text": "Junichande Rural Municipality"}, {"id": "Chhedagad Municipality", "text": "Chhedagad Municipality"}], "Salyan": [{"id": "Darma Rural Municipality", "text": "Darma Rural Municipality"}, {"id": "Kumakh Malika Rural Municipality", "text": "Kumakh Malika Rural Municipality"}, {"id": "Banagad Kupinde Municipality", "text": "Banagad Kupinde Municipality"}, {"id": "Dhorchaur Rural Municipality", "text": "Dhorchaur Rural Municipality"}, {"id": "Bagachour Municipality", "text": "Bagachour Municipality"}, {"id": "Chhatreshwori Rural Municipality", "text": "Chhatreshwori Rural Municipality"}, {"id": "Sharada Municipality", "text": "Sharada Municipality"}, {"id": "Kalimati Rural Municipality", "text": "Kalimati Rural Municipality"}, {"id": "Tribeni Rural Municipality", "text": "Tribeni Rural Municipality"}, {"id": "Kapurkot Rural Municipality", "text": "Kapurkot Rural Municipality"}], "Surkhet": [{"id": "Simta Rural Municipality", "text": "Simta Rural Municipality"}, {"id": "Chingad Rural Municipality", "text": "Chingad Rural Municipality"}, {"id": "Lekabeshi Municipality", "text": "Lekabeshi Municipality"}, {"id": "Gurbhakot Municipality", "text": "Gurbhakot Municipality"}, {"id": "Bheriganga Municipality", "text": "Bheriganga Municipality"}, {"id": "Birendranagar Municipality", "text": "Birendranagar Municipality"}, {"id": "Barahatal Rural Municipality", "text": "Barahatal Rural Municipality"}, {"id": "Panchapuri Municipality", "text": "Panchapuri Municipality"}, {"id": "Chaukune Rural Municipality", "text": "Chaukune Rural Municipality"}], "Humla": [{"id": "Chankheli Rural Municipality", "text": "Chankheli Rural Municipality"}, {"id": "Kharpunath Rural Municipality", "text": "Kharpunath Rural Municipality"}, {"id": "Simkot Rural Municipality", "text": "Simkot Rural Municipality"}, {"id": "Namkha Rural Municipality", "text": "Namkha Rural Municipality"}, {"id": "Sarkegad Rural Municipality", "text": "Sarkegad Rural Municipality"}, {"id": "Adanchuli Rural Municipality", "text": "Adanchuli Rural Municipality"}, {"id": "Tanjakot Rural Municipality", "text": "Tanjakot Rural Municipality"}], "Rukum West": [{"id": "Aathabisakot Municipality", "text": "Aathabisakot Municipality"}, {"id": "Sanibheri Rural Municipality", "text": "Sanibheri Rural Municipality"}, {"id": "Banphikot Rural Municipality", "text": "Banphikot Rural Municipality"}, {"id": "Musikot Municipality", "text": "Musikot Municipality"}, {"id": "Tribeni Rural Municipality", "text": "Tribeni Rural Municipality"}, {"id": "Chaurjahari Municipality", "text": "Chaurjahari Municipality"}], "Taplejung": [{"id": "Mikwakhola Rural Municipality", "text": "Mikwakhola Rural Municipality"}, {"id": "Maiwakhola Rural Municipality", "text": "Maiwakhola Rural Municipality"}, {"id": "Aatharai Tribeni Rural Municipality", "text": "Aatharai Tribeni Rural Municipality"}, {"id": "Phungling Municipality", "text": "Phungling Municipality"}, {"id": "Pathivara Yangwarak Rural Municipality", "text": "Pathivara Yangwarak Rural Municipality"}, {"id": "Sirijanga Rural Municipality", "text": "Sirijanga Rural Municipality"}, {"id": "Phaktanlung Rural Municipality", "text": "Phaktanlung Rural Municipality"}, {"id": "Meringden Rural Municipality", "text": "Meringden Rural Municipality"}, {"id": "Sidingba Rural Municipality", "text": "Sidingba Rural Municipality"}], "Sankhuwasabha": [{"id": "Bhotkhola Rural Municipality", "text": "Bhotkhola Rural Municipality"}, {"id": "Makalu Rural Municipality", "text": "Makalu Rural Municipality"}, {"id": "Silichong Rural Municipality", "text": "Silichong Rural Municipality"}, {"id": "Chichila Rural Municipality", "text": "Chichila Rural Municipality"}, {"id": "Sabhapokhari Rural Municipality", "text": "Sabhapokhari Rural Municipality"}, {"id": "Panchakhapan Municipality", "text": "Panchakhapan Municipality"}, {"id": "Chainapur Municipality", "text": "Chainapur Municipality"}, {"id": "Madi Municipality", "text": "Madi Municipality"}, {"id": "Dharmadevi Municipality", "text": "Dharmadevi Municipality"}, {"id": "Khandabari Municipality", "text": "Khandabari Municipality"}], "Solukhumbu": [{"id": "Mahakulung Rural Municipality", "text": "Mahakulung Rural Municipality"}, {"id": "Sotang Rural Municipality", "text": "Sotang Rural Municipality"}, {"id": "Dhudhakoshi Rural Municipality", "text": "Dhudhakoshi Rural Municipality"}, {"id": "Dhudha Koushika Rural Municipality", "text": "Dhudha Koushika Rural Municipality"}, {"id": "Necha Salyan Rural Municipality", "text": "Necha Salyan Rural Municipality"}, {"id": "Solu Dhudhakunda Municipality", "text": "Solu Dhudhakunda Municipality"}, {"id": "Likhu Pike Rural Municipality", "text": "Likhu Pike Rural Municipality"}, {"id": "Khumbu Pasanglhamu Rural Municipality", "text": "Khumbu Pasanglhamu Rural Municipality"}], "Okhaldhunga": [{"id": "Siddhicharan Municipality", "text": "Siddhicharan Municipality"}, {"id": "Molung Rural Municipality", "text": "Molung Rural Municipality"}, {"id": "Khiji Demba Rural Municipality", "text": "Khiji Demba Rural Municipality"}, {"id": "Likhu Rural Municipality", "text": "Likhu Rural Municipality"}, {"id": "Champadevi Rural Municipality", "text": "Champadevi Rural Municipality"}, {"id": "Sunkoshi Rural Municipality", "text": "Sunkoshi Rural Municipality"}, {"id": "Chishankhu Gadhi Rural Municipality", "text": "Chishankhu Gadhi Rural Municipality"}, {"id": "Manebhanjyang Rural Municipality", "text": "Manebhanjyang Rural Municipality"}], "Khotang": [{"id": "Kepilasgadhi Rural Municipality", "text": "Kepilasgadhi Rural Municipality"}, {"id": "Aiselukharka Rural Municipality", "text": "Aiselukharka Rural Municipality"}, {"id": "Lamidanda Rural Municipality", "text": "Lamidanda Rural Municipality"}, {"id": "Halesi Tuwachung Municipality", "text": "Halesi Tuwachung Municipality"}, {"id": "Sakela Rural Municipality", "text": "Sakela Rural Municipality"}, {"id": "Diprung Rural Municipality", "text": "Diprung Rural Municipality"}, {"id": "Khotehang Rural Municipality", "text": "Khotehang Rural Municipality"}, {"id": "Jante Dhunga Rural Municipality", "text": "Jante Dhunga Rural Municipality"}, {"id": "Barahapokhari Rural Municipality", "text": "Barahapokhari Rural Municipality"}, {"id": "Diktel Rupakot Majhuwagadhi Municipality", "text": "Diktel Rupakot Majhuwagadhi Municipality"}], "Bhojpur": [{"id": "Shadananda Municipality", "text": "Shadananda Municipality"}, {"id": "Tyamke Maiyum Rural Municipality", "text": "Tyamke Maiyum Rural Municipality"}, {"id": "Bhojpur Municipality", "text": "Bhojpur Municipality"}, {"id": "Pauwa Dunma Rural Municipality", "text": "Pauwa Dunma Rural Municipality"}, {"id": "Ramprasad Rai Rural Municipality", "text": "Ramprasad Rai Rural Municipality"}, {"id": "Hatuwagadhi Rural Municipality", "text": "Hatuwagadhi Rural Municipality"}, {"id": "Aamchowk Rural Municipality", "text": "Aamchowk Rural Municipality"}, {"id": "Salpa Silichho Rural Municipality", "text": "Salpa Silichho Rural Municipality"}, {"id": "Arun Rural Municipality", "text": "Arun Rural Municipality"}], "Dhankuta": [{"id": "Pakhribas Municipality", "text": "Pakhribas Municipality"}, {"id": "Chhathar Jorpati Rural Municipality", "text": "Chhathar Jorpati Rural Municipality"}, {"id": "Dhankuta Municipality", "text": "Dhankuta Municipality"}, {"id": "Sangurigadhi Rural Municipality", "text": "Sangurigadhi Rural Municipality"}, {"id": "Chaubise Rural Municipality", "text": "Chaubise Rural Municipality"}, {"id": "Mahalaxmi Municipality", "text": "Mahalaxmi Municipality"}, {"id": "Khalsa Chhintang Sahidbhumi Rural Municipality", "text": "Khalsa Chhintang Sahidbhumi Rural Municipality"}], "Tehrathum": [{"id": "Aatharai Rural Municipality", "text": "Aatharai Rural Municipality"}, {"id": "Phedap Rural Municipality", "text": "Phedap Rural Municipality"}, {"id": "Menchhayayem Rural Municipality", "text": "Menchhayayem Rural Municipality"}, {"id": "Myanglung Municipality", "text": "Myanglung Municipality"}, {"id": "Laligurans Municipality", "text": "Laligurans Municipality"}, {"id": "Chhathar Rural Municipality", "text": "Chhathar Rural Municipality"}], "Panchthar": [{"id": "Hilihan Rural Municipality", "text": "Hilihan Rural Municipality"}, {"id": "Falelung Rural Municipality", "text": "Falelung Rural Municipality"}, {"id": "Phidim Municipality", "text": "Phidim Municipality"}, {"id": "Falgunanda Rural Municipality", "text": "Falgunanda Rural Municipality"}, {"id": "Kummayak Rural Municipality", "text": "Kummayak Rural Municipality"}, {"id": "Miklajung Rural Municipality", "text": "Miklajung Rural Municipality"}, {"id": "Yangbarak Rural Municipality", "text": "Yangbarak Rural Municipality"}, {"id": "Tumbewa Rural Municipality", "text": "Tumbewa Rural Municipality"}], "Ilam": [{"id": "Mai Jogmai Rural Municipality", "text": "Mai Jogmai Rural Municipality"}, {"id": "Sandakpur Rural Municipality", "text": "Sandakpur Rural Municipality"}, {"id": "Ilam Municipality", "text": "Ilam Municipality"}, {"id": "Deumai Municipality", "text": "Deumai Municipality"}, {"id": "Mangsebung Rural Municipality", "text": "Mangsebung Rural Municipality"}, {"id": "Chulachuli Rural Municipality", "text": "Chulachuli Rural Municipality"}, {"id": "Mai Municipality", "text": "Mai Municipality"}, {"id": "Suryodaya Municipality", "text": "Suryodaya Municipality"}, {"id": "Rong Rural Municipality", "text": "Rong Rural Municipality"}, {"id": "Fakfokathum Rural Municipality", "text": "Fakfokathum Rural Municipality"}], "Jhapa": [{"id": "Mechinagar Municipality", "text": "Mechinagar Municipality"}, {"id": "Arjundhara Municipality", "text": "Arjundhara Municipality"}, {"id": "Kankai Municipality", "text": "Kankai Municipality"}, {"id": "Shivasatakshi Municipality", "text": "Shivasatakshi Municipality"}, {"id": "Kamal Rural Municipality", "text": "Kamal Rural Municipality"}, {"id": "Damak Municipality", "text": "Damak Municipality"}, {"id": "Gauradaha Municipality", "text": "Gauradaha Municipality"}, {"id": "Barhadashi Rural Municipality", "text": "Barhadashi Rural Municipality"}, {"id": "Haldibari Rural Municipality", "text": "Haldibari Rural Municipality"}, {"id": "Bhadrapur Municipality", "text": "Bhadrapur Municipality"}, {"id": "Kachanakawal Rural Municipality", "text": "Kachanakawal Rural Municipality"}, {"id": "Buddhashanti Rural Municipality", "text": "Buddhashanti Rural Municipality"}, {"id": "Gauriganj Rural Municipality", "text": "Gauriganj Rural Municipality"}, {"id": "Jhapa Rural Municipality", "text": "Jhapa Rural Municipality"}, {"id": "Birtamod Municipality", "text": "Birtamod Municipality"}], "Morang": [{"id": "Miklajung Rural Municipality", "text": "Miklajung Rural Municipality"}, {"id": "Letang Municipality", "text": "Letang Municipality"}, {"id": "Sundarharaicha Municipality", "text": "Sundarharaicha Municipality"}, {"id": "Belbari Municipality", "text": "Belbari Municipality"}, {"id": "Kanepokhari Rural Municipality", "text": "Kanepokhari Rural Municipality"}, {"id": "Pathari Shanishchare Municipality", "text": "Pathari Shanishchare Municipality"}, {"id": "Urlabari Municipality", "text": "Urlabari Municipality"}, {"id": "Ratuwamai Municipality", "text": "Ratuwamai Municipality"}, {"id": "Rangeli Municipality", "text": "Rangeli Municipality"}, {"id": "Gramthan Rural Municipality", "text": "Gramthan Rural Municipality"}, {"id": "Budhiganga Rural Municipality", "text": "Budhiganga Rural Municipality"}, {"id": "Biratnagar Metropolitan City", "text": "Biratnagar Metropolitan City"}, {"id": "Dhanapalthan Rural Municipality", "text": "Dhanapalthan Rural Municipality"}, {"id": "Jahada Rural Municipality", "text": "Jahada Rural Municipality"}, {"id": "Kerabari Rural Municipality", "text": "Kerabari Rural Municipality"}, {"id": "Sunwarshi Municipality", "text": "Sunwarshi Municipality"}, {"id": "Katahari Rural Municipality", "text": "Katahari Rural Municipality"}], "Sunsari": [{"id": "Dharan Sub-Metropolitan City", "text": "Dharan Sub-Metropolitan City"}, {"id": "Baraha Municipality", "text": "Baraha Municipality"}, {"id": "Koshi Rural Municipality", "text": "Koshi Rural Municipality"}, {"id": "Ramdhuni Municipality", "text": "Ramdhuni Municipality"}, {"id": "Itahari Sub-Metropolitan City", "text": "Itahari Sub-Metropolitan City"}, {"id": "Duhabi Municipality", "text": "Duhabi Municipality"}, {"id": "Gadhi Rural Municipality", "text": "Gadhi Rural Municipality"}, {"id": "Inaruwa Municipality", "text": "Inaruwa Municipality"}, {"id": "Harinagara Rural Municipality", "text": "Harinagara Rural Municipality"}, {"id": "Barju Rural Municipality", "text": "Barju Rural Municipality"}, {"id": "Bhokraha Rural Municipality", "text": "Bhokraha Rural Municipality"}, {"id": "Dewangunj Rural Municipality", "text": "Dewangunj Rural Municipality"}], "Udayapur": [{"id": "Belaka Municipality", "text": "Belaka Municipality"}, {"id": "Chaudandigadhi Municipality", "text": "Chaudandigadhi Municipality"}, {"id": "Triyuga Municipality", "text": "Triyuga Municipality"}, {"id": "Rautamai Rural Municipality", "text": "Rautamai Rural Municipality"}, {"id": "Sunkoshi Rural Municipality", "text": "Sunkoshi Rural Municipality"}, {"id": "Katari Municipality", "text": "Katari Municipality"}, {"id": "Udayapurgadhi Rural Municipality", "text": "Udayapurgadhi Rural Municipality"}, {"id": "Tapli Rural Municipality", "text": "Tapli Rural Municipality"}]}}, "ne": {"provinces": [{"id": "सुदूरपश्चिम प्रदेश", "text": "सुदूरपश्चिम प्रदेश"}, {"id": "मधेश प्रदेश", "text": "मधेश प्रदेश"}, {"id": "गण्डकी प्रदेश", "text": "गण्डकी प्रदेश"}, {"id": "बागमती प्रदेश", "text": "बागमती प्रदेश"}, {"id": "लुम्बिनी प्रदेश", "text": "लुम्बिनी प्रदेश"}, {"id": "कर्णाली प्रदेश", "text": "कर्णाली प्रदेश"}, {"id": "कोशी प्रदेश", "text": "कोशी प्रदेश"}], "districts": {"सुदूरपश्चिम प्रदेश": [{"id": "बाजुरा", "text": "बाजुरा"}, {"id": "बझाङ", "text": "बझाङ"}, {"id": "बैतडी", "text": "बैतडी"}, {"id": "डडेलधुरा", "text": "डडेलधुरा"}, {"id": "डोटी", "text": "डोटी"}, {"id": "अछाम", "text": "अछाम"}, {"id": "कैलाली", "text": "कैलाली"}, {"id": "दार्चुला", "text": "दार्चुला"}, {"id": "कञ्‍चनपुर", "text": "कञ्‍चनपुर"}], "मधेश प्रदेश": [{"id": "सप्तरी", "text": "सप्तरी"}, {"id": "सिराहा", "text": "सिराहा"}, {"id": "धनुषा", "text": "धनुषा"}, {"id": "महोत्तरी", "text": "महोत्तरी"}, {"id": "सर्लाही", "text": "सर्लाही"}, {"id": "रौतहट", "text": "रौतहट"}, {"id": "बारा", "text": "बारा"}, {"id": "पर्सा", "text": "पर्सा"}], "गण्डकी प्रदेश": [{"id": "गोरखा", "text": "गोरखा"}, {"id": "मनाङ", "text": "मनाङ"}, {"id": "मुस्ताङ", "text": "मुस्ताङ"}, {"id": "म्याग्दी", "text": "म्याग्दी"}, {"id": "कास्की", "text": "कास्की"}, {"id": "लमजुङ", "text": "लमजुङ"}, {"id": "तनहुँ", "text": "तनहुँ"}, {"id": "नवलपरासी पूर्व", "text": "नवलपरासी पूर्व"}, {"id": "स्याङ्जा", "text": "स्याङ्जा"}, {"id": "पर्वत", "text": "पर्वत"}, {"id": "बाग्लुङ", "text": "बाग्लुङ"}], "बागमती प्रदेश": [{"id": "दोलखा", "text": "दोलखा"}, {"id": "सिन्धुपाल्चोक", "text": "सिन्धुपाल्चोक"}, {"id": "रसुवा", "text": "रसुवा"}, {"id": "धादिङ", "text": "धादिङ"}, {"id": "नुवाकोट", "text": "नुवाकोट"}, {"id": "काठमाडौं", "text": "काठमाडौं"}, {"id": "भक्तपुर", "text": "भक्तपुर"}, {"id": "ललितपुर", "text": "ललितपुर"}, {"id": "काभ्रेपलान्चोक", "text": "काभ्रेपलान्चोक"}, {"id": "रामेछाप", "text": "रामेछाप"}, {"id": "सिन्धुली", "text": "सिन्धुली"}, {"id": "मकवानपुर", "text": "मकवानपुर"}, {"id": "चितवन", "text": "चितवन"}], "लुम्बिनी प्रदेश": [{"id": "रूकुम पूर्व", "text": "रूकुम पूर्व"}, {"id": "रोल्पा", "text": "रोल्पा"}, {"id": "प्युठान", "text": "प्युठान"}, {"id": "गुल्मी", "text": "गुल्मी"}, {"id": "अर्घाखाँची", "text": "अर्घाखाँची"}, {"id": "पाल्पा", "text": "पाल्पा"}, {"id": "रुपन्देही", "text": "रुपन्देही"}, {"id": "कपिलवस्तु", "text": "कपिलवस्तु"}, {"id": "दाङ", "text": "दाङ"}, {"id": "बाँके", "text": "बाँके"}, {"id": "बर्दिया", "text": "बर्दिया"}, {"id": "नवलपरासी पश्चिम", "text": "नवलपरासी पश्चिम"}], "कर्णाली प्रदेश": [{"id": "डोल्पा", "text": "डोल्पा"}, {"id": "मुगु", "text": "मुगु"}, {"id": "जुम्ला", "text": "जुम्ला"}, {"id": "कालिकोट", "text": "कालिकोट"}, {"id": "दैलेख", "text": "दैलेख"}, {"id": "जाजरकोट", "text": "जाजरकोट"}, {"id": "सल्यान", "text": "सल्यान"}, {"id": "सुर्खेत", "text": "सुर्खेत"}, {"id": "हुम्ला", "text": "हुम्ला"}, {"id": "रूकुम पश्चिम", "text": "रूकुम पश्चिम"}], "कोशी प्रदेश": [{"id": "ताप्लेजुङ", "text": "ताप्लेजुङ"}, {"id": "सङ्खुवासभा", "text": "सङ्खुवासभा"}, {"id": "सोलुखुम्बु", "text": "सोलुखुम्बु"}, {"id": "ओखलढुङ्गा", "text": "ओखलढुङ्गा"}, {"id": "खोटाङ", "text": "खोटाङ"}, {"id": "भोजपुर", "text": "भोजपुर"}, {"id": "धनकुटा", "text": "धनकुटा"}, {"id": "तेह्रथुम", "text": "तेह्रथुम"}, {"id": "पाँचथर", "text": "पाँचथर"}, {"id": "इलाम", "text": "इलाम"}, {"id": "झापा", "text": "झापा"}, {"id": "मोरङ", "text": "मोरङ"}, {"id": "सुनसरी", "text": "सुनसरी"}, {"id": "उदयपुर", "text": "उदयपुर"}]}, "municipalities": {"बाजुरा": [{"id": "हिमाली गाउँपालिका", "text": "हिमाली गाउँपालिका"}, {"id": "गौमुल गाउँपालिका", "text": "गौमुल गाउँपालिका"}, {"id": "बडीमालिका नगरपालिका", "text": "बडीमालिका नगरपालिका"}, {"id": "छेडेदह गाउँपालिका", "text": "छेडेदह गाउँपालिका"}, {"id": "बुढीगंगा नगरपालिका", "text": "बुढीगंगा नगरपालिका"}, {"id": "त्रिवेणी नगरपालिका", "text": "त्रिवेणी नगरपालिका"}, {"id": "जगन्नाथगाउँपालिका", "text": "जगन्नाथगाउँपालिका"}, {"id": "बुढीनन्दा नगरपालिका", "text": "बुढीनन्दा नगरपालिका"}, {"id": "स्वामीकार्तिक खापर गाउँपालिका", "text": "स्वामीकार्तिक खापर गाउँपालिका"}], "बझाङ": [{"id": "काँडा गाउँपालिका", "text": "काँडा गाउँपालिका"}, {"id": "बुङ्गल नगरपालिका", "text": "बुङ्गल नगरपालिका"}, {"id": "तलकोट गाउँपालिका", "text": "तलकोट गाउँपालिका"}, {"id": "मष्टा गाउँपालिका", "text": "मष्टा गाउँपालिका"}, {"id": "जयपृथ्वी नगरपालिका", "text": "जयपृथ्वी नगरपालिका"}, {"id": "छबिसपाथिभेरा गाउँपालिका", "text": "छबिसपाथिभेरा गाउँपालिका"}, {"id": "दुर्गाथली गाउँपालिका", "text": "दुर्गाथली गाउँपालिका"}, {"id": "बित्थडचिर गाउँपालिका", "text": "बित्थडचिर गाउँपालिका"}, {"id": "थलारा गाउँपालिका", "text": "थलारा गाउँपालिका"}, {"id": "खप्तडछान्ना गाउँपालिका", "text": "खप्तडछान्ना गाउँपालिका"}, {"id": "सूर्मा गाउँपालिका", "text": "सूर्मा गाउँपालिका"}, {"id": "केदारस्यु गाउँपालिका", "text": "केदारस्यु गाउँपालिका"}], "बैतडी": [{"id": "डिलासैनी गाउँपालिका", "text": "डिलासैनी गाउँपालिका"}, {"id": "दोगडाकेदार गाउँपालिका", "text": "दोगडाकेदार गाउँपालिका"}, {"id": "पुर्चौडी नगरपालिका", "text": "पुर्चौडी नगरपालिका"}, {"id": "सुर्नया गाउँपालिका", "text": "सुर्नया गाउँपालिका"}, {"id": "दशरथचन्द नगरपालिका", "text": "दशरथचन्द नगरपालिका"}, {"id": "शिवनाथ गाउँपालिका", "text": "शिवनाथ गाउँपालिका"}, {"id": "मेलौली नगरपालिका", "text": "मेलौली नगरपालिका"}, {"id": "पाटन नगरपालिका", "text": "पाटन नगरपालिका"}, {"id": "सिगास गाउँपालिका", "text": "सिगास गाउँपालिका"}, {"id": "पञ्चेश्वर गाउँपालिका", "text": "पञ्चेश्वर गाउँपालिका"}], "डडेलधुरा": [{"id": "नवदुर्गा गाउँपालिका", "text": "नवदुर्गा गाउँपालिका"}, {"id": "अमरगढी नगरपालिका", "text": "अमरगढी नगरपालिका"}, {"id": "भागेश्वोर गाउँपालिका", "text": "भागेश्वोर गाउँपालिका"}, {"id": "परशुराम नगरपालिका", "text": "परशुराम नगरपालिका"}, {"id": "आलिताल गाउँपालिका", "text": "आलिताल गाउँपालिका"}, {"id": "गन्यापधुरा गाउँपालिका", "text": "गन्यापधुरा गाउँपालिका"}, {"id": "अजयमेरु गाउँपालिका", "text": "अजयमेरु गाउँपालिका"}], "डोटी": [{"id": "पूर्बिचाैकि गाउँपालिका", "text": "पूर्बिचाैकि गाउँपालिका"}, {"id": "सायल गाउँपालिका", "text": "सायल गाउँपालिका"}, {"id": "के.आई.सिंह गाउँपालिका", "text": "के.आई.सिंह गाउँपालिका"}, {"id": "बोगटान फुड्सिल गाउँपालिका", "text": "बोगटान फुड्सिल गाउँपालिका"}, {"id": "बडीकेदार गाउँपालिका", "text": "बडीकेदार गाउँपालिका"}, {"id": "जोरायल गाउँपालिका", "text": "जोरायल गाउँपालिका"}, {"id": "आदर्श गाउँपालिका", "text": "आदर्श गाउँपालिका"}, {"id": "शिखर नगरपालिका", "text": "शिखर नगरपालिका"}, {"id": "दिपायल सिलगढी नगरपालिका", "text": "दिपायल सिलगढी नगरपालिका"}], "अछाम": [{"id": "रामारोशन गाउँपालिका", "text": "रामारोशन गाउँपालिका"}, {"id": "मेल्लेख गाउँपालिका", "text": "मेल्लेख गाउँपालिका"}, {"id": "साँफेबगर नगरपालिका", "text": "साँफेबगर नगरपालिका"}, {"id": "चौरपाटी गाउँपालिका", "text": "चौरपाटी गाउँपालिका"}, {"id": "मंगलसेन नगरपालिका", "text": "मंगलसेन नगरपालिका"}, {"id": "कमलबजार नगरपालिका", "text": "कमलबजार नगरपालिका"}, {"id": "ढकारी गाउँपालिका", "text": "ढकारी गाउँपालिका"}, {"id": "तुर्माखाँद गाउँपालिका", "text": "तुर्माखाँद गाउँपालिका"}, {"id": "पंचदेवल विनायक नगरपालिका", "text": "पंचदेवल विनायक नगरपालिका"}, {"id": "बान्नीगढी जयगढ गाउँपालिका", "text": "बान्नीगढी जयगढ गाउँपालिका"}], "कैलाली": [{"id": "मोहन्याल गाउँपालिका", "text": "मोहन्याल गाउँपालिका"}, {"id": "चुरे गाउँपालिका", "text": "चुरे गाउँपालिका"}, {"id": "गोदावरी नगरपालिका", "text": "गोदावरी नगरपालिका"}, {"id": "गौरीगङ्गा नगरपालिका", "text": "गौरीगङ्गा नगरपालिका"}, {"id": "बर्दगोरिया गाउँपालिका", "text": "बर्दगोरिया गाउँपालिका"}, {"id": "लम्किचुहा नगरपालिका", "text": "लम्किचुहा नगरपालिका"}, {"id": "जानकी गाउँपालिका", "text": "जानकी गाउँपालिका"}, {"id": "जोशीपुर गाउँपालिका", "text": "जोशीपुर गाउँपालिका"}, {"id": "टीकापुर नगरपालिका", "text": "टीकापुर नगरपालिका"}, {"id": "भजनी नगरपालिका", "text": "भजनी नगरपालिका"}, {"id": "धनगढी उप-महानगरपालिका", "text": "धनगढी उप-महानगरपालिका"}, {"id": "घोडाघोडी नगरपालिका", "text": "घोडाघोडी नगरपालिका"}, {"id": "कैलारी गाउँपालिका", "text": "कैलारी गाउँपालिका"}], "दार्चुला": [{"id": "व्यास गाउँपालिका", "text": "व्यास गाउँपालिका"}, {"id": "दुहुँ गाउँपालिका", "text": "दुहुँ गाउँपालिका"}, {"id": "महाकाली नगरपालिका", "text": "महाकाली नगरपालिका"}, {"id": "अपिहिमाल गाउँपालिका", "text": "अपिहिमाल गाउँपालिका"}, {"id": "मार्मा गाउँपालिका", "text": "मार्मा गाउँपालिका"}, {"id": "शैल्यशिखर नगरपालिका", "text": "शैल्यशिखर नगरपालिका"}, {"id": "लेकम गाउँपालिका", "text": "लेकम गाउँपालिका"}, {"id": "नौगाड गाउँपालिका", "text": "नौगाड गाउँपालिका"}, {"id": "मालिकार्जुन गाउँपालिका", "text": "मालिकार्जुन गाउँपालिका"}], "कञ्‍चनपुर": [{"id": "कृष्णपुर नगरपालिका", "text": "कृष्णपुर नगरपालिका"}, {"id": "शुक्लाफाटा नगरपालिका", "text": "शुक्लाफाटा नगरपालिका"}, {"id": "बेदकोट नगरपालिका", "text": "बेदकोट नगरपालिका"}, {"id": "भीमदत्त नगरपालिका", "text": "भीमदत्त नगरपालिका"}, {"id": "लालझाडी गाउँपालिका", "text": "लालझाडी गाउँपालिका"}, {"id": "पुनर्वास नगरपालिका", "text": "पुनर्वास नगरपालिका"}, {"id": "बेलौरी नगरपालिका", "text": "बेलौरी नगरपालिका"}, {"id": "बेलडाँडी गाउँपालिका", "text": "बेलडाँडी गाउँपालिका"}, {"id": "महाकाली नगरपालिका", "text": "महाकाली नगरपालिका"}], "सप्तरी": [{"id": "सप्तकोशी नगरपालिका", "text": "सप्तकोशी नगरपालिका"}, {"id": "कञ्चनरुप नगरपालिका", "text": "कञ्चनरुप नगरपालिका"}, {"id": "रुपनी गाउँपालिका", "text": "रुपनी गाउँपालिका"}, {"id": "शम्भुनाथ नगरपालिका", "text": "शम्भुनाथ नगरपालिका"}, {"id": "सुरुङ्‍गा नगरपालिका", "text": "सुरुङ्‍गा नगरपालिका"}, {"id": "बलान-बिहुल गाउँपालिका", "text": "बलान-बिहुल गाउँपालिका"}, {"id": "बोदे बर्साइन नगरपालिका", "text": "बोदे बर्साइन नगरपालिका"}, {"id": "बेल्ही चपेना गाउँपालिका", "text": "बेल्ही चपेना गाउँपालिका"}, {"id": "बिष्णुपुर गाउँपालिका", "text": "बिष्णुपुर गाउँपालिका"}, {"id": "राजविराज नगरपालिका", "text": "राजविराज नगरपालिका"}, {"id": "महादेवा गाउँपालिका", "text": "महादेवा गाउँपालिका"}, {"id": "तिरहुत गाउँपालिका", "text": "तिरहुत गाउँपालिका"}, {"id": "तिलाठी कोईलाडी गाउँपालिका", "text": "तिलाठी कोईलाडी गाउँपालिका"}, {"id": "छिन्नमस्ता गाउँपालिका", "text": "छिन्नमस्ता गाउँपालिका"}, {"id": "अग्निसाइर कृष्णासवरन गाउँपालिका", "text": "अग्निसाइर कृष्णासवरन गाउँपालिका"}, {"id": "खडक नगरपालिका", "text": "खडक नगरपालिका"}, {"id": "डाक्नेश्वरी नगरपालिका", "text": "डाक्नेश्वरी नगरपालिका"}, {"id": "हनुमाननगर कंकालिनी नगरपालिका", "text": "हनुमाननगर कंकालिनी नगरपालिका"}], "सिराहा": [{"id": "लहान नगरपालिका", "text": "लहान नगरपालिका"}, {"id": "धनगढीमाई नगरपालिका", "text": "धनगढीमाई नगरपालिका"}, {"id": "गोलबजार नगरपालिका", "text": "गोलबजार नगरपालिका"}, {"id": "मिर्चैया नगरपालिका", "text": "मिर्चैया नगरपालिका"}, {"id": "कर्जन्हा नगरपालिका", "text": "कर्जन्हा नगरपालिका"}, {"id": "नरहा गाउँपालिका", "text": "नरहा गाउँपालिका"}, {"id": "बिष्णुपुर गाउँपालिका", "text": "बिष्णुपुर गाउँपालिका"}, {"id": "अर्नमा गाउँपालिका", "text": "अर्नमा गाउँपालिका"}, {"id": "सुखीपुर नगरपालिका", "text": "सुखीपुर नगरपालिका"}, {"id": "सखुवानन्कारकट्टी गाउँपालिका", "text": "सखुवानन्कारकट्टी गाउँपालिका"}, {"id": "भगवानपुर गाउँपालिका", "text": "भगवानपुर गाउँपालिका"}, {"id": "नवराजपुर गाउँपालिका", "text": "नवराजपुर गाउँपालिका"}, {"id": "बरियारपट्टी गाउँपालिका", "text": "बरियारपट्टी गाउँपालिका"}, {"id": "औरही गाउँपालिका", "text": "औरही गाउँपालिका"}, {"id": "सिरहा नगरपालिका", "text": "सिरहा नगरपालिका"}, {"id": "कल्याणपुर नगरपालिका", "text": "कल्याणपुर नगरपालिका"}, {"id": "लक्ष्मीपुर पटरी गाउँपालिका", "text": "लक्ष्मीपुर पटरी गाउँपालिका"}], "धनुषा": [{"id": "धनुषाधाम नगरपालिका", "text": "धनुषाधाम नगरपालिका"}, {"id": "मिथिला नगरपालिका", "text": "मिथिला नगरपालिका"}, {"id": "बटेश्वर गाउँपालिका", "text": "बटेश्वर गाउँपालिका"}, {"id": "क्षिरेश्वरनाथ नगरपालिका", "text": "क्षिरेश्वरनाथ नगरपालिका"}, {"id": "लक्ष्मीनिया गाउँपालिका", "text": "लक्ष्मीनिया गाउँपालिका"}, {"id": "मिथिला बिहारी नगरपालिका", "text": "मिथिला बिहारी नगरपालिका"}, {"id": "हंसपुर नगरपालिका", "text": "हंसपुर नगरपालिका"}, {"id": "शहीदनगर नगरपालिका", "text": "शहीदनगर नगरपालिका"}, {"id": "कमला नगरपालिका", "text": "कमला नगरपालिका"}, {"id": "जनकनन्दिनी गाउँपालिका", "text": "जनकनन्दिनी गाउँपालिका"}, {"id": "विदेह नगरपालिका", "text": "विदेह नगरपालिका"}, {"id": "जनकपुरधाम उप-महानगरपालिका", "text": "जनकपुरधाम उप-महानगरपालिका"}, {"id": "धनौजी गाउँपालिका", "text": "धनौजी गाउँपालिका"}, {"id": "नगराईन नगरपालिका", "text": "नगराईन नगरपालिका"}, {"id": "गणेशमान चारनाथ नगरपालिका", "text": "गणेशमान चारनाथ नगरपालिका"}, {"id": "सबैला नगरपालिका", "text": "सबैला नगरपालिका"}, {"id": "औरही गाउँपालिका", "text": "औरही गाउँपालिका"}, {"id": "मुखियापट्टी मुसहरनिया गाउँपालिका", "text": "मुखियापट्टी मुसहरनिया गाउँपालिका"}], "महोत्तरी": [{"id": "बर्दिबास नगरपालिका", "text": "बर्दिबास नगरपालिका"}, {"id": "गौशाला नगरपालिका", "text": "गौशाला नगरपालिका"}, {"id": "सोनमा गाउँपालिका", "text": "सोनमा गाउँपालिका"}, {"id": "औरही नगरपालिका", "text": "औरही नगरपालिका"}, {"id": "लोहरपट्टी नगरपालिका", "text": "लोहरपट्टी नगरपालिका"}, {"id": "बलवा नगरपालिका", "text": "बलवा नगरपालिका"}, {"id": "रामगोपालपुर नगरपालिका", "text": "रामगोपालपुर नगरपालिका"}, {"id": "साम्सी गाउँपालिका", "text": "साम्सी गाउँपालिका"}, {"id": "एकडारा गाउँपालिका", "text": "एकडारा गाउँपालिका"}, {"id": "महोत्तरी गाउँपालिका", "text": "महोत्तरी गाउँपालिका"}, {"id": "पिपरा गाउँपालिका", "text": "पिपरा गाउँपालिका"}, {"id": "मटिहानी नगरपालिका", "text": "मटिहानी नगरपालिका"}, {"id": "जलेश्वर नगरपालिका", "text": "जलेश्वर नगरपालिका"}, {"id": "भँगाहा नगरपालिका", "text": "भँगाहा नगरपालिका"}, {"id": "मनरा शिसवा नगरपालिका", "text": "मनरा शिसवा नगरपालिका"}], "सर्लाही": [{"id": "लालबन्दी नगरपालिका", "text": "लालबन्दी नगरपालिका"}, {"id": "बागमती नगरपालिका", "text": "बागमती नगरपालिका"}, {"id": "बरहथवा नगरपालिका", "text": "बरहथवा नगरपालिका"}, {"id": "हरिपुर नगरपालिका", "text": "हरिपुर नगरपालिका"}, {"id": "ईश्वरपुर नगरपालिका", "text": "ईश्वरपुर नगरपालिका"}, {"id": "पर्सा गाउँपालिका", "text": "पर्सा गाउँपालिका"}, {"id": "ब्रह्मपुरी गाउँपालिका", "text": "ब्रह्मपुरी गाउँपालिका"}, {"id": "चन्द्रनगर गाउँपालिका", "text": "चन्द्रनगर गाउँपालिका"}, {"id": "कविलासी नगरपालिका", "text": "कविलासी नगरपालिका"}, {"id": "चक्रघट्टा गाउँपालिका", "text": "चक्रघट्टा गाउँपालिका"}, {"id": "धनकौल गाउँपालिका", "text": "धनकौल गाउँपालिका"}, {"id": "रामनगर गाउँपालिका", "text": "रामनगर गाउँपालिका"}, {"id": "बलारा नगरपालिका", "text": "बलारा नगरपालिका"}, {"id": "गोडैटा नगरपालिका", "text": "गोडैटा नगरपालिका"}, {"id": "विष्णु गाउँपालिका", "text": "विष्णु गाउँपालिका"}, {"id": "मलंगवा नगरपालिका", "text": "मलंगवा नगरपालिका"}, {"id": "हरिवन नगरपालिका", "text": "हरिवन नगरपालिका"}, {"id": "हरिपुर्वा नगरपालिका", "text": "हरिपुर्वा नगरपालिका"}, {"id": "बसबरीया गाउँपालिका", "text": "बसबरीया गाउँपालिका"}, {"id": "कौडेना गाउँपालिका", "text": "कौडेना गाउँपालिका"}], "रौतहट": [{"id": "चन्द्रपुर नगरपालिका", "text": "चन्द्रपुर नगरपालिका"}, {"id": "गुजरा नगरपालिका", "text": "गुजरा नगरपालिका"}, {"id": "फतुवाबिजयपुर नगरपालिका", "text": "फतुवाबिजयपुर नगरपालिका"}, {"id": "कटहरिया नगरपालिका", "text": "कटहरिया नगरपालिका"}, {"id": "बृन्दावन नगरपालिका", "text": "बृन्दावन नगरपालिका"}, {"id": "माधव नारायण नगरपालिका", "text": "माधव नारायण नगरपालिका"}, {"id": "गरुडा नगरपालिका", "text": "गरुडा नगरपालिका"}, {"id": "देवाही गोनाही नगरपालिका", "text": "देवाही गोनाही नगरपालिका"}, {"id": "मौलापुर नगरपालिका", "text": "मौलापुर नगरपालिका"}, {"id": "बौधीमाई नगरपालिका", "text": "बौधीमाई नगरपालिका"}, {"id": "परोहा नगरपालिका", "text": "परोहा नगरपालिका"}, {"id": "यमुनामाई गाउँपालिका", "text": "यमुनामाई गाउँपालिका"}, {"id": "राजदेवी नगरपालिका", "text": "राजदेवी नगरपालिका"}, {"id": "गौर नगरपालिका", "text": "गौर नगरपालिका"}, {"id": "ईशनाथ नगरपालिका", "text": "ईशनाथ नगरपालिका"}, {"id": "गढीमाई नगरपालिका", "text": "गढीमाई नगरपालिका"}, {"id": "राजपुर नगरपालिका", "text": "राजपुर नगरपालिका"}, {"id": "दुर्गा भगवती गाउँपालिका", "text": "दुर्गा भगवती गाउँपालिका"}], "बारा": [{"id": "निजगढ नगरपालिका", "text": "निजगढ नगरपालिका"}, {"id": "कोल्हवी नगरपालिका", "text": "कोल्हवी नगरपालिका"}, {"id": "परवानीपुर गाउँपालिका", "text": "परवानीपुर गाउँपालिका"}, {"id": "प्रसौनी गाउँपालिका", "text": "प्रसौनी गाउँपालिका"}, {"id": "विश्रामपुर गाउँपालिका", "text": "विश्रामपुर गाउँपालिका"}, {"id": "फेटा गाउँपालिका", "text": "फेटा गाउँपालिका"}, {"id": "कलैया उप-महानगरपालिका", "text": "कलैया उप-महानगरपालिका"}, {"id": "करैयामाई गाउँपालिका", "text": "करैयामाई गाउँपालिका"}, {"id": "आदर्श कोटवाल गाउँपालिका", "text": "आदर्श कोटवाल गाउँपालिका"}, {"id": "सिम्रौनगढ नगरपालिका", "text": "सिम्रौनगढ नगरपालिका"}, {"id": "पचरौता नगरपालिका", "text": "पचरौता नगरपालिका"}, {"id": "महागढीमाई नगरपालिका", "text": "महागढीमाई नगरपालिका"}, {"id": "देवताल गाउँपालिका", "text": "देवताल गाउँपालिका"}, {"id": "जीतपुर सिमरा उप-महानगरपालिका", "text": "जीतपुर सिमरा उप-महानगरपालिका"}, {"id": "बारागढी गाउँपालिका", "text": "बारागढी गाउँपालिका"}, {"id": "सुवर्ण गाउँपालिका", "text": "सुवर्ण गाउँपालिका"}], "पर्सा": [{"id": "ठोरी गाउँपालिका", "text": "ठोरी गाउँपालिका"}, {"id": "जिराभवानी गाउँपालिका", "text": "जिराभवानी गाउँपालिका"}, {"id": "जगरनाथपुर गाउँपालिका", "text": "जगरनाथपुर गाउँपालिका"}, {"id": "सखुवा प्रसौनी गाउँपालिका", "text": "सखुवा प्रसौनी गाउँपालिका"}, {"id": "पर्सागढी नगरपालिका", "text": "पर्सागढी नगरपालिका"}, {"id": "वीरगंज महानगरपालिका", "text": "वीरगंज महानगरपालिका"}, {"id": "बहुदरमाई नगरपालिका", "text": "बहुदरमाई नगरपालिका"}, {"id": "पोखरि नगरपालिका", "text": "पोखरि नगरपालिका"}, {"id": "कालिकामाई गाउँपालिका", "text": "कालिकामाई गाउँपालिका"}, {"id": "धोबीनी गाउँपालिका", "text": "धोबीनी गाउँपालिका"}, {"id": "पकहाँ मैनपुर गाउँपालिका", "text": "पकहाँ मैनपुर गाउँपालिका"}, {"id": "बिन्दबासिनी गाउँपालिका", "text": "बिन्दबासिनी गाउँपालिका"}, {"id": "पटेर्वा सुगौली गाउँपालिका", "text": "पटेर्वा सुगौली गाउँपालिका"}, {"id": "छिपहरमाई गाउँपालिका", "text": "छिपहरमाई गाउँपालिका"}], "गोरखा": [{"id": "चुमनुव्री गाउँपालिका", "text": "चुमनुव्री गाउँपालिका"}, {"id": "बारपाक सुलिकोट गाउँपालिका", "text": "बारपाक सुलिकोट गाउँपालिका"}, {"id": "धार्चे गाउँपालिका", "text": "धार्चे गाउँपालिका"}, {"id": "आरूघाट गाउँपालिका", "text": "आरूघाट गाउँपालिका"}, {"id": "भिमसेनथापा गाउँपालिका", "text": "भिमसेनथापा गाउँपालिका"}, {"id": "सिरानचोक गाउँपालिका", "text": "सिरानचोक गाउँपालिका"}, {"id": "गोरखा Municipality", "text": "गोरखा Municipality"}, {"id": "शहिद लखन गाउँपालिका", "text": "शहिद लखन गाउँपालिका"}, {"id": "गण्डकी गाउँपालिका", "text": "गण्डकी गाउँपालिका"}, {"id": "अजिरकोट गाउँपालिका", "text": "अजिरकोट गाउँपालिका"}, {"id": "पालुङटार नगरपालिका", "text": "पालुङटार नगरपालिका"}], "मनाङ": [{"id": "नार्पा भूमि गाउँपालिका", "text": "नार्पा भूमि गाउँपालिका"}, {"id": "चाँमे गाउँपालिका", "text": "चाँमे गाउँपालिका"}, {"id": "नासाेँ गाउँपालिका", "text": "नासाेँ गाउँपालिका"}, {"id": "मनाङ ङिस्याङ गाउँपालिका", "text": "मनाङ ङिस्याङ गाउँपालिका"}], "मुस्ताङ": [{"id": "दालोमे गाउँपालिका", "text": "दालोमे गाउँपालिका"}, {"id": "घरपझोङ गाउँपालिका", "text": "घरपझोङ गाउँपालिका"}, {"id": "लोमन्थाङ गाउँपालिका", "text": "लोमन्थाङ गाउँपालिका"}, {"id": "थासाङ गाउँपालिका", "text": "थासाङ गाउँपालिका"}, {"id": "वारागुङ मुक्तिक्षेत्रगाउँपालिका", "text": "वारागुङ मुक्तिक्षेत्रगाउँपालिका"}], "म्याग्दी": [{"id": "अन्नपूर्ण गाउँपालिका", "text": "अन्नपूर्ण गाउँपालिका"}, {"id": "रघुगंगा गाउँपालिका", "text": "रघुगंगा गाउँपालिका"}, {"id": "धवलागिरी गाउँपालिका", "text": "धवलागिरी गाउँपालिका"}, {"id": "मालिका गाउँपालिका", "text": "मालिका गाउँपालिका"}, {"id": "मंगला गाउँपालिका", "text": "मंगला गाउँपालिका"}, {"id": "बेनी नगरपालिका", "text": "बेनी नगरपालिका"}], "कास्की": [{"id": "मादी गाउँपालिका", "text": "मादी गाउँपालिका"}, {"id": "माछापुच्छ्रे गाउँपालिका", "text": "माछापुच्छ्रे गाउँपालिका"}, {"id": "पोखरा महानगरपालिका", "text": "पोखरा महानगरपालिका"}, {"id": "रूपा गाउँपालिका", "text": "रूपा गाउँपालिका"}, {"id": "माछापुच्छ्रे गाउँपालिका", "text": "माछापुच्छ्रे गाउँपालिका"}], "लमजुङ": [{"id": "दोर्दी गाउँपालिका", "text": "दोर्दी गाउँपालिका"}, {"id": "मर्स्याङदी गाउँपालिका", "text": "मर्स्याङदी गाउँपालिका"}, {"id": "मध्यनेपाल नगरपालिका", "text": "मध्यनेपाल नगरपालिका"}, {"id": "बेसीशहर नगरपालिका", "text": "बेसीशहर नगरपालिका"}, {"id": "राईनास नगरपालिका", "text": "राईनास नगरपालिका"}, {"id": "क्व्होलासोथार गाउँपालिका", "text": "क्व्होलासोथार गाउँपालिका"}, {"id": "सुन्दरबजार नगरपालिका", "text": "सुन्दरबजार नगरपालिका"}, {"id": "दूधपोखरी गाउँपालिका", "text": "दूधपोखरी गाउँपालिका"}], "तनहुँ": [{"id": "भानु नगरपालिका", "text": "भानु नगरपालिका"}, {"id": "व्यास नगरपालिका", "text": "व्यास नगरपालिका"}, {"id": "म्याग्दे गाउँपालिका", "text": "म्याग्दे गाउँपालिका"}, {"id": "शुक्लागण्डकी नगरपालिका", "text": "शुक्लागण्डकी नगरपालिका"}, {"id": "भिमाद नगरपालिका", "text": "भिमाद नगरपालिका"}, {"id": "घिरिङ गाउँपालिका", "text": "घिरिङ गाउँपालिका"}, {"id": "देवघाट गाउँपालिका", "text": "देवघाट गाउँपालिका"}, {"id": "बन्दिपुर गाउँपालिका", "text": "बन्दिपुर गाउँपालिका"}, {"id": "आँबूखैरेनी गाउँपालिका", "text": "आँबूखैरेनी गाउँपालिका"}, {"id": "ऋषिङ्ग गाउँपालिका", "text": "ऋषिङ्ग गाउँपालिका"}], "नवलपरासी पूर्व": [{"id": "गैंडाकोट नगरपालिका", "text": "गैंडाकोट नगरपालिका"}, {"id": "बुलिङटार गाउँपालिका", "text": "बुलिङटार गाउँपालिका"}, {"id": "हुप्सेकोट गाउँपालिका", "text": "हुप्सेकोट गाउँपालिका"}, {"id": "देवचुली नगरपालिका", "text": "देवचुली नगरपालिका"}, {"id": "कावासोती नगरपालिका", "text": "कावासोती नगरपालिका"}, {"id": "मध्यविन्दु नगरपालिका", "text": "मध्यविन्दु नगरपालिका"}, {"id": "विनयी त्रिवेणी गाउँपालिका", "text": "विनयी त्रिवेणी गाउँपालिका"}, {"id": "बौदीकाली गाउँपालिका", "text": "बौदीकाली गाउँपालिका"}], "स्याङ्जा": [{"id": "फेदीखोला गाउँपालिका", "text": "फेदीखोला गाउँपालिका"}, {"id": "आँधिखोला गाउँपालिका", "text": "आँधिखोला गाउँपालिका"}, {"id": "अर्जुनचौपारी गाउँपालिका", "text": "अर्जुनचौपारी गाउँपालिका"}, {"id": "भीरकोट नगरपालिका", "text": "भीरकोट नगरपालिका"}, {"id": "विरुवा गाउँपालिका", "text": "विरुवा गाउँपालिका"}, {"id": "चापाकोट नगरपालिका", "text": "चापाकोट नगरपालिका"}, {"id": "वालिङ नगरपालिका", "text": "वालिङ नगरपालिका"}, {"id": "गल्याङ नगरपालिका", "text": "गल्याङ नगरपालिका"}, {"id": "कालीगण्डकी गाउँपालिका", "text": "कालीगण्डकी गाउँपालिका"}, {"id": "पुतलीबजार नगरपालिका", "text": "पुतलीबजार नगरपालिका"}, {"id": "हरिनास गाउँपालिका", "text": "हरिनास गाउँपालिका"}], "पर्वत": [{"id": "मोदी गाउँपालिका", "text": "मोदी गाउँपालिका"}, {"id": "कुश्मा नगरपालिका", "text": "कुश्मा नगरपालिका"}, {"id": "फलेवास नगरपालिका", "text": "फलेवास नगरपालिका"}, {"id": "महाशिला गाउँपालिका", "text": "महाशिला गाउँपालिका"}, {"id": "विहादी गाउँपालिका", "text": "विहादी गाउँपालिका"}, {"id": "पैयूँ गाउँपालिका", "text": "पैयूँ गाउँपालिका"}, {"id": "जलजला गाउँपालिका", "text": "जलजला गाउँपालिका"}], "बाग्लुङ": [{"id": "बाग्लुङ नगरपालिका", "text": "बाग्लुङ नगरपालिका"}, {"id": "ताराखोला गाउँपालिका", "text": "ताराखोला गाउँपालिका"}, {"id": "तमानखोला गाउँपालिका", "text": "तमानखोला गाउँपालिका"}, {"id": "ढोरपाटन नगरपालिका", "text": "ढोरपाटन नगरपालिका"}, {"id": "निसीखोला गाउँपालिका", "text": "निसीखोला गाउँपालिका"}, {"id": "वडिगाड गाउँपालिका", "text": "वडिगाड गाउँपालिका"}, {"id": "गल्कोट नगरपालिका", "text": "गल्कोट नगरपालिका"}, {"id": "जैमिनी नगरपालिका", "text": "जैमिनी नगरपालिका"}, {"id": "काठेखोला गाउँपालिका", "text": "काठेखोला गाउँपालिका"}, {"id": "बरेङ गाउँपालिका", "text": "बरेङ गाउँपालिका"}], "दोलखा": [{"id": "गौरीशंकर गाउँपालिका", "text": "गौरीशंकर गाउँपालिका"}, {"id": "विगु गाउँपालिका", "text": "विगु गाउँपालिका"}, {"id": "कालिन्चोक गाउँपालिका", "text": "कालिन्चोक गाउँपालिका"}, {"id": "जिरी नगरपालिका", "text": "जिरी नगरपालिका"}, {"id": "तामाकोशी गाउँपालिका", "text": "तामाकोशी गाउँपालिका"}, {"id": "मेलुङ गाउँपालिका", "text": "मेलुङ गाउँपालिका"}, {"id": "शैलुङ गाउँपालिका", "text": "शैलुङ गाउँपालिका"}, {"id": "भीमेश्वर नगरपालिका", "text": "भीमेश्वर नगरपालिका"}, {"id": "वैतेश्वर गाउँपालिका", "text": "वैतेश्वर गाउँपालिका"}], "सिन्धुपाल्चोक": [{"id": "जुगल गाउँपालिका", "text": "जुगल गाउँपालिका"}, {"id": "पाँचपोखरी थाङपाल गाउँपालिका", "text": "पाँचपोखरी थाङपाल गाउँपालिका"}, {"id": "हेलम्बु गाउँपालिका", "text": "हेलम्बु गाउँपालिका"}, {"id": "चौतारा साँगाचोकगढी नगरपालिका", "text": "चौतारा साँगाचोकगढी नगरपालिका"}, {"id": "बलेफी गाउँपालिका", "text": "बलेफी गाउँपालिका"}, {"id": "बाह्रविसे नगरपालिका", "text": "बाह्रविसे नगरपालिका"}, {"id": "लिसंखु पाखर गाउँपालिका", "text": "लिसंखु पाखर गाउँपालिका"}, {"id": "सुनकोशी गाउँपालिका", "text": "सुनकोशी गाउँपालिका"}, {"id": "भोटेकोशी गाउँपालिका", "text": "भोटेकोशी गाउँपालिका"}, {"id": "मेलम्ची नगरपालिका", "text": "मेलम्ची नगरपालिका"}, {"id": "ईन्द्रावती गाउँपालिका", "text": "ईन्द्रावती गाउँपालिका"}, {"id": "त्रिपुरासुन्दरी गाउँपालिका", "text": "त्रिपुरासुन्दरी गाउँपालिका"}], "रसुवा": [{"id": "गोसाईकुण्ड गाउँपालिका", "text": "गोसाईकुण्ड गाउँपालिका"}, {"id": "आमाछोदिङ्मो गाउँपालिका", "text": "आमाछोदिङ्मो गाउँपालिका"}, {"id": "उत्तरगया गाउँपालिका", "text": "उत्तरगया गाउँपालिका"}, {"id": "कालिका गाउँपालिका", "text": "कालिका गाउँपालिका"}, {"id": "नौकुण्ड गाउँपालिका", "text": "नौकुण्ड गाउँपालिका"}], "धादिङ": [{"id": "खनियाबास गाउँपालिका", "text": "खनियाबास गाउँपालिका"}, {"id": "गंगाजमुना गाउँपालिका", "text": "गंगाजमुना गाउँपालिका"}, {"id": "त्रिपुरासुन्दरी गाउँपालिका", "text": "त्रिपुरासुन्दरी गाउँपालिका"}, {"id": "नेत्रावती डबजोङ गाउँपालिका", "text": "नेत्रावती डबजोङ गाउँपालिका"}, {"id": "नीलकण्ठ नगरपालिका", "text": "नीलकण्ठ नगरपालिका"}, {"id": "सिद्धलेक गाउँपालिका", "text": "सिद्धलेक गाउँपालिका"}, {"id": "वेनीघाट रोराङ गाउँपालिका", "text": "वेनीघाट रोराङ गाउँपालिका"}, {"id": "गजुरी गाउँपालिका", "text": "गजुरी गाउँपालिका"}, {"id": "गल्छी गाउँपालिका", "text": "गल्छी गाउँपालिका"}, {"id": "थाक्रे गाउँपालिका", "text": "थाक्रे गाउँपालिका"}, {"id": "धुनिवेशी नगरपालिका", "text": "धुनिवेशी नगरपालिका"}, {"id": "रुबी भ्याली गाउँपालिका", "text": "रुबी भ्याली गाउँपालिका"}, {"id": "ज्वालामूखी गाउँपालिका", "text": "ज्वालामूखी गाउँपालिका"}], "नुवाकोट": [{"id": "तादी गाउँपालिका", "text": "तादी गाउँपालिका"}, {"id": "सुर्यगढी गाउँपालिका", "text": "सुर्यगढी गाउँपालिका"}, {"id": "विदुर नगरपालिका", "text": "विदुर नगरपालिका"}, {"id": "किस्पाङ गाउँपालिका", "text": "किस्पाङ गाउँपालिका"}, {"id": "म्यागङ गाउँपालिका", "text": "म्यागङ गाउँपालिका"}, {"id": "बेलकोटगढी नगरपालिका", "text": "बेलकोटगढी नगरपालिका"}, {"id": "लिखु गाउँपालिका", "text": "लिखु गाउँपालिका"}, {"id": "पञ्चकन्या गाउँपालिका", "text": "पञ्चकन्या गाउँपालिका"}, {"id": "शिवपुरी गाउँपालिका", "text": "शिवपुरी गाउँपालिका"}, {"id": "ककनी गाउँपालिका", "text": "ककनी गाउँपालिका"}, {"id": "दुप्चेश्वर गाउँपालिका", "text": "दुप्चेश्वर गाउँपालिका"}, {"id": "तारकेश्वर गाउँपालिका", "text": "तारकेश्वर गाउँपालिका"}], "काठमाडौं": [{"id": "कागेश्वरी मनोहरा नगरपालिका", "text": "कागेश्वरी मनोहरा नगरपालिका"}, {"id": "गोकर्णेश्वर नगरपालिका", "text": "गोकर्णेश्वर नगरपालिका"}, {"id": "बूढानीलकण्ठ नगरपालिका", "text": "बूढानीलकण्ठ नगरपालिका"}, {"id": "टोखा नगरपालिका", "text": "टोखा नगरपालिका"}, {"id": "तारकेश्वर नगरपालिका", "text": "तारकेश्वर नगरपालिका"}, {"id": "नागार्जुन नगरपालिका", "text": "नागार्जुन नगरपालिका"}, {"id": "कीर्तिपुर नगरपालिका", "text": "कीर्तिपुर नगरपालिका"}, {"id": "दक्षिणकाली नगरपालिका", "text": "दक्षिणकाली नगरपालिका"}, {"id": "शङ्खरापुर नगरपालिका", "text": "शङ्खरापुर नगरपालिका"}, {"id": "काठमाडौँ महानगरपालिका", "text": "काठमाडौँ महानगरपालिका"}, {"id": "चन्द्रागिरी नगरपालिका", "text": "चन्द्रागिरी नगरपालिका"}], "भक्तपुर": [{"id": "भक्तपुर नगरपालिका", "text": "भक्तपुर नगरपालिका"}, {"id": "मध्यपुर थिमि नगरपालिका", "text": "मध्यपुर थिमि नगरपालिका"}, {"id": "सूर्यविनायक नगरपालिका", "text": "सूर्यविनायक नगरपालिका"}, {"id": "चाँगुनारायण नगरपालिका", "text": "चाँगुनारायण नगरपालिका"}], "ललितपुर": [{"id": "महालक्ष्मी नगरपालिका", "text": "महालक्ष्मी नगरपालिका"}, {"id": "ललितपुर महानगरपालिका", "text": "ललितपुर महानगरपालिका"}, {"id": "गोदावरी नगरपालिका", "text": "गोदावरी नगरपालिका"}, {"id": "महाङ्काल गाउँपालिका", "text": "महाङ्काल गाउँपालिका"}, {"id": "वाग्मती गाउँपालिका", "text": "वाग्मती गाउँपालिका"}, {"id": "कोन्ज्योसोम गाउँपालिका", "text": "कोन्ज्योसोम गाउँपालिका"}], "काभ्रेपलान्चोक": [{"id": "चौंरीदेउराली गाउँपालिका", "text": "चौंरीदेउराली गाउँपालिका"}, {"id": "भुम्लु गाउँपालिका", "text": "भुम्लु गाउँपालिका"}, {"id": "मण्डनदेउपुर नगरपालिका", "text": "मण्डनदेउपुर नगरपालिका"}, {"id": "बनेपा नगरपालिका", "text": "बनेपा नगरपालिका"}, {"id": "पाँचखाल नगरपालिका", "text": "पाँचखाल नगरपालिका"}, {"id": "तेमाल गाउँपालिका", "text": "तेमाल गाउँपालिका"}, {"id": "नमोबुद्ध नगरपालिका", "text": "नमोबुद्ध नगरपालिका"}, {"id": "पनौती नगरपालिका", "text": "पनौती नगरपालिका"}, {"id": "रोशी गाउँपालिका", "text": "रोशी गाउँपालिका"}, {"id": "महाभारत गाउँपालिका", "text": "महाभारत गाउँपालिका"}, {"id": "खानीखोला गाउँपालिका", "text": "खानीखोला गाउँपालिका"}, {"id": "धुलिखेल नगरपालिका", "text": "धुलिखेल नगरपालिका"}, {"id": "बेथानचोक गाउँपालिका", "text": "बेथानचोक गाउँपालिका"}], "रामेछाप": [{"id": "उमाकुण्ड गाउँपालिका", "text": "उमाकुण्ड गाउँपालिका"}, {"id": "गोकुलगंगा गाउँपालिका", "text": "गोकुलगंगा गाउँपालिका"}, {"id": "लिखु गाउँपालिका", "text": "लिखु गाउँपालिका"}, {"id": "मन्थली नगरपालिका", "text": "मन्थली नगरपालिका"}, {"id": "खाँडादेवी गाउँपालिका", "text": "खाँडादेवी गाउँपालिका"}, {"id": "दोरम्बा शैलुङ गाउँपालिका", "text": "दोरम्बा शैलुङ गाउँपालिका"}, {"id": "सुनापति गाउँपालिका", "text": "सुनापति गाउँपालिका"}, {"id": "रामेछाप नगरपालिका", "text": "रामेछाप नगरपालिका"}], "सिन्धुली": [{"id": "दुधौली नगरपालिका", "text": "दुधौली नगरपालिका"}, {"id": "तीनपाटन गाउँपालिका", "text": "तीनपाटन गाउँपालिका"}, {"id": "गोलन्जोर गाउँपालिका", "text": "गोलन्जोर गाउँपालिका"}, {"id": "कमलामाई नगरपालिका", "text": "कमलामाई नगरपालिका"}, {"id": "सुनकोशी गाउँपालिका", "text": "सुनकोशी गाउँपालिका"}, {"id": "मरिण गाउँपालिका", "text": "मरिण गाउँपालिका"}, {"id": "हरिहरपुरगढी गाउँपालिका", "text": "हरिहरपुरगढी गाउँपालिका"}, {"id": "फिक्कल गाउँपालिका", "text": "फिक्कल गाउँपालिका"}, {"id": "घ्याङलेख गाउँपालिका", "text": "घ्याङलेख गाउँपालिका"}], "मकवानपुर": [{"id": "इन्द्रसरोवर गाउँपालिका", "text": "इन्द्रसरोवर गाउँपालिका"}, {"id": "थाहा नगरपालिका", "text": "थाहा नगरपालिका"}, {"id": "कैलाश गाउँपालिका", "text": "कैलाश गाउँपालिका"}, {"id": "मनहरी गाउँपालिका", "text": "मनहरी गाउँपालिका"}, {"id": "हेटौडा उप-महानगरपालिका", "text": "हेटौडा उप-महानगरपालिका"}, {"id": "मकवानपुरगढी गाउँपालिका", "text": "मकवानपुरगढी गाउँपालिका"}, {"id": "बकैया गाउँपालिका", "text": "बकैया गाउँपालिका"}, {"id": "बागमती गाउँपालिका", "text": "बागमती गाउँपालिका"}, {"id": "राक्सिराङ्ग गाउँपालिका", "text": "राक्सिराङ्ग गाउँपालिका"}, {"id": "भीमफेदी गाउँपालिका", "text": "भीमफेदी गाउँपालिका"}], "चितवन": [{"id": "राप्ती नगरपालिका", "text": "राप्ती नगरपालिका"}, {"id": "कालिका नगरपालिका", "text": "कालिका नगरपालिका"}, {"id": "भरतपुर महानगरपालिका", "text": "भरतपुर महानगरपालिका"}, {"id": "रत्ननगर नगरपालिका", "text": "रत्ननगर नगरपालिका"}, {"id": "खैरहनी नगरपालिका", "text": "खैरहनी नगरपालिका"}, {"id": "माडी नगरपालिका", "text": "माडी नगरपालिका"}, {"id": "इच्छाकामना गाउँपालिका", "text": "इच्छाकामना गाउँपालिका"}], "रूकुम पूर्व": [{"id": "सिस्ने गाउँपालिका", "text": "सिस्ने गाउँपालिका"}, {"id": "भूमे गाउँपालिका", "text": "भूमे गाउँपालिका"}, {"id": "पुथा उत्तरगंगा गाउँपालिका", "text": "पुथा उत्तरगंगा गाउँपालिका"}], "रोल्पा": [{"id": "सुनछहरी गाउँपालिका", "text": "सुनछहरी गाउँपालिका"}, {"id": "थबाङ गाउँपालिका", "text": "थबाङ गाउँपालिका"}, {"id": "दुईखोली गाउँपालिका", "text": "दुईखोली गाउँपालिका"}, {"id": "मादी गाउँपालिका", "text": "मादी गाउँपालिका"}, {"id": "त्रिवेणी गाउँपालिका", "text": "त्रिवेणी गाउँपालिका"}, {"id": "रोल्पा नगरपालिका", "text": "रोल्पा नगरपालिका"}, {"id": "रुन्टीगढी गाउँपालिका", "text": "रुन्टीगढी गाउँपालिका"}, {"id": "सुनिलस्मृति गाउँपालिका", "text": "सुनिलस्मृति गाउँपालिका"}, {"id": "लुङग्री गाउँपालिका", "text": "लुङग्री गाउँपालिका"}, {"id": "गङ्गादेव गाउँपालिका", "text": "गङ्गादेव गाउँपालिका"}], "प्युठान": [{"id": "नौबहिनी गाउँपालिका", "text": "नौबहिनी गाउँपालिका"}, {"id": "झिमरुक गाउँपालिका", "text": "झिमरुक गाउँपालिका"}, {"id": "प्यूठान नगरपालिका", "text": "प्यूठान नगरपालिका"}, {"id": "स्वर्गद्वारी नगरपालिका", "text": "स्वर्गद्वारी नगरपालिका"}, {"id": "माण्डवी गाउँपालिका", "text": "माण्डवी गाउँपालिका"}, {"id": "ऐरावती गाउँपालिका", "text": "ऐरावती गाउँपालिका"}, {"id": "सरुमारानी गाउँपालिका", "text": "सरुमारानी गाउँपालिका"}, {"id": "गौमुखी गाउँपालिका", "text": "गौमुखी गाउँपालिका"}, {"id": "मल्लरा गाउँपालिका", "text": "मल्लरा गाउँपालिका"}], "गुल्मी": [{"id": "कालीगण्डकी गाउँपालिका", "text": "कालीगण्डकी गाउँपालिका"}, {"id": "सत्यवती गाउँपालिका", "text": "सत्यवती गाउँपालिका"}, {"id": "मुसिकोट नगरपालिका", "text": "मुसिकोट नगरपालिका"}, {"id": "इस्मा गाउँपालिका", "text": "इस्मा गाउँपालिका"}, {"id": "मालिका गाउँपालिका", "text": "मालिका गाउँपालिका"}, {"id": "मदाने गाउँपालिका", "text": "मदाने गाउँपालिका"}, {"id": "धुर्कोट गाउँपालिका", "text": "धुर्कोट गाउँपालिका"}, {"id": "रेसुङ्गा नगरपालिका", "text": "रेसुङ्गा नगरपालिका"}, {"id": "छत्रकोट गाउँपालिका", "text": "छत्रकोट गाउँपालिका"}, {"id": "रुरुक्षेत्र गाउँपालिका", "text": "रुरुक्षेत्र गाउँपालिका"}, {"id": "चन्द्रकोट गाउँपालिका", "text": "चन्द्रकोट गाउँपालिका"}, {"id": "गुल्मी दरबार गाउँपालिका", "text": "गुल्मी दरबार गाउँपालिका"}], "अर्घाखाँची": [{"id": "छत्रदेव गाउँपालिका", "text": "छत्रदेव गाउँपालिका"}, {"id": "मालारानी गाउँपालिका", "text": "मालारानी गाउँपालिका"}, {"id": "भुमिकास्थान नगरपालिका", "text": "भुमिकास्थान नगरपालिका"}, {"id": "सन्धिखर्क नगरपालिका", "text": "सन्धिखर्क नगरपालिका"}, {"id": "शितगंगा नगरपालिका", "text": "शितगंगा नगरपालिका"}, {"id": "पाणिनी गाउँपालिका", "text": "पाणिनी गाउँपालिका"}], "पाल्पा": [{"id": "रामपुर नगरपालिका", "text": "रामपुर नगरपालिका"}, {"id": "पूर्वखोला गाउँपालिका", "text": "पूर्वखोला गाउँपालिका"}, {"id": "रम्भा गाउँपालिका", "text": "रम्भा गाउँपालिका"}, {"id": "बगनासकाली गाउँपालिका", "text": "बगनासकाली गाउँपालिका"}, {"id": "तानसेन नगरपालिका", "text": "तानसेन नगरपालिका"}, {"id": "रैनादेवी छहरा गाउँपालिका", "text": "रैनादेवी छहरा गाउँपालिका"}, {"id": "माथागढी गाउँपालिका", "text": "माथागढी गाउँपालिका"}, {"id": "रिब्दीकोट गाउँपालिका", "text": "रिब्दीकोट गाउँपालिका"}, {"id": "तिनाउ गाउँपालिका", "text": "तिनाउ गाउँपालिका"}, {"id": "निस्दी गाउँपालिका", "text": "निस्दी गाउँपालिका"}], "रुपन्देही": [{"id": "देवदह नगरपालिका", "text": "देवदह नगरपालिका"}, {"id": "बुटवल उप-महानगरपालिका", "text": "बुटवल उप-महानगरपालिका"}, {"id": "सैनामैना नगरपालिका", "text": "सैनामैना नगरपालिका"}, {"id": "कञ्चन गाउँपालिका", "text": "कञ्चन गाउँपालिका"}, {"id": "शुद्धोधन गाउँपालिका", "text": "शुद्धोधन गाउँपालिका"}, {"id": "सियारी गाउँपालिका", "text": "सियारी गाउँपालिका"}, {"id": "तिलोत्तमा नगरपालिका", "text": "तिलोत्तमा नगरपालिका"}, {"id": "ओमसतिया गाउँपालिका", "text": "ओमसतिया गाउँपालिका"}, {"id": "रोहिणी गाउँपालिका", "text": "रोहिणी गाउँपालिका"}, {"id": "मायादेवी गाउँपालिका", "text": "मायादेवी गाउँपालिका"}, {"id": "लुम्बिनी साँस्कृतिक नगरपालिका", "text": "लुम्बिनी साँस्कृतिक नगरपालिका"}, {"id": "कोटहीमाई गाउँपालिका", "text": "कोटहीमाई गाउँपालिका"}, {"id": "सम्मरीमाई गाउँपालिका", "text": "सम्मरीमाई गाउँपालिका"}, {"id": "मर्चवारी गाउँपालिका", "text": "मर्चवारी गाउँपालिका"}, {"id": "गैडहवा गाउँपालिका", "text": "गैडहवा गाउँपालिका"}, {"id": "सिद्धार्थनगर नगरपालिका", "text": "सिद्धार्थनगर नगरपालिका"}], "कपिलवस्तु": [{"id": "वाणगङ्गा नगरपालिका", "text": "वाणगङ्गा नगरपालिका"}, {"id": "शिवराज नगरपालिका", "text": "शिवराज नगरपालिका"}, {"id": "विजयनगर गाउँपालिका", "text": "विजयनगर गाउँपालिका"}, {"id": "कृष्णनगर नगरपालिका", "text": "कृष्णनगर नगरपालिका"}, {"id": "महाराजगंज नगरपालिका", "text": "महाराजगंज नगरपालिका"}, {"id": "यसोधरा गाउँपालिका", "text": "यसोधरा गाउँपालिका"}, {"id": "मायादेवी गाउँपालिका", "text": "मायादेवी गाउँपालिका"}, {"id": "शुद्धोधन गाउँपालिका", "text": "शुद्धोधन गाउँपालिका"}, {"id": "बुद्धभूमि नगरपालिका", "text": "बुद्धभूमि नगरपालिका"}, {"id": "कपिलवस्तु नगरपालिका", "text": "कपिलवस्तु नगरपालिका"}], "दाङ": [{"id": "बंगलाचुली गाउँपालिका", "text": "बंगलाचुली गाउँपालिका"}, {"id": "तुलसीपुर उप-महानगरपालिका", "text": "तुलसीपुर उप-महानगरपालिका"}, {"id": "शान्तिनगर गाउँपालिका", "text": "शान्तिनगर गाउँपालिका"}, {"id": "बबई गाउँपालिका", "text": "बबई गाउँपालिका"}, {"id": "दंगीशरण गाउँपालिका", "text": "दंगीशरण गाउँपालिका"}, {"id": "लमही नगरपालिका", "text": "लमही नगरपालिका"}, {"id": "घोराही उप-महानगरपालिका", "text": "घोराही उप-महानगरपालिका"}, {"id": "राप्ती गाउँपालिका", "text": "राप्ती गाउँपालिका"}, {"id": "गढवा गाउँपालिका", "text": "गढवा गाउँपालिका"}, {"id": "राजपुर गाउँपालिका", "text": "राजपुर गाउँपालिका"}], "बाँके": [{"id": "खजुरा गाउँपालिका", "text": "खजुरा गाउँपालिका"}, {"id": "जानकी गाउँपालिका", "text": "जानकी गाउँपालिका"}, {"id": "राप्ती सोनारी गाउँपालिका", "text": "राप्ती सोनारी गाउँपालिका"}, {"id": "कोहलपुर नगरपालिका", "text": "कोहलपुर नगरपालिका"}, {"id": "बैजनाथ गाउँपालिका", "text": "बैजनाथ गाउँपालिका"}, {"id": "नेपालगन्ज उप-महानगरपालिका", "text": "नेपालगन्ज उप-महानगरपालिका"}, {"id": "डुडुवा गाउँपालिका", "text": "डुडुवा गाउँपालिका"}, {"id": "नरैनापुर गाउँपालिका", "text": "नरैनापुर गाउँपालिका"}], "बर्दिया": [{"id": "ठाकुरबाबा नगरपालिका", "text": "ठाकुरबाबा नगरपालिका"}, {"id": "गेरुवा गाउँपालिका", "text": "गेरुवा गाउँपालिका"}, {"id": "राजापुर नगरपालिका", "text": "राजापुर नगरपालिका"}, {"id": "मधुवन नगरपालिका", "text": "मधुवन नगरपालिका"}, {"id": "बाँसगढी नगरपालिका", "text": "बाँसगढी नगरपालिका"}, {"id": "बारबर्दिया नगरपालिका", "text": "बारबर्दिया नगरपालिका"}, {"id": "गुलरिया नगरपालिका", "text": "गुलरिया नगरपालिका"}, {"id": "बढैयाताल गाउँपालिका", "text": "बढैयाताल गाउँपालिका"}], "नवलपरासी पश्चिम": [{"id": "बर्दघाट नगरपालिका", "text": "बर्दघाट नगरपालिका"}, {"id": "सुनवल नगरपालिका", "text": "सुनवल नगरपालिका"}, {"id": "रामग्राम नगरपालिका", "text": "रामग्राम नगरपालिका"}, {"id": "पाल्हीनन्दन गाउँपालिका", "text": "पाल्हीनन्दन गाउँपालिका"}, {"id": "सरावल गाउँपालिका", "text": "सरावल गाउँपालिका"}, {"id": "सुस्ता गाउँपालिका", "text": "सुस्ता गाउँपालिका"}, {"id": "प्रतापपुर गाउँपालिका", "text": "प्रतापपुर गाउँपालिका"}], "डोल्पा": [{"id": "मुड्केचुला गाउँपालिका", "text": "मुड्केचुला गाउँपालिका"}, {"id": "त्रिपुरासुन्दरी नगरपालिका", "text": "त्रिपुरासुन्दरी नगरपालिका"}, {"id": "ठुली भेरी नगरपालिका", "text": "ठुली भेरी नगरपालिका"}, {"id": "काईके गाउँपालिका", "text": "काईके गाउँपालिका"}, {"id": "छार्का ताङसोङ गाउँपालिका", "text": "छार्का ताङसोङ गाउँपालिका"}, {"id": "शे फोक्सुण्डो गाउँपालिका", "text": "शे फोक्सुण्डो गाउँपालिका"}, {"id": "जगदुल्ला गाउँपालिका", "text": "जगदुल्ला गाउँपालिका"}, {"id": "डोल्पो बुद्ध गाउँपालिका", "text": "डोल्पो बुद्ध गाउँपालिका"}], "मुगु": [{"id": "मुगूम कार्मारोङ गाउँपालिका", "text": "मुगूम कार्मारोङ गाउँपालिका"}, {"id": "छायाँनाथ रारा नगरपालिका", "text": "छायाँनाथ रारा नगरपालिका"}, {"id": "खत्याड गाउँपालिका", "text": "खत्याड गाउँपालिका"}, {"id": "सोरु गाउँपालिका", "text": "सोरु गाउँपालिका"}], "जुम्ला": [{"id": "पातारासी गाउँपालिका", "text": "पातारासी गाउँपालिका"}, {"id": "कनकासुन्दरी गाउँपालिका", "text": "कनकासुन्दरी गाउँपालिका"}, {"id": "सिंजा गाउँपालिका", "text": "सिंजा गाउँपालिका"}, {"id": "चन्दननाथ नगरपालिका", "text": "चन्दननाथ नगरपालिका"}, {"id": "गुठिचौर गाउँपालिका", "text": "गुठिचौर गाउँपालिका"}, {"id": "तातोपानी गाउँपालिका", "text": "तातोपानी गाउँपालिका"}, {"id": "तिला गाउँपालिका", "text": "तिला गाउँपालिका"}, {"id": "हिमा गाउँपालिका", "text": "हिमा गाउँपालिका"}], "कालिकोट": [{"id": "महावै गाउँपालिका", "text": "महावै गाउँपालिका"}, {"id": "कालिका गाउँपालिका", "text": "कालिका गाउँपालिका"}, {"id": "पलाँता गाउँपालिका", "text": "पलाँता गाउँपालिका"}, {"id": "पचालझरना गाउँपालिका", "text": "पचालझरना गाउँपालिका"}, {"id": "रास्कोट नगरपालिका", "text": "रास्कोट नगरपालिका"}, {"id": "सान्नी त्रिवेणी गाउँपालिका", "text": "सान्नी त्रिवेणी गाउँपालिका"}, {"id": "नरहरिनाथ गाउँपालिका", "text": "नरहरिनाथ गाउँपालिका"}, {"id": "खाँडाचक्र नगरपालिका", "text": "खाँडाचक्र नगरपालिका"}, {"id": "तिलागुफा नगरपालिका", "text": "तिलागुफा नगरपालिका"}], "दैलेख": [{"id": "नौमुले गाउँपालिका", "text": "नौमुले गाउँपालिका"}, {"id": "महाबु गाउँपालिका", "text": "महाबु गाउँपालिका"}, {"id": "भैरवी गाउँपालिका", "text": "भैरवी गाउँपालिका"}, {"id": "ठाटीकाँध गाउँपालिका", "text": "ठाटीकाँध गाउँपालिका"}, {"id": "आठबीस नगरपालिका", "text": "आठबीस नगरपालिका"}, {"id": "चामुण्डा बिन्द्रासैनी नगरपालिका", "text": "चामुण्डा बिन्द्रासैनी नगरपालिका"}, {"id": "दुल्लू नगरपालिका", "text": "दुल्लू नगरपालिका"}, {"id": "नारायण नगरपालिका", "text": "नारायण नगरपालिका"}, {"id": "भगवतीमाई गाउँपालिका", "text": "भगवतीमाई गाउँपालिका"}, {"id": "डुङ्गेश्वर गाउँपालिका", "text": "डुङ्गेश्वर गाउँपालिका"}, {"id": "गुराँस गाउँपालिका", "text": "गुराँस गाउँपालिका"}], "जाजरकोट": [{"id": "शिवालय गाउँपालिका", "text": "शिवालय गाउँपालिका"}, {"id": "भेरी नगरपालिका", "text": "भेरी नगरपालिका"}, {"id": "त्रिवेणी नलगाड नगरपालिका", "text": "त्रिवेणी नलगाड नगरपालिका"}, {"id": "बारेकोट गाउँपालिका", "text": "बारेकोट गाउँपालिका"}, {"id": "कुसे गाउँपालिका", "text": "कुसे गाउँपालिका"}, {"id": "जुनीचाँदे गाउँपालिका", "text": "जुनीचाँदे गाउँपालिका"}, {"id": "छेडागाड नगरपालिका", "text": "छेडागाड नगरपालिका"}], "सल्यान": [{"id": "दार्मा गाउँपालिका", "text": "दार्मा गाउँपालिका"}, {"id": "कुमाख गाउँपालिका", "text": "कुमाख गाउँपालिका"}, {"id": "बनगाड कुपिण्डे नगरपालिका", "text": "बनगाड कुपिण्डे नगरपालिका"}, {"id": "ढोरचौर गाउँपालिका", "text": "ढोरचौर गाउँपालिका"}, {"id": "बागचौर नगरपालिका", "text": "बागचौर नगरपालिका"}, {"id": "छत्रेश्वरी गाउँपालिका", "text": "छत्रेश्वरी गाउँपालिका"}, {"id": "शारदा नगरपालिका", "text": "शारदा नगरपालिका"}, {"id": "कालिमाटी गाउँपालिका", "text": "कालिमाटी गाउँपालिका"}, {"id": "त्रिवेणी गाउँपालिका", "text": "त्रिवेणी गाउँपालिका"}, {"id": "कपुरकोट गाउँपालिका", "text": "कपुरकोट गाउँपालिका"}], "सुर्खेत": [{"id": "सिम्ता गाउँपालिका", "text": "सिम्ता गाउँपालिका"}, {"id": "चिङ्गाड गाउँपालिका", "text": "चिङ्गाड गाउँपालिका"}, {"id": "लेकबेशी नगरपालिका", "text": "लेकबेशी नगरपालिका"}, {"id": "गुर्भाकोट नगरपालिका", "text": "गुर्भाकोट नगरपालिका"}, {"id": "भेरीगंगा नगरपालिका", "text": "भेरीगंगा नगरपालिका"}, {"id": "वीरेन्द्रनगर नगरपालिका", "text": "वीरेन्द्रनगर नगरपालिका"}, {"id": "बराहताल गाउँपालिका", "text": "बराहताल गाउँपालिका"}, {"id": "पञ्चपुरी नगरपालिका", "text": "पञ्चपुरी नगरपालिका"}, {"id": "चौकुने गाउँपालिका", "text": "चौकुने गाउँपालिका"}], "हुम्ला": [{"id": "चंखेली गाउँपालिका", "text": "चंखेली गाउँपालिका"}, {"id": "खार्पूनाथ गाउँपालिका", "text": "खार्पूनाथ गाउँपालिका"}, {"id": "सिमकोट गाउँपालिका", "text": "सिमकोट गाउँपालिका"}, {"id": "नाम्खा गाउँपालिका", "text": "नाम्खा गाउँपालिका"}, {"id": "सर्केगाड गाउँपालिका", "text": "सर्केगाड गाउँपालिका"}, {"id": "अदानचुली गाउँपालिका", "text": "अदानचुली गाउँपालिका"}, {"id": "ताँजाकोट गाउँपालिका", "text": "ताँजाकोट गाउँपालिका"}], "रूकुम पश्चिम": [{"id": "आठबिसकोट नगरपालिका", "text": "आठबिसकोट नगरपालिका"}, {"id": "सानीभेरी गाउँपालिका", "text": "सानीभेरी गाउँपालिका"}, {"id": "बाँफिकोट गाउँपालिका", "text": "बाँफिकोट गाउँपालिका"}, {"id": "मुसिकोट नगरपालिका", "text": "मुसिकोट नगरपालिका"}, {"id": "त्रिवेणी गाउँपालिका", "text": "त्रिवेणी गाउँपालिका"}, {"id": "चौरजहारी नगरपालिका", "text": "चौरजहारी नगरपालिका"}], "ताप्लेजुङ": [{"id": "मिक्वाखोला गाउँपालिका", "text": "मिक्वाखोला गाउँपालिका"}, {"id": "मैवाखोला गाउँपालिका", "text": "मैवाखोला गाउँपालिका"}, {"id": "आठराई त्रिवेणी गाउँपालिका", "text": "आठराई त्रिवेणी गाउँपालिका"}, {"id": "फुङ्लिङ नगरपालिका", "text": "फुङ्लिङ नगरपालिका"}, {"id": "पाथीभरा याङवरक गाउँपालिका", "text": "पाथीभरा याङवरक गाउँपालिका"}, {"id": "सिरीजङ्घा गाउँपालिका", "text": "सिरीजङ्घा गाउँपालिका"}, {"id": "फक्ताङलुङ गाउँपालिका", "text": "फक्ताङलुङ गाउँपालिका"}, {"id": "मेरीङदेन गाउँपालिका", "text": "मेरीङदेन गाउँपालिका"}, {"id": "सिदिङ्वा गाउँपालिका", "text": "सिदिङ्वा गाउँपालिका"}], "सङ्खुवासभा": [{"id": "भोटखोला गाउँपालिका", "text": "भोटखोला गाउँपालिका"}, {"id": "मकालु गाउँपालिका", "text": "मकालु गाउँपालिका"}, {"id": "सिलिचोङ गाउँपालिका", "text": "सिलिचोङ गाउँपालिका"}, {"id": "चिचिला गाउँपालिका", "text": "चिचिला गाउँपालिका"}, {"id": "सभापोखरी गाउँपालिका", "text": "सभापोखरी गाउँपालिका"}, {"id": "पाँचखपन नगरपालिका", "text": "पाँचखपन नगरपालिका"}, {"id": "चैनपुर नगरपालिका", "text": "चैनपुर नगरपालिका"}, {"id": "मादी नगरपालिका", "text": "मादी नगरपालिका"}, {"id": "धर्मदेवी नगरपालिका", "text": "धर्मदेवी नगरपालिका"}, {"id": "खाँदवारी नगरपालिका", "text": "खाँदवारी नगरपालिका"}], "सोलुखुम्बु": [{"id": "महाकुलुङ गाउँपालिका", "text": "महाकुलुङ गाउँपालिका"}, {"id": "सोताङ गाउँपालिका", "text": "सोताङ गाउँपालिका"}, {"id": "थुलुङ दुधकोशी गाउँपालिका", "text": "थुलुङ दुधकोशी गाउँपालिका"}, {"id": "दुधकोशी गाउँपालिका", "text": "दुधकोशी गाउँपालिका"}, {"id": "नेचासल्यान गाउँपालिका", "text": "नेचासल्यान गाउँपालिका"}, {"id": "सोलुदुधकुण्ड नगरपालिका", "text": "सोलुदुधकुण्ड नगरपालिका"}, {"id": "लिखु पिके गाउँपालिका", "text": "लिखु पिके गाउँपालिका"}, {"id": "खुम्बु पासाङल्हामु गाउँपालिका", "text": "खुम्बु पासाङल्हामु गाउँपालिका"}], "ओखलढुङ्गा": [{"id": "सिद्धिचरण नगरपालिका", "text": "सिद्धिचरण नगरपालिका"}, {"id": "मोलुङ गाउँपालिका", "text": "मोलुङ गाउँपालिका"}, {"id": "खिजीदेम्वा गाउँपालिका", "text": "खिजीदेम्वा गाउँपालिका"}, {"id": "लिखु गाउँपालिका", "text": "लिखु गाउँपालिका"}, {"id": "चम्पादेवी गाउँपालिका", "text": "चम्पादेवी गाउँपालिका"}, {"id": "सुनकोशी गाउँपालिका", "text": "सुनकोशी गाउँपालिका"}, {"id": "चिशंखुगढी गाउँपालिका", "text": "चिशंखुगढी गाउँपालिका"}, {"id": "मानेभञ्ज्याङ गाउँपालिका", "text": "मानेभञ्ज्याङ गाउँपालिका"}], "खोटाङ": [{"id": "केपिलासगढी गाउँपालिका", "text": "केपिलासगढी गाउँपालिका"}, {"id": "ऐसेलुखर्क गाउँपालिका", "text": "ऐसेलुखर्क गाउँपालिका"}, {"id": "लामिडाँडा गाउँपालिका", "text": "लामिडाँडा गाउँपालिका"}, {"id": "हलेसी तुवाचुङ नगरपालिका", "text": "हलेसी तुवाचुङ नगरपालिका"}, {"id": "साकेला गाउँपालिका", "text": "साकेला गाउँपालिका"}, {"id": "दिप्रुङ गाउँपालिका", "text": "दिप्रुङ गाउँपालिका"}, {"id": "खोटेहाङ गाउँपालिका", "text": "खोटेहाङ गाउँपालिका"}, {"id": "जन्तेढुङ्गा गाउँपालिका", "text": "जन्तेढुङ्गा गाउँपालिका"}, {"id": "बराहपोखरी गाउँपालिका", "text": "बराहपोखरी गाउँपालिका"}, {"id": "दिक्तेल रुपाकोट मझुवागढी नगरपालिका", "text": "दिक्तेल रुपाकोट मझुवागढी नगरपालिका"}], "भोजपुर": [{"id": "षडानन्द नगरपालिका", "text": "षडानन्द नगरपालिका"}, {"id": "टेम्केमैयुङ गाउँपालिका", "text": "टेम्केमैयुङ गाउँपालिका"}, {"id": "भोजपुर नगरपालिका", "text": "भोजपुर नगरपालिका"}, {"id": "पौवादुङमा गाउँपालिका", "text": "पौवादुङमा गाउँपालिका"}, {"id": "रामप्रसादराई गाउँपालिका", "text": "रामप्रसादराई गाउँपालिका"}, {"id": "हतुवागढी गाउँपालिका", "text": "हतुवागढी गाउँपालिका"}, {"id": "आमचोक गाउँपालिका", "text": "आमचोक गाउँपालिका"}, {"id": "साल्पासिलिछो गाउँपालिका", "text": "साल्पासिलिछो गाउँपालिका"}, {"id": "अरुण गाउँपालिका", "text": "अरुण गाउँपालिका"}], "धनकुटा": [{"id": "पाख्रिबास नगरपालिका", "text": "पाख्रिबास नगरपालिका"}, {"id": "छथर जोरपाटी गाउँपालिका", "text": "छथर जोरपाटी गाउँपालिका"}, {"id": "धनकुटा नगरपालिका", "text": "धनकुटा नगरपालिका"}, {"id": "साँगुरीगढी गाउँपालिका", "text": "साँगुरीगढी गाउँपालिका"}, {"id": "चौबिसे गाउँपालिका", "text": "चौबिसे गाउँपालिका"}, {"id": "महालक्ष्मी नगरपालिका", "text": "महालक्ष्मी नगरपालिका"}, {"id": "सहिदभूमि गाउँपालिका", "text": "सहिदभूमि गाउँपालिका"}], "तेह्रथुम": [{"id": "आठराई त्रिवेणी गाउँपालिका", "text": "आठराई त्रिवेणी गाउँपालिका"}, {"id": "फेदाप गाउँपालिका", "text": "फेदाप गाउँपालिका"}, {"id": "मेन्छयायेम गाउँपालिका", "text": "मेन्छयायेम गाउँपालिका"}, {"id": "म्याङलुङ नगरपालिका", "text": "म्याङलुङ नगरपालिका"}, {"id": "लालीगुराँस नगरपालिका", "text": "लालीगुराँस नगरपालिका"}, {"id": "छथर गाउँपालिका", "text": "छथर गाउँपालिका"}], "पाँचथर": [{"id": "हिलिहाङ गाउँपालिका", "text": "हिलिहाङ गाउँपालिका"}, {"id": "फालेलुङ गाउँपालिका", "text": "फालेलुङ गाउँपालिका"}, {"id": "फिदिम नगरपालिका", "text": "फिदिम नगरपालिका"}, {"id": "फाल्गुनन्द गाउँपालिका", "text": "फाल्गुनन्द गाउँपालिका"}, {"id": "कुम्मायक गाउँपालिका", "text": "कुम्मायक गाउँपालिका"}, {"id": "मिक्लाजुङ गाउँपालिका", "text": "मिक्लाजुङ गाउँपालिका"}, {"id": "याङवरक गाउँपालिका", "text": "याङवरक गाउँपालिका"}, {"id": "तुम्वेवा गाउँपालिका", "text": "तुम्वेवा गाउँपालिका"}], "इलाम": [{"id": "माईजोगमाई गाउँपालिका", "text": "माईजोगमाई गाउँपालिका"}, {"id": "सन्दकपुर गाउँपालिका", "text": "सन्दकपुर गाउँपालिका"}, {"id": "इलाम नगरपालिका", "text": "इलाम नगरपालिका"}, {"id": "देउमाई नगरपालिका", "text": "देउमाई नगरपालिका"}, {"id": "माङसेबुङ गाउँपालिका", "text": "माङसेबुङ गाउँपालिका"}, {"id": "चुलाचुली गाउँपालिका", "text": "चुलाचुली गाउँपालिका"}, {"id": "माई नगरपालिका", "text": "माई नगरपालिका"}, {"id": "सूर्योदय नगरपालिका", "text": "सूर्योदय नगरपालिका"}, {"id": "रोङ गाउँपालिका", "text": "रोङ गाउँपालिका"}, {"id": "फाकफोकथुम गाउँपालिका", "text": "फाकफोकथुम गाउँपालिका"}], "झापा": [{"id": "मेचीनगर नगरपालिका", "text": "मेचीनगर नगरपालिका"}, {"id": "अर्जुनधारा नगरपालिका", "text": "अर्जुनधारा नगरपालिका"}, {"id": "कनकाई नगरपालिका", "text": "कनकाई नगरपालिका"}, {"id": "शिवसताक्षी नगरपालिका", "text": "शिवसताक्षी नगरपालिका"}, {"id": "कमल गाउँपालिका", "text": "कमल गाउँपालिका"}, {"id": "दमक नगरपालिका", "text": "दमक नगरपालिका"}, {"id": "गौरादह नगरपालिका", "text": "गौरादह नगरपालिका"}, {"id": "बाह्रदशी गाउँपालिका", "text": "बाह्रदशी गाउँपालिका"}, {"id": "हल्दीबारी गाउँपालिका", "text": "हल्दीबारी गाउँपालिका"}, {"id": "भद्रपुर नगरपालिका", "text": "भद्रपुर नगरपालिका"}, {"id": "कचनकवल गाउँपालिका", "text": "कचनकवल गाउँपालिका"}, {"id": "बुद्धशान्ति गाउँपालिका", "text": "बुद्धशान्ति गाउँपालिका"}, {"id": "गौरीगञ्ज गाउँपालिका", "text": "गौरीगञ्ज गाउँपालिका"}, {"id": "झापा गाउँपालिका", "text": "झापा गाउँपालिका"}, {"id": "बिर्तामोड नगरपालिका", "text": "बिर्तामोड नगरपालिका"}], "मोरङ": [{"id": "मिक्लाजुङ गाउँपालिका", "text": "मिक्लाजुङ गाउँपालिका"}, {"id": "लेटाङ नगरपालिका", "text": "लेटाङ नगरपालिका"}, {"id": "सुन्दरहरैँचा नगरपालिका", "text": "सुन्दरहरैँचा नगरपालिका"}, {"id": "बेलबारी नगरपालिका", "text": "बेलबारी नगरपालिका"}, {"id": "कानेपोखरी गाउँपालिका", "text": "कानेपोखरी गाउँपालिका"}, {"id": "पथरी शनिश्चरे नगरपालिका", "text": "पथरी शनिश्चरे नगरपालिका"}, {"id": "उर्लाबारी नगरपालिका", "text": "उर्लाबारी नगरपालिका"}, {"id": "रतुवामाई नगरपालिका", "text": "रतुवामाई नगरपालिका"}, {"id": "रंगेली नगरपालिका", "text": "रंगेली नगरपालिका"}, {"id": "ग्रामथान गाउँपालिका", "text": "ग्रामथान गाउँपालिका"}, {"id": "बुढीगंगा गाउँपालिका", "text": "बुढीगंगा गाउँपालिका"}, {"id": "विराटनगर महानगरपालिका", "text": "विराटनगर महानगरपालिका"}, {"id": "धनपालथान गाउँपालिका", "text": "धनपालथान गाउँपालिका"}, {"id": "जहदा गाउँपालिका", "text": "जहदा गाउँपालिका"}, {"id": "केराबारी गाउँपालिका", "text": "केराबारी गाउँपालिका"}, {"id": "सुनवर्षी नगरपालिका", "text": "सुनवर्षी नगरपालिका"}, {"id": "कटहरी गाउँपालिका", "text": "कटहरी गाउँपालिका"}], "सुनसरी": [{"id": "धरान उप-महानगरपालिका", "text": "धरान उप-महानगरपालिका"}, {"id": "बराहक्षेत्र नगरपालिका", "text": "बराहक्षेत्र नगरपालिका"}, {"id": "कोशी गाउँपालिका", "text": "कोशी गाउँपालिका"}, {"id": "रामधुनी नगरपालिका", "text": "रामधुनी नगरपालिका"}, {"id": "इटहरी उप-महानगरपालिका", "text": "इटहरी उप-महानगरपालिका"}, {"id": "दुहवी नगरपालिका", "text": "दुहवी नगरपालिका"}, {"id": "गढी गाउँपालिका", "text": "गढी गाउँपालिका"}, {"id": "इनरुवा नगरपालिका", "text": "इनरुवा नगरपालिका"}, {"id": "हरिनगर गाउँपालिका", "text": "हरिनगर गाउँपालिका"}, {"id": "बर्जु गाउँपालिका", "text": "बर्जु गाउँपालिका"}, {"id": "भोक्राहा नरसिंह गाउँपालिका", "text": "भोक्राहा नरसिंह गाउँपालिका"}, {"id": "देवानगञ्ज गाउँपालिका", "text": "देवानगञ्ज गाउँपालिका"}], "उदयपुर": [{"id": "वेलका नगरपालिका", "text": "वेलका नगरपालिका"}, {"id": "चौदण्डीगढी नगरपालिका", "text": "चौदण्डीगढी नगरपालिका"}, {"id": "त्रियुगा नगरपालिका", "text": "त्रियुगा नगरपालिका"}, {"id": "रौतामाई गाउँपालिका", "text": "रौतामाई गाउँपालिका"}, {"id": "सुनकोशी गाउँपालिका", "text": "सुनकोशी गाउँपालिका"}, {"id": "कटारी नगरपालिका", "text": "कटारी नगरपालिका"}, {"id": "उदयपुरग गाउँपालिका", "text": "उदयपुरग गाउँपालिका"}, {"id": "ताप्ली गाउँपालिका", "text": "ताप्ली गाउँपालिका"}]}}};
@@ -1,6 +1,9 @@
 (function () {
     'use strict';
 
+    var SELECTOR = '.nepkit-datepicker';
+    var INITIALIZED_CLASS = 'nepali-datepicker-initialized';
+
     function isDarkTheme() {
         var docEl = document.documentElement;
         var body = document.body;
@@ -28,90 +31,155 @@
         }
     }
 
-    function applyThemeToDatepickerContainers() {
+    function applyTheme(container, dark) {
+        container.classList.remove(dark ? 'ndp-light' : 'ndp-dark');
+        container.classList.add(dark ? 'ndp-dark' : 'ndp-light');
+    }
+
+    // Theme work is batched into one animation frame: new picker containers
+    // are themed individually, and a theme switch re-themes all of them once.
+    var pendingContainers = [];
+    var themeAll = false;
+    var frameRequested = false;
+
+    function flushTheme() {
+        frameRequested = false;
         var dark = isDarkTheme();
-        var containers = document.querySelectorAll('.ndp-container');
-        if (!containers || !containers.length) return;
+        var containers = themeAll ? document.querySelectorAll('.ndp-container') : pendingContainers;
+        for (var i = 0; i < containers.length; i++) {
+            applyTheme(containers[i], dark);
+        }
+        pendingContainers = [];
+        themeAll = false;
+    }
 
-        containers.forEach(function (c) {
-            c.classList.remove('ndp-dark');
-            c.classList.remove('ndp-light');
-            c.classList.add(dark ? 'ndp-dark' : 'ndp-light');
-        });
+    function scheduleTheme(container) {
+        if (container) {
+            pendingContainers.push(container);
+        } else {
+            themeAll = true;
+        }
+        if (frameRequested) return;
+        frameRequested = true;
+        if (window.requestAnimationFrame) {
+            window.requestAnimationFrame(flushTheme);
+        } else {
+            window.setTimeout(flushTheme, 16);
+        }
     }
 
-    function initNepaliDatePickers() {
-        var inputs = document.querySelectorAll('.nepkit-datepicker:not(.nepali-datepicker-initialized)');
-        if (!inputs || !inputs.length) return;
-
-        inputs.forEach(function (el) {
-            var format = el.dataset.format || 'YYYY-MM-DD';
-            // Convert strftime format to datepicker format
-            format = format.replace(/%Y/g, 'YYYY').replace(/%m/g, 'MM').replace(/%d/g, 'DD');
-
-            var options = {
-                dateFormat: format,
-                closeOnDateSelect: true
-            };
-
-            // Determine language based on data attributes
-            var useNepali = el.dataset.ne === 'true';
-            var useEnglish = el.dataset.en === 'true';
-
-            if (useNepali) {
-                // Devanagari digits and Nepali month/day names
-                options.unicodeDate = true;
-            } else if (useEnglish || (!useNepali && !el.dataset.ne)) {
-                // English month/day names and digits
-                options.language = 'english';
-            }
+    function initPicker(el) {
+        if (el.classList.contains(INITIALIZED_CLASS)) return false;
 
-            // Nepali Datepicker v5 exposes `element.NepaliDatePicker(options)`
-            if (typeof el.NepaliDatePicker === 'function') {
-                el.NepaliDatePicker(options);
-                el.classList.add('nepali-datepicker-initialized');
-            }
-            // Fallback for jQuery plugin (v2.0.2)
-            else if (typeof window.jQuery !== 'undefined' && typeof window.jQuery(el).nepaliDatePicker === 'function') {
-                window.jQuery(el).nepaliDatePicker(options);
-                el.classList.add('nepali-datepicker-initialized');
+        var format = el.dataset.format || 'YYYY-MM-DD';
+        // Convert strftime format to datepicker format
+        format = format.replace(/%Y/g, 'YYYY').replace(/%m/g, 'MM').replace(/%d/g, 'DD');
+
+        var options = {
+            dateFormat: format,
+            closeOnDateSelect: true
+        };
+
+        // Determine language based on data attributes
+        var useNepali = el.dataset.ne === 'true';
+        var useEnglish = el.dataset.en === 'true';
+
+        if (useNepali) {
+            // Devanagari digits and Nepali month/day names
+            options.unicodeDate = true;
+        } else if (useEnglish || (!useNepali && !el.dataset.ne)) {
+            // English month/day names and digits
+            options.language = 'english';
+        }
+
+        // Nepali Datepicker v5 exposes `element.NepaliDatePicker(options)`
+        if (typeof el.NepaliDatePicker === 'function') {
+            el.NepaliDatePicker(options);
+        }
+        // Fallback for jQuery plugin (v2.0.2)
+        else if (typeof window.jQuery !== 'undefined' && typeof window.jQuery(el).nepaliDatePicker === 'function') {
+            window.jQuery(el).nepaliDatePicker(options);
+        } else {
+            return false;
+        }
+        el.classList.add(INITIALIZED_CLASS);
+        return true;
+    }
+
+    function pickerFor(target) {
+        return target && target.closest ? target.closest(SELECTOR) : null;
+    }
+
+    // Pickers are created lazily, the first time an input is used. Listening
+    // on the document covers inputs added later (inlines, popups) without
+    // rescanning the page.
+    function onPointerDown(e) {
+        // Runs before focus, so the plugin's own focus handler opens the picker
+        var el = pickerFor(e.target);
+        if (el) initPicker(el);
+    }
+
+    function onFocusIn(e) {
+        var el = pickerFor(e.target);
+        if (el && initPicker(el)) {
+            // Keyboard focus happened before the plugin was listening
+            el.dispatchEvent(new Event('focus'));
+        }
+    }
+
+    // Only nodes added since the last callback are inspected: picker
+    // containers the plugin inserts get themed, nothing else is rescanned.
+    function onMutations(mutations) {
+        for (var i = 0; i < mutations.length; i++) {
+            var added = mutations[i].addedNodes;
+            for (var j = 0; j < added.length; j++) {
+                var node = added[j];
+                if (node.nodeType !== 1) continue;
+                if (node.classList.contains('ndp-container')) {
+                    scheduleTheme(node);
+                } else if (node.querySelector) {
+                    var nested = node.querySelectorAll('.ndp-container');
+                    for (var k = 0; k < nested.length; k++) scheduleTheme(nested[k]);
+                }
             }
+        }
+    }
 
-            // Ensure theme is applied when the picker is actually shown.
-            // (The plugin often creates/inserts DOM on focus.)
-            var applySoon = function () {
-                // Run twice: once immediately, once after paint.
-                applyThemeToDatepickerContainers();
-                window.setTimeout(applyThemeToDatepickerContainers, 0);
-            };
+    function initObservers() {
+        document.addEventListener('pointerdown', onPointerDown, true);
+        document.addEventListener('focusin', onFocusIn, true);
 
-            el.addEventListener('focus', applySoon);
-            el.addEventListener('click', applySoon);
+        if (typeof MutationObserver === 'undefined' || !document.body) return;
+
+        new MutationObserver(onMutations).observe(document.body, {
+            childList: true,
+            subtree: true
         });
-    }
 
-    // Also listen for DOM changes (admin popups/other dynamic content)
-    function initObserver() {
-        if (typeof MutationObserver !== 'undefined' && document.body) {
-            var observer = new MutationObserver(function () {
-                initNepaliDatePickers();
-                applyThemeToDatepickerContainers();
-            });
-            observer.observe(document.body, {
-                childList: true,
-                subtree: true
-            });
+        // Re-theme when the admin or OS switches between light and dark
+        var themeObserver = new MutationObserver(function () {
+            scheduleTheme();
+        });
+        var themeAttributes = ['class', 'data-theme', 'data-color-scheme'];
+        themeObserver.observe(document.documentElement, { attributes: true, attributeFilter: themeAttributes });
+        themeObserver.observe(document.body, { attributes: true, attributeFilter: themeAttributes });
+
+        if (window.matchMedia) {
+            var query = window.matchMedia('(prefers-color-scheme: dark)');
+            if (query.addEventListener) {
+                query.addEventListener('change', function () {
+                    scheduleTheme();
+                });
+            }
         }
+
+        // Containers that already exist (e.g. created before this script ran)
+        scheduleTheme();
     }
 
-    // Initialize on page load
     if (document.readyState === 'loading') {
-        document.addEventListener('DOMContentLoaded', function() {
-            initNepaliDatePickers();
-            initObserver();
-        });
+        document.addEventListener('DOMContentLoaded', initObservers);
     } else {
-        initNepaliDatePickers();
-        initObserver();
+        initObservers();
     }
 })();
@@ -0,0 +1,38 @@
+"""
+Static files storages that precompress assets during `collectstatic`.
+
+Example:
+    STORAGES = {
+        "staticfiles": {
+            "BACKEND": "django_nepkit.storage.PrecompressedManifestStaticFilesStorage",
+        },
+    }
+"""
+
+from django.contrib.staticfiles.storage import (
+    ManifestStaticFilesStorage,
+    StaticFilesStorage,
+)
+
+from django_nepkit.compression import precompress_directory
+
+
+class PrecompressMixin:
+    """Write .gz/.br siblings for collected files after post-processing."""
+
+    def post_process(self, paths, dry_run=False, **options):
+        parent = getattr(super(), "post_process", None)
+        if parent is not None:
+            yield from parent(paths, dry_run=dry_run, **options)
+        if not dry_run:
+            precompress_directory(self.location)
+
+
+class PrecompressedStaticFilesStorage(PrecompressMixin, StaticFilesStorage):
+    pass
+
+
+class PrecompressedManifestStaticFilesStorage(
+    PrecompressMixin, ManifestStaticFilesStorage
+):
+    pass
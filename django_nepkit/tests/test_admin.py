@@ -0,0 +1,578 @@
+"""
+Tests for NepaliModelAdmin changelist columns and filters.
+"""
+
+import django
+import pytest
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.contrib.admin.sites import AdminSite
+from django.core.cache import cache
+from django.db import connection, models
+from django.template.loader import render_to_string
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from nepali.datetime import nepalidate, nepalidatetime
+
+from django_nepkit.admin import (
+    NepaliDateFilter,
+    NepaliDateRangeListFilter,
+    NepaliModelAdmin,
+    NepaliMonthFilter,
+    _bs_date_part_position,
+    nepali_date_presets,
+)
+from django_nepkit.conf import nepkit_settings
+from django_nepkit.models import (
+    DistrictField,
+    MunicipalityField,
+    NepaliCurrencyField,
+    NepaliDateField,
+    NepaliDateTimeField,
+)
+
+
+class Payment(models.Model):
+    title = models.CharField(max_length=50)
+    paid_on = NepaliDateField(null=True, blank=True)
+    paid_on_ne = NepaliDateField(ne=True, null=True, blank=True)
+    recorded_at = NepaliDateTimeField(null=True, blank=True)
+    amount = NepaliCurrencyField(null=True, blank=True)
+
+    class Meta:
+        app_label = "django_nepkit"
+
+
+class PaymentAdmin(NepaliModelAdmin):
+    list_display = ("title", "paid_on", "paid_on_ne", "recorded_at", "amount")
+
+
+def _admin():
+    return PaymentAdmin(Payment, AdminSite())
+
+
+def _payment(**kwargs):
+    defaults = {
+        "title": "Rent",
+        "paid_on": nepalidate(2081, 1, 15),
+        "paid_on_ne": nepalidate(2081, 1, 15),
+        "recorded_at": nepalidatetime(2081, 1, 15, 14, 30),
+        "amount": 1234567,
+    }
+    defaults.update(kwargs)
+    return Payment(**defaults)
+
+
+class TestListDisplay:
+    def test_nepali_fields_become_columns(self):
+        columns = _admin().get_list_display(None)
+        assert columns[0] == "title"
+        assert all(callable(column) for column in columns[1:])
+        assert columns[1].short_description == "paid on"
+        assert columns[1].admin_order_field == "paid_on"
+
+    def test_columns_are_built_once(self):
+        model_admin = _admin()
+        first = model_admin.get_list_display(None)
+        second = model_admin.get_list_display(None)
+        assert first == second
+        assert first is not second
+        assert first[1] is second[1]
+
+    def test_rendering_does_not_look_up_fields(self, monkeypatch):
+        model_admin = _admin()
+        columns = model_admin.get_list_display(None)
+        payments = [_payment() for _ in range(100)]
+
+        calls = []
+        get_field = Payment._meta.get_field
+
+        def counting_get_field(name):
+            calls.append(name)
+            return get_field(name)
+
+        monkeypatch.setattr(Payment._meta, "get_field", counting_get_field)
+        rows = [
+            [payment.title] + [column(payment) for column in columns[1:]]
+            for payment in payments
+        ]
+
+        assert calls == []
+        assert rows[0] == [
+            "Rent",
+            "Baishakh 15, 2081",
+            "बैशाख १५, २०८१",
+            "Baishakh 15, 2081 02:30 PM",
+            "Rs. 12,34,567.00",
+        ]
+
+    def test_empty_values(self):
+        model_admin = _admin()
+        columns = model_admin.get_list_display(None)
+        payment = _payment(paid_on=None, amount=None)
+        assert columns[1](payment) == model_admin.get_empty_value_display()
+        assert columns[4](payment) == model_admin.get_empty_value_display()
+
+    def test_time_format_change_rebuilds_columns(self, monkeypatch):
+        model_admin = _admin()
+        payment = _payment()
+        assert model_admin.get_list_display(None)[3](payment).endswith("PM")
+
+        monkeypatch.setitem(nepkit_settings._user_settings, "TIME_FORMAT", 24)
+        assert model_admin.get_list_display(None)[3](payment).endswith("14:30")
+
+
+class FakeChangeList:
+    """The parts of ChangeList the filters use."""
+
+    pk_attname = "id"
+
+    def __init__(self, queryset, add_facets=False):
+        self.queryset = queryset
+        self.add_facets = add_facets
+
+    def get_queryset(self, request, exclude_parameters=None):
+        return self.queryset
+
+    def get_query_string(self, new_params=None, remove=None):
+        return "?" + "&".join(f"{k}={v}" for k, v in (new_params or {}).items())
+
+
+def _filter(filter_class, params=None, field_name="paid_on"):
+    return filter_class(
+        Payment._meta.get_field(field_name),
+        RequestFactory().get("/"),
+        dict(params or {}),
+        Payment,
+        _admin(),
+        field_name,
+    )
+
+
+class TestBsDatePartPosition:
+    def test_default_format(self):
+        assert _bs_date_part_position("%Y-%m-%d", "Y") == (1, 4)
+        assert _bs_date_part_position("%Y-%m-%d", "m") == (6, 2)
+
+    def test_other_orders(self):
+        assert _bs_date_part_position("%d/%m/%Y", "Y") == (7, 4)
+
+    def test_unknown_position(self):
+        assert _bs_date_part_position("%B %Y", "Y") is None
+        assert _bs_date_part_position("%Y-%m-%d", "H") is None
+
+
+@pytest.mark.django_db
+class TestNepaliDateFilters:
+    @pytest.fixture(autouse=True)
+    def payments(self):
+        cache.clear()
+        for year, month in [(2079, 12), (2080, 1), (2080, 1), (2080, 3)]:
+            Payment.objects.create(title="x", paid_on=nepalidate(year, month, 1))
+        Payment.objects.create(title="undated")
+        yield
+        cache.clear()
+
+    def test_years_come_from_data(self):
+        options = _filter(NepaliDateFilter).get_filter_options()
+        assert options == [("2079", "2079"), ("2080", "2080")]
+
+    def test_months_come_from_data(self):
+        options = _filter(NepaliMonthFilter).get_filter_options()
+        assert options == [("01", "Baisakh"), ("03", "Ashad"), ("12", "Chaitra")]
+
+    def test_options_take_one_cached_query(self):
+        with CaptureQueriesContext(connection) as queries:
+            _filter(NepaliDateFilter).get_filter_options()
+            _filter(NepaliDateFilter).get_filter_options()
+        assert len(queries) == 1
+        assert "GROUP BY" in queries[0]["sql"]
+
+    def test_saving_invalidates_options(self):
+        _filter(NepaliDateFilter).get_filter_options()
+        payment = Payment.objects.create(title="y", paid_on=nepalidate(2081, 2, 2))
+        assert ("2081", "2081") in _filter(NepaliDateFilter).get_filter_options()
+
+        payment.delete()
+        assert ("2081", "2081") not in _filter(NepaliDateFilter).get_filter_options()
+
+    def test_registered_filters_are_watched_before_first_use(self, monkeypatch):
+        from django_nepkit import admin as nepkit_admin
+
+        monkeypatch.setattr(nepkit_admin, "_filter_cache_keys", {})
+        site = AdminSite()
+        site.register(
+            Payment,
+            type(
+                "FilteredPaymentAdmin",
+                (PaymentAdmin,),
+                {"list_filter": (("paid_on", NepaliDateFilter), "title")},
+            ),
+        )
+        nepkit_admin.connect_filter_invalidation()
+
+        # Options cached by another process are cleared by a save in this one.
+        key = "django_nepkit:admin_filter:django_nepkit.payment:paid_on:bs_year"
+        cache.set(key, {"2070": 1})
+        Payment.objects.create(title="y", paid_on=nepalidate(2081, 2, 2))
+        assert cache.get(key) is None
+
+    @pytest.mark.skipif(django.VERSION < (5, 0), reason="Facets need Django 5.0+")
+    def test_facet_counts(self):
+        date_filter = _filter(NepaliDateFilter)
+        changelist = FakeChangeList(Payment.objects.all(), add_facets=True)
+        displays = [choice["display"] for choice in date_filter.choices(changelist)]
+        assert displays[1:] == ["2079 (1)", "2080 (3)"]
+
+    @pytest.mark.skipif(django.VERSION < (5, 0), reason="Facets need Django 5.0+")
+    def test_facet_counts_follow_other_filters(self):
+        date_filter = _filter(NepaliDateFilter)
+        queryset = Payment.objects.filter(paid_on__contains="-01-")
+        changelist = FakeChangeList(queryset, add_facets=True)
+        displays = [choice["display"] for choice in date_filter.choices(changelist)]
+        assert displays[1:] == ["2079 (0)", "2080 (2)"]
+
+    def test_list_parameters(self):
+        date_filter = _filter(NepaliDateFilter, {"paid_on_bs_year": ["2080"]})
+        queryset = date_filter.queryset(None, Payment.objects.all())
+        assert queryset.count() == 3
+
+        choices = list(date_filter.choices(FakeChangeList(Payment.objects.all())))
+        assert [c["display"] for c in choices if c["selected"]] == ["2080"]
+
+
+class HierarchyAdmin(NepaliModelAdmin):
+    list_display = ("title", "paid_on")
+    bs_date_hierarchy = "paid_on"
+
+
+class Superuser:
+    is_active = is_staff = is_superuser = True
+
+    def has_perm(self, perm, obj=None):
+        return True
+
+
+def _changelist(admin_class=None, **params):
+    request = RequestFactory().get("/", params)
+    request.user = Superuser()
+    model_admin = (admin_class or HierarchyAdmin)(Payment, AdminSite())
+    return model_admin.get_changelist_instance(request)
+
+
+def _hierarchy(changelist):
+    hierarchy = changelist.filter_specs[0]
+    return [
+        (choice["display"], choice["selected"], choice.get("back", False))
+        for choice in hierarchy.choices(changelist)
+    ]
+
+
+@pytest.mark.django_db
+class TestBsDateHierarchy:
+    @pytest.fixture(autouse=True)
+    def payments(self):
+        for year, month, day in [
+            (2079, 12, 30),
+            (2080, 1, 1),
+            (2080, 1, 15),
+            (2080, 3, 2),
+        ]:
+            Payment.objects.create(title="x", paid_on=nepalidate(year, month, day))
+        Payment.objects.create(title="undated")
+
+    def test_years(self):
+        assert _hierarchy(_changelist()) == [
+            ("All dates", True, False),
+            ("2079", False, False),
+            ("2080", False, False),
+        ]
+
+    def test_months_of_a_year(self):
+        changelist = _changelist(paid_on__bs_year="2080")
+        assert changelist.result_count == 3
+        assert _hierarchy(changelist) == [
+            ("All dates", False, True),
+            ("2080", True, False),
+            ("Baisakh", False, False),
+            ("Ashad", False, False),
+        ]
+
+    def test_days_of_a_month(self):
+        changelist = _changelist(paid_on__bs_year="2080", paid_on__bs_month="1")
+        assert changelist.result_count == 2
+        assert _hierarchy(changelist) == [
+            ("All dates", False, True),
+            ("2080", False, True),
+            ("Baisakh 2080", True, False),
+            ("1", False, False),
+            ("15", False, False),
+        ]
+
+    def test_single_day(self):
+        changelist = _changelist(
+            paid_on__bs_year="2080", paid_on__bs_month="1", paid_on__bs_day="15"
+        )
+        assert changelist.result_count == 1
+        assert _hierarchy(changelist)[-1] == ("Baisakh 15, 2080", True, False)
+
+    def test_uses_range_and_group_by(self):
+        changelist = _changelist(paid_on__bs_year="2080")
+        sql = str(changelist.queryset.query)
+        assert ">= 2080-" in sql and "< 2081-" in sql
+        with CaptureQueriesContext(connection) as queries:
+            list(changelist.filter_specs[0].choices(changelist))
+        assert len(queries) == 1
+        assert "GROUP BY" in queries[0]["sql"]
+
+    def test_bounds(self):
+        hierarchy = _changelist().filter_specs[0]
+        assert hierarchy.get_bounds((2080,)) == ("2080-", "2081-")
+        assert hierarchy.get_bounds((2080, 12)) == ("2080-12-", "2080-13-")
+        assert hierarchy.get_bounds((2080, 1, 9)) == ("2080-01-09", "2080-01-10")
+
+    def test_invalid_month(self):
+        with pytest.raises(IncorrectLookupParameters):
+            _changelist(paid_on__bs_year="2080", paid_on__bs_month="13")
+
+    def test_template(self):
+        changelist = _changelist(paid_on__bs_year="2080")
+        hierarchy = changelist.filter_specs[0]
+        html = render_to_string(
+            hierarchy.template,
+            {"title": "paid on", "choices": hierarchy.choices(changelist)},
+        )
+        assert 'class="date-back">&lsaquo; All dates</a>' in html
+        assert "paid_on__bs_month=3" in html
+
+
+class RangeAdmin(NepaliModelAdmin):
+    list_display = ("title", "paid_on")
+    list_filter = (
+        ("paid_on", NepaliDateRangeListFilter),
+        ("recorded_at", NepaliDateRangeListFilter),
+    )
+
+
+class TestNepaliDatePresets:
+    def test_presets(self):
+        presets = nepali_date_presets(nepalidate(2083, 3, 10))
+        periods = {
+            key: (str(first), str(last)) for key, (_, first, last) in presets.items()
+        }
+        assert periods == {
+            "today": ("2083-03-10", "2083-03-10"),
+            "this_month": ("2083-03-01", "2083-03-32"),
+            "last_month": ("2083-02-01", "2083-02-31"),
+            "this_year": ("2083-01-01", "2083-12-30"),
+            "this_fiscal_year": ("2082-04-01", "2083-03-32"),
+            "last_fiscal_year": ("2081-04-01", "2082-03-32"),
+        }
+
+    def test_fiscal_year_after_shrawan(self):
+        presets = nepali_date_presets(nepalidate(2083, 4, 1))
+        assert str(presets["this_fiscal_year"][1]) == "2083-04-01"
+
+
+@pytest.mark.django_db
+class TestNepaliDateRangeListFilter:
+    @pytest.fixture(autouse=True)
+    def payments(self):
+        for day in (1, 15, 30):
+            Payment.objects.create(
+                title=f"day {day}",
+                paid_on=nepalidate(2080, 1, day),
+                recorded_at=nepalidatetime(2080, 1, day, 18, 0),
+            )
+        Payment.objects.create(title="undated")
+
+    def _titles(self, **params):
+        changelist = _changelist(RangeAdmin, **params)
+        return sorted(changelist.queryset.values_list("title", flat=True))
+
+    def test_range(self):
+        titles = self._titles(
+            paid_on__bs_gte="2080-01-01", paid_on__bs_lte="2080-01-15"
+        )
+        assert titles == ["day 1", "day 15"]
+
+    def test_single_range_lookup(self):
+        changelist = _changelist(
+            RangeAdmin, paid_on__bs_gte="2080-01-01", paid_on__bs_lte="2080-01-15"
+        )
+        sql = str(changelist.queryset.query)
+        assert "BETWEEN 2080-01-01 AND 2080-01-15" in sql
+        assert "LIKE" not in sql
+
+    def test_open_ended(self):
+        assert self._titles(paid_on__bs_gte="2080-01-15") == ["day 15", "day 30"]
+        assert self._titles(paid_on__bs_lte="2080-01-15") == ["day 1", "day 15"]
+
+    def test_inputs_are_normalized(self):
+        assert self._titles(paid_on__bs_gte="15/01/2080") == ["day 15", "day 30"]
+
+    def test_datetime_end_includes_whole_day(self):
+        titles = self._titles(recorded_at__bs_lte="2080-01-15")
+        assert titles == ["day 1", "day 15"]
+
+    def test_invalid_date(self):
+        with pytest.raises(IncorrectLookupParameters):
+            _changelist(RangeAdmin, paid_on__bs_gte="someday")
+
+    def test_presets_and_form(self):
+        changelist = _changelist(RangeAdmin, title="x", paid_on__bs_gte="2080-01-15")
+        date_filter = changelist.filter_specs[0]
+        choices = list(date_filter.choices(changelist))
+        assert [c["display"] for c in choices][:3] == [
+            "Any date",
+            "Today",
+            "This month",
+        ]
+        assert date_filter.hidden_params == [("title", "x")]
+
+        html = render_to_string(
+            date_filter.template,
+            {"title": "paid on", "choices": choices, "spec": date_filter},
+        )
+        assert 'name="paid_on__bs_gte"' in html
+        assert 'value="2080-01-15"' in html
+        assert 'class="nepkit-datepicker"' in html
+        assert '<input type="hidden" name="title" value="x">' in html
+
+    def test_preset_selected(self):
+        today = nepalidate.today()
+        changelist = _changelist(
+            RangeAdmin,
+            paid_on__bs_gte=today.strftime("%Y-%m-%d"),
+            paid_on__bs_lte=today.strftime("%Y-%m-%d"),
+        )
+        choices = changelist.filter_specs[0].choices(changelist)
+        assert [c["display"] for c in choices if c["selected"]] == ["Today"]
+
+
+class Branch(models.Model):
+    name = models.CharField(max_length=50)
+    district = DistrictField(blank=True)
+    district_code = DistrictField(code=True, null=True, blank=True)
+    municipality = MunicipalityField(ne=True, blank=True)
+
+    class Meta:
+        app_label = "django_nepkit"
+
+
+class BranchAdmin(NepaliModelAdmin):
+    search_fields = ("name", "district", "=district_code", "^municipality")
+
+
+class BilingualBranchAdmin(NepaliModelAdmin):
+    list_display = ("name", "district", "district_code", "municipality")
+    bilingual_location_fields = ("district_code", "municipality")
+
+
+class TestBilingualLocationDisplay:
+    def _columns(self, **attrs):
+        admin_class = type("Admin", (BilingualBranchAdmin,), attrs)
+        return admin_class(Branch, AdminSite()).get_list_display(None)
+
+    def test_only_listed_fields_become_columns(self):
+        columns = self._columns()
+        assert columns[:2] == ["name", "district"]
+        assert columns[2].short_description == "district code"
+        assert columns[3].admin_order_field == "municipality"
+
+    def test_all_location_fields(self):
+        columns = self._columns(bilingual_location_fields=True)
+        assert all(callable(column) for column in columns[1:])
+
+    def test_cells_add_the_other_language(self):
+        branch = Branch(
+            name="Head office",
+            district_code="Kathmandu",
+            municipality="काठमाडौं महानगरपालिका",
+        )
+        columns = self._columns()
+        assert columns[2](branch) == "Kathmandu (काठमाडौं)"
+        assert columns[3](branch) == (
+            "काठमाडौं महानगरपालिका (Kathmandu Metropolitan City)"
+        )
+
+    def test_blank_and_unknown_values(self):
+        columns = self._columns()
+        assert columns[3](Branch(municipality="")) == ""
+        assert columns[3](Branch(municipality="Atlantis")) == "Atlantis"
+        assert columns[2](Branch(district_code=None)) == "-"
+
+
+def _search(term):
+    request = RequestFactory().get("/")
+    request.user = Superuser()
+    model_admin = BranchAdmin(Branch, AdminSite())
+    queryset, _duplicates = model_admin.get_search_results(
+        request, Branch.objects.all(), term
+    )
+    return queryset
+
+
+class TestLocationSearchFields:
+    def test_rewrites_location_fields(self):
+        fields = BranchAdmin(Branch, AdminSite()).get_search_fields(None)
+        assert fields == (
+            "name",
+            "district__location_contains",
+            "district_code__location_exact",
+            "municipality__location_startswith",
+        )
+
+    def test_other_entries_unchanged(self):
+        model_admin = BranchAdmin(Branch, AdminSite())
+        assert model_admin._location_search_field("district__iexact") == (
+            "district__iexact"
+        )
+        assert model_admin._location_search_field("missing") == "missing"
+
+
+@pytest.mark.django_db
+class TestLocationSearch:
+    @pytest.fixture(autouse=True)
+    def branches(self):
+        Branch.objects.create(
+            name="Head office",
+            district="Kathmandu",
+            district_code="Kathmandu",
+            municipality="काठमाडौं महानगरपालिका",
+        )
+        Branch.objects.create(
+            name="Valley",
+            district="Kavrepalanchok",
+            district_code="Kavrepalanchok",
+            municipality="धुलिखेल नगरपालिका",
+        )
+        Branch.objects.create(name="Kaski desk", district="Kaski")
+
+    def _names(self, term):
+        return sorted(_search(term).values_list("name", flat=True))
+
+    def test_english_name(self):
+        assert self._names("kathmandu") == ["Head office"]
+
+    def test_nepali_name_and_chandrabindu(self):
+        assert self._names("काठमाडौँ") == ["Head office"]
+
+    def test_aliases(self):
+        assert self._names("kavre") == ["Valley"]
+        assert self._names("KMC") == ["Head office"]
+
+    def test_other_fields_still_searched(self):
+        assert self._names("desk") == ["Kaski desk"]
+
+    def test_words_must_all_match(self):
+        assert self._names("kathmandu office") == ["Head office"]
+        assert self._names("kathmandu desk") == []
+
+    def test_uses_in_not_like_on_location_columns(self):
+        sql = str(_search("kathmandu").query)
+        assert '"district" IN (' in sql
+        assert '"district" LIKE' not in sql
+        assert '"municipality" IN (' in sql
+
+    def test_no_matching_location(self):
+        assert self._names("atlantis") == []
@@ -1,4 +1,5 @@
 from unittest.mock import MagicMock
+import pytest
 from django_nepkit.serializers import (
     NepaliCurrencySerializerField,
     NepaliLocalizedSerializerMixin,
@@ -102,3 +103,135 @@ def test_date_range_filter():
     # Test exact
     f.filter(qs, "2080-01-01")
     qs.filter.assert_any_call(birth_date="2080-01-01")
+
+
+def test_nepali_localized_serializer_mixin_locations():
+    from django.db import models
+    from rest_framework import serializers
+
+    from django_nepkit.models import DistrictField, MunicipalityField
+
+    class Clinic(models.Model):
+        district = DistrictField()
+        municipality = MunicipalityField(ne=True)
+
+        class Meta:
+            app_label = "django_nepkit"
+
+    class ClinicSerializer(NepaliLocalizedSerializerMixin, serializers.ModelSerializer):
+        class Meta:
+            model = Clinic
+            fields = ["district", "municipality"]
+
+    clinic = Clinic(district="Kaski", municipality="पोखरा महानगरपालिका")
+
+    assert ClinicSerializer(clinic).data == {
+        "district": "Kaski",
+        "municipality": "पोखरा महानगरपालिका",
+    }
+    data = ClinicSerializer(clinic, context={"ne": True}).data
+    assert data["district_ne"] == "कास्की"
+    assert data["municipality_en"] == "Pokhara Metropolitan City"
+
+
+def test_nepali_localized_serializer_mixin_plan_is_built_once(monkeypatch):
+    from django.db import models
+    from nepali.datetime import nepalidate, nepalidatetime
+    from rest_framework import serializers
+
+    from django_nepkit.models import NepaliDateTimeField
+
+    class Voucher(models.Model):
+        issued_on = NepaliDateField()
+        recorded_at = NepaliDateTimeField()
+        amount = NepaliCurrencyField()
+
+        class Meta:
+            app_label = "django_nepkit"
+
+    class VoucherSerializer(
+        NepaliLocalizedSerializerMixin, serializers.ModelSerializer
+    ):
+        class Meta:
+            model = Voucher
+            fields = ["issued_on", "recorded_at", "amount"]
+
+    vouchers = [
+        Voucher(
+            issued_on=nepalidate(2081, 4, day),
+            recorded_at=nepalidatetime(2081, 4, day, 9, 5, 30),
+            amount=1500,
+        )
+        for day in range(1, 21)
+    ]
+
+    calls = []
+    get_field = Voucher._meta.get_field
+
+    def counting_get_field(name):
+        calls.append(name)
+        return get_field(name)
+
+    monkeypatch.setattr(Voucher._meta, "get_field", counting_get_field)
+    data = VoucherSerializer(vouchers, many=True, context={"ne": True}).data
+
+    # Only while building the fields and the plan, not once per instance
+    assert len(calls) < len(vouchers)
+    assert [row["issued_on_ne"] for row in data] == [
+        voucher.issued_on.strftime_ne("%Y-%m-%d") for voucher in vouchers
+    ]
+    assert data[0]["recorded_at_ne"] == "२०८१-०४-०१ ०९:०५:३०"
+    assert data[0]["amount_ne"] == "१,५००.००"
+
+
+def test_nepali_localized_serializer_mixin_only_skips_bad_values(monkeypatch):
+    from django.db import models
+    from rest_framework import serializers
+
+    from django_nepkit import serializers as nepkit_serializers
+
+    class Receipt(models.Model):
+        amount = NepaliCurrencyField()
+
+        class Meta:
+            app_label = "django_nepkit"
+
+    class ReceiptSerializer(
+        NepaliLocalizedSerializerMixin, serializers.ModelSerializer
+    ):
+        class Meta:
+            model = Receipt
+            fields = ["amount"]
+
+    def failing_format(value, **kwargs):
+        raise error
+
+    monkeypatch.setattr(nepkit_serializers, "format_nepali_currency", failing_format)
+    receipt = Receipt(amount=1500)
+
+    error = ValueError("not a number")
+    data = ReceiptSerializer(receipt, context={"ne": True}).data
+    assert "amount_ne" not in data
+
+    # Bugs are not hidden behind a missing key.
+    error = RuntimeError("bug")
+    with pytest.raises(RuntimeError):
+        ReceiptSerializer(receipt, context={"ne": True}).data
+
+
+def test_localized_date_formats():
+    from nepali.datetime import nepalidate
+
+    from django_nepkit.serializers import _localize_date, _numeric_template
+
+    assert (
+        _numeric_template("%Y/%m/%d {x}")
+        == "{0.year:04d}/{0.month:02d}/{0.day:02d} {{x}}"
+    )
+    assert _numeric_template("%B %d, %Y") is None
+
+    instance = MagicMock(issued_on=nepalidate(2081, 4, 1))
+    localize = _localize_date("%B %d, %Y", nepalidate)
+    assert localize(instance, "issued_on", None) == (
+        instance.issued_on.strftime_ne("%B %d, %Y")
+    )
@@ -0,0 +1,238 @@
+"""
+Tests for the datepicker's third-party assets (assets.py).
+"""
+
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from django_nepkit import assets
+from django_nepkit.assets import (
+    VENDOR_ASSETS,
+    Script,
+    asset_path,
+    check_asset_settings,
+    datepicker_media,
+    integrity_of,
+)
+from django_nepkit.conf import nepkit_settings
+from django_nepkit.widgets import NepaliDatePickerWidget
+
+
+@pytest.fixture
+def vendored(monkeypatch):
+    """Pretend the local copies have been downloaded."""
+    monkeypatch.setattr(assets, "local_asset_exists", lambda path: True)
+
+
+@pytest.fixture
+def not_vendored(monkeypatch):
+    monkeypatch.setattr(assets, "local_asset_exists", lambda path: False)
+
+
+@pytest.fixture
+def local_mode(monkeypatch):
+    monkeypatch.setitem(nepkit_settings._user_settings, "ASSET_MODE", "local")
+
+
+class TestAssetPath:
+    def test_local_copy_is_preferred(self, vendored, local_mode):
+        assert asset_path("jquery") == VENDOR_ASSETS["jquery"][1]
+
+    def test_falls_back_to_cdn_when_missing(self, not_vendored, local_mode):
+        assert asset_path("jquery") == VENDOR_ASSETS["jquery"][0]
+
+    def test_cdn_mode_is_the_default(self, vendored):
+        assert asset_path("datepicker_js") == VENDOR_ASSETS["datepicker_js"][0]
+
+
+class TestScript:
+    def test_renders_attributes(self):
+        html = str(Script("https://example.com/a.js", defer=True))
+        assert html == '<script src="https://example.com/a.js" defer></script>'
+
+    def test_relative_paths_use_static(self):
+        html = str(Script("django_nepkit/js/a.js", defer=True))
+        assert html.startswith('<script src="') and "django_nepkit/js/a.js" in html
+
+    def test_equality(self):
+        assert Script("a.js", defer=True) == Script("a.js", defer=True)
+        assert Script("a.js", defer=True) != Script("a.js", async_=True)
+        assert Script("a.js") == "a.js"
+
+
+class TestDatepickerMedia:
+    def test_local_media(self, vendored, local_mode):
+        media = str(datepicker_media())
+        assert "cdn" not in media and "sajanmaharjan" not in media
+        assert "django_nepkit/vendor/nepali-datepicker/" in media
+        assert "defer" not in media
+
+    def test_deferred_scripts(self, vendored):
+        media = datepicker_media(loading="defer")
+        assert all(" defer>" in str(script) for script in media.render_js())
+
+    def test_admin_uses_bridge_instead_of_jquery(self, vendored):
+        media = str(datepicker_media(admin=True))
+        assert "admin-jquery-bridge.js" in media
+        assert "vendor/jquery/" not in media
+        assert "admin-nepali-datepicker.css" in media
+
+    def test_widget_loading(self, vendored, monkeypatch):
+        monkeypatch.setitem(nepkit_settings._user_settings, "ASSET_LOADING", "defer")
+        assert " defer>" in str(NepaliDatePickerWidget().media)
+        assert " async>" in str(NepaliDatePickerWidget(loading="async").media)
+
+
+class TestAssetChecks:
+    def test_no_errors_when_vendored(self, vendored, local_mode):
+        assert check_asset_settings() == []
+
+    def test_warns_when_missing(self, not_vendored, local_mode):
+        assert [e.id for e in check_asset_settings()] == ["django_nepkit.W001"]
+
+    def test_cdn_mode_does_not_warn(self, not_vendored):
+        assert check_asset_settings() == []
+
+    def test_invalid_settings(self, vendored, monkeypatch):
+        monkeypatch.setitem(nepkit_settings._user_settings, "ASSET_MODE", "bundle")
+        monkeypatch.setitem(nepkit_settings._user_settings, "ASSET_LOADING", "lazy")
+        ids = [e.id for e in check_asset_settings()]
+        assert ids == ["django_nepkit.E002", "django_nepkit.E003"]
+
+
+class _FakeResponse:
+    def __init__(self, url):
+        self.url = url
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def read(self):
+        return f"/* {self.url} */".encode()
+
+
+@pytest.fixture
+def pinned_fake_assets(monkeypatch):
+    """Pin every vendored asset to the hash of what _FakeResponse serves."""
+    for name, (url, _path) in VENDOR_ASSETS.items():
+        monkeypatch.setitem(
+            assets.VENDOR_ASSET_INTEGRITY, name, integrity_of(_FakeResponse(url).read())
+        )
+
+
+@pytest.mark.usefixtures("pinned_fake_assets")
+class TestVendorAssetsCommand:
+    def test_downloads_each_asset(self, tmp_path, monkeypatch):
+        from django_nepkit.management.commands import nepkit_vendor_assets
+
+        requested = []
+
+        def fake_urlopen(url, timeout):
+            requested.append(url)
+            return _FakeResponse(url)
+
+        monkeypatch.setattr(nepkit_vendor_assets, "urlopen", fake_urlopen)
+        call_command(
+            "nepkit_vendor_assets", output_dir=str(tmp_path), stdout=StringIO()
+        )
+
+        assert requested == [url for url, _path in VENDOR_ASSETS.values()]
+        for url, local_path in VENDOR_ASSETS.values():
+            assert (tmp_path / local_path).read_text() == f"/* {url} */"
+
+        # Existing copies are kept unless --force is given
+        requested.clear()
+        call_command(
+            "nepkit_vendor_assets", output_dir=str(tmp_path), stdout=StringIO()
+        )
+        assert requested == []
+
+    def test_download_error(self, tmp_path, monkeypatch):
+        from django_nepkit.management.commands import nepkit_vendor_assets
+
+        def failing_urlopen(url, timeout):
+            raise OSError("network unreachable")
+
+        monkeypatch.setattr(nepkit_vendor_assets, "urlopen", failing_urlopen)
+        with pytest.raises(CommandError, match="network unreachable"):
+            call_command("nepkit_vendor_assets", output_dir=str(tmp_path))
+
+    def test_defaults_to_first_staticfiles_dir(self, tmp_path, monkeypatch, settings):
+        from django_nepkit.management.commands import nepkit_vendor_assets
+
+        monkeypatch.setattr(
+            nepkit_vendor_assets, "urlopen", lambda url, timeout: _FakeResponse(url)
+        )
+        settings.STATICFILES_DIRS = [str(tmp_path)]
+        call_command("nepkit_vendor_assets", stdout=StringIO())
+        for _url, local_path in VENDOR_ASSETS.values():
+            assert (tmp_path / local_path).is_file()
+
+    def test_requires_an_output_dir(self, settings):
+        settings.STATICFILES_DIRS = []
+        with pytest.raises(CommandError, match="--output-dir"):
+            call_command("nepkit_vendor_assets")
+
+    def test_rejects_a_hash_mismatch(self, tmp_path, monkeypatch):
+        from django_nepkit.management.commands import nepkit_vendor_assets
+
+        monkeypatch.setitem(
+            assets.VENDOR_ASSET_INTEGRITY,
+            "jquery",
+            integrity_of(b"something else"),
+        )
+        monkeypatch.setattr(
+            nepkit_vendor_assets, "urlopen", lambda url, timeout: _FakeResponse(url)
+        )
+        with pytest.raises(CommandError, match="does not match its pinned hash"):
+            call_command(
+                "nepkit_vendor_assets", output_dir=str(tmp_path), stdout=StringIO()
+            )
+        _url, jquery_path = VENDOR_ASSETS["jquery"]
+        assert not (tmp_path / jquery_path).exists()
+
+    def test_unpinned_assets_need_opt_in(self, tmp_path, monkeypatch):
+        from django_nepkit.management.commands import nepkit_vendor_assets
+
+        monkeypatch.setitem(assets.VENDOR_ASSET_INTEGRITY, "datepicker_js", None)
+        monkeypatch.setattr(
+            nepkit_vendor_assets, "urlopen", lambda url, timeout: _FakeResponse(url)
+        )
+        with pytest.raises(CommandError, match="--allow-unpinned"):
+            call_command(
+                "nepkit_vendor_assets", output_dir=str(tmp_path), stdout=StringIO()
+            )
+
+        out = StringIO()
+        call_command(
+            "nepkit_vendor_assets",
+            output_dir=str(tmp_path),
+            allow_unpinned=True,
+            stdout=out,
+        )
+        url, local_path = VENDOR_ASSETS["datepicker_js"]
+        assert (tmp_path / local_path).is_file()
+        assert integrity_of(_FakeResponse(url).read()) in out.getvalue()
+
+    def test_skips_prefixed_staticfiles_dirs(self, tmp_path, monkeypatch, settings):
+        from django_nepkit.management.commands import nepkit_vendor_assets
+
+        monkeypatch.setattr(
+            nepkit_vendor_assets, "urlopen", lambda url, timeout: _FakeResponse(url)
+        )
+        prefixed, plain = tmp_path / "prefixed", tmp_path / "plain"
+        settings.STATICFILES_DIRS = [("vendor", str(prefixed)), ("", str(plain))]
+        call_command("nepkit_vendor_assets", stdout=StringIO())
+        for _url, local_path in VENDOR_ASSETS.values():
+            assert (plain / local_path).is_file()
+        assert not prefixed.exists()
+
+        settings.STATICFILES_DIRS = [("vendor", str(prefixed))]
+        with pytest.raises(CommandError, match="--output-dir"):
+            call_command("nepkit_vendor_assets")
@@ -0,0 +1,181 @@
+"""
+Tests for the precompression helpers (compression.py).
+"""
+
+import gzip
+
+import pytest
+from django.test import RequestFactory
+
+from django_nepkit.compression import (
+    accepted_encodings,
+    compress,
+    negotiate_encoding,
+)
+
+
+class TestAcceptedEncodings:
+    """Tests for Accept-Encoding parsing."""
+
+    def test_parses_codings(self):
+        assert accepted_encodings("gzip, deflate, br") == {"gzip", "deflate", "br"}
+
+    def test_ignores_zero_quality(self):
+        assert accepted_encodings("gzip;q=0, br;q=0.5") == {"br"}
+
+    def test_empty(self):
+        assert accepted_encodings("") == set()
+
+
+class TestCompress:
+    """Tests for compress and negotiate_encoding."""
+
+    def test_gzip_round_trip_is_reproducible(self):
+        data = b"nepal " * 100
+        assert gzip.decompress(compress(data, "gzip")) == data
+        assert compress(data, "gzip") == compress(data, "gzip")
+
+    def test_unknown_encoding(self):
+        with pytest.raises(ValueError):
+            compress(b"x", "deflate")
+
+    def test_negotiates_gzip(self):
+        request = RequestFactory().get("/", HTTP_ACCEPT_ENCODING="gzip")
+        assert negotiate_encoding(request) == "gzip"
+
+    def test_negotiates_identity(self):
+        request = RequestFactory().get("/", HTTP_ACCEPT_ENCODING="deflate")
+        assert negotiate_encoding(request) is None
+
+
+JS = "window.NEPKIT = " + "[1, 2, 3], " * 200 + "0;\n"
+
+
+class TestPrecompressFiles:
+    """Tests for precompress_file and precompress_directory."""
+
+    def test_writes_gzip_sibling(self, tmp_path):
+        from django_nepkit.compression import precompress_file
+
+        path = tmp_path / "app.js"
+        path.write_text(JS)
+        written = precompress_file(path)
+        assert tmp_path / "app.js.gz" in written
+        assert gzip.decompress((tmp_path / "app.js.gz").read_bytes()) == JS.encode()
+
+    def test_skips_small_and_up_to_date_files(self, tmp_path):
+        from django_nepkit.compression import precompress_file
+
+        small = tmp_path / "small.js"
+        small.write_text("x")
+        assert precompress_file(small) == []
+
+        path = tmp_path / "app.js"
+        path.write_text(JS)
+        precompress_file(path)
+        assert precompress_file(path) == []
+
+    def test_directory_only_compresses_text_assets(self, tmp_path):
+        from django_nepkit.compression import precompress_directory
+
+        (tmp_path / "css").mkdir()
+        (tmp_path / "css" / "site.css").write_text("body { color: red; }\n" * 50)
+        (tmp_path / "logo.png").write_bytes(b"\x89PNG" + b"\x00" * 1000)
+        written = precompress_directory(tmp_path)
+        assert [path.name for path in written] == ["site.css.gz"]
+
+
+class TestPrecompressStorage:
+    """Tests for the precompressing staticfiles storages."""
+
+    def test_post_process_compresses_collected_files(self, tmp_path):
+        from django_nepkit.storage import PrecompressedStaticFilesStorage
+
+        (tmp_path / "app.js").write_text(JS)
+        storage = PrecompressedStaticFilesStorage(
+            location=str(tmp_path), base_url="/static/"
+        )
+        list(storage.post_process({"app.js": (storage, "app.js")}))
+        assert (tmp_path / "app.js.gz").exists()
+
+    def test_dry_run_writes_nothing(self, tmp_path):
+        from django_nepkit.storage import PrecompressedStaticFilesStorage
+
+        (tmp_path / "app.js").write_text(JS)
+        storage = PrecompressedStaticFilesStorage(
+            location=str(tmp_path), base_url="/static/"
+        )
+        list(storage.post_process({}, dry_run=True))
+        assert not (tmp_path / "app.js.gz").exists()
+
+
+class TestPrecompressedStaticMiddleware:
+    """Tests for PrecompressedStaticMiddleware."""
+
+    @pytest.fixture
+    def middleware(self, tmp_path, settings):
+        from django.http import HttpResponse
+
+        from django_nepkit.compression import precompress_file
+        from django_nepkit.middleware import PrecompressedStaticMiddleware
+
+        (tmp_path / "js").mkdir()
+        (tmp_path / "js" / "app.js").write_text(JS)
+        precompress_file(tmp_path / "js" / "app.js")
+        settings.STATIC_URL = "/static/"
+        settings.STATIC_ROOT = str(tmp_path)
+        return PrecompressedStaticMiddleware(lambda request: HttpResponse("fallback"))
+
+    def test_serves_gzip_variant(self, middleware):
+        request = RequestFactory().get("/static/js/app.js", HTTP_ACCEPT_ENCODING="gzip")
+        response = middleware(request)
+        assert response["Content-Encoding"] == "gzip"
+        assert response["Content-Type"].startswith("text/javascript")
+        assert "Accept-Encoding" in response["Vary"]
+        body = b"".join(response.streaming_content)
+        assert gzip.decompress(body) == JS.encode()
+
+    def test_ignores_sibling_older_than_source(self, middleware, tmp_path):
+        import os
+
+        original = tmp_path / "js" / "app.js"
+        stat = original.stat()
+        os.utime(original.with_name("app.js.gz"), (stat.st_atime, stat.st_mtime - 60))
+        request = RequestFactory().get("/static/js/app.js", HTTP_ACCEPT_ENCODING="gzip")
+        assert middleware(request).content == b"fallback"
+
+    def test_passes_through_without_accept_encoding(self, middleware):
+        response = middleware(RequestFactory().get("/static/js/app.js"))
+        assert response.content == b"fallback"
+
+    def test_passes_through_outside_static_url(self, middleware):
+        request = RequestFactory().get("/js/app.js", HTTP_ACCEPT_ENCODING="gzip")
+        assert middleware(request).content == b"fallback"
+
+    def test_rejects_path_traversal(self, middleware):
+        request = RequestFactory().get(
+            "/static/../../etc/passwd", HTTP_ACCEPT_ENCODING="gzip"
+        )
+        assert middleware(request).content == b"fallback"
+
+    def test_async_mode(self, middleware):
+        import asyncio
+
+        from asgiref.sync import iscoroutinefunction
+        from django.http import HttpResponse
+
+        from django_nepkit.middleware import PrecompressedStaticMiddleware
+
+        async def get_response(request):
+            return HttpResponse("fallback")
+
+        async_middleware = PrecompressedStaticMiddleware(get_response)
+        assert iscoroutinefunction(async_middleware)
+        assert not iscoroutinefunction(middleware)
+
+        request = RequestFactory().get("/static/js/app.js", HTTP_ACCEPT_ENCODING="gzip")
+        response = asyncio.run(async_middleware(request))
+        assert response["Content-Encoding"] == "gzip"
+
+        request = RequestFactory().get("/js/app.js", HTTP_ACCEPT_ENCODING="gzip")
+        assert asyncio.run(async_middleware(request)).content == b"fallback"
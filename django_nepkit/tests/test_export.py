@@ -0,0 +1,168 @@
+"""
+Tests for streaming CSV/XLSX export (export.py and the admin actions).
+"""
+
+import csv
+import io
+from decimal import Decimal
+
+import pytest
+from django.contrib.admin.sites import AdminSite
+from django.db import connection, models
+from django.http import FileResponse, StreamingHttpResponse
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from nepali.datetime import nepalidate, nepalidatetime
+
+from django_nepkit import export
+from django_nepkit.admin import NepaliModelAdmin
+from django_nepkit.export import iter_export_rows
+from django_nepkit.models import (
+    NepaliCurrencyField,
+    NepaliDateField,
+    NepaliDateTimeField,
+)
+
+
+class Invoice(models.Model):
+    number = models.IntegerField()
+    issued_on = NepaliDateField(null=True, blank=True)
+    issued_on_ne = NepaliDateField(ne=True, null=True, blank=True)
+    created_at = NepaliDateTimeField(null=True, blank=True)
+    total = NepaliCurrencyField(max_digits=12, decimal_places=2, null=True)
+
+    class Meta:
+        app_label = "django_nepkit"
+
+
+class InvoiceAdmin(NepaliModelAdmin):
+    actions = ["export_as_csv", "export_as_xlsx"]
+    export_fields = ("number", "issued_on", "issued_on_ne", "total")
+
+
+class Superuser:
+    is_active = is_staff = is_superuser = True
+
+    def has_perm(self, perm, obj=None):
+        return True
+
+
+def _request():
+    request = RequestFactory().get("/")
+    request.user = Superuser()
+    return request
+
+
+@pytest.fixture
+def invoices(db):
+    Invoice.objects.create(
+        number=1,
+        issued_on=nepalidate(2081, 1, 15),
+        issued_on_ne=nepalidate(2081, 1, 15),
+        created_at=nepalidatetime(2081, 1, 15, 14, 30),
+        total=Decimal("1234567.5"),
+    )
+    Invoice.objects.create(number=2)
+    return Invoice.objects.order_by("number")
+
+
+class TestIterExportRows:
+    def test_formats_nepali_values(self, invoices):
+        rows = list(iter_export_rows(invoices, ["number", "issued_on", "issued_on_ne"]))
+        assert rows == [
+            ["number", "issued on", "issued on ne"],
+            (1, "2081-01-15", "२०८१-०१-१५"),
+            (2, "", ""),
+        ]
+
+    def test_currency(self, invoices):
+        rows = list(iter_export_rows(invoices, ["total"]))
+        assert rows[1:] == [("12,34,567.50",), ("",)]
+
+    def test_all_fields_by_default(self, invoices):
+        header = next(iter_export_rows(invoices))
+        assert header == [
+            "ID",
+            "number",
+            "issued on",
+            "issued on ne",
+            "created at",
+            "total",
+        ]
+
+    def test_ad_columns(self, invoices):
+        rows = list(iter_export_rows(invoices, ["issued_on", "created_at"], True))
+        assert rows[0] == [
+            "issued on (BS)",
+            "issued on (AD)",
+            "created at (BS)",
+            "created at (AD)",
+        ]
+        assert rows[1] == (
+            "2081-01-15",
+            "2024-04-27",
+            "2081-01-15 14:30:00",
+            "2024-04-27 14:30:00",
+        )
+        assert rows[2] == ("", "", "", "")
+
+    def test_batches_share_one_query(self, invoices, monkeypatch):
+        monkeypatch.setattr(export, "EXPORT_BATCH_SIZE", 1)
+        with CaptureQueriesContext(connection) as queries:
+            rows = list(iter_export_rows(invoices, ["number"]))
+        assert rows == [["number"], (1,), (2,)]
+        assert len(queries) == 1
+
+
+class TestExportActions:
+    def test_csv(self, invoices):
+        model_admin = InvoiceAdmin(Invoice, AdminSite())
+        response = model_admin.export_as_csv(_request(), invoices)
+
+        assert isinstance(response, StreamingHttpResponse)
+        assert response["Content-Disposition"] == 'attachment; filename="invoice.csv"'
+        content = b"".join(response.streaming_content).decode("utf-8")
+        assert content.startswith("\ufeff")
+        rows = list(csv.reader(io.StringIO(content.lstrip("\ufeff"))))
+        assert rows[0] == ["number", "issued on", "issued on ne", "total"]
+        assert rows[1] == ["1", "2081-01-15", "२०८१-०१-१५", "12,34,567.50"]
+
+    def test_xlsx(self, invoices):
+        openpyxl = pytest.importorskip("openpyxl")
+        model_admin = InvoiceAdmin(Invoice, AdminSite())
+        response = model_admin.export_as_xlsx(_request(), invoices)
+
+        assert isinstance(response, FileResponse)
+        content = b"".join(response.streaming_content)
+        sheet = openpyxl.load_workbook(io.BytesIO(content)).active
+        rows = list(sheet.iter_rows(values_only=True))
+        assert rows[0] == ("number", "issued on", "issued on ne", "total")
+        assert rows[1] == (1, "2081-01-15", "२०८१-०१-१५", "12,34,567.50")
+
+    def test_default_columns_follow_admin_fields(self, invoices):
+        class RestrictedAdmin(NepaliModelAdmin):
+            exclude = ("total", "created_at")
+
+        model_admin = RestrictedAdmin(Invoice, AdminSite())
+        rows = list(model_admin.get_export_rows(_request(), invoices))
+        assert rows[0] == ["number", "issued on", "issued on ne"]
+
+    def test_actions_are_opt_in(self):
+        model_admin = NepaliModelAdmin(Invoice, AdminSite())
+        actions = model_admin.get_actions(_request())
+        assert "export_as_csv" not in actions
+        assert "export_as_xlsx" not in actions
+
+    def test_actions(self, monkeypatch):
+        model_admin = InvoiceAdmin(Invoice, AdminSite())
+        actions = model_admin.get_actions(_request())
+        assert "export_as_csv" in actions
+        if export.openpyxl is None:
+            assert "export_as_xlsx" not in actions
+        else:
+            assert "export_as_xlsx" in actions
+
+        monkeypatch.setattr(export, "openpyxl", None)
+        actions = model_admin.get_actions(_request())
+        assert "export_as_csv" in actions
+        assert "export_as_xlsx" not in actions
@@ -0,0 +1,67 @@
+"""
+Tests for database expressions (expressions.py).
+"""
+
+import pytest
+from django.db import models
+
+from django_nepkit.expressions import LocationTranslation
+from django_nepkit.models import DistrictField, MunicipalityField, ProvinceField
+
+
+class Office(models.Model):
+    name = models.CharField(max_length=50)
+    province = ProvinceField(blank=True)
+    district = DistrictField(code=True, null=True, blank=True)
+    municipality = MunicipalityField(ne=True, blank=True)
+
+    class Meta:
+        app_label = "django_nepkit"
+
+
+@pytest.mark.django_db
+class TestLocationTranslation:
+    @pytest.fixture(autouse=True)
+    def offices(self):
+        Office.objects.create(
+            name="Head office",
+            province="Bagmati Province",
+            district="Kathmandu",
+            municipality="काठमाडौं महानगरपालिका",
+        )
+        Office.objects.create(name="Unassigned")
+
+    def _values(self, **annotations):
+        return list(
+            Office.objects.order_by("name")
+            .annotate(**annotations)
+            .values_list(*annotations)
+        )
+
+    def test_english_names_to_nepali(self):
+        assert self._values(province_ne=LocationTranslation("province")) == [
+            ("बागमती प्रदेश",),
+            (None,),
+        ]
+
+    def test_nepali_names_to_english(self):
+        assert self._values(municipality_en=LocationTranslation("municipality")) == [
+            ("Kathmandu Metropolitan City",),
+            (None,),
+        ]
+
+    def test_codes_in_either_language(self):
+        assert self._values(
+            ne=LocationTranslation("district"),
+            en=LocationTranslation("district", ne=False),
+        ) == [("काठमाडौं", "Kathmandu"), (None, None)]
+
+    def test_same_language_returns_column(self):
+        assert self._values(province_en=LocationTranslation("province", ne=False)) == [
+            ("Bagmati Province",),
+            ("",),
+        ]
+
+    def test_non_location_field(self):
+        with pytest.raises(ValueError, match="'name' is not"):
+            Office.objects.annotate(x=LocationTranslation("name"))
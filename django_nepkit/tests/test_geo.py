@@ -0,0 +1,153 @@
+"""
+Tests for offline reverse geocoding (geo.py) and its utils/view wrappers.
+"""
+
+import json
+
+import pytest
+from django.test import RequestFactory
+
+from django_nepkit.geo import GeoIndex, haversine_km
+
+SAMPLE_CSV = """level,name,parent,lat,lon,south,west,north,east
+province,Gandaki Province,,28.40,84.00,27.40,82.90,29.30,85.20
+province,Bagmati Province,,27.70,85.50,26.90,84.20,28.40,86.60
+district,Kaski,,28.30,83.95,28.05,83.65,28.70,84.20
+district,Kathmandu,,27.71,85.32,27.60,85.18,27.82,85.53
+municipality,Pokhara Metropolitan City,Kaski,28.21,83.99,28.09,83.83,28.37,84.12
+municipality,काठमाडौं महानगरपालिका,Kathmandu,27.71,85.32,27.66,85.27,27.75,85.37
+municipality,Kirtipur Municipality,Kathmandu,27.67,85.28,27.64,85.25,27.69,85.30
+municipality,Unknown Place,Kathmandu,27.00,85.00,26.90,84.90,27.10,85.10
+"""
+
+
+@pytest.fixture
+def geo_index(tmp_path):
+    path = tmp_path / "geo.csv"
+    path.write_text(SAMPLE_CSV, encoding="utf-8")
+    return GeoIndex.from_csv(path)
+
+
+@pytest.fixture
+def configured_index(geo_index, monkeypatch):
+    monkeypatch.setattr("django_nepkit.geo.get_geo_index", lambda: geo_index)
+    return geo_index
+
+
+class TestGeoIndex:
+    """Tests for the grid spatial index."""
+
+    def test_skips_unknown_locations(self, geo_index):
+        assert len(geo_index.entries["municipality"]) == 3
+
+    def test_locate_point_in_bbox(self, geo_index):
+        entry = geo_index.locate(28.2, 83.98)
+        assert entry.location.name == "Pokhara Metropolitan City"
+
+    def test_locate_prefers_closest_centroid_on_overlap(self, geo_index):
+        # Inside both Kathmandu and Kirtipur boxes, closer to Kirtipur.
+        entry = geo_index.locate(27.675, 85.28)
+        assert entry.location.name == "Kirtipur Municipality"
+
+    def test_locate_outside_returns_none(self, geo_index):
+        assert geo_index.locate(0, 0) is None
+
+    def test_nearest_orders_by_distance(self, geo_index):
+        results = geo_index.nearest(27.70, 85.31, n=2)
+        names = [entry.location.name for entry, _ in results]
+        assert names == ["Kathmandu Metropolitan City", "Kirtipur Municipality"]
+        assert results[0][1] < results[1][1]
+
+    def test_nearest_from_far_away_finds_all(self, geo_index):
+        assert len(geo_index.nearest(20.0, 80.0, n=10)) == 3
+
+    def test_within_radius(self, geo_index):
+        results = geo_index.within_radius(27.71, 85.32, 10)
+        names = {entry.location.name for entry, _ in results}
+        assert names == {"Kathmandu Metropolitan City", "Kirtipur Municipality"}
+
+    def test_within_huge_radius_only_scans_the_data(self, geo_index):
+        assert len(geo_index.within_radius(27.71, 85.32, 2e5)) == 3
+        assert len(geo_index.within_radius(27.71, 85.32, float("inf"))) == 3
+        assert geo_index.within_radius(27.71, 85.32, float("nan")) == []
+
+    def test_haversine(self):
+        # Kathmandu to Pokhara is roughly 140 km as the crow flies.
+        assert 130 < haversine_km(27.71, 85.32, 28.21, 83.99) < 150
+
+
+class TestGeoUtils:
+    """Tests for the geocoding helpers exposed in utils.py."""
+
+    def test_reverse_geocode(self, configured_index):
+        from django_nepkit.utils import reverse_geocode
+
+        assert reverse_geocode(28.2, 83.98) == {
+            "province": "Gandaki Province",
+            "district": "Kaski",
+            "municipality": "Pokhara Metropolitan City",
+        }
+
+    def test_reverse_geocode_nepali(self, configured_index):
+        from django_nepkit.utils import reverse_geocode
+
+        result = reverse_geocode(28.2, 83.98, ne=True)
+        assert result["district"] == "कास्की"
+
+    def test_reverse_geocode_without_dataset(self, monkeypatch):
+        from django_nepkit.utils import reverse_geocode
+
+        monkeypatch.setattr("django_nepkit.geo.get_geo_index", lambda: None)
+        assert reverse_geocode(28.2, 83.98)["municipality"] is None
+
+    def test_get_location_centroid(self, configured_index):
+        from django_nepkit.utils import get_location_centroid
+
+        result = get_location_centroid("district", "Kaski")
+        assert result["lat"] == 28.30
+        assert result["bbox"] == [28.05, 83.65, 28.70, 84.20]
+
+    def test_nearest_locations(self, configured_index):
+        from django_nepkit.utils import nearest_locations
+
+        result = nearest_locations(28.2, 83.98, n=1)
+        assert result[0]["name"] == "Pokhara Metropolitan City"
+        assert "distance_km" in result[0]
+
+
+class TestReverseGeocodeView:
+    """Tests for reverse_geocode_view."""
+
+    def test_returns_hierarchy(self, configured_index):
+        from django_nepkit.views import reverse_geocode_view
+
+        request = RequestFactory().get("/", {"lat": "27.71", "lon": "85.32"})
+        response = reverse_geocode_view(request)
+        data = json.loads(response.content)
+        assert data["municipality"] == "Kathmandu Metropolitan City"
+        assert data["province"] == "Bagmati Province"
+
+    def test_nearest_and_radius(self, configured_index):
+        from django_nepkit.views import reverse_geocode_view
+
+        request = RequestFactory().get(
+            "/", {"lat": "27.71", "lon": "85.32", "nearest": "2", "radius": "10"}
+        )
+        data = json.loads(reverse_geocode_view(request).content)
+        assert len(data["nearest"]) == 2
+        assert len(data["within_radius"]) == 2
+
+    @pytest.mark.parametrize("radius", ["inf", "nan", "501"])
+    def test_rejects_unbounded_radius(self, configured_index, radius):
+        from django_nepkit.views import reverse_geocode_view
+
+        request = RequestFactory().get(
+            "/", {"lat": "27.71", "lon": "85.32", "radius": radius}
+        )
+        assert reverse_geocode_view(request).status_code == 400
+
+    def test_invalid_coordinates(self, configured_index):
+        from django_nepkit.views import reverse_geocode_view
+
+        request = RequestFactory().get("/", {"lat": "abc", "lon": "85.32"})
+        assert reverse_geocode_view(request).status_code == 400
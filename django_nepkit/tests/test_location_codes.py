@@ -0,0 +1,335 @@
+"""
+Tests for code-backed location storage (code=True), its lookups and the
+ConvertLocationNamesToCodes migration operation.
+"""
+
+import json
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured, ValidationError
+from django.db import connection, models
+from django.db.migrations.state import ModelState, ProjectState
+
+from django_nepkit.models import DistrictField, MunicipalityField, ProvinceField
+from django_nepkit.operations import ConvertLocationNamesToCodes
+from django_nepkit import registry as registry_module
+from django_nepkit.registry import LocationRegistry, registry
+
+
+class CodedAddress(models.Model):
+    province = ProvinceField(code=True, null=True, blank=True)
+    district = DistrictField(code=True, null=True, blank=True)
+    municipality = MunicipalityField(code=True, ne=True, null=True, blank=True)
+
+    class Meta:
+        app_label = "django_nepkit"
+
+
+class CodedOffice(models.Model):
+    district = DistrictField(code=True, null=True, blank=True)
+    municipality = MunicipalityField(
+        code=True, parent_field="district", null=True, blank=True
+    )
+
+    class Meta:
+        app_label = "django_nepkit"
+
+
+class TestRegistryCodes:
+    """Tests for the registry code tables."""
+
+    def test_province_codes_are_official_numbers(self):
+        assert registry.code(registry.get("province", "Koshi Province")) == 1
+        assert registry.code(registry.get("province", "Sudurpaschim Province")) == 7
+
+    def test_codes_are_unique_per_level(self):
+        for level, source in registry.sources.items():
+            codes = {registry.code(item) for item in source}
+            assert len(codes) == len(source)
+            assert max(codes) < 32768
+
+    def test_round_trip(self):
+        kaski = registry.get("district", "Kaski")
+        assert registry.get_by_code("district", registry.code(kaski)) is kaski
+
+    def test_codes_come_from_frozen_table(self):
+        with open(registry_module.LOCATION_CODES_PATH, encoding="utf-8") as f:
+            table = json.load(f)
+        kaski = registry.get("district", "Kaski")
+        assert registry.code(kaski) == table["district"]["Kaski"]
+        godawari = registry.get("municipality", "Godawari Municipality", "Lalitpur")
+        assert (
+            registry.code(godawari)
+            == table["municipality"]["Lalitpur"]["Godawari Municipality"]
+        )
+
+    def test_missing_code_fails_loudly(self, tmp_path, monkeypatch):
+        path = tmp_path / "codes.json"
+        path.write_text(json.dumps({"district": {}, "municipality": {}}))
+        monkeypatch.setattr(registry_module, "LOCATION_CODES_PATH", path)
+        with pytest.raises(ImproperlyConfigured, match="No storage code"):
+            LocationRegistry().code(registry.get("district", "Kaski"))
+
+    def test_get_within(self):
+        name = "Godawari Municipality"
+        assert len(registry.get_all("municipality", name)) == 2
+        (lalitpur,) = registry.get_within("municipality", name, "district", "Lalitpur")
+        assert lalitpur.district.name == "Lalitpur"
+        code = registry.code(registry.get("district", "Kailali"))
+        (kailali,) = registry.get_within("municipality", name, "district", code)
+        assert kailali.district.name == "Kailali"
+        assert registry.get_within("municipality", name, "district", "Kaski") == []
+
+    def test_codes_matching_contains(self):
+        codes = registry.codes_matching("municipality", "icontains", "pokhara")
+        names = {registry.get_by_code("municipality", code).name for code in codes}
+        assert names == {"Pokhara Metropolitan City"}
+
+
+class TestCodeFieldConversion:
+    """Tests for value conversion on code-backed fields."""
+
+    def test_internal_type(self):
+        assert DistrictField(code=True).get_internal_type() == "SmallIntegerField"
+        assert DistrictField().get_internal_type() == "CharField"
+
+    def test_prep_value_accepts_both_languages(self):
+        field = DistrictField(code=True)
+        code = registry.code(registry.get("district", "Kaski"))
+        assert field.get_prep_value("Kaski") == code
+        assert field.get_prep_value("कास्की") == code
+        assert field.get_prep_value(None) is None
+
+    def test_prep_value_rejects_unknown_name(self):
+        field = DistrictField(code=True)
+        field.name = "district"
+        with pytest.raises(ValueError):
+            field.get_prep_value("Atlantis")
+
+    def test_prep_value_rejects_ambiguous_name(self):
+        field = MunicipalityField(code=True)
+        field.name = "municipality"
+        with pytest.raises(ValueError, match="Ambiguous"):
+            field.get_prep_value("Godawari Municipality")
+
+    def test_converts_code_to_field_language(self):
+        code = registry.code(registry.get("district", "Kaski"))
+        assert DistrictField(code=True).to_python(code) == "Kaski"
+        assert DistrictField(code=True, ne=True).to_python(code) == "कास्की"
+
+    def test_deconstruct(self):
+        _name, _path, _args, kwargs = DistrictField(code=True).deconstruct()
+        assert kwargs["code"] is True
+
+
+@pytest.mark.django_db
+class TestCodeFieldQueries:
+    """Tests for storing and querying code-backed fields."""
+
+    @pytest.fixture
+    def address(self):
+        return CodedAddress.objects.create(
+            province="Gandaki Province",
+            district="कास्की",
+            municipality="Pokhara Metropolitan City",
+        )
+
+    def test_stores_integer_codes(self, address):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT district FROM {CodedAddress._meta.db_table} WHERE id = %s",
+                [address.pk],
+            )
+            assert cursor.fetchone()[0] == registry.code(
+                registry.get("district", "Kaski")
+            )
+
+    def test_reads_back_names(self, address):
+        address = CodedAddress.objects.get(pk=address.pk)
+        assert address.province == "Gandaki Province"
+        assert address.district == "Kaski"
+        assert address.municipality == "पोखरा महानगरपालिका"
+
+    def test_exact_and_in_accept_names(self, address):
+        assert CodedAddress.objects.filter(district="Kaski").exists()
+        assert CodedAddress.objects.filter(district="कास्की").exists()
+        assert CodedAddress.objects.filter(district__in=["Kaski", "Lamjung"]).exists()
+        assert not CodedAddress.objects.filter(district="Lamjung").exists()
+        assert not CodedAddress.objects.filter(district="Atlantis").exists()
+
+    def test_partial_name_lookups(self, address):
+        assert CodedAddress.objects.filter(municipality__icontains="pokhara").exists()
+        assert CodedAddress.objects.filter(province__startswith="Gandaki").exists()
+        assert CodedAddress.objects.exclude(district__icontains="atlantis").exists()
+
+
+@pytest.mark.django_db
+class TestAmbiguousNames:
+    """Tests for municipality names shared by more than one district."""
+
+    name = "Godawari Municipality"
+
+    def _stored_code(self, office):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT municipality FROM {CodedOffice._meta.db_table} WHERE id = %s",
+                [office.pk],
+            )
+            return cursor.fetchone()[0]
+
+    def test_parent_field_picks_the_code(self):
+        for district in ("Lalitpur", "Kailali"):
+            office = CodedOffice.objects.create(
+                district=district, municipality=self.name
+            )
+            location = registry.get("municipality", self.name, district)
+            assert self._stored_code(office) == registry.code(location)
+            assert CodedOffice.objects.filter(
+                pk=office.pk, municipality=self.name
+            ).exists()
+
+    def test_loaded_instance_saves_back_losslessly(self):
+        kailali = registry.get("municipality", self.name, "Kailali")
+        address = CodedAddress.objects.create(municipality=registry.code(kailali))
+        address = CodedAddress.objects.get(pk=address.pk)
+        assert address.municipality == kailali.name_nepali
+        address.full_clean()
+        address.save()
+        assert CodedAddress.objects.filter(
+            pk=address.pk, municipality=registry.code(kailali)
+        ).exists()
+
+    def test_missing_parent_is_rejected(self):
+        office = CodedOffice(municipality=self.name)
+        with pytest.raises(ValidationError) as excinfo:
+            office.full_clean()
+        assert excinfo.value.error_dict["municipality"][0].code == "ambiguous"
+        with pytest.raises(ValueError, match="Ambiguous"):
+            office.save()
+
+    def test_wrong_parent_reports_invalid_parent(self):
+        office = CodedOffice(district="Kaski", municipality=self.name)
+        with pytest.raises(ValidationError) as excinfo:
+            office.full_clean()
+        assert excinfo.value.error_dict["municipality"][0].code == "invalid_parent"
+
+
+@pytest.mark.django_db(transaction=True)
+class TestConvertLocationNamesToCodes:
+    """Tests for the ConvertLocationNamesToCodes migration operation."""
+
+    def _state(self, field):
+        state = ProjectState()
+        state.add_model(
+            ModelState(
+                "nepkit_ops",
+                "Place",
+                [("id", models.AutoField(primary_key=True)), ("district", field)],
+            )
+        )
+        return state
+
+    def test_forwards_and_backwards(self):
+        from_state = self._state(DistrictField(null=True, blank=True))
+        operation = ConvertLocationNamesToCodes(
+            "place", "district", DistrictField(code=True, null=True, blank=True)
+        )
+        to_state = from_state.clone()
+        operation.state_forwards("nepkit_ops", to_state)
+
+        Place = from_state.apps.get_model("nepkit_ops", "Place")
+        with connection.schema_editor() as editor:
+            editor.create_model(Place)
+        try:
+            Place.objects.create(district="Kaski")
+            Place.objects.create(district="कास्की")
+            Place.objects.create(district="")
+
+            with connection.schema_editor() as editor:
+                operation.database_forwards("nepkit_ops", editor, from_state, to_state)
+
+            Coded = to_state.apps.get_model("nepkit_ops", "Place")
+            assert list(
+                Coded.objects.order_by("id").values_list("district", flat=True)
+            ) == ["Kaski", "Kaski", None]
+
+            with connection.schema_editor() as editor:
+                operation.database_backwards("nepkit_ops", editor, to_state, from_state)
+
+            values = set(Place.objects.values_list("district", flat=True))
+            assert values == {"Kaski", None}
+        finally:
+            with connection.schema_editor() as editor:
+                editor.delete_model(Place)
+
+    def test_unknown_values_abort(self):
+        from_state = self._state(DistrictField(blank=True))
+        operation = ConvertLocationNamesToCodes(
+            "place", "district", DistrictField(code=True, null=True)
+        )
+        to_state = from_state.clone()
+        operation.state_forwards("nepkit_ops", to_state)
+
+        Place = from_state.apps.get_model("nepkit_ops", "Place")
+        with connection.schema_editor() as editor:
+            editor.create_model(Place)
+        try:
+            Place.objects.create(district="Atlantis")
+            with pytest.raises(ValueError, match="Atlantis"):
+                with connection.schema_editor() as editor:
+                    operation.database_forwards(
+                        "nepkit_ops", editor, from_state, to_state
+                    )
+        finally:
+            with connection.schema_editor() as editor:
+                editor.delete_model(Place)
+
+    def test_ambiguous_names_resolved_by_parent(self):
+        name = "Godawari Municipality"
+        from_state = ProjectState()
+        from_state.add_model(
+            ModelState(
+                "nepkit_ops",
+                "Office",
+                [
+                    ("id", models.AutoField(primary_key=True)),
+                    ("district", DistrictField(null=True, blank=True)),
+                    ("municipality", MunicipalityField(null=True, blank=True)),
+                ],
+            )
+        )
+        operation = ConvertLocationNamesToCodes(
+            "office",
+            "municipality",
+            MunicipalityField(code=True, parent_field="district", null=True),
+        )
+        to_state = from_state.clone()
+        operation.state_forwards("nepkit_ops", to_state)
+
+        Office = from_state.apps.get_model("nepkit_ops", "Office")
+        with connection.schema_editor() as editor:
+            editor.create_model(Office)
+        try:
+            Office.objects.create(district="Lalitpur", municipality=name)
+            Office.objects.create(district="Kailali", municipality=name)
+            orphan = Office.objects.create(district=None, municipality=name)
+            with pytest.raises(ValueError, match="ambiguous"):
+                with connection.schema_editor() as editor:
+                    operation.database_forwards(
+                        "nepkit_ops", editor, from_state, to_state
+                    )
+
+            orphan.delete()
+            with connection.schema_editor() as editor:
+                operation.database_forwards("nepkit_ops", editor, from_state, to_state)
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"SELECT district, municipality FROM {Office._meta.db_table}"
+                )
+                stored = dict(cursor.fetchall())
+            for district in ("Lalitpur", "Kailali"):
+                location = registry.get("municipality", name, district)
+                assert int(stored[district]) == registry.code(location)
+        finally:
+            with connection.schema_editor() as editor:
+                editor.delete_model(Office)
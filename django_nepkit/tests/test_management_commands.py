@@ -0,0 +1,213 @@
+"""
+Tests for django-nepkit management commands.
+"""
+
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import models
+
+from django_nepkit.models import DistrictField, MunicipalityField, ProvinceField
+
+
+class RawAddress(models.Model):
+    address = models.CharField(max_length=255, blank=True)
+    province = ProvinceField(blank=True)
+    district = DistrictField(blank=True)
+    municipality_ne = MunicipalityField(ne=True, blank=True)
+
+    class Meta:
+        app_label = "django_nepkit"
+
+
+class CodedRawAddress(models.Model):
+    address = models.CharField(max_length=255, blank=True)
+    district = DistrictField(code=True, null=True, blank=True)
+    municipality = MunicipalityField(code=True, null=True, blank=True)
+
+    class Meta:
+        app_label = "django_nepkit"
+
+
+def _run(*args, **kwargs):
+    out = StringIO()
+    call_command(
+        "nepkit_normalize_addresses",
+        "django_nepkit.RawAddress",
+        "address",
+        *args,
+        stdout=out,
+        **kwargs,
+    )
+    return out.getvalue()
+
+
+@pytest.mark.django_db
+class TestNormalizeAddressesCommand:
+    """Tests for nepkit_normalize_addresses."""
+
+    @pytest.fixture
+    def rows(self):
+        return RawAddress.objects.bulk_create(
+            [
+                RawAddress(address="Pokhara, Kaski"),
+                RawAddress(address="विराटनगर, मोरङ"),
+                RawAddress(address="Somewhere unknown"),
+            ]
+        )
+
+    def test_fills_structured_columns(self, rows):
+        _run(province="province", district="district", municipality="municipality_ne")
+
+        pokhara = RawAddress.objects.get(pk=rows[0].pk)
+        assert pokhara.province == "Gandaki Province"
+        assert pokhara.district == "Kaski"
+        assert pokhara.municipality_ne == "पोखरा महानगरपालिका"
+
+        # Values follow each target field's language, not the input script.
+        biratnagar = RawAddress.objects.get(pk=rows[1].pk)
+        assert biratnagar.province == "Koshi Province"
+        assert biratnagar.district == "Morang"
+
+        unknown = RawAddress.objects.get(pk=rows[2].pk)
+        assert unknown.province == ""
+
+    def test_code_columns_get_the_resolved_code(self):
+        from django_nepkit.registry import registry
+
+        name = "Godawari Municipality"
+        rows = CodedRawAddress.objects.bulk_create(
+            [
+                CodedRawAddress(address=f"{name}, Lalitpur"),
+                CodedRawAddress(address=f"{name}, Kailali"),
+            ]
+        )
+        call_command(
+            "nepkit_normalize_addresses",
+            "django_nepkit.CodedRawAddress",
+            "address",
+            district="district",
+            municipality="municipality",
+            stdout=StringIO(),
+        )
+        for row, district in zip(rows, ("Lalitpur", "Kailali")):
+            stored = CodedRawAddress.objects.filter(pk=row.pk).values_list(
+                "municipality", flat=True
+            )
+            location = registry.get("municipality", name, district)
+            assert stored[0].code == registry.code(location)
+
+    def test_dry_run_reports_without_writing(self, rows):
+        output = _run("--dry-run", province="province")
+        assert "Would update 2 of 3 rows" in output
+        assert "1 unresolved" in output
+        assert not RawAddress.objects.exclude(province="").exists()
+
+    def test_resume_from_primary_key(self, rows):
+        _run(province="province", resume_from=rows[0].pk)
+        assert RawAddress.objects.get(pk=rows[0].pk).province == ""
+        assert RawAddress.objects.get(pk=rows[1].pk).province == "Koshi Province"
+
+    def test_existing_values_kept_without_overwrite(self, rows):
+        RawAddress.objects.filter(pk=rows[0].pk).update(province="Bagmati Province")
+        _run(province="province", batch_size=1)
+        assert RawAddress.objects.get(pk=rows[0].pk).province == "Bagmati Province"
+
+        _run("--overwrite", province="province")
+        assert RawAddress.objects.get(pk=rows[0].pk).province == "Gandaki Province"
+
+    def test_multiprocessing_workers(self, rows):
+        _run(province="province", district="district", workers=2, batch_size=1)
+        assert RawAddress.objects.get(pk=rows[0].pk).district == "Kaski"
+        assert RawAddress.objects.get(pk=rows[1].pk).district == "Morang"
+
+    def test_requires_a_target(self):
+        with pytest.raises(CommandError):
+            _run()
+
+    def test_rejects_unknown_field(self):
+        with pytest.raises(CommandError):
+            _run(province="missing")
+
+    def test_rejects_wrong_target_type(self):
+        with pytest.raises(CommandError):
+            _run(province="district")
+
+
+class TestBuildLocationDataCommand:
+    """Tests for nepkit_build_location_data."""
+
+    def _run(self, tmp_path, *args):
+        out = StringIO()
+        call_command(
+            "nepkit_build_location_data",
+            "--output-dir",
+            str(tmp_path),
+            *args,
+            stdout=out,
+        )
+        return json.loads((tmp_path / "manifest.json").read_text(encoding="utf-8"))
+
+    def test_writes_hashed_language_files(self, tmp_path):
+        manifest = self._run(tmp_path)
+        assert set(manifest["files"]) == {"en", "ne"}
+        english = tmp_path / manifest["files"]["en"].rsplit("/", 1)[1]
+        content = english.read_text(encoding="utf-8")
+        assert "Pokhara Metropolitan City" in content
+        assert "पोखरा" not in content
+
+    def test_output_is_reproducible(self, tmp_path):
+        assert self._run(tmp_path) == self._run(tmp_path)
+
+    def test_chunks_split_municipalities(self, tmp_path):
+        manifest = self._run(tmp_path, "--chunks")
+        assert len(manifest["chunks"]["en"]) == 7
+        assert "गण्डकी प्रदेश" in manifest["chunks"]["ne"]
+        base = tmp_path / manifest["files"]["en"].rsplit("/", 1)[1]
+        assert "Pokhara Metropolitan City" not in base.read_text(encoding="utf-8")
+
+    def test_removes_stale_files(self, tmp_path):
+        def precompress():
+            for path in tmp_path.glob("nepal-data.*.js"):
+                path.with_name(path.name + ".gz").write_bytes(b"")
+
+        self._run(tmp_path, "--chunks")
+        precompress()
+        manifest = self._run(tmp_path)
+        current = {name.rsplit("/", 1)[1] for name in manifest["files"].values()}
+        assert {path.name for path in tmp_path.glob("nepal-data.*")} == current
+
+        # Siblings of files that are still current are kept.
+        precompress()
+        self._run(tmp_path)
+        remaining = {path.name for path in tmp_path.glob("nepal-data.*")}
+        assert remaining == current | {name + ".gz" for name in current}
+
+
+class TestPrecompressStaticCommand:
+    """Tests for nepkit_precompress_static."""
+
+    def test_compresses_directory(self, tmp_path):
+        (tmp_path / "app.js").write_text("var x = 1;\n" * 100)
+        out = StringIO()
+        call_command("nepkit_precompress_static", str(tmp_path), stdout=out)
+        assert (tmp_path / "app.js.gz").exists()
+        assert "Wrote 1 precompressed files" in out.getvalue()
+
+    def test_rejects_missing_directory(self, tmp_path):
+        with pytest.raises(CommandError):
+            call_command("nepkit_precompress_static", str(tmp_path / "missing"))
+
+    def test_defaults_to_static_root(self, tmp_path, settings):
+        (tmp_path / "app.js").write_text("var x = 1;\n" * 100)
+        settings.STATIC_ROOT = str(tmp_path)
+        call_command("nepkit_precompress_static", stdout=StringIO())
+        assert (tmp_path / "app.js.gz").exists()
+
+    def test_requires_static_root_without_paths(self, settings):
+        settings.STATIC_ROOT = None
+        with pytest.raises(CommandError, match="STATIC_ROOT"):
+            call_command("nepkit_precompress_static")
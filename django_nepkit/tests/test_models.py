@@ -3,10 +3,13 @@ Tests for django-nepkit model fields.
 """
 
 import pytest
-from django.core.exceptions import ValidationError
+from django.core.exceptions import ImproperlyConfigured, ValidationError
+from django.db import IntegrityError, models, transaction
+from django.db.migrations.state import ModelState
 from nepali.datetime import nepalidate, nepalidatetime
 
 from django_nepkit.models import (
+    _bs_format_pattern,
     NepaliDateField,
     NepaliDateTimeField,
     NepaliPhoneNumberField,
@@ -16,6 +19,28 @@ from django_nepkit.models import (
 )
 
 
+class HierarchicalAddress(models.Model):
+    province = ProvinceField(blank=True)
+    district = DistrictField(blank=True, parent_field="province")
+    municipality = MunicipalityField(blank=True, parent_field="district")
+
+    class Meta:
+        app_label = "django_nepkit"
+
+
+class ConstrainedRecord(models.Model):
+    phone = NepaliPhoneNumberField(blank=True, db_constraints=True)
+    born_on = NepaliDateField(db_constraints=True)
+    recorded_at = NepaliDateTimeField(null=True, db_constraints=True)
+    district = DistrictField(db_constraints=True)
+    municipality = MunicipalityField(
+        code=True, null=True, blank=True, db_constraints=True
+    )
+
+    class Meta:
+        app_label = "django_nepkit"
+
+
 class TestNepaliDateField:
     """Tests for NepaliDateField."""
 
@@ -160,3 +185,179 @@ class TestLocationFields:
         field = DistrictField(htmx=True)
 
         assert field.htmx is True
+
+    def test_choices_shared_between_fields(self):
+        """Fields of the same level and language share one choices object."""
+        assert MunicipalityField().choices is MunicipalityField().choices
+        assert MunicipalityField().choices is not MunicipalityField(ne=True).choices
+
+    def test_default_choices_not_deconstructed(self):
+        """Registry choices are kept out of migrations."""
+        _name, _path, _args, kwargs = MunicipalityField(ne=True).deconstruct()
+        assert "choices" not in kwargs
+
+        _name, _path, _args, kwargs = MunicipalityField(
+            choices=[("Kathmandu", "Kathmandu")]
+        ).deconstruct()
+        assert kwargs["choices"] == [("Kathmandu", "Kathmandu")]
+
+    def test_formfield_uses_shared_choices(self):
+        """Form fields still list every location plus the blank choice."""
+        formfield = DistrictField().formfield()
+        assert len(list(formfield.choices)) == len(DistrictField().choices) + 1
+
+
+class TestLocationValidation:
+    """Tests for set-based location validation and parent consistency."""
+
+    def test_accepts_known_name(self):
+        DistrictField().validate("Kaski", None)
+
+    def test_rejects_unknown_name(self):
+        with pytest.raises(ValidationError) as exc:
+            DistrictField().validate("Atlantis", None)
+        assert exc.value.code == "invalid_choice"
+
+    def test_rejects_other_language(self):
+        with pytest.raises(ValidationError):
+            DistrictField().validate("कास्की", None)
+        DistrictField(ne=True).validate("कास्की", None)
+
+    def test_code_field_accepts_both_languages(self):
+        DistrictField(code=True).validate("कास्की", None)
+
+    def test_blank_and_null(self):
+        with pytest.raises(ValidationError):
+            DistrictField().validate("", None)
+        DistrictField(blank=True).validate("", None)
+
+    def test_custom_choices_use_default_validation(self):
+        field = DistrictField(choices=[("Kaski", "Kaski")])
+        with pytest.raises(ValidationError):
+            field.validate("Lamjung", None)
+
+    def test_parent_consistency(self):
+        address = HierarchicalAddress(
+            province="Gandaki Province",
+            district="Kaski",
+            municipality="Pokhara Metropolitan City",
+        )
+        address.clean_fields()
+
+        address.district = "Kathmandu"
+        with pytest.raises(ValidationError) as exc:
+            address.clean_fields()
+        assert set(exc.value.message_dict) == {"district", "municipality"}
+
+    def test_parent_level_is_not_mixed(self):
+        """A province name is not accepted as a municipality's district."""
+        address = HierarchicalAddress(
+            province="Gandaki Province",
+            district="Gandaki Province",
+            municipality="Pokhara Metropolitan City",
+        )
+        with pytest.raises(ValidationError) as exc:
+            address.clean_fields()
+        assert exc.value.error_dict["municipality"][0].code == "invalid_parent"
+
+    def test_parent_field_check(self):
+        field = HierarchicalAddress._meta.get_field("district")
+        assert field.check() == []
+
+        field = DistrictField(parent_field="missing")
+        field.set_attributes_from_name("district")
+        field.model = HierarchicalAddress
+        assert field.check()[0].id == "django_nepkit.E001"
+
+        field = DistrictField(parent_field="municipality")
+        field.set_attributes_from_name("district")
+        field.model = HierarchicalAddress
+        assert field.check()[0].id == "django_nepkit.E004"
+
+        field = DistrictField(parent_field="district")
+        field.set_attributes_from_name("other_district")
+        field.model = HierarchicalAddress
+        assert field.check()[0].id == "django_nepkit.E004"
+
+
+class TestDbConstraints:
+    """Tests for the CHECK constraints added by db_constraints=True."""
+
+    def _record(self, **kwargs):
+        values = {
+            "phone": "9841234567",
+            "born_on": "2050-01-15",
+            "recorded_at": "2081-04-01 10:30:00",
+            "district": "Kaski",
+            "municipality": "Pokhara Metropolitan City",
+        }
+        values.update(kwargs)
+        return ConstrainedRecord(**values)
+
+    def test_constraints_are_added_to_meta(self):
+        names = {c.name for c in ConstrainedRecord._meta.constraints}
+        assert names == {
+            f"django_nepkit_constrainedrecord_{name}_valid"
+            for name in ("phone", "born_on", "recorded_at", "district", "municipality")
+        }
+        assert HierarchicalAddress._meta.constraints == []
+
+    def test_deconstruct(self):
+        field = ConstrainedRecord._meta.get_field("district")
+        assert field.deconstruct()[3]["db_constraints"] is True
+        assert "db_constraints" not in DistrictField().deconstruct()[3]
+
+    def test_fields_must_define_the_condition(self):
+        from django_nepkit.models import CheckConstraintMixin
+
+        class CodeField(CheckConstraintMixin, models.CharField):
+            pass
+
+        field = CodeField(max_length=5, db_constraints=True)
+        field.set_attributes_from_name("code")
+        with pytest.raises(ImproperlyConfigured, match="CodeField 'code'"):
+            field.get_check_condition()
+
+    def test_migration_state(self):
+        state = ModelState.from_model(ConstrainedRecord)
+        assert len(state.options["constraints"]) == 5
+        # Rendering the state does not add the constraints a second time.
+        rendered = state.render(ConstrainedRecord._meta.apps.__class__([]))
+        assert len(rendered._meta.constraints) == 5
+
+    def test_bs_format_pattern(self):
+        pattern = _bs_format_pattern("%Y-%m-%d")
+        assert pattern == "^[0-9]{4}-(0[1-9]|1[0-2])-(0[1-9]|[12][0-9]|3[0-2])$"
+        assert _bs_format_pattern("%Y.%m") == "^[0-9]{4}\\.(0[1-9]|1[0-2])$"
+        with pytest.raises(ImproperlyConfigured):
+            _bs_format_pattern("%B %d, %Y")
+
+    @pytest.mark.django_db
+    def test_valid_rows_are_accepted(self):
+        ConstrainedRecord.objects.bulk_create(
+            [self._record(), self._record(phone="", municipality=None)]
+        )
+        assert ConstrainedRecord.objects.count() == 2
+
+    @pytest.mark.django_db
+    @pytest.mark.parametrize(
+        "values",
+        [
+            {"phone": "12345"},
+            {"born_on": "2050-13-01"},
+            {"born_on": ""},
+            {"recorded_at": "2081-04-01"},
+            {"district": "Atlantis"},
+        ],
+    )
+    def test_invalid_rows_are_rejected(self, values):
+        with pytest.raises(IntegrityError), transaction.atomic():
+            ConstrainedRecord.objects.bulk_create([self._record(**values)])
+
+    @pytest.mark.django_db
+    def test_update_is_checked(self):
+        self._record().save()
+        with pytest.raises(IntegrityError), transaction.atomic():
+            ConstrainedRecord.objects.update(district="कास्की")
+        with pytest.raises(IntegrityError), transaction.atomic():
+            ConstrainedRecord.objects.update(municipality=9999)
@@ -0,0 +1,155 @@
+"""
+Tests for the in-memory location registry (registry.py).
+"""
+
+import pytest
+
+from django_nepkit.registry import registry
+
+
+class TestLocationRegistry:
+    """Tests for LocationRegistry.get."""
+
+    def test_get_by_english_name(self):
+        assert registry.get("district", "Kaski").name_nepali == "कास्की"
+
+    def test_get_by_nepali_name(self):
+        assert registry.get("province", "बागमती प्रदेश").name == "Bagmati Province"
+
+    def test_get_normalizes_chandrabindu(self):
+        location = registry.get("municipality", "काठमाडौं महानगरपालिका")
+        assert location.name == "Kathmandu Metropolitan City"
+
+    def test_get_unknown_returns_none(self):
+        assert registry.get("district", "Atlantis") is None
+
+    def test_parent_disambiguates_shared_names(self):
+        # "Godawari Municipality" exists in both Lalitpur and Kailali.
+        lalitpur = registry.get(
+            "municipality", "Godawari Municipality", parent="Lalitpur"
+        )
+        kailali = registry.get(
+            "municipality", "Godawari Municipality", parent="Kailali"
+        )
+        assert lalitpur.district.name == "Lalitpur"
+        assert kailali.district.name == "Kailali"
+
+    def test_belongs_to_checks_one_parent_level(self):
+        name = "Pokhara Metropolitan City"
+        assert registry.belongs_to("municipality", name, "Kaski")
+        assert registry.belongs_to("municipality", name, "कास्की")
+        assert not registry.belongs_to("municipality", name, "Gandaki Province")
+        assert registry.belongs_to(
+            "municipality", name, "Gandaki Province", parent_level="province"
+        )
+        assert not registry.belongs_to(
+            "municipality", name, "Kaski", parent_level="province"
+        )
+
+    def test_belongs_to_rejects_a_parent_level_not_above(self):
+        with pytest.raises(ValueError, match="no parent level"):
+            registry.belongs_to("province", "Gandaki Province", "Kaski")
+        with pytest.raises(ValueError, match="not above"):
+            registry.belongs_to("district", "Kaski", "Kaski", parent_level="district")
+        with pytest.raises(ValueError, match="not above"):
+            registry.belongs_to(
+                "district", "Kaski", "Pokhara Metropolitan City", "municipality"
+            )
+
+    def test_names_in_both_languages_are_shared(self):
+        names = registry.names("district", None)
+        assert names is registry.names("district", None)
+        assert {"Kaski", "कास्की"} <= names
+
+
+class TestLocationSearch:
+    """Tests for LocationRegistry.search."""
+
+    def _names(self, query, **kwargs):
+        return [item.name for _level, item in registry.search(query, **kwargs)]
+
+    def test_prefix_is_case_insensitive(self):
+        assert "Kathmandu" in self._names("KATH")
+
+    def test_exact_match_ranks_first(self):
+        assert self._names("kaski")[0] == "Kaski"
+
+    def test_matches_later_words(self):
+        names = self._names("east", level="district")
+        assert set(names) == {"Nawalparasi East", "Rukum East"}
+
+    def test_generic_words_are_not_indexed(self):
+        assert self._names("municipality") == []
+
+    def test_nepali_with_either_nasal_mark(self):
+        assert self._names("काठमाडौँ")[0] == "Kathmandu"
+        assert self._names("काठमाडौं")[0] == "Kathmandu"
+
+    def test_aliases(self):
+        assert self._names("chitwan") == ["Chitawan"]
+        assert self._names("province 3") == ["Bagmati Province"]
+        assert self._names("kmc") == ["Kathmandu Metropolitan City"]
+
+    def test_level_and_limit(self):
+        results = registry.search("b", limit=3, level="district")
+        assert len(results) == 3
+        assert {level for level, _item in results} == {"district"}
+
+    def test_empty_query(self):
+        assert registry.search("   ") == []
+
+
+class TestLocationMatch:
+    """Tests for LocationRegistry.match and stored_values."""
+
+    def _names(self, level, text, mode="contains"):
+        return {item.name for item in registry.match(level, text, mode)}
+
+    def test_contains_is_complete(self):
+        assert self._names("district", "east") == {"Nawalparasi East", "Rukum East"}
+
+    def test_startswith_and_exact(self):
+        assert "Kathmandu" in self._names("district", "kath", "startswith")
+        assert self._names("district", "athmandu", "startswith") == set()
+        assert self._names("district", "KASKI", "exact") == {"Kaski"}
+
+    def test_nepali_and_aliases(self):
+        assert self._names("district", "काठमाडौँ", "exact") == {"Kathmandu"}
+        assert self._names("district", "chitwan", "exact") == {"Chitawan"}
+
+    def test_empty_text(self):
+        assert registry.match("district", "  ") == set()
+
+    def test_stored_values(self):
+        kaski = registry.match("district", "kaski", "exact")
+        assert registry.stored_values(kaski) == {"Kaski", "कास्की"}
+        assert registry.stored_values(kaski, code=True) == {
+            registry.code(registry.get("district", "Kaski"))
+        }
+
+
+class TestLocationTranslation:
+    """Tests for LocationRegistry.translate and translations."""
+
+    def test_translate_both_ways(self):
+        assert registry.translate("district", "Kaski") == "कास्की"
+        assert registry.translate("district", "कास्की", ne=False) == "Kaski"
+
+    def test_translate_normalizes_chandrabindu(self):
+        assert (
+            registry.translate("municipality", "काठमाडौं महानगरपालिका", ne=False)
+            == "Kathmandu Metropolitan City"
+        )
+
+    def test_translate_same_language_and_unknown(self):
+        assert registry.translate("district", "Kaski", ne=False) == "Kaski"
+        assert registry.translate("district", "Atlantis") is None
+        assert registry.translate("district", "") is None
+
+    def test_translations(self):
+        kaski = registry.get("district", "Kaski")
+        assert registry.translations("district")["Kaski"] == "कास्की"
+        assert registry.translations("district", ne=False)["कास्की"] == "Kaski"
+        coded = registry.translations("district", ne=False, code=True)
+        assert coded[registry.code(kaski)] == "Kaski"
+        assert len(coded) == len(registry.sources["district"])
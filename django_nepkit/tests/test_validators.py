@@ -2,10 +2,40 @@
 Tests for django-nepkit validators.
 """
 
+from decimal import Decimal
+
 import pytest
 from django.core.exceptions import ValidationError
+from django.db import models
+from nepali import phone_number
+from nepali.datetime import nepalidate
+
+from django_nepkit.models import (
+    DistrictField,
+    NepaliCurrencyField,
+    NepaliDateField,
+    NepaliDateTimeField,
+    NepaliPhoneNumberField,
+    ProvinceField,
+)
+from django_nepkit.validators import (
+    PHONE_NUMBER_RE,
+    validate_nepali_fields,
+    validate_nepali_phone_number,
+)
+
 
-from django_nepkit.validators import validate_nepali_phone_number
+class Applicant(models.Model):
+    name = models.CharField(max_length=20)
+    phone = NepaliPhoneNumberField(blank=True)
+    born_on = NepaliDateField()
+    applied_at = NepaliDateTimeField(null=True, blank=True)
+    fee = NepaliCurrencyField(max_digits=6, decimal_places=2)
+    province = ProvinceField(blank=True)
+    district = DistrictField(blank=True, parent_field="province")
+
+    class Meta:
+        app_label = "django_nepkit"
 
 
 class TestPhoneNumberValidator:
@@ -61,3 +91,152 @@ class TestPhoneNumberValidator:
         """Test that empty string fails validation."""
         with pytest.raises(ValidationError):
             validate_nepali_phone_number("")
+
+
+class TestValidateLocationFields:
+    """Tests for the batch location validator."""
+
+    def _address(self, **kwargs):
+        from django_nepkit.tests.test_models import HierarchicalAddress
+
+        return HierarchicalAddress(**kwargs)
+
+    def test_valid_rows_have_no_errors(self):
+        from django_nepkit.validators import validate_location_fields
+
+        rows = [
+            self._address(
+                province="Gandaki Province",
+                district="Kaski",
+                municipality="Pokhara Metropolitan City",
+            ),
+            self._address(province="Bagmati Province", district="Kathmandu"),
+        ]
+        assert validate_location_fields(rows) == {}
+
+    def test_reports_errors_per_row_and_field(self):
+        from django_nepkit.validators import validate_location_fields
+
+        rows = [
+            self._address(province="Gandaki Province", district="Kaski"),
+            self._address(province="Gandaki Province", district="Atlantis"),
+            self._address(
+                province="Bagmati Province",
+                district="Kaski",
+                municipality="Kirtipur Municipality",
+            ),
+        ]
+        errors = validate_location_fields(rows)
+        assert set(errors) == {1, 2}
+        assert "district" in errors[1]
+        assert set(errors[2]) == {"district", "municipality"}
+
+    def test_restricts_to_given_fields(self):
+        from django_nepkit.validators import validate_location_fields
+
+        rows = [self._address(province="Gandaki Province", district="Atlantis")]
+        assert validate_location_fields(rows, fields=["province"]) == {}
+
+    def test_empty_input(self):
+        from django_nepkit.validators import validate_location_fields
+
+        assert validate_location_fields([]) == {}
+
+
+class TestValidateNepaliFields:
+    """Tests for the batch validator covering every Nepali field."""
+
+    def _applicant(self, **kwargs):
+        values = {
+            "name": "Sita",
+            "phone": "9841234567",
+            "born_on": "2050-01-15",
+            "fee": Decimal("1500.00"),
+            "province": "Gandaki Province",
+            "district": "Kaski",
+        }
+        values.update(kwargs)
+        return Applicant(**values)
+
+    def test_valid_rows_have_no_errors(self):
+        rows = [
+            self._applicant(),
+            self._applicant(
+                phone="",
+                born_on=nepalidate(2050, 1, 15),
+                applied_at="2081-04-01 10:30:00",
+                fee="99.5",
+                province="",
+                district="",
+            ),
+        ]
+        assert validate_nepali_fields(rows) == {}
+
+    def test_reports_errors_per_row_and_field(self):
+        rows = [
+            self._applicant(),
+            self._applicant(phone="12345", born_on="2050-13-40"),
+            self._applicant(applied_at="yesterday", fee=Decimal("123456.00")),
+            self._applicant(district="Kathmandu"),
+            self._applicant(born_on=None, fee="abc"),
+        ]
+        errors = validate_nepali_fields(rows)
+        assert set(errors) == {1, 2, 3, 4}
+        assert errors[1]["phone"] == ["12345 is not a valid nepali phone number"]
+        assert errors[1]["born_on"] == [
+            "2050-13-40 is not a valid Bikram Sambat value. Expected format: %Y-%m-%d."
+        ]
+        assert set(errors[2]) == {"applied_at", "fee"}
+        assert set(errors[3]) == {"district"}
+        assert set(errors[4]) == {"born_on", "fee"}
+
+    def test_matches_full_clean(self):
+        rows = [
+            self._applicant(phone="98412345678"),
+            self._applicant(fee=Decimal("1.234")),
+            self._applicant(born_on="2050-01-15", province="Atlantis"),
+        ]
+        fields = ["phone", "born_on", "applied_at", "fee", "province"]
+        errors = validate_nepali_fields(rows, fields=fields)
+        for index, row in enumerate(rows):
+            with pytest.raises(ValidationError) as excinfo:
+                row.full_clean(exclude=["district"])
+            assert errors[index] == excinfo.value.message_dict
+
+    def test_distinct_values_are_checked_once(self, monkeypatch):
+        calls = []
+        to_python = NepaliDateField.to_python
+
+        def counting_to_python(field, value):
+            calls.append(value)
+            return to_python(field, value)
+
+        monkeypatch.setattr(NepaliDateField, "to_python", counting_to_python)
+        rows = [self._applicant(born_on="2050-01-15") for _ in range(50)]
+        rows.append(self._applicant(born_on="2051-02-20"))
+        assert validate_nepali_fields(rows, fields=["born_on"]) == {}
+        assert sorted(calls) == ["2050-01-15", "2051-02-20"]
+
+    def test_restricts_to_given_fields(self):
+        rows = [self._applicant(phone="12345", district="Atlantis")]
+        assert set(validate_nepali_fields(rows, fields=["phone"])[0]) == {"phone"}
+
+    def test_phone_pattern_matches_library(self):
+        numbers = [
+            "9841234567",
+            "+977-9841234567",
+            "9779801234567",
+            "014123456",
+            "0141234567",
+            "+977-14123456",
+            "12345",
+            "1234567890",
+            "9941234567",
+            "abcdefghij",
+            "",
+        ]
+        for number in numbers:
+            assert bool(PHONE_NUMBER_RE.match(number)) == phone_number.is_valid(number)
+
+    def test_empty_input(self):
+        assert validate_nepali_fields([]) == {}
@@ -272,3 +272,359 @@ class TestMunicipalityListView:
 
         assert "text/html" in response["Content-Type"]
         assert b"<option" in response.content
+
+
+class TestLocationSearchView:
+    """Tests for location_search_view."""
+
+    def test_returns_ranked_results_with_path(self, rf):
+        from django_nepkit.views import location_search_view
+        import json
+
+        request = rf.get("/", {"q": "pokhara"})
+        data = json.loads(location_search_view(request).content)
+        assert data[0] == {
+            "id": "Pokhara Metropolitan City",
+            "text": "Pokhara Metropolitan City, Kaski",
+            "level": "municipality",
+            "path": ["Gandaki Province", "Kaski", "Pokhara Metropolitan City"],
+        }
+
+    def test_limit_and_level(self, rf):
+        from django_nepkit.views import location_search_view
+        import json
+
+        request = rf.get("/", {"q": "k", "limit": "2", "level": "district"})
+        data = json.loads(location_search_view(request).content)
+        assert len(data) == 2
+        assert all(item["level"] == "district" for item in data)
+
+    def test_unknown_level(self, rf):
+        from django_nepkit.views import location_search_view
+
+        request = rf.get("/", {"q": "k", "level": "village"})
+        assert location_search_view(request).status_code == 400
+
+    def test_nepali_html_options(self, rf):
+        from django_nepkit.views import location_search_view
+
+        request = rf.get("/", {"q": "कास्की", "ne": "true"}, HTTP_HX_REQUEST="true")
+        response = location_search_view(request)
+        assert "text/html" in response["Content-Type"]
+        assert 'value="कास्की"' in response.content.decode()
+
+    def test_url_is_registered(self):
+        from django.urls import reverse
+
+        assert reverse("location-search") == "/locations/search/"
+
+
+class TestLocationCaching:
+    """Tests for ETag and Cache-Control handling on location views."""
+
+    def test_sets_validators_and_cache_headers(self, rf):
+        from django_nepkit.views import district_list_view
+
+        response = district_list_view(rf.get("/", {"province": "Bagmati Province"}))
+        assert response["ETag"].startswith('"')
+        assert "public" in response["Cache-Control"]
+        assert "max-age=86400" in response["Cache-Control"]
+        assert "HX-Request" in response["Vary"]
+
+    def test_etag_depends_on_query_and_format(self, rf):
+        from django_nepkit.views import district_list_view
+
+        def etag(*args, **kwargs):
+            return district_list_view(rf.get("/", *args, **kwargs))["ETag"]
+
+        params = {"province": "Bagmati Province"}
+        assert etag(params) == etag(params)
+        assert etag(params) != etag({"province": "Koshi Province"})
+        assert etag(params) != etag(params, HTTP_HX_REQUEST="true")
+
+    def test_matching_etag_short_circuits(self, rf, monkeypatch):
+        from django_nepkit import views
+
+        params = {"district": "Kathmandu"}
+        etag = views.municipality_list_view(rf.get("/", params))["ETag"]
+
+        def fail(*args, **kwargs):
+            raise AssertionError("data should not be computed")
+
+        monkeypatch.setattr(views, "get_municipalities_by_district", fail)
+        response = views.municipality_list_view(
+            rf.get("/", params, HTTP_IF_NONE_MATCH=etag)
+        )
+        assert response.status_code == 304
+        assert response["ETag"] == etag
+        assert response.content == b""
+
+    def test_max_age_is_configurable(self, rf, monkeypatch):
+        from django_nepkit.conf import nepkit_settings
+        from django_nepkit.views import location_search_view
+
+        monkeypatch.setitem(
+            nepkit_settings._user_settings, "LOCATION_CACHE_MAX_AGE", 60
+        )
+        response = location_search_view(rf.get("/", {"q": "kaski"}))
+        assert "max-age=60" in response["Cache-Control"]
+
+    def test_errors_are_not_cached(self, rf):
+        from django_nepkit.views import location_search_view
+
+        response = location_search_view(rf.get("/", {"q": "k", "level": "village"}))
+        assert response.status_code == 400
+        assert not response.has_header("ETag")
+
+
+class TestAsyncViews:
+    """Tests for the async view variants and their URL routing."""
+
+    @pytest.fixture
+    def arf(self):
+        from django.test import AsyncRequestFactory
+
+        return AsyncRequestFactory()
+
+    def test_views_are_coroutines(self):
+        import inspect
+
+        from django_nepkit import views
+
+        for name in (
+            "async_district_list_view",
+            "async_municipality_list_view",
+            "async_location_batch_view",
+            "async_location_search_view",
+            "async_reverse_geocode_view",
+        ):
+            assert inspect.iscoroutinefunction(getattr(views, name))
+
+    def test_matches_sync_response(self, rf, arf):
+        import asyncio
+
+        from django_nepkit.views import (
+            async_district_list_view,
+            district_list_view,
+        )
+
+        params = {"province": "Gandaki Province"}
+        expected = district_list_view(rf.get("/", params))
+        response = asyncio.run(async_district_list_view(arf.get("/", params)))
+        assert response.content == expected.content
+        assert response["ETag"] == expected["ETag"]
+
+    def test_not_modified(self, arf):
+        import asyncio
+
+        from django_nepkit.views import async_location_search_view
+
+        first = asyncio.run(async_location_search_view(arf.get("/", {"q": "kas"})))
+        request = arf.get("/", {"q": "kas"}, headers={"If-None-Match": first["ETag"]})
+        assert asyncio.run(async_location_search_view(request)).status_code == 304
+
+    def test_reverse_geocode_without_dataset(self, arf, monkeypatch):
+        import asyncio
+        import json
+
+        from django_nepkit.views import async_reverse_geocode_view
+
+        monkeypatch.setattr("django_nepkit.geo.is_geo_index_loaded", lambda: True)
+        monkeypatch.setattr("django_nepkit.geo.get_geo_index", lambda: None)
+        request = arf.get("/", {"lat": "27.7", "lon": "85.3"})
+        data = json.loads(asyncio.run(async_reverse_geocode_view(request)).content)
+        assert data["municipality"] is None
+
+    def test_routing_follows_asgi_application(self, settings, monkeypatch):
+        from django_nepkit.conf import nepkit_settings
+        from django_nepkit.urls import _use_async_views
+
+        settings.ASGI_APPLICATION = None
+        assert _use_async_views() is False
+        settings.ASGI_APPLICATION = "project.asgi.application"
+        assert _use_async_views() is True
+        monkeypatch.setitem(nepkit_settings._user_settings, "ASYNC_VIEWS", False)
+        assert _use_async_views() is False
+
+    def test_routing_without_asgi_application(self, settings, monkeypatch):
+        """uvicorn/hypercorn setups leave ASGI_APPLICATION unset."""
+        from django_nepkit.conf import nepkit_settings
+        from django_nepkit.urls import _use_async_views
+
+        del settings.ASGI_APPLICATION
+        assert _use_async_views() is False
+        monkeypatch.setitem(nepkit_settings._user_settings, "ASYNC_VIEWS", True)
+        assert _use_async_views() is True
+
+
+class TestLocationBatchView:
+    """Tests for location_batch_view."""
+
+    def test_returns_keyed_children(self, rf):
+        from django_nepkit.views import location_batch_view
+        import json
+
+        request = rf.get(
+            "/",
+            {
+                "province": ["Koshi Province", "Gandaki Province"],
+                "district": "Kathmandu",
+            },
+        )
+        data = json.loads(location_batch_view(request).content)
+        assert set(data["districts"]) == {"Koshi Province", "Gandaki Province"}
+        assert {"id": "Kaski", "text": "Kaski"} in data["districts"]["Gandaki Province"]
+        assert {
+            "id": "Kathmandu Metropolitan City",
+            "text": "Kathmandu Metropolitan City",
+        } in data["municipalities"]["Kathmandu"]
+
+    def test_unknown_parent_gives_empty_list(self, rf):
+        from django_nepkit.views import location_batch_view
+        import json
+
+        data = json.loads(location_batch_view(rf.get("/", {"district": "X"})).content)
+        assert data == {"districts": {}, "municipalities": {"X": []}}
+
+    def test_nepali(self, rf):
+        from django_nepkit.views import location_batch_view
+        import json
+
+        request = rf.get("/", {"province": "गण्डकी प्रदेश", "ne": "true"})
+        data = json.loads(location_batch_view(request).content)
+        assert {"id": "कास्की", "text": "कास्की"} in data["districts"]["गण्डकी प्रदेश"]
+
+    def test_rejects_too_many_parents(self, rf):
+        from django_nepkit.constants import LOCATION_BATCH_MAX_PARENTS
+        from django_nepkit.views import location_batch_view
+
+        names = [f"District {i}" for i in range(LOCATION_BATCH_MAX_PARENTS + 1)]
+        request = rf.get("/", {"district": names})
+        assert location_batch_view(request).status_code == 400
+
+    def test_is_cacheable(self, rf):
+        from django_nepkit.views import location_batch_view
+
+        response = location_batch_view(rf.get("/", {"province": "Koshi Province"}))
+        assert response.has_header("ETag")
+
+
+class TestLocationExportView:
+    """Tests for location_export_view."""
+
+    def _body(self, response):
+        return b"".join(response.streaming_content)
+
+    def test_streams_ndjson(self, rf):
+        from django_nepkit.registry import registry
+        from django_nepkit.views import location_export_view
+        import json
+
+        response = location_export_view(rf.get("/"))
+        assert response.streaming
+        assert response["Content-Type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in self._body(response).splitlines()]
+        assert lines[0] == {"version": registry.dataset_version}
+        assert len(lines) == 1 + 7 + 77 + 753
+        assert lines[1]["name"] == "Koshi Province"
+        assert lines[2]["parent"] == lines[1]["code"]
+
+    def test_nested_json(self, rf):
+        from django_nepkit.views import location_export_view
+        import json
+
+        response = location_export_view(rf.get("/", {"format": "json"}))
+        data = json.loads(self._body(response))
+        districts = [d for p in data["provinces"] for d in p["districts"]]
+        assert len(districts) == 77
+        assert sum(len(d["municipalities"]) for d in districts) == 753
+        assert data["provinces"][0]["name_nepali"] == "कोशी प्रदेश"
+
+    def test_gzip_body(self, rf):
+        from django_nepkit.views import location_export_view
+        import gzip
+
+        identity = self._body(location_export_view(rf.get("/")))
+        response = location_export_view(
+            rf.get("/", HTTP_ACCEPT_ENCODING="gzip, br;q=0")
+        )
+        assert response["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in response["Vary"]
+        assert gzip.decompress(self._body(response)) == identity
+
+    def test_since_version_and_etag(self, rf):
+        import json
+
+        from django_nepkit.registry import registry
+        from django_nepkit.views import location_export_view
+
+        request = rf.get("/", {"since_version": registry.dataset_version})
+        response = location_export_view(request)
+        assert response.status_code == 200
+        assert json.loads(response.content) == {
+            "version": registry.dataset_version,
+            "unchanged": True,
+        }
+        assert "public" not in response.get("Cache-Control", "")
+
+        etag = location_export_view(rf.get("/"))["ETag"]
+        request = rf.get("/", HTTP_IF_NONE_MATCH=etag)
+        assert location_export_view(request).status_code == 304
+
+        request = rf.get("/", {"since_version": "outdated"})
+        assert location_export_view(request).status_code == 200
+
+    def test_unknown_format(self, rf):
+        from django_nepkit.views import location_export_view
+
+        assert location_export_view(rf.get("/", {"format": "xml"})).status_code == 400
+
+    def test_async_streams_same_body(self, rf):
+        import asyncio
+
+        from django.test import AsyncRequestFactory
+
+        from django_nepkit.views import (
+            async_location_export_view,
+            location_export_view,
+        )
+
+        async def read():
+            response = await async_location_export_view(AsyncRequestFactory().get("/"))
+            return b"".join([chunk async for chunk in response.streaming_content])
+
+        expected = self._body(location_export_view(rf.get("/")))
+        assert asyncio.run(read()) == expected
+
+    def test_async_compresses_off_the_event_loop(self, rf, monkeypatch):
+        import asyncio
+        import gzip
+        import threading
+
+        from django.test import AsyncRequestFactory
+
+        from django_nepkit import views
+
+        loop_thread = {}
+        compressed_in = []
+        compressed_export = views._compressed_export
+
+        def recording_export(fmt, encoding):
+            compressed_in.append(threading.current_thread())
+            return compressed_export(fmt, encoding)
+
+        monkeypatch.setattr(views, "_compressed_export", recording_export)
+
+        async def read():
+            loop_thread["thread"] = threading.current_thread()
+            request = AsyncRequestFactory().get(
+                "/", headers={"Accept-Encoding": "gzip"}
+            )
+            response = await views.async_location_export_view(request)
+            return b"".join([chunk async for chunk in response.streaming_content])
+
+        body = asyncio.run(read())
+        assert compressed_in and compressed_in[0] is not loop_thread["thread"]
+        assert gzip.decompress(body) == self._body(
+            views.location_export_view(rf.get("/"))
+        )
@@ -99,3 +99,25 @@ class TestLocationWidgets:
         html = widget.render("province", None)
 
         assert 'data-ne="true"' in html
+
+    def test_media_loads_only_own_language_data(self):
+        """Location widgets include only the generated file for their language."""
+        from django_nepkit.widgets import location_data_file
+
+        english = [str(path) for path in ProvinceSelectWidget().media._js]
+        nepali = [str(path) for path in DistrictSelectWidget(ne=True).media._js]
+
+        assert english == [
+            location_data_file("en"),
+            "django_nepkit/js/address-chaining.js",
+        ]
+        assert nepali[0] == location_data_file("ne")
+        assert ".ne." in nepali[0]
+
+    def test_location_widget_exposes_dataset_version(self):
+        """The dataset version lets the JS keep cached responses until data changes."""
+        from django_nepkit.registry import registry
+
+        html = DistrictSelectWidget().render("district", None)
+
+        assert f'data-version="{registry.dataset_version}"' in html
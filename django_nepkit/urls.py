@@ -1,10 +1,61 @@
+from django.conf import settings
 from django.urls import path
 
-from django_nepkit.views import district_list_view, municipality_list_view
+from django_nepkit import views
+from django_nepkit.conf import nepkit_settings
 
 app_name = "django_nepkit"
 
+
+def _use_async_views():
+    """
+    Route to the ``async def`` views when serving over ASGI.
+
+    NEPKIT["ASYNC_VIEWS"] forces the choice; by default it follows whether
+    an ASGI_APPLICATION is configured. Plain uvicorn/hypercorn deployments
+    usually don't set one and need ASYNC_VIEWS = True.
+    """
+    if nepkit_settings.ASYNC_VIEWS is not None:
+        return bool(nepkit_settings.ASYNC_VIEWS)
+    return bool(getattr(settings, "ASGI_APPLICATION", None))
+
+
+USE_ASYNC_VIEWS = _use_async_views()
+
+
+def _pick(sync_view, async_view):
+    return async_view if USE_ASYNC_VIEWS else sync_view
+
+
 urlpatterns = [
-    path("districts/", district_list_view, name="district-list"),
-    path("municipalities/", municipality_list_view, name="municipality-list"),
+    path(
+        "districts/",
+        _pick(views.district_list_view, views.async_district_list_view),
+        name="district-list",
+    ),
+    path(
+        "municipalities/",
+        _pick(views.municipality_list_view, views.async_municipality_list_view),
+        name="municipality-list",
+    ),
+    path(
+        "locations/batch/",
+        _pick(views.location_batch_view, views.async_location_batch_view),
+        name="location-batch",
+    ),
+    path(
+        "locations/export/",
+        _pick(views.location_export_view, views.async_location_export_view),
+        name="location-export",
+    ),
+    path(
+        "locations/search/",
+        _pick(views.location_search_view, views.async_location_search_view),
+        name="location-search",
+    ),
+    path(
+        "geocode/reverse/",
+        _pick(views.reverse_geocode_view, views.async_reverse_geocode_view),
+        name="reverse-geocode",
+    ),
 ]
@@ -247,19 +247,15 @@ def _is_nepali_text(tokens):
     return any(re.search(r"[\u0900-\u097F]", t) for t in tokens)
 
 
-def normalize_address(address_string: str) -> dict[str, Optional[str]]:
+def _resolve_address(address_string):
     """
-    Attempts to normalize a Nepali address string into Province, District, and Municipality.
-    Returns a dictionary with 'province', 'district', and 'municipality'.
+    Resolve a raw address string into location objects.
+
+    Returns:
+        Tuple of (province, district, municipality) objects, any of which may be None
     """
     if not address_string:
-        return {"province": None, "district": None, "municipality": None}
-
-    result: dict[str, Optional[str]] = {
-        "province": None,
-        "district": None,
-        "municipality": None,
-    }
+        return None, None, None
 
     # Prepare tokens
     content = address_string.replace(",", " ").replace("-", " ")
@@ -273,29 +269,250 @@ def normalize_address(address_string: str) -> dict[str, Optional[str]]:
     found_district = _find_location_in_tokens(districts, tokens, normalized_tokens)
     found_province = _find_location_in_tokens(provinces, tokens, normalized_tokens)
 
+    # Municipality names repeat across districts; prefer the one in the
+    # district the address names.
+    if (
+        found_municipality
+        and found_district
+        and found_municipality.district is not found_district
+    ):
+        from django_nepkit.registry import registry
+
+        within = registry.get_within(
+            "municipality", found_municipality.name, "district", found_district
+        )
+        if within:
+            found_municipality = within[0]
+
     # Fill in the gaps using hierarchy
     if found_municipality:
-        result["municipality"] = found_municipality.name
         if not found_district:
             found_district = found_municipality.district
         if not found_province:
             found_province = found_municipality.province
 
-    if found_district:
-        result["district"] = found_district.name
-        if not found_province:
-            found_province = found_district.province
+    if found_district and not found_province:
+        found_province = found_district.province
+
+    return found_province, found_district, found_municipality
+
 
-    if found_province:
-        result["province"] = found_province.name
+def normalize_address(address_string: str) -> dict[str, Optional[str]]:
+    """
+    Attempts to normalize a Nepali address string into Province, District, and Municipality.
+    Returns a dictionary with 'province', 'district', and 'municipality'.
+    """
+    result: dict[str, Optional[str]] = {
+        "province": None,
+        "district": None,
+        "municipality": None,
+    }
+    if not address_string:
+        return result
+
+    found = dict(
+        zip(("province", "district", "municipality"), _resolve_address(address_string))
+    )
 
     # Use Nepali names if input contains Nepali text
-    if _is_nepali_text(tokens):
-        if found_municipality:
-            result["municipality"] = found_municipality.name_nepali
-        if found_district:
-            result["district"] = found_district.name_nepali
-        if found_province:
-            result["province"] = found_province.name_nepali
+    ne = _is_nepali_text(address_string.split())
+    for key, location in found.items():
+        if location is not None:
+            result[key] = location.name_nepali if ne else location.name
+
+    return result
+
+
+def _geo_entry_to_dict(entry, ne=False, distance=None):
+    """Serialize a GeoEntry the way location views expect."""
+    location = entry.location
+    data = {
+        "level": entry.level,
+        "name": location.name_nepali if ne else location.name,
+        "lat": entry.lat,
+        "lon": entry.lon,
+        "bbox": list(entry.bbox),
+    }
+    if distance is not None:
+        data["distance_km"] = round(distance, 3)
+    return data
 
+
+def reverse_geocode(
+    lat: float, lon: float, ne: bool = False
+) -> dict[str, Optional[str]]:
+    """
+    Turn GPS coordinates into Province, District, and Municipality, fully offline.
+    Requires NEPKIT["GEODATA_PATH"]; returns all None when the point is not covered.
+    """
+    from django_nepkit.geo import get_geo_index
+
+    result: dict[str, Optional[str]] = {
+        "province": None,
+        "district": None,
+        "municipality": None,
+    }
+    index = get_geo_index()
+    if index is None:
+        return result
+
+    # Most specific level first; parents come from the hierarchy.
+    hierarchy = {}
+    for level in ("municipality", "district", "province"):
+        entry = index.locate(lat, lon, level=level)
+        if entry is None:
+            continue
+        location = entry.location
+        hierarchy[level] = location
+        if level == "municipality":
+            hierarchy["district"] = location.district
+            hierarchy["province"] = location.province
+        elif level == "district":
+            hierarchy["province"] = location.province
+        break
+
+    for level, location in hierarchy.items():
+        result[level] = location.name_nepali if ne else location.name
     return result
+
+
+def get_location_centroid(level: str, name: str, ne: bool = False) -> Optional[dict]:
+    """Return the centroid and bounding box of a location by English or Nepali name."""
+    from django_nepkit.geo import get_geo_index
+    from django_nepkit.registry import registry
+
+    index = get_geo_index()
+    location = registry.get(level, name)
+    if index is None or location is None:
+        return None
+    entry = index.get(location)
+    return _geo_entry_to_dict(entry, ne=ne) if entry else None
+
+
+def nearest_locations(
+    lat: float, lon: float, n: int = 5, level: str = "municipality", ne: bool = False
+) -> list[dict]:
+    """Return the ``n`` locations whose centroids are closest to a point."""
+    from django_nepkit.geo import get_geo_index
+
+    index = get_geo_index()
+    if index is None:
+        return []
+    return [
+        _geo_entry_to_dict(entry, ne=ne, distance=distance)
+        for entry, distance in index.nearest(lat, lon, n=n, level=level)
+    ]
+
+
+def locations_within_radius(
+    lat: float,
+    lon: float,
+    radius_km: float,
+    level: str = "municipality",
+    ne: bool = False,
+) -> list[dict]:
+    """Return locations whose centroids lie within ``radius_km`` of a point."""
+    from django_nepkit.geo import get_geo_index
+
+    index = get_geo_index()
+    if index is None:
+        return []
+    return [
+        _geo_entry_to_dict(entry, ne=ne, distance=distance)
+        for entry, distance in index.within_radius(lat, lon, radius_km, level=level)
+    ]
+
+
+def search_locations(
+    query: str, limit: int = 10, level: Optional[str] = None, ne: bool = False
+) -> list[dict]:
+    """
+    Autocomplete provinces, districts and municipalities by name prefix.
+
+    Each result carries the full hierarchy path, so that municipalities
+    sharing a name can be told apart, e.g. "Godawari Municipality, Kailali".
+    """
+    from django_nepkit.registry import registry
+
+    results = []
+    for current, location in registry.search(query, limit=limit, level=level):
+        ancestors = []
+        if current == "municipality":
+            ancestors = [location.province, location.district]
+        elif current == "district":
+            ancestors = [location.province]
+        path = [
+            item.name_nepali if ne else item.name for item in (*ancestors, location)
+        ]
+        results.append(
+            {
+                "id": path[-1],
+                # Name followed by its immediate parent, e.g. "Kaski, Gandaki Province"
+                "text": ", ".join(reversed(path[-2:])),
+                "level": current,
+                "path": path,
+            }
+        )
+    return results
+
+
+def _export_record(location, level):
+    from django_nepkit.registry import registry
+
+    return {
+        "level": level,
+        "code": registry.code(location),
+        "name": location.name,
+        "name_nepali": location.name_nepali,
+    }
+
+
+def iter_location_export(fmt: str = "ndjson"):
+    """
+    Yield the full Province -> District -> Municipality tree in both languages.
+
+    ``ndjson`` yields a header line with the dataset version followed by one
+    flat record per location, parents first (children name their parent's
+    code in ``parent``). ``json`` yields a single nested document in pieces.
+    """
+    import json
+
+    from django_nepkit.registry import registry
+
+    def dump(data):
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+    def ordered(items):
+        return sorted(items, key=registry.code)
+
+    version = registry.dataset_version
+    if fmt == "ndjson":
+        yield dump({"version": version}) + "\n"
+        for province in ordered(provinces):
+            yield dump(_export_record(province, "province")) + "\n"
+            for district in ordered(province.districts):
+                record = _export_record(district, "district")
+                record["parent"] = registry.code(province)
+                yield dump(record) + "\n"
+                for municipality in ordered(district.municipalities):
+                    record = _export_record(municipality, "municipality")
+                    record["parent"] = registry.code(district)
+                    yield dump(record) + "\n"
+    elif fmt == "json":
+        yield '{"version":' + dump(version) + ',"provinces":['
+        for index, province in enumerate(ordered(provinces)):
+            record = _export_record(province, "province")
+            record["districts"] = [
+                {
+                    **_export_record(district, "district"),
+                    "municipalities": [
+                        _export_record(municipality, "municipality")
+                        for municipality in ordered(district.municipalities)
+                    ],
+                }
+                for district in ordered(province.districts)
+            ]
+            yield ("," if index else "") + dump(record)
+        yield "]}"
+    else:
+        raise ValueError(f"Unsupported export format '{fmt}'.")
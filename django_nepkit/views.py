@@ -1,4 +1,20 @@
-from django.http import JsonResponse, HttpResponse
+import hashlib
+import inspect
+import math
+from functools import lru_cache, wraps
+
+from asgiref.sync import sync_to_async
+
+from django.http import (
+    HttpResponse,
+    JsonResponse,
+    StreamingHttpResponse,
+)
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    patch_vary_headers,
+)
 
 from django_nepkit.utils import (
     get_districts_by_province,
@@ -82,6 +98,71 @@ def _should_return_html(request):
     )
 
 
+def _location_etag(request):
+    """
+    Build a strong ETag for a location response without computing it.
+
+    The body depends only on the dataset, the query string, the default
+    language and whether HTML was requested.
+    """
+    from django_nepkit.registry import registry
+
+    parts = [
+        registry.dataset_version,
+        nepkit_settings.DEFAULT_LANGUAGE,
+        str(_should_return_html(request)),
+        *(f"{key}={value}" for key, value in sorted(request.GET.lists())),
+    ]
+    digest = hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def _patch_location_cache_headers(response, etag):
+    """Attach the ETag, Cache-Control and Vary headers to a location response."""
+    if response.status_code in (200, 304):
+        response["ETag"] = etag
+        max_age = nepkit_settings.LOCATION_CACHE_MAX_AGE
+        if max_age is not None:
+            patch_cache_control(response, public=True, max_age=max_age)
+    patch_vary_headers(response, ("HX-Request",))
+    return response
+
+
+def cache_location_response(view):
+    """
+    Make a location view cacheable by browsers and shared caches.
+
+    Conditional requests whose ``If-None-Match`` matches are answered with
+    ``304 Not Modified`` before the view runs.
+    """
+
+    if inspect.iscoroutinefunction(view):
+
+        @wraps(view)
+        async def async_wrapper(request, *args, **kwargs):
+            if request.method not in ("GET", "HEAD"):
+                return await view(request, *args, **kwargs)
+            etag = _location_etag(request)
+            response = get_conditional_response(request, etag=etag)
+            if response is None:
+                response = await view(request, *args, **kwargs)
+            return _patch_location_cache_headers(response, etag)
+
+        return async_wrapper
+
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        if request.method not in ("GET", "HEAD"):
+            return view(request, *args, **kwargs)
+        etag = _location_etag(request)
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = view(request, *args, **kwargs)
+        return _patch_location_cache_headers(response, etag)
+
+    return wrapper
+
+
 def _location_list_view(request, param_name, data_func, placeholders):
     """
     Generic view handler for location hierarchy endpoints.
@@ -112,8 +193,7 @@ def _location_list_view(request, param_name, data_func, placeholders):
     return JsonResponse(data, safe=False)
 
 
-def district_list_view(request):
-    """Return list of districts for a given province."""
+def _district_list(request):
     from django_nepkit.constants import PLACEHOLDERS
 
     return _location_list_view(
@@ -124,8 +204,7 @@ def district_list_view(request):
     )
 
 
-def municipality_list_view(request):
-    """Return list of municipalities for a given district."""
+def _municipality_list(request):
     from django_nepkit.constants import PLACEHOLDERS
 
     return _location_list_view(
@@ -137,3 +216,325 @@ def municipality_list_view(request):
             PLACEHOLDERS["municipality"]["en"],
         ),
     )
+
+
+def _parse_float_param(request, name):
+    """Read a float query parameter, returning None if missing or invalid."""
+    try:
+        return float(request.GET[name])
+    except (KeyError, ValueError):
+        return None
+
+
+def _reverse_geocode(request):
+    from django_nepkit.constants import GEO_MAX_RADIUS_KM
+    from django_nepkit.registry import LEVELS
+    from django_nepkit.utils import (
+        locations_within_radius,
+        nearest_locations,
+        reverse_geocode,
+    )
+
+    lat = _parse_float_param(request, "lat")
+    lon = _parse_float_param(request, "lon")
+    if lat is None or lon is None or not (-90 <= lat <= 90 and -180 <= lon <= 180):
+        return JsonResponse(
+            {"error": "Valid 'lat' and 'lon' are required."}, status=400
+        )
+
+    ne, _en = _parse_language_params(request)
+    data = reverse_geocode(lat, lon, ne=ne)
+
+    level = request.GET.get("level", "municipality")
+    if level not in LEVELS:
+        return JsonResponse({"error": f"Unknown level '{level}'."}, status=400)
+
+    nearest = request.GET.get("nearest")
+    if nearest and nearest.isdigit():
+        data["nearest"] = nearest_locations(
+            lat, lon, n=min(int(nearest), 50), level=level, ne=ne
+        )
+
+    radius = _parse_float_param(request, "radius")
+    if radius is not None and not (
+        math.isfinite(radius) and radius <= GEO_MAX_RADIUS_KM
+    ):
+        return JsonResponse(
+            {"error": f"'radius' must be at most {GEO_MAX_RADIUS_KM} km."},
+            status=400,
+        )
+    if radius is not None and radius > 0:
+        data["within_radius"] = locations_within_radius(
+            lat, lon, radius, level=level, ne=ne
+        )
+
+    return JsonResponse(data)
+
+
+def _location_search(request):
+    from django_nepkit.constants import PLACEHOLDERS
+    from django_nepkit.registry import LEVELS, SEARCH_MAX_RESULTS
+    from django_nepkit.utils import search_locations
+
+    level = request.GET.get("level") or None
+    if level is not None and level not in LEVELS:
+        return JsonResponse({"error": f"Unknown level '{level}'."}, status=400)
+
+    limit = request.GET.get("limit", "")
+    limit = min(int(limit), SEARCH_MAX_RESULTS) if limit.isdigit() else 10
+
+    ne, _en = _parse_language_params(request)
+    data = search_locations(request.GET.get("q", ""), limit=limit, level=level, ne=ne)
+
+    if _should_return_html(request):
+        placeholder = PLACEHOLDERS[level or "municipality"]["ne" if ne else "en"]
+        return _render_options(data, placeholder)
+
+    return JsonResponse(data, safe=False)
+
+
+def _location_batch(request):
+    """
+    Resolve children for many parents at once:
+    `?province=A&province=B&district=X` ->
+    ``{"districts": {"A": [...], "B": [...]}, "municipalities": {"X": [...]}}``.
+    """
+    from django_nepkit.constants import LOCATION_BATCH_MAX_PARENTS
+
+    provinces = list(dict.fromkeys(v for v in request.GET.getlist("province") if v))
+    districts = list(dict.fromkeys(v for v in request.GET.getlist("district") if v))
+    if len(provinces) + len(districts) > LOCATION_BATCH_MAX_PARENTS:
+        return JsonResponse(
+            {"error": f"At most {LOCATION_BATCH_MAX_PARENTS} parents per request."},
+            status=400,
+        )
+
+    ne, en = _parse_language_params(request)
+    return JsonResponse(
+        {
+            "districts": {
+                name: get_districts_by_province(name, ne=ne, en=en)
+                for name in provinces
+            },
+            "municipalities": {
+                name: get_municipalities_by_district(name, ne=ne, en=en)
+                for name in districts
+            },
+        }
+    )
+
+
+EXPORT_CONTENT_TYPES = {
+    "ndjson": "application/x-ndjson; charset=utf-8",
+    "json": "application/json; charset=utf-8",
+}
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+
+@lru_cache(maxsize=None)
+def _compressed_export(fmt, encoding):
+    """Build and compress an export body once per process."""
+    from django_nepkit.compression import compress
+    from django_nepkit.utils import iter_location_export
+
+    return compress("".join(iter_location_export(fmt)).encode("utf-8"), encoding)
+
+
+def _iter_chunks(data):
+    for start in range(0, len(data), EXPORT_CHUNK_SIZE):
+        yield data[start : start + EXPORT_CHUNK_SIZE]
+
+
+async def _aiter_sync(iterable):
+    for item in iterable:
+        yield item
+
+
+def _export_etag(fmt, encoding):
+    from django_nepkit.registry import registry
+
+    return f'"{registry.dataset_version}-{fmt}-{encoding or "identity"}"'
+
+
+def _finish_export(response, fmt, encoding):
+    from django_nepkit.registry import registry
+
+    response["ETag"] = _export_etag(fmt, encoding)
+    response["X-Nepkit-Dataset-Version"] = registry.dataset_version
+    max_age = nepkit_settings.LOCATION_CACHE_MAX_AGE
+    if max_age is not None:
+        patch_cache_control(response, public=True, max_age=max_age)
+    patch_vary_headers(response, ("Accept-Encoding",))
+    return response
+
+
+def _location_export_request(request):
+    """
+    Check an export request before any body is built.
+
+    Returns ``(response, fmt, encoding)``. ``response`` is set when no body is
+    needed: an unknown format, a `since_version` that is still current (a
+    small "unchanged" JSON document) or a matching `If-None-Match` (304).
+    """
+    from django_nepkit.compression import negotiate_encoding
+    from django_nepkit.registry import registry
+
+    fmt = request.GET.get("format", "ndjson")
+    if fmt not in EXPORT_CONTENT_TYPES:
+        response = JsonResponse({"error": f"Unknown format '{fmt}'."}, status=400)
+        return response, fmt, None
+
+    version = registry.dataset_version
+    encoding = negotiate_encoding(request)
+
+    if request.GET.get("since_version") == version:
+        # A plain GET, so answer 200; not cached, as it goes stale with the data.
+        response = JsonResponse({"version": version, "unchanged": True})
+        response["X-Nepkit-Dataset-Version"] = version
+        return response, fmt, encoding
+
+    response = get_conditional_response(request, etag=_export_etag(fmt, encoding))
+    if response is not None:
+        response = _finish_export(response, fmt, encoding)
+    return response, fmt, encoding
+
+
+def _location_export_response(fmt, encoding, body=None, asynchronous=False):
+    """
+    Stream the full location tree: `?format=ndjson` (default) or `json`.
+
+    ``body`` is the precompressed export when an encoding was negotiated;
+    otherwise the tree is encoded as it is streamed.
+    """
+    from django_nepkit.utils import iter_location_export
+
+    if encoding:
+        content = _iter_chunks(body)
+    else:
+        content = (chunk.encode("utf-8") for chunk in iter_location_export(fmt))
+    response = StreamingHttpResponse(
+        _aiter_sync(content) if asynchronous else content,
+        content_type=EXPORT_CONTENT_TYPES[fmt],
+    )
+    if encoding:
+        response["Content-Encoding"] = encoding
+        response["Content-Length"] = len(body)
+    return _finish_export(response, fmt, encoding)
+
+
+# Views. Each has an ``async def`` twin for ASGI deployments: the work is
+# CPU-only lookups in memory, so the async views run it inline instead of
+# handing off to a thread.
+
+
+@cache_location_response
+def district_list_view(request):
+    """Return list of districts for a given province."""
+    return _district_list(request)
+
+
+@cache_location_response
+async def async_district_list_view(request):
+    """Async version of district_list_view."""
+    return _district_list(request)
+
+
+@cache_location_response
+def municipality_list_view(request):
+    """Return list of municipalities for a given district."""
+    return _municipality_list(request)
+
+
+@cache_location_response
+async def async_municipality_list_view(request):
+    """Async version of municipality_list_view."""
+    return _municipality_list(request)
+
+
+@cache_location_response
+def location_batch_view(request):
+    """Return districts and municipalities for several parents in one response."""
+    return _location_batch(request)
+
+
+@cache_location_response
+async def async_location_batch_view(request):
+    """Async version of location_batch_view."""
+    return _location_batch(request)
+
+
+def location_export_view(request):
+    """
+    Stream every province, district and municipality in both languages.
+
+    Optional parameters:
+        format: 'ndjson' (default) or 'json' (nested)
+        since_version: Dataset version the client already has; when it is
+                       still current the response is ``{"version": ...,
+                       "unchanged": true}`` instead of the tree
+    """
+    response, fmt, encoding = _location_export_request(request)
+    if response is not None:
+        return response
+    body = _compressed_export(fmt, encoding) if encoding else None
+    return _location_export_response(fmt, encoding, body)
+
+
+async def async_location_export_view(request):
+    """
+    Async version of location_export_view.
+
+    The compressed body is built in a worker thread (once per process), so
+    compression never blocks the event loop.
+    """
+    response, fmt, encoding = _location_export_request(request)
+    if response is not None:
+        return response
+    body = None
+    if encoding:
+        body = await sync_to_async(_compressed_export)(fmt, encoding)
+    return _location_export_response(fmt, encoding, body, asynchronous=True)
+
+
+@cache_location_response
+def location_search_view(request):
+    """
+    Autocomplete locations by name prefix: `?q=pokh`.
+
+    Optional parameters:
+        limit: Maximum number of results (default 10, at most 50)
+        level: Restrict to 'province', 'district' or 'municipality'
+    """
+    return _location_search(request)
+
+
+@cache_location_response
+async def async_location_search_view(request):
+    """Async version of location_search_view."""
+    return _location_search(request)
+
+
+def reverse_geocode_view(request):
+    """
+    Resolve `lat`/`lon` into Province, District and Municipality, fully offline.
+
+    Optional parameters:
+        nearest: Also return the N closest locations
+        radius: Also return locations within this many kilometres
+        level: Level for `nearest`/`radius` (default: municipality)
+    """
+    return _reverse_geocode(request)
+
+
+async def async_reverse_geocode_view(request):
+    """
+    Async version of reverse_geocode_view.
+
+    The geodata file is read in a worker thread on first use only; later
+    requests are answered from the in-memory index.
+    """
+    from django_nepkit import geo
+
+    if not geo.is_geo_index_loaded():
+        await sync_to_async(geo.get_geo_index)()
+    return _reverse_geocode(request)
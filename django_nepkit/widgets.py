@@ -1,9 +1,15 @@
+import json
+from functools import lru_cache
+from pathlib import Path
+
 from django import forms
 from django.urls import reverse, NoReverseMatch
 from nepali.datetime import nepalidate
 from django_nepkit.utils import BS_DATE_FORMAT
 
+from django_nepkit.assets import datepicker_media
 from django_nepkit.conf import nepkit_settings
+from django_nepkit.constants import LOCATION_DATA_DIR, LOCATION_DATA_MANIFEST
 
 
 def _append_css_class(attrs, class_name: str):
@@ -69,12 +75,57 @@ class NepaliWidgetMixin:
         return context
 
 
+@lru_cache(maxsize=1)
+def _location_data_manifest():
+    """
+    Load the manifest written by `nepkit_build_location_data`.
+
+    A copy in the project's static files takes precedence over the bundled one.
+    """
+    from django.apps import apps
+
+    path = f"{LOCATION_DATA_DIR}/{LOCATION_DATA_MANIFEST}"
+    found = None
+    if apps.is_installed("django.contrib.staticfiles"):
+        from django.contrib.staticfiles import finders
+
+        found = finders.find(path)
+    if not found:
+        found = Path(__file__).resolve().parent / "static" / path
+    try:
+        with open(found, encoding="utf-8") as manifest:
+            return json.load(manifest)
+    except (OSError, ValueError):
+        return {}
+
+
+def location_data_file(lang):
+    """Static path of the generated location data for a language, or None."""
+    return _location_data_manifest().get("files", {}).get(lang)
+
+
 class ChainedSelectWidget(forms.Select):
-    class Media:
-        js = (
-            "django_nepkit/js/nepal-data.js",
-            "django_nepkit/js/address-chaining.js",
-        )
+    _batch_url_name = "django_nepkit:location-batch"
+
+    @property
+    def media(self):
+        # Only this widget's language; without data the JS falls back to the API.
+        data_file = location_data_file("ne" if getattr(self, "ne", False) else "en")
+        js = (data_file,) if data_file else ()
+        return forms.Media(js=(*js, "django_nepkit/js/address-chaining.js"))
+
+    def get_context(self, name, value, attrs):
+        from django_nepkit.registry import registry
+
+        context = super().get_context(name, value, attrs)
+        # Lets address-chaining.js keep cached responses until the data changes
+        context["widget"]["attrs"]["data-version"] = registry.dataset_version
+        # Used by address-chaining.js to hydrate pre-filled selects in one request
+        try:
+            context["widget"]["attrs"]["data-batch-url"] = reverse(self._batch_url_name)
+        except NoReverseMatch:
+            pass
+        return context
 
 
 class ProvinceSelectWidget(NepaliWidgetMixin, ChainedSelectWidget):
@@ -104,19 +155,23 @@ class MunicipalitySelectWidget(NepaliWidgetMixin, ChainedSelectWidget):
 
 
 class NepaliDatePickerWidget(NepaliWidgetMixin, forms.TextInput):
+    """
+    Text input with the Nepali datepicker.
+
+    Args:
+        loading: 'defer' or 'async' to load the datepicker scripts without
+                 blocking rendering (default: NEPKIT["ASSET_LOADING"])
+    """
+
     input_type = "text"
 
-    class Media:
-        css = {
-            "all": (
-                "https://nepalidatepicker.sajanmaharjan.com.np/v5/nepali.datepicker/css/nepali.datepicker.v5.0.6.min.css",
-            )
-        }
-        js = (
-            "https://code.jquery.com/jquery-3.5.1.slim.min.js",
-            "https://nepalidatepicker.sajanmaharjan.com.np/v5/nepali.datepicker/js/nepali.datepicker.v5.0.6.min.js",
-            "django_nepkit/js/nepali-datepicker-init.js",
-        )
+    def __init__(self, *args, **kwargs):
+        self.loading = kwargs.pop("loading", nepkit_settings.ASSET_LOADING)
+        super().__init__(*args, **kwargs)
+
+    @property
+    def media(self):
+        return datepicker_media(loading=self.loading)
 
     def _configure_attrs(self, attrs):
         classes = attrs.get("class", "")